@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures the cost of constructing the gRPC clients.
+
+Each client is built on a channel created up front, so the numbers cover
+the client and transport rather than channel setup. "eager" also wraps
+every method, as construction did before methods were wrapped on first
+use; "lazy" is plain construction::
+
+    python benchmarks/client_construction.py --number 500
+"""
+import argparse
+import timeit
+
+import grpc  # type: ignore
+
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.cloud import datacatalog_v1
+from google.cloud import datacatalog_v1beta1
+
+CLIENTS = (
+    datacatalog_v1.DataCatalogClient,
+    datacatalog_v1.PolicyTagManagerClient,
+    datacatalog_v1.PolicyTagManagerSerializationClient,
+    datacatalog_v1beta1.DataCatalogClient,
+    datacatalog_v1beta1.PolicyTagManagerClient,
+    datacatalog_v1beta1.PolicyTagManagerSerializationClient,
+)
+
+
+def _rpc_names(transport_class):
+    base = transport_class.__mro__[1]
+    return [name for name, attr in vars(base).items() if isinstance(attr, property)]
+
+
+def construct(client_class, channel, wrap_all=False):
+    transport_class = client_class.get_transport_class("grpc")
+    transport = transport_class(
+        credentials=ga_credentials.AnonymousCredentials(), channel=channel
+    )
+    client = client_class(transport=transport)
+    if wrap_all:
+        for name in _rpc_names(transport_class):
+            transport._wrapped_methods[name]
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    channel = grpc.insecure_channel("localhost:1")
+    print("{:<56} {:>10} {:>10}".format("client", "eager (us)", "lazy (us)"))
+    for client_class in CLIENTS:
+        row = []
+        for wrap_all in (True, False):
+            best = min(
+                timeit.repeat(
+                    lambda: construct(client_class, channel, wrap_all),
+                    number=args.number,
+                    repeat=args.repeat,
+                )
+            )
+            row.append(best / args.number * 1e6)
+        version = client_class.__module__.split(".")[2]
+        name = "{}.{}".format(version, client_class.__name__)
+        print("{:<56} {:>10.1f} {:>10.1f}".format(name, *row))
+    channel.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures client throughput against a :class:`DataCatalogEmulator`.
+
+Several threads share one client and call ``get_entry`` on entries of
+the emulator, which delays each call by ``--latency`` seconds::
+
+    python benchmarks/emulator_throughput.py --threads 16 --latency 0.005
+"""
+import argparse
+import concurrent.futures
+import timeit
+
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+
+LOCATION = "projects/p1/locations/us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with emulator_module.DataCatalogEmulator(
+        max_workers=args.threads, latency=args.latency
+    ) as emulator:
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+        )
+        entry_group = client.create_entry_group(
+            parent=LOCATION, entry_group_id="g1", entry_group=datacatalog.EntryGroup()
+        )
+        names = [
+            client.create_entry(
+                parent=entry_group.name,
+                entry_id="e{}".format(i),
+                entry=datacatalog.Entry(user_specified_type="table"),
+            ).name
+            for i in range(args.entries)
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(args.threads) as executor:
+            start = timeit.default_timer()
+            list(
+                executor.map(
+                    lambda i: client.get_entry(name=names[i % len(names)]),
+                    range(args.calls),
+                )
+            )
+            elapsed = timeit.default_timer() - start
+
+    print(
+        "{} calls on {} threads: {:.0f} calls/s, {:.2f}ms per call".format(
+            args.calls,
+            args.threads,
+            args.calls / elapsed,
+            elapsed / args.calls * args.threads * 1e3,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
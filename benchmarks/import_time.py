@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures cold import time of the datacatalog packages.
+
+Each statement runs in a fresh interpreter, and the median of the runs
+is reported. "import *" loads every public name, as importing the
+package did before names were loaded on first use::
+
+    python benchmarks/import_time.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import google.cloud.datacatalog",
+    "from google.cloud.datacatalog import Entry",
+    "from google.cloud.datacatalog import DataCatalogClient",
+    "from google.cloud.datacatalog import *",
+    "from google.cloud.datacatalog_v1 import SearchCatalogRequest",
+    "from google.cloud.datacatalog_v1 import *",
+    "from google.cloud.datacatalog_v1beta1 import *",
+)
+
+_TIMER = """
+import sys, time
+start = time.perf_counter()
+{}
+print(time.perf_counter() - start, "grpc" in sys.modules)
+"""
+
+
+def measure(statement, runs):
+    times = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", _TIMER.format(statement)], universal_newlines=True
+        )
+        seconds, grpc_loaded = output.split()
+        times.append(float(seconds))
+    return statistics.median(times), grpc_loaded == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print("{:<62} {:>10} {:>6}".format("statement", "ms", "grpc"))
+    for statement in STATEMENTS:
+        seconds, grpc_loaded = measure(statement, args.runs)
+        print(
+            "{:<62} {:>10.1f} {:>6}".format(
+                statement, seconds * 1e3, "yes" if grpc_loaded else "no"
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures queries against a :class:`SearchIndex`.
+
+The index is built from generated entries, each with a schema, and the
+time of each query is reported per call::
+
+    python benchmarks/local_search.py --entries 10000
+"""
+import argparse
+import timeit
+
+from google.cloud.datacatalog_v1 import local_search
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+
+QUERIES = (
+    "name:table_0042",
+    "column:customer_id",
+    "description:nightly",
+    "type=table orders",
+    "name:table_00 -description:legacy",
+)
+
+
+def _entries(count, columns):
+    return [
+        datacatalog.Entry(
+            name="projects/p1/locations/us/entryGroups/g1/entries/e{}".format(i),
+            type_=datacatalog.EntryType.TABLE,
+            display_name="table_{:04d}".format(i),
+            description="{} orders, refreshed nightly.".format(
+                "Legacy" if i % 2 else "Daily"
+            ),
+            schema=schema.Schema(
+                columns=[
+                    schema.ColumnSchema(column="col_{}_{}".format(i % 50, c))
+                    for c in range(columns)
+                ]
+                + [schema.ColumnSchema(column="customer_id")] * (i % 100 == 0)
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    entries = _entries(args.entries, args.columns)
+    start = timeit.default_timer()
+    index = local_search.SearchIndex(entries)
+    print("index: {:.2f}s".format(timeit.default_timer() - start))
+
+    for query in QUERIES:
+        results = len(index.search(query))
+        seconds = min(
+            timeit.repeat(lambda: index.search(query), number=args.number, repeat=3)
+        )
+        print(
+            "{:<36} {:>6} results {:>10.1f}us".format(
+                query, results, seconds / args.number * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures reads from a :class:`CatalogMirror`.
+
+The mirror is loaded with generated entries, each with a schema and tags,
+through a stub client, and the time of each kind of read is reported per
+call::
+
+    python benchmarks/mirror_reads.py --entries 10000
+"""
+import argparse
+import timeit
+
+import mock
+
+from google.cloud.datacatalog_v1 import mirror
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import tags
+
+PARENT = "projects/p1/locations/us"
+GROUP = PARENT + "/entryGroups/g1"
+
+
+def _client(count, columns):
+    client = mock.Mock(spec=DataCatalogClient)
+    client._raw_responses = False
+    client.parse_common_location_path = DataCatalogClient.parse_common_location_path
+    client.search_catalog.return_value = []
+    client.list_entry_groups.return_value = [datacatalog.EntryGroup(name=GROUP)]
+    client.list_entries.return_value = [
+        datacatalog.Entry(
+            name="{}/entries/e{}".format(GROUP, i),
+            linked_resource="//bigquery.googleapis.com/tables/t{}".format(i),
+            type_=datacatalog.EntryType.TABLE,
+            schema=schema.Schema(
+                columns=[
+                    schema.ColumnSchema(column="c{}".format(c), type_="STRING")
+                    for c in range(columns)
+                ]
+            ),
+        )
+        for i in range(count)
+    ]
+    client.list_tags.side_effect = lambda parent: [
+        tags.Tag(name=parent + "/tags/t1", template="projects/p1/tagTemplates/tt")
+    ]
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    catalog = mirror.CatalogMirror(_client(args.entries, args.columns), [PARENT])
+    start = timeit.default_timer()
+    catalog.sync()
+    print("sync: {:.2f}s".format(timeit.default_timer() - start))
+
+    middle = args.entries // 2
+    reads = {
+        "get_entry": lambda: catalog.get_entry("{}/entries/e{}".format(GROUP, middle)),
+        "lookup_entry": lambda: catalog.lookup_entry(
+            "//bigquery.googleapis.com/tables/t{}".format(middle)
+        ),
+        "list_tags": lambda: catalog.list_tags("{}/entries/e{}".format(GROUP, middle)),
+    }
+    for label, read in reads.items():
+        seconds = min(timeit.repeat(read, number=args.number, repeat=3))
+        print("{:<14} {:>8.1f}us".format(label, seconds / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares resource name parsers.
+
+"re.match" is the uncompiled regular expression the clients used to
+match on every call, "compiled" the same expression compiled once,
+"parse" :meth:`PathParser.parse` and "parse_batch" its batch variant,
+per name::
+
+    python benchmarks/path_parsing.py --names 10000
+"""
+import argparse
+import re
+import timeit
+
+from google.cloud.datacatalog_v1 import path_parser
+
+TEMPLATES = {
+    "entry": "projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}",
+    "tag": "projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}/tags/{tag}",
+    "enum_value": "projects/{project}/locations/{location}/tagTemplates/{tag_template}/fields/{tag_template_field_id}/enumValues/{enum_value_display_name}",
+}
+
+
+def _names(template, count, width):
+    variables = re.findall(r"\{(\w+)\}", template)
+    return [
+        template.format(
+            **{name: "{}-{:0{}d}".format(name, i, width) for name in variables}
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--names", type=int, default=10000)
+    parser.add_argument("--width", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        "{:<12} {:>10} {:>10} {:>10} {:>12}".format(
+            "template", "re.match", "compiled", "parse", "parse_batch"
+        )
+    )
+    for label, template in TEMPLATES.items():
+        names = _names(template, args.names, args.width)
+        parser_ = path_parser.PathParser(template)
+        pattern = parser_._regex.pattern
+        compiled = re.compile(pattern)
+
+        def uncompiled():
+            for name in names:
+                m = re.match(pattern, name)
+                m.groupdict() if m else {}
+
+        def precompiled():
+            for name in names:
+                m = compiled.match(name)
+                m.groupdict() if m else {}
+
+        def parse():
+            for name in names:
+                parser_.parse(name)
+
+        def parse_batch():
+            parser_.parse_batch(names)
+
+        row = [
+            min(timeit.repeat(func, number=1, repeat=args.repeat)) / len(names) * 1e9
+            for func in (uncompiled, precompiled, parse, parse_batch)
+        ]
+        print("{:<12} {:>8.0f}ns {:>8.0f}ns {:>8.0f}ns {:>10.0f}ns".format(label, *row))
+
+
+if __name__ == "__main__":
+    main()
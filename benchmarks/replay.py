@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Measures list_entries paging replayed from a recording.
+
+The walk over the entries of an entry group is recorded once against a
+:class:`DataCatalogEmulator`, unless ``--path`` already holds a
+recording, and then replayed without a connection, both as fast as
+possible and with the recorded latency::
+
+    python benchmarks/replay.py --entries 5000 --path /tmp/list_entries.rec
+"""
+import argparse
+import os
+import tempfile
+import timeit
+
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1 import recording
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+
+ENTRY_GROUP = "projects/p1/locations/us/entryGroups/g1"
+
+
+def record(path, entries, page_size):
+    with emulator_module.DataCatalogEmulator() as emulator:
+        setup = DataCatalogClient(
+            transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+        )
+        setup.create_entry_group(
+            parent="projects/p1/locations/us",
+            entry_group_id="g1",
+            entry_group=datacatalog.EntryGroup(),
+        )
+        for i in range(entries):
+            setup.create_entry(
+                parent=ENTRY_GROUP,
+                entry_id="e{}".format(i),
+                entry=datacatalog.Entry(user_specified_type="table"),
+            )
+
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcRecordReplayTransport(
+                path=path, mode=recording.RECORD, channel=emulator.channel()
+            )
+        )
+        list(
+            client.list_entries(request={"parent": ENTRY_GROUP, "page_size": page_size})
+        )
+        client.transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--path")
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "list_entries.rec")
+    if not os.path.exists(path):
+        record(path, args.entries, args.page_size)
+    records = list(recording.read_records(path))
+    print(
+        "{} calls recorded, {:.1f}ms in total".format(
+            len(records), sum(record.latency for record in records) * 1e3
+        )
+    )
+
+    for reproduce_latency in (False, True):
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcRecordReplayTransport(
+                path=path, reproduce_latency=reproduce_latency
+            )
+        )
+        best = min(
+            timeit.repeat(
+                lambda: list(
+                    client.list_entries(
+                        request={"parent": ENTRY_GROUP, "page_size": args.page_size}
+                    )
+                ),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            "replay{}: {:.1f}ms per walk".format(
+                " with latency" if reproduce_latency else "", best * 1e3
+            )
+        )
+        client.transport.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Runs the client hot path benchmarks and stores the results as JSON.
+
+Each benchmark is timed over ``--rounds`` rounds, and the per-call
+min, median, mean and standard deviation are written to ``--output``
+along with the interpreter, platform and package version. With
+``--compare``, medians are also checked against an earlier results
+file, and the run fails if any benchmark got slower than
+``--threshold`` times its old median::
+
+    python benchmarks/suite.py --output 3.6.2.json
+    python benchmarks/suite.py --output head.json --compare 3.6.2.json
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import re
+import statistics
+import sys
+import timeit
+
+import grpc  # type: ignore
+import pkg_resources
+
+from client_construction import CLIENTS
+from client_construction import construct
+from import_time import measure
+
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import pagers
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import tags
+
+LOCATION = "projects/p1/locations/us"
+
+BENCHMARKS = {}
+
+# Kept short: each statement costs a fresh interpreter per round.
+IMPORT_STATEMENTS = (
+    "import google.cloud.datacatalog",
+    "from google.cloud.datacatalog_v1 import DataCatalogClient",
+)
+
+
+def benchmark(name, number):
+    """Registers a benchmark.
+
+    The decorated function does any setup, registering cleanups on the
+    given :class:`contextlib.ExitStack`, and returns the callable to
+    time; ``number`` is how many calls make up one round.
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = (func, number)
+        return func
+
+    return decorator
+
+
+def _large_entry(columns=500):
+    return datacatalog.Entry(
+        name=LOCATION + "/entryGroups/g1/entries/orders",
+        linked_resource="//bigquery.googleapis.com/projects/p1/datasets/d/tables/t",
+        type_=datacatalog.EntryType.TABLE,
+        display_name="orders",
+        description="One row per customer order. " * 20,
+        schema=schema.Schema(
+            columns=[
+                schema.ColumnSchema(
+                    column="column_{}".format(i),
+                    type_="RECORD",
+                    mode="REPEATED",
+                    description="Column {} of the orders table.".format(i),
+                    subcolumns=[
+                        schema.ColumnSchema(column="field_{}".format(j), type_="STRING")
+                        for j in range(5)
+                    ],
+                )
+                for i in range(columns)
+            ]
+        ),
+    )
+
+
+def _large_list_tags_response(count=200):
+    return datacatalog.ListTagsResponse(
+        tags=[
+            tags.Tag(
+                name="{}/entryGroups/g1/entries/orders/tags/t{}".format(LOCATION, i),
+                template=LOCATION + "/tagTemplates/governance",
+                column="column_{}".format(i),
+                fields={
+                    "owner": tags.TagField(string_value="sales analytics"),
+                    "pii": tags.TagField(bool_value=True),
+                    "rows": tags.TagField(double_value=1e6),
+                    "grade": tags.TagField(
+                        enum_value=tags.TagField.EnumValue(display_name="Gold")
+                    ),
+                },
+            )
+            for i in range(count)
+        ],
+        next_page_token="token",
+    )
+
+
+for _client_class in CLIENTS:
+
+    def _construct(stack, client_class=_client_class):
+        channel = grpc.insecure_channel("localhost:1")
+        stack.callback(channel.close)
+        return lambda: construct(client_class, channel)
+
+    benchmark(
+        "construct.{}.{}".format(
+            _client_class.__module__.split(".")[2], _client_class.__name__
+        ),
+        number=200,
+    )(_construct)
+
+
+@benchmark("coerce.search_catalog_request", number=2000)
+def coerce_search_catalog_request(stack):
+    request = {
+        "scope": {
+            "include_org_ids": ["123"],
+            "include_project_ids": ["p1", "p2", "p3"],
+            "restricted_locations": ["us", "eu"],
+        },
+        "query": "type=table system=bigquery column:customer_id",
+        "page_size": 100,
+        "order_by": "last_modified_timestamp desc",
+    }
+    return lambda: datacatalog.SearchCatalogRequest(request)
+
+
+@benchmark("serialize.entry", number=20)
+def serialize_entry(stack):
+    entry = _large_entry()
+    return lambda: datacatalog.Entry.serialize(entry)
+
+
+@benchmark("deserialize.entry", number=20)
+def deserialize_entry(stack):
+    data = datacatalog.Entry.serialize(_large_entry())
+    return lambda: datacatalog.Entry.deserialize(data)
+
+
+@benchmark("serialize.list_tags_response", number=20)
+def serialize_list_tags_response(stack):
+    response = _large_list_tags_response()
+    return lambda: datacatalog.ListTagsResponse.serialize(response)
+
+
+@benchmark("deserialize.list_tags_response", number=20)
+def deserialize_list_tags_response(stack):
+    data = datacatalog.ListTagsResponse.serialize(_large_list_tags_response())
+    return lambda: datacatalog.ListTagsResponse.deserialize(data)
+
+
+@benchmark("pager.list_entries", number=5)
+def pager_list_entries(stack):
+    # 10 pages of 100 entries, served from memory.
+    responses = [
+        datacatalog.ListEntriesResponse(
+            entries=[
+                datacatalog.Entry(
+                    name="{}/entryGroups/g1/entries/e{}".format(
+                        LOCATION, page * 100 + i
+                    )
+                )
+                for i in range(100)
+            ],
+            next_page_token=str(page + 1) if page < 9 else "",
+        )
+        for page in range(10)
+    ]
+
+    def method(request, metadata=()):
+        return responses[int(request.page_token)]
+
+    def iterate():
+        for _ in pagers.ListEntriesPager(
+            method, datacatalog.ListEntriesRequest(), responses[0]
+        ):
+            pass
+
+    return iterate
+
+
+@benchmark("unary.get_entry", number=100)
+def unary_get_entry(stack):
+    emulator = stack.enter_context(emulator_module.DataCatalogEmulator())
+    client = DataCatalogClient(
+        transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+    )
+    entry_group = client.create_entry_group(
+        parent=LOCATION, entry_group_id="g1", entry_group=datacatalog.EntryGroup()
+    )
+    name = client.create_entry(
+        parent=entry_group.name, entry_id="orders", entry=_large_entry(columns=20)
+    ).name
+    return lambda: client.get_entry(name=name)
+
+
+def _summarize(times, number):
+    per_call = [seconds / number for seconds in times]
+    return {
+        "min": min(per_call),
+        "median": statistics.median(per_call),
+        "mean": statistics.mean(per_call),
+        "stdev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "rounds": len(per_call),
+        "number": number,
+    }
+
+
+def run(name, rounds):
+    """Runs one benchmark, returning its summary."""
+    func, number = BENCHMARKS[name]
+    with contextlib.ExitStack() as stack:
+        call = func(stack)
+        call()
+        return _summarize(timeit.repeat(call, number=number, repeat=rounds), number)
+
+
+def run_import(statement, rounds):
+    """Times a cold import, one fresh interpreter per round."""
+    return _summarize([measure(statement, 1)[0] for _ in range(rounds)], 1)
+
+
+def compare(results, baseline, threshold):
+    """Prints median ratios against a baseline, returning the regressions."""
+    regressions = []
+    print(
+        "{:<64} {:>10} {:>10} {:>7}".format(
+            "benchmark", "old (us)", "new (us)", "ratio"
+        )
+    )
+    for name, result in results["benchmarks"].items():
+        old = baseline["benchmarks"].get(name)
+        if old is None:
+            continue
+        ratio = result["median"] / old["median"]
+        print(
+            "{:<64} {:>10.1f} {:>10.1f} {:>7.2f}{}".format(
+                name,
+                old["median"] * 1e6,
+                result["median"] * 1e6,
+                ratio,
+                " *" if ratio > threshold else "",
+            )
+        )
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", metavar="BASELINE")
+    parser.add_argument("--threshold", type=float, default=1.1)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--import-rounds", type=int, default=5)
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks matching this regex."
+    )
+    args = parser.parse_args()
+
+    pattern = re.compile(args.filter)
+    benchmarks = {}
+    for name in BENCHMARKS:
+        if pattern.search(name):
+            benchmarks[name] = run(name, args.rounds)
+            print("{:<64} {:>10.1f} us".format(name, benchmarks[name]["median"] * 1e6))
+    for statement in IMPORT_STATEMENTS:
+        name = "import." + statement
+        if pattern.search(name):
+            benchmarks[name] = run_import(statement, args.import_rounds)
+            print("{:<64} {:>10.1f} us".format(name, benchmarks[name]["median"] * 1e6))
+
+    results = {
+        "version": pkg_resources.get_distribution("google-cloud-datacatalog").version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "benchmarks": benchmarks,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
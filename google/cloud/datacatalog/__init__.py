@@ -14,123 +14,262 @@
 # limitations under the License.
 #
 
-from google.cloud.datacatalog_v1.services.data_catalog.client import DataCatalogClient
-from google.cloud.datacatalog_v1.services.data_catalog.async_client import (
-    DataCatalogAsyncClient,
-)
-from google.cloud.datacatalog_v1.services.policy_tag_manager.client import (
-    PolicyTagManagerClient,
-)
-from google.cloud.datacatalog_v1.services.policy_tag_manager.async_client import (
-    PolicyTagManagerAsyncClient,
-)
-from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.client import (
-    PolicyTagManagerSerializationClient,
-)
-from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.async_client import (
-    PolicyTagManagerSerializationAsyncClient,
-)
+import importlib
+import sys
+import typing
+
+# The module each public name is imported from. Names are imported on first
+# access (PEP 562), so importing the package does not load grpc, the
+# transports and every message type up front.
+_LAZY_IMPORTS = {
+    "DataCatalogClient": "google.cloud.datacatalog_v1.services.data_catalog.client",
+    "DataCatalogAsyncClient": "google.cloud.datacatalog_v1.services.data_catalog.async_client",
+    "PolicyTagManagerClient": "google.cloud.datacatalog_v1.services.policy_tag_manager.client",
+    "PolicyTagManagerAsyncClient": "google.cloud.datacatalog_v1.services.policy_tag_manager.async_client",
+    "PolicyTagManagerSerializationClient": "google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.client",
+    "PolicyTagManagerSerializationAsyncClient": "google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.async_client",
+    "BigQueryConnectionSpec": "google.cloud.datacatalog_v1.types.bigquery",
+    "BigQueryRoutineSpec": "google.cloud.datacatalog_v1.types.bigquery",
+    "CloudSqlBigQueryConnectionSpec": "google.cloud.datacatalog_v1.types.bigquery",
+    "IntegratedSystem": "google.cloud.datacatalog_v1.types.common",
+    "DataSource": "google.cloud.datacatalog_v1.types.data_source",
+    "CreateEntryGroupRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "CreateEntryRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "CreateTagRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "CreateTagTemplateFieldRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "CreateTagTemplateRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DatabaseTableSpec": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DataSourceConnectionSpec": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DeleteEntryGroupRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DeleteEntryRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DeleteTagRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DeleteTagTemplateFieldRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "DeleteTagTemplateRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "Entry": "google.cloud.datacatalog_v1.types.datacatalog",
+    "EntryGroup": "google.cloud.datacatalog_v1.types.datacatalog",
+    "GetEntryGroupRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "GetEntryRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "GetTagTemplateRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListEntriesRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListEntriesResponse": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListEntryGroupsRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListEntryGroupsResponse": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListTagsRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "ListTagsResponse": "google.cloud.datacatalog_v1.types.datacatalog",
+    "LookupEntryRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "RenameTagTemplateFieldEnumValueRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "RenameTagTemplateFieldRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "RoutineSpec": "google.cloud.datacatalog_v1.types.datacatalog",
+    "SearchCatalogRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "SearchCatalogResponse": "google.cloud.datacatalog_v1.types.datacatalog",
+    "UpdateEntryGroupRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "UpdateEntryRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "UpdateTagRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "UpdateTagTemplateFieldRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "UpdateTagTemplateRequest": "google.cloud.datacatalog_v1.types.datacatalog",
+    "EntryType": "google.cloud.datacatalog_v1.types.datacatalog",
+    "GcsFilesetSpec": "google.cloud.datacatalog_v1.types.gcs_fileset_spec",
+    "GcsFileSpec": "google.cloud.datacatalog_v1.types.gcs_fileset_spec",
+    "CreatePolicyTagRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "CreateTaxonomyRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "DeletePolicyTagRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "DeleteTaxonomyRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "GetPolicyTagRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "GetTaxonomyRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "ListPolicyTagsRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "ListPolicyTagsResponse": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "ListTaxonomiesRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "ListTaxonomiesResponse": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "PolicyTag": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "Taxonomy": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "UpdatePolicyTagRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "UpdateTaxonomyRequest": "google.cloud.datacatalog_v1.types.policytagmanager",
+    "CrossRegionalSource": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ExportTaxonomiesRequest": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ExportTaxonomiesResponse": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ImportTaxonomiesRequest": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ImportTaxonomiesResponse": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "InlineSource": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ReplaceTaxonomyRequest": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "SerializedPolicyTag": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "SerializedTaxonomy": "google.cloud.datacatalog_v1.types.policytagmanagerserialization",
+    "ColumnSchema": "google.cloud.datacatalog_v1.types.schema",
+    "Schema": "google.cloud.datacatalog_v1.types.schema",
+    "SearchCatalogResult": "google.cloud.datacatalog_v1.types.search",
+    "SearchResultType": "google.cloud.datacatalog_v1.types.search",
+    "BigQueryDateShardedSpec": "google.cloud.datacatalog_v1.types.table_spec",
+    "BigQueryTableSpec": "google.cloud.datacatalog_v1.types.table_spec",
+    "TableSpec": "google.cloud.datacatalog_v1.types.table_spec",
+    "ViewSpec": "google.cloud.datacatalog_v1.types.table_spec",
+    "TableSourceType": "google.cloud.datacatalog_v1.types.table_spec",
+    "FieldType": "google.cloud.datacatalog_v1.types.tags",
+    "Tag": "google.cloud.datacatalog_v1.types.tags",
+    "TagField": "google.cloud.datacatalog_v1.types.tags",
+    "TagTemplate": "google.cloud.datacatalog_v1.types.tags",
+    "TagTemplateField": "google.cloud.datacatalog_v1.types.tags",
+    "SystemTimestamps": "google.cloud.datacatalog_v1.types.timestamps",
+    "UsageSignal": "google.cloud.datacatalog_v1.types.usage",
+    "UsageStats": "google.cloud.datacatalog_v1.types.usage",
+}
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    # Static type checkers do not follow __getattr__, so they are shown
+    # the imports.
+    from google.cloud.datacatalog_v1.services.data_catalog.client import (
+        DataCatalogClient,
+    )
+    from google.cloud.datacatalog_v1.services.data_catalog.async_client import (
+        DataCatalogAsyncClient,
+    )
+    from google.cloud.datacatalog_v1.services.policy_tag_manager.client import (
+        PolicyTagManagerClient,
+    )
+    from google.cloud.datacatalog_v1.services.policy_tag_manager.async_client import (
+        PolicyTagManagerAsyncClient,
+    )
+    from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.client import (
+        PolicyTagManagerSerializationClient,
+    )
+    from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.async_client import (
+        PolicyTagManagerSerializationAsyncClient,
+    )
+    from google.cloud.datacatalog_v1.types.bigquery import BigQueryConnectionSpec
+    from google.cloud.datacatalog_v1.types.bigquery import BigQueryRoutineSpec
+    from google.cloud.datacatalog_v1.types.bigquery import (
+        CloudSqlBigQueryConnectionSpec,
+    )
+    from google.cloud.datacatalog_v1.types.common import IntegratedSystem
+    from google.cloud.datacatalog_v1.types.data_source import DataSource
+    from google.cloud.datacatalog_v1.types.datacatalog import CreateEntryGroupRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import CreateEntryRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import CreateTagRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import (
+        CreateTagTemplateFieldRequest,
+    )
+    from google.cloud.datacatalog_v1.types.datacatalog import CreateTagTemplateRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import DatabaseTableSpec
+    from google.cloud.datacatalog_v1.types.datacatalog import DataSourceConnectionSpec
+    from google.cloud.datacatalog_v1.types.datacatalog import DeleteEntryGroupRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import DeleteEntryRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import DeleteTagRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import (
+        DeleteTagTemplateFieldRequest,
+    )
+    from google.cloud.datacatalog_v1.types.datacatalog import DeleteTagTemplateRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import Entry
+    from google.cloud.datacatalog_v1.types.datacatalog import EntryGroup
+    from google.cloud.datacatalog_v1.types.datacatalog import GetEntryGroupRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import GetEntryRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import GetTagTemplateRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import ListEntriesRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import ListEntriesResponse
+    from google.cloud.datacatalog_v1.types.datacatalog import ListEntryGroupsRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import ListEntryGroupsResponse
+    from google.cloud.datacatalog_v1.types.datacatalog import ListTagsRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import ListTagsResponse
+    from google.cloud.datacatalog_v1.types.datacatalog import LookupEntryRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import (
+        RenameTagTemplateFieldEnumValueRequest,
+    )
+    from google.cloud.datacatalog_v1.types.datacatalog import (
+        RenameTagTemplateFieldRequest,
+    )
+    from google.cloud.datacatalog_v1.types.datacatalog import RoutineSpec
+    from google.cloud.datacatalog_v1.types.datacatalog import SearchCatalogRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import SearchCatalogResponse
+    from google.cloud.datacatalog_v1.types.datacatalog import UpdateEntryGroupRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import UpdateEntryRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import UpdateTagRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import (
+        UpdateTagTemplateFieldRequest,
+    )
+    from google.cloud.datacatalog_v1.types.datacatalog import UpdateTagTemplateRequest
+    from google.cloud.datacatalog_v1.types.datacatalog import EntryType
+    from google.cloud.datacatalog_v1.types.gcs_fileset_spec import GcsFilesetSpec
+    from google.cloud.datacatalog_v1.types.gcs_fileset_spec import GcsFileSpec
+    from google.cloud.datacatalog_v1.types.policytagmanager import (
+        CreatePolicyTagRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanager import CreateTaxonomyRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import (
+        DeletePolicyTagRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanager import DeleteTaxonomyRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import GetPolicyTagRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import GetTaxonomyRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import ListPolicyTagsRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import (
+        ListPolicyTagsResponse,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanager import ListTaxonomiesRequest
+    from google.cloud.datacatalog_v1.types.policytagmanager import (
+        ListTaxonomiesResponse,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanager import PolicyTag
+    from google.cloud.datacatalog_v1.types.policytagmanager import Taxonomy
+    from google.cloud.datacatalog_v1.types.policytagmanager import (
+        UpdatePolicyTagRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanager import UpdateTaxonomyRequest
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        CrossRegionalSource,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        ExportTaxonomiesRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        ExportTaxonomiesResponse,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        ImportTaxonomiesRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        ImportTaxonomiesResponse,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        InlineSource,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        ReplaceTaxonomyRequest,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        SerializedPolicyTag,
+    )
+    from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
+        SerializedTaxonomy,
+    )
+    from google.cloud.datacatalog_v1.types.schema import ColumnSchema
+    from google.cloud.datacatalog_v1.types.schema import Schema
+    from google.cloud.datacatalog_v1.types.search import SearchCatalogResult
+    from google.cloud.datacatalog_v1.types.search import SearchResultType
+    from google.cloud.datacatalog_v1.types.table_spec import BigQueryDateShardedSpec
+    from google.cloud.datacatalog_v1.types.table_spec import BigQueryTableSpec
+    from google.cloud.datacatalog_v1.types.table_spec import TableSpec
+    from google.cloud.datacatalog_v1.types.table_spec import ViewSpec
+    from google.cloud.datacatalog_v1.types.table_spec import TableSourceType
+    from google.cloud.datacatalog_v1.types.tags import FieldType
+    from google.cloud.datacatalog_v1.types.tags import Tag
+    from google.cloud.datacatalog_v1.types.tags import TagField
+    from google.cloud.datacatalog_v1.types.tags import TagTemplate
+    from google.cloud.datacatalog_v1.types.tags import TagTemplateField
+    from google.cloud.datacatalog_v1.types.timestamps import SystemTimestamps
+    from google.cloud.datacatalog_v1.types.usage import UsageSignal
+    from google.cloud.datacatalog_v1.types.usage import UsageStats
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from google.cloud.datacatalog_v1.types.bigquery import BigQueryConnectionSpec
-from google.cloud.datacatalog_v1.types.bigquery import BigQueryRoutineSpec
-from google.cloud.datacatalog_v1.types.bigquery import CloudSqlBigQueryConnectionSpec
-from google.cloud.datacatalog_v1.types.common import IntegratedSystem
-from google.cloud.datacatalog_v1.types.data_source import DataSource
-from google.cloud.datacatalog_v1.types.datacatalog import CreateEntryGroupRequest
-from google.cloud.datacatalog_v1.types.datacatalog import CreateEntryRequest
-from google.cloud.datacatalog_v1.types.datacatalog import CreateTagRequest
-from google.cloud.datacatalog_v1.types.datacatalog import CreateTagTemplateFieldRequest
-from google.cloud.datacatalog_v1.types.datacatalog import CreateTagTemplateRequest
-from google.cloud.datacatalog_v1.types.datacatalog import DatabaseTableSpec
-from google.cloud.datacatalog_v1.types.datacatalog import DataSourceConnectionSpec
-from google.cloud.datacatalog_v1.types.datacatalog import DeleteEntryGroupRequest
-from google.cloud.datacatalog_v1.types.datacatalog import DeleteEntryRequest
-from google.cloud.datacatalog_v1.types.datacatalog import DeleteTagRequest
-from google.cloud.datacatalog_v1.types.datacatalog import DeleteTagTemplateFieldRequest
-from google.cloud.datacatalog_v1.types.datacatalog import DeleteTagTemplateRequest
-from google.cloud.datacatalog_v1.types.datacatalog import Entry
-from google.cloud.datacatalog_v1.types.datacatalog import EntryGroup
-from google.cloud.datacatalog_v1.types.datacatalog import GetEntryGroupRequest
-from google.cloud.datacatalog_v1.types.datacatalog import GetEntryRequest
-from google.cloud.datacatalog_v1.types.datacatalog import GetTagTemplateRequest
-from google.cloud.datacatalog_v1.types.datacatalog import ListEntriesRequest
-from google.cloud.datacatalog_v1.types.datacatalog import ListEntriesResponse
-from google.cloud.datacatalog_v1.types.datacatalog import ListEntryGroupsRequest
-from google.cloud.datacatalog_v1.types.datacatalog import ListEntryGroupsResponse
-from google.cloud.datacatalog_v1.types.datacatalog import ListTagsRequest
-from google.cloud.datacatalog_v1.types.datacatalog import ListTagsResponse
-from google.cloud.datacatalog_v1.types.datacatalog import LookupEntryRequest
-from google.cloud.datacatalog_v1.types.datacatalog import (
-    RenameTagTemplateFieldEnumValueRequest,
-)
-from google.cloud.datacatalog_v1.types.datacatalog import RenameTagTemplateFieldRequest
-from google.cloud.datacatalog_v1.types.datacatalog import RoutineSpec
-from google.cloud.datacatalog_v1.types.datacatalog import SearchCatalogRequest
-from google.cloud.datacatalog_v1.types.datacatalog import SearchCatalogResponse
-from google.cloud.datacatalog_v1.types.datacatalog import UpdateEntryGroupRequest
-from google.cloud.datacatalog_v1.types.datacatalog import UpdateEntryRequest
-from google.cloud.datacatalog_v1.types.datacatalog import UpdateTagRequest
-from google.cloud.datacatalog_v1.types.datacatalog import UpdateTagTemplateFieldRequest
-from google.cloud.datacatalog_v1.types.datacatalog import UpdateTagTemplateRequest
-from google.cloud.datacatalog_v1.types.datacatalog import EntryType
-from google.cloud.datacatalog_v1.types.gcs_fileset_spec import GcsFilesetSpec
-from google.cloud.datacatalog_v1.types.gcs_fileset_spec import GcsFileSpec
-from google.cloud.datacatalog_v1.types.policytagmanager import CreatePolicyTagRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import CreateTaxonomyRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import DeletePolicyTagRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import DeleteTaxonomyRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import GetPolicyTagRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import GetTaxonomyRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import ListPolicyTagsRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import ListPolicyTagsResponse
-from google.cloud.datacatalog_v1.types.policytagmanager import ListTaxonomiesRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import ListTaxonomiesResponse
-from google.cloud.datacatalog_v1.types.policytagmanager import PolicyTag
-from google.cloud.datacatalog_v1.types.policytagmanager import Taxonomy
-from google.cloud.datacatalog_v1.types.policytagmanager import UpdatePolicyTagRequest
-from google.cloud.datacatalog_v1.types.policytagmanager import UpdateTaxonomyRequest
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    CrossRegionalSource,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    ExportTaxonomiesRequest,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    ExportTaxonomiesResponse,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    ImportTaxonomiesRequest,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    ImportTaxonomiesResponse,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import InlineSource
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    ReplaceTaxonomyRequest,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    SerializedPolicyTag,
-)
-from google.cloud.datacatalog_v1.types.policytagmanagerserialization import (
-    SerializedTaxonomy,
-)
-from google.cloud.datacatalog_v1.types.schema import ColumnSchema
-from google.cloud.datacatalog_v1.types.schema import Schema
-from google.cloud.datacatalog_v1.types.search import SearchCatalogResult
-from google.cloud.datacatalog_v1.types.search import SearchResultType
-from google.cloud.datacatalog_v1.types.table_spec import BigQueryDateShardedSpec
-from google.cloud.datacatalog_v1.types.table_spec import BigQueryTableSpec
-from google.cloud.datacatalog_v1.types.table_spec import TableSpec
-from google.cloud.datacatalog_v1.types.table_spec import ViewSpec
-from google.cloud.datacatalog_v1.types.table_spec import TableSourceType
-from google.cloud.datacatalog_v1.types.tags import FieldType
-from google.cloud.datacatalog_v1.types.tags import Tag
-from google.cloud.datacatalog_v1.types.tags import TagField
-from google.cloud.datacatalog_v1.types.tags import TagTemplate
-from google.cloud.datacatalog_v1.types.tags import TagTemplateField
-from google.cloud.datacatalog_v1.types.timestamps import SystemTimestamps
-from google.cloud.datacatalog_v1.types.usage import UsageSignal
-from google.cloud.datacatalog_v1.types.usage import UsageStats
 
 __all__ = (
     "DataCatalogClient",
@@ -222,3 +361,8 @@ __all__ = (
     "UsageSignal",
     "UsageStats",
 )
+
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    # Python 3.6 does not support module __getattr__, so import eagerly.
+    for _name in __all__:
+        __getattr__(_name)
@@ -14,99 +14,218 @@
 # limitations under the License.
 #
 
-from .services.data_catalog import DataCatalogClient
-from .services.data_catalog import DataCatalogAsyncClient
-from .services.policy_tag_manager import PolicyTagManagerClient
-from .services.policy_tag_manager import PolicyTagManagerAsyncClient
-from .services.policy_tag_manager_serialization import (
-    PolicyTagManagerSerializationClient,
-)
-from .services.policy_tag_manager_serialization import (
-    PolicyTagManagerSerializationAsyncClient,
-)
+import importlib
+import sys
+import typing
+
+# The module each public name is imported from. Names are imported on first
+# access (PEP 562), so importing the package does not load grpc, the
+# transports and every message type up front.
+_LAZY_IMPORTS = {
+    "DataCatalogClient": ".services.data_catalog",
+    "DataCatalogAsyncClient": ".services.data_catalog",
+    "PolicyTagManagerClient": ".services.policy_tag_manager",
+    "PolicyTagManagerAsyncClient": ".services.policy_tag_manager",
+    "PolicyTagManagerSerializationClient": ".services.policy_tag_manager_serialization",
+    "PolicyTagManagerSerializationAsyncClient": ".services.policy_tag_manager_serialization",
+    "BigQueryConnectionSpec": ".types.bigquery",
+    "BigQueryRoutineSpec": ".types.bigquery",
+    "CloudSqlBigQueryConnectionSpec": ".types.bigquery",
+    "IntegratedSystem": ".types.common",
+    "DataSource": ".types.data_source",
+    "CreateEntryGroupRequest": ".types.datacatalog",
+    "CreateEntryRequest": ".types.datacatalog",
+    "CreateTagRequest": ".types.datacatalog",
+    "CreateTagTemplateFieldRequest": ".types.datacatalog",
+    "CreateTagTemplateRequest": ".types.datacatalog",
+    "DatabaseTableSpec": ".types.datacatalog",
+    "DataSourceConnectionSpec": ".types.datacatalog",
+    "DeleteEntryGroupRequest": ".types.datacatalog",
+    "DeleteEntryRequest": ".types.datacatalog",
+    "DeleteTagRequest": ".types.datacatalog",
+    "DeleteTagTemplateFieldRequest": ".types.datacatalog",
+    "DeleteTagTemplateRequest": ".types.datacatalog",
+    "Entry": ".types.datacatalog",
+    "EntryGroup": ".types.datacatalog",
+    "GetEntryGroupRequest": ".types.datacatalog",
+    "GetEntryRequest": ".types.datacatalog",
+    "GetTagTemplateRequest": ".types.datacatalog",
+    "ListEntriesRequest": ".types.datacatalog",
+    "ListEntriesResponse": ".types.datacatalog",
+    "ListEntryGroupsRequest": ".types.datacatalog",
+    "ListEntryGroupsResponse": ".types.datacatalog",
+    "ListTagsRequest": ".types.datacatalog",
+    "ListTagsResponse": ".types.datacatalog",
+    "LookupEntryRequest": ".types.datacatalog",
+    "RenameTagTemplateFieldEnumValueRequest": ".types.datacatalog",
+    "RenameTagTemplateFieldRequest": ".types.datacatalog",
+    "RoutineSpec": ".types.datacatalog",
+    "SearchCatalogRequest": ".types.datacatalog",
+    "SearchCatalogResponse": ".types.datacatalog",
+    "UpdateEntryGroupRequest": ".types.datacatalog",
+    "UpdateEntryRequest": ".types.datacatalog",
+    "UpdateTagRequest": ".types.datacatalog",
+    "UpdateTagTemplateFieldRequest": ".types.datacatalog",
+    "UpdateTagTemplateRequest": ".types.datacatalog",
+    "EntryType": ".types.datacatalog",
+    "GcsFilesetSpec": ".types.gcs_fileset_spec",
+    "GcsFileSpec": ".types.gcs_fileset_spec",
+    "CreatePolicyTagRequest": ".types.policytagmanager",
+    "CreateTaxonomyRequest": ".types.policytagmanager",
+    "DeletePolicyTagRequest": ".types.policytagmanager",
+    "DeleteTaxonomyRequest": ".types.policytagmanager",
+    "GetPolicyTagRequest": ".types.policytagmanager",
+    "GetTaxonomyRequest": ".types.policytagmanager",
+    "ListPolicyTagsRequest": ".types.policytagmanager",
+    "ListPolicyTagsResponse": ".types.policytagmanager",
+    "ListTaxonomiesRequest": ".types.policytagmanager",
+    "ListTaxonomiesResponse": ".types.policytagmanager",
+    "PolicyTag": ".types.policytagmanager",
+    "Taxonomy": ".types.policytagmanager",
+    "UpdatePolicyTagRequest": ".types.policytagmanager",
+    "UpdateTaxonomyRequest": ".types.policytagmanager",
+    "CrossRegionalSource": ".types.policytagmanagerserialization",
+    "ExportTaxonomiesRequest": ".types.policytagmanagerserialization",
+    "ExportTaxonomiesResponse": ".types.policytagmanagerserialization",
+    "ImportTaxonomiesRequest": ".types.policytagmanagerserialization",
+    "ImportTaxonomiesResponse": ".types.policytagmanagerserialization",
+    "InlineSource": ".types.policytagmanagerserialization",
+    "ReplaceTaxonomyRequest": ".types.policytagmanagerserialization",
+    "SerializedPolicyTag": ".types.policytagmanagerserialization",
+    "SerializedTaxonomy": ".types.policytagmanagerserialization",
+    "ColumnSchema": ".types.schema",
+    "Schema": ".types.schema",
+    "SearchCatalogResult": ".types.search",
+    "SearchResultType": ".types.search",
+    "BigQueryDateShardedSpec": ".types.table_spec",
+    "BigQueryTableSpec": ".types.table_spec",
+    "TableSpec": ".types.table_spec",
+    "ViewSpec": ".types.table_spec",
+    "TableSourceType": ".types.table_spec",
+    "FieldType": ".types.tags",
+    "Tag": ".types.tags",
+    "TagField": ".types.tags",
+    "TagTemplate": ".types.tags",
+    "TagTemplateField": ".types.tags",
+    "SystemTimestamps": ".types.timestamps",
+    "UsageSignal": ".types.usage",
+    "UsageStats": ".types.usage",
+}
+
+if typing.TYPE_CHECKING:  # pragma: NO COVER
+    # Static type checkers do not follow __getattr__, so they are shown
+    # the imports.
+    from .services.data_catalog import DataCatalogClient
+    from .services.data_catalog import DataCatalogAsyncClient
+    from .services.policy_tag_manager import PolicyTagManagerClient
+    from .services.policy_tag_manager import PolicyTagManagerAsyncClient
+    from .services.policy_tag_manager_serialization import (
+        PolicyTagManagerSerializationClient,
+    )
+    from .services.policy_tag_manager_serialization import (
+        PolicyTagManagerSerializationAsyncClient,
+    )
+    from .types.bigquery import BigQueryConnectionSpec
+    from .types.bigquery import BigQueryRoutineSpec
+    from .types.bigquery import CloudSqlBigQueryConnectionSpec
+    from .types.common import IntegratedSystem
+    from .types.data_source import DataSource
+    from .types.datacatalog import CreateEntryGroupRequest
+    from .types.datacatalog import CreateEntryRequest
+    from .types.datacatalog import CreateTagRequest
+    from .types.datacatalog import CreateTagTemplateFieldRequest
+    from .types.datacatalog import CreateTagTemplateRequest
+    from .types.datacatalog import DatabaseTableSpec
+    from .types.datacatalog import DataSourceConnectionSpec
+    from .types.datacatalog import DeleteEntryGroupRequest
+    from .types.datacatalog import DeleteEntryRequest
+    from .types.datacatalog import DeleteTagRequest
+    from .types.datacatalog import DeleteTagTemplateFieldRequest
+    from .types.datacatalog import DeleteTagTemplateRequest
+    from .types.datacatalog import Entry
+    from .types.datacatalog import EntryGroup
+    from .types.datacatalog import GetEntryGroupRequest
+    from .types.datacatalog import GetEntryRequest
+    from .types.datacatalog import GetTagTemplateRequest
+    from .types.datacatalog import ListEntriesRequest
+    from .types.datacatalog import ListEntriesResponse
+    from .types.datacatalog import ListEntryGroupsRequest
+    from .types.datacatalog import ListEntryGroupsResponse
+    from .types.datacatalog import ListTagsRequest
+    from .types.datacatalog import ListTagsResponse
+    from .types.datacatalog import LookupEntryRequest
+    from .types.datacatalog import RenameTagTemplateFieldEnumValueRequest
+    from .types.datacatalog import RenameTagTemplateFieldRequest
+    from .types.datacatalog import RoutineSpec
+    from .types.datacatalog import SearchCatalogRequest
+    from .types.datacatalog import SearchCatalogResponse
+    from .types.datacatalog import UpdateEntryGroupRequest
+    from .types.datacatalog import UpdateEntryRequest
+    from .types.datacatalog import UpdateTagRequest
+    from .types.datacatalog import UpdateTagTemplateFieldRequest
+    from .types.datacatalog import UpdateTagTemplateRequest
+    from .types.datacatalog import EntryType
+    from .types.gcs_fileset_spec import GcsFilesetSpec
+    from .types.gcs_fileset_spec import GcsFileSpec
+    from .types.policytagmanager import CreatePolicyTagRequest
+    from .types.policytagmanager import CreateTaxonomyRequest
+    from .types.policytagmanager import DeletePolicyTagRequest
+    from .types.policytagmanager import DeleteTaxonomyRequest
+    from .types.policytagmanager import GetPolicyTagRequest
+    from .types.policytagmanager import GetTaxonomyRequest
+    from .types.policytagmanager import ListPolicyTagsRequest
+    from .types.policytagmanager import ListPolicyTagsResponse
+    from .types.policytagmanager import ListTaxonomiesRequest
+    from .types.policytagmanager import ListTaxonomiesResponse
+    from .types.policytagmanager import PolicyTag
+    from .types.policytagmanager import Taxonomy
+    from .types.policytagmanager import UpdatePolicyTagRequest
+    from .types.policytagmanager import UpdateTaxonomyRequest
+    from .types.policytagmanagerserialization import CrossRegionalSource
+    from .types.policytagmanagerserialization import ExportTaxonomiesRequest
+    from .types.policytagmanagerserialization import ExportTaxonomiesResponse
+    from .types.policytagmanagerserialization import ImportTaxonomiesRequest
+    from .types.policytagmanagerserialization import ImportTaxonomiesResponse
+    from .types.policytagmanagerserialization import InlineSource
+    from .types.policytagmanagerserialization import ReplaceTaxonomyRequest
+    from .types.policytagmanagerserialization import SerializedPolicyTag
+    from .types.policytagmanagerserialization import SerializedTaxonomy
+    from .types.schema import ColumnSchema
+    from .types.schema import Schema
+    from .types.search import SearchCatalogResult
+    from .types.search import SearchResultType
+    from .types.table_spec import BigQueryDateShardedSpec
+    from .types.table_spec import BigQueryTableSpec
+    from .types.table_spec import TableSpec
+    from .types.table_spec import ViewSpec
+    from .types.table_spec import TableSourceType
+    from .types.tags import FieldType
+    from .types.tags import Tag
+    from .types.tags import TagField
+    from .types.tags import TagTemplate
+    from .types.tags import TagTemplateField
+    from .types.timestamps import SystemTimestamps
+    from .types.usage import UsageSignal
+    from .types.usage import UsageStats
+# Subpackages that are available as attributes without being imported.
+_SUBPACKAGES = ("services", "types")
+
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .types.bigquery import BigQueryConnectionSpec
-from .types.bigquery import BigQueryRoutineSpec
-from .types.bigquery import CloudSqlBigQueryConnectionSpec
-from .types.common import IntegratedSystem
-from .types.data_source import DataSource
-from .types.datacatalog import CreateEntryGroupRequest
-from .types.datacatalog import CreateEntryRequest
-from .types.datacatalog import CreateTagRequest
-from .types.datacatalog import CreateTagTemplateFieldRequest
-from .types.datacatalog import CreateTagTemplateRequest
-from .types.datacatalog import DatabaseTableSpec
-from .types.datacatalog import DataSourceConnectionSpec
-from .types.datacatalog import DeleteEntryGroupRequest
-from .types.datacatalog import DeleteEntryRequest
-from .types.datacatalog import DeleteTagRequest
-from .types.datacatalog import DeleteTagTemplateFieldRequest
-from .types.datacatalog import DeleteTagTemplateRequest
-from .types.datacatalog import Entry
-from .types.datacatalog import EntryGroup
-from .types.datacatalog import GetEntryGroupRequest
-from .types.datacatalog import GetEntryRequest
-from .types.datacatalog import GetTagTemplateRequest
-from .types.datacatalog import ListEntriesRequest
-from .types.datacatalog import ListEntriesResponse
-from .types.datacatalog import ListEntryGroupsRequest
-from .types.datacatalog import ListEntryGroupsResponse
-from .types.datacatalog import ListTagsRequest
-from .types.datacatalog import ListTagsResponse
-from .types.datacatalog import LookupEntryRequest
-from .types.datacatalog import RenameTagTemplateFieldEnumValueRequest
-from .types.datacatalog import RenameTagTemplateFieldRequest
-from .types.datacatalog import RoutineSpec
-from .types.datacatalog import SearchCatalogRequest
-from .types.datacatalog import SearchCatalogResponse
-from .types.datacatalog import UpdateEntryGroupRequest
-from .types.datacatalog import UpdateEntryRequest
-from .types.datacatalog import UpdateTagRequest
-from .types.datacatalog import UpdateTagTemplateFieldRequest
-from .types.datacatalog import UpdateTagTemplateRequest
-from .types.datacatalog import EntryType
-from .types.gcs_fileset_spec import GcsFilesetSpec
-from .types.gcs_fileset_spec import GcsFileSpec
-from .types.policytagmanager import CreatePolicyTagRequest
-from .types.policytagmanager import CreateTaxonomyRequest
-from .types.policytagmanager import DeletePolicyTagRequest
-from .types.policytagmanager import DeleteTaxonomyRequest
-from .types.policytagmanager import GetPolicyTagRequest
-from .types.policytagmanager import GetTaxonomyRequest
-from .types.policytagmanager import ListPolicyTagsRequest
-from .types.policytagmanager import ListPolicyTagsResponse
-from .types.policytagmanager import ListTaxonomiesRequest
-from .types.policytagmanager import ListTaxonomiesResponse
-from .types.policytagmanager import PolicyTag
-from .types.policytagmanager import Taxonomy
-from .types.policytagmanager import UpdatePolicyTagRequest
-from .types.policytagmanager import UpdateTaxonomyRequest
-from .types.policytagmanagerserialization import CrossRegionalSource
-from .types.policytagmanagerserialization import ExportTaxonomiesRequest
-from .types.policytagmanagerserialization import ExportTaxonomiesResponse
-from .types.policytagmanagerserialization import ImportTaxonomiesRequest
-from .types.policytagmanagerserialization import ImportTaxonomiesResponse
-from .types.policytagmanagerserialization import InlineSource
-from .types.policytagmanagerserialization import ReplaceTaxonomyRequest
-from .types.policytagmanagerserialization import SerializedPolicyTag
-from .types.policytagmanagerserialization import SerializedTaxonomy
-from .types.schema import ColumnSchema
-from .types.schema import Schema
-from .types.search import SearchCatalogResult
-from .types.search import SearchResultType
-from .types.table_spec import BigQueryDateShardedSpec
-from .types.table_spec import BigQueryTableSpec
-from .types.table_spec import TableSpec
-from .types.table_spec import ViewSpec
-from .types.table_spec import TableSourceType
-from .types.tags import FieldType
-from .types.tags import Tag
-from .types.tags import TagField
-from .types.tags import TagTemplate
-from .types.tags import TagTemplateField
-from .types.timestamps import SystemTimestamps
-from .types.usage import UsageSignal
-from .types.usage import UsageStats
 
 __all__ = (
     "DataCatalogAsyncClient",
@@ -198,3 +317,8 @@ __all__ = (
     "UsageStats",
     "ViewSpec",
 )
+
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    # Python 3.6 does not support module __getattr__, so import eagerly.
+    for _name in __all__:
+        __getattr__(_name)
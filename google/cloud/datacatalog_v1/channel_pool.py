@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pools of gRPC channels that spread calls across connections.
+
+A single channel multiplexes every call over one HTTP/2 connection, which
+caps the calls in flight at the server's concurrent stream limit. A pool
+holds several channels, each with its own connection, and sends each
+unary call on one of them.
+"""
+import asyncio
+import itertools
+import threading
+from typing import List, Sequence
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+# Send each call on the next channel in turn.
+ROUND_ROBIN = "round_robin"
+# Send each call on the channel with the fewest calls in flight.
+LEAST_BUSY = "least_busy"
+
+# Channel options that give a channel its own connection, rather than
+# sharing one with other channels to the same target.
+CHANNEL_OPTIONS = (("grpc.use_local_subchannel_pool", 1),)
+
+
+class _Picker:
+    """Chooses the channel for each call, and counts calls in flight."""
+
+    def __init__(self, size: int, dispatch: str):
+        if dispatch not in (ROUND_ROBIN, LEAST_BUSY):
+            raise ValueError("Unknown dispatch policy: {!r}.".format(dispatch))
+        self._dispatch = dispatch
+        self._lock = threading.Lock()
+        self._next = 0
+        self.in_flight = [0] * size
+
+    def acquire(self) -> int:
+        with self._lock:
+            index = self._next
+            self._next = (index + 1) % len(self.in_flight)
+            if self._dispatch == LEAST_BUSY:
+                # Ties go to the channel after the last one picked.
+                order = itertools.chain(range(index, len(self.in_flight)), range(index))
+                index = min(order, key=self.in_flight.__getitem__)
+            self.in_flight[index] += 1
+            return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self.in_flight[index] -= 1
+
+
+class _PooledUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, picker: _Picker, callables: Sequence):
+        self._picker = picker
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._picker.acquire()
+        try:
+            return self._callables[index](request, *args, **kwargs)
+        finally:
+            self._picker.release(index)
+
+    def with_call(self, request, *args, **kwargs):
+        index = self._picker.acquire()
+        try:
+            return self._callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self._picker.release(index)
+
+    def future(self, request, *args, **kwargs):
+        index = self._picker.acquire()
+        try:
+            future = self._callables[index].future(request, *args, **kwargs)
+        except BaseException:
+            self._picker.release(index)
+            raise
+        future.add_done_callback(lambda _: self._picker.release(index))
+        return future
+
+
+class ChannelPool(grpc.Channel):
+    """A :class:`grpc.Channel` that spreads unary calls over several channels.
+
+    Each unary-unary call is sent on one channel of the pool, chosen by
+    ``dispatch``: :data:`ROUND_ROBIN` or :data:`LEAST_BUSY`. Streaming
+    stubs are bound to one channel each, in turn.
+    """
+
+    def __init__(self, channels: Sequence[grpc.Channel], dispatch: str = ROUND_ROBIN):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        self.channels = tuple(channels)
+        self._picker = _Picker(len(self.channels), dispatch)
+        self._stub_channels = itertools.cycle(self.channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of unary calls in flight on each channel."""
+        return list(self._picker.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _PooledUnaryUnaryMultiCallable(
+            self._picker,
+            [channel.unary_unary(method, *args, **kwargs) for channel in self.channels],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return next(self._stub_channels).unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return next(self._stub_channels).stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return next(self._stub_channels).stream_stream(method, *args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self.channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self.channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _PooledAsyncUnaryUnaryMultiCallable(aio.UnaryUnaryMultiCallable):
+    def __init__(self, picker: _Picker, callables: Sequence):
+        self._picker = picker
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._picker.acquire()
+        try:
+            call = self._callables[index](request, *args, **kwargs)
+        except BaseException:
+            self._picker.release(index)
+            raise
+        call.add_done_callback(lambda _: self._picker.release(index))
+        return call
+
+
+class AsyncChannelPool(aio.Channel):
+    """An :class:`grpc.aio.Channel` that spreads unary calls over several
+    channels.
+
+    Calls are dispatched as by :class:`ChannelPool`. Connectivity state is
+    that of the first channel; :meth:`channel_ready` waits for all of them.
+    """
+
+    def __init__(self, channels: Sequence[aio.Channel], dispatch: str = ROUND_ROBIN):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        self.channels = tuple(channels)
+        self._picker = _Picker(len(self.channels), dispatch)
+        self._stub_channels = itertools.cycle(self.channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """The number of unary calls in flight on each channel."""
+        return list(self._picker.in_flight)
+
+    def unary_unary(self, method, *args, **kwargs):
+        return _PooledAsyncUnaryUnaryMultiCallable(
+            self._picker,
+            [channel.unary_unary(method, *args, **kwargs) for channel in self.channels],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return next(self._stub_channels).unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return next(self._stub_channels).stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return next(self._stub_channels).stream_stream(method, *args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False):
+        return self.channels[0].get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self.channels[0].wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await asyncio.gather(*[channel.channel_ready() for channel in self.channels])
+
+    async def close(self, grace=None):
+        await asyncio.gather(*[channel.close(grace) for channel in self.channels])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncChannelPool",
+    "ChannelPool",
+    "LEAST_BUSY",
+    "ROUND_ROBIN",
+)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cursors that let a long crawl over a pager resume after a restart.
+
+The ``cursor`` of a
+:class:`~google.cloud.datacatalog_v1.services.data_catalog.pagers.ListEntriesPager`
+or
+:class:`~google.cloud.datacatalog_v1.services.data_catalog.pagers.SearchCatalogPager`
+is a string holding the request, with the page token of the current
+page, and how many items of that page have been consumed. :func:`resume`
+makes a pager that continues from a cursor, and :func:`checkpointed`
+iterates over a pager while saving its cursor to a file, so that running
+the same crawl again picks up where the last run stopped.
+
+An item counts as consumed once the next one is asked for, so an item
+whose processing was interrupted is returned again when resuming.
+"""
+import base64
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+import proto  # type: ignore
+
+from google.cloud.datacatalog_v1.types import datacatalog
+
+_CURSOR_VERSION = 1
+
+# The requests of the pagers that have cursors, by protobuf name.
+_REQUEST_TYPES: Dict[str, Type[proto.Message]] = {
+    datacatalog.SearchCatalogRequest.pb().DESCRIPTOR.full_name: (
+        datacatalog.SearchCatalogRequest
+    ),
+    datacatalog.ListEntriesRequest.pb().DESCRIPTOR.full_name: (
+        datacatalog.ListEntriesRequest
+    ),
+}
+
+
+def encode_cursor(request: proto.Message, consumed: int) -> str:
+    """Returns the cursor of ``request``'s page, of which ``consumed``
+    items have been consumed.
+    """
+    pb = type(request).pb(request)
+    state = {
+        "version": _CURSOR_VERSION,
+        "request_type": pb.DESCRIPTOR.full_name,
+        "request": base64.b64encode(pb.SerializeToString()).decode("ascii"),
+        "consumed": consumed,
+    }
+    return base64.urlsafe_b64encode(
+        json.dumps(state, sort_keys=True).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[proto.Message, int]:
+    """Returns the request and the number of consumed items of a cursor.
+
+    Raises:
+        ValueError: If ``cursor`` is not a cursor.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        request_type = _REQUEST_TYPES[state["request_type"]]
+        if state["version"] != _CURSOR_VERSION or state["consumed"] < 0:
+            raise ValueError(cursor)
+        request = request_type.deserialize(base64.b64decode(state["request"]))
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid pager cursor.") from exc
+    return request, state["consumed"]
+
+
+def resume(method: Callable[..., Any], cursor: str, **kwargs) -> Any:
+    """Continues a pager from its cursor.
+
+    Args:
+        method (Callable): The client method that made the pager, such
+            as ``client.list_entries``.
+        cursor (str): The pager's ``cursor``.
+        kwargs: Other arguments of ``method``, such as ``retry`` or
+            ``metadata``.
+
+    Returns:
+        The pager returned by ``method``, whose iteration skips the items
+        already consumed.
+
+    Raises:
+        ValueError: If ``cursor`` is not a cursor.
+    """
+    request, consumed = decode_cursor(cursor)
+    pager = method(request=request, **kwargs)
+    pager._consumed = consumed
+    return pager
+
+
+class _CursorFile:
+    """A cursor kept in a file, which is replaced whole on each save."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[str]:
+        try:
+            with open(self.path, encoding="ascii") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def save(self, cursor: str) -> None:
+        partial = self.path + ".partial"
+        with open(partial, "w", encoding="ascii") as f:
+            f.write(cursor)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, self.path)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def checkpointed(
+    method: Callable[..., Any],
+    request: Any = None,
+    *,
+    path: str,
+    every_pages: int = 1,
+    **kwargs
+) -> Iterator[Any]:
+    """Iterates over the items of a pager, saving its cursor to ``path``.
+
+    If ``path`` holds a cursor, iteration resumes from it and ``request``
+    is ignored. Otherwise ``method`` is called with ``request``. The
+    cursor is saved each time ``every_pages`` pages have been consumed,
+    and the file is removed once the last item has been.
+
+    Args:
+        method (Callable): The client method to page through, such as
+            ``client.search_catalog``.
+        request (Any): The request of the first run.
+        path (str): The file that keeps the cursor between runs.
+        every_pages (int): The number of pages between saves.
+        kwargs: Other arguments of ``method``, such as ``retry`` or
+            ``metadata``.
+
+    Yields:
+        The items of the pager, such as
+        :class:`~google.cloud.datacatalog_v1.types.Entry`.
+
+    Raises:
+        ValueError: If ``every_pages`` is less than 1, or ``path`` does
+            not hold a cursor.
+    """
+    if every_pages < 1:
+        raise ValueError("every_pages must be at least 1.")
+    cursor_file = _CursorFile(path)
+    cursor = cursor_file.load()
+    if cursor is not None:
+        pager = resume(method, cursor, **kwargs)
+    else:
+        pager = method(request=request, **kwargs)
+
+    pages = 0
+    for page in pager.pages:
+        items = getattr(page, pager._items_field)
+        while pager._consumed < len(items):
+            yield items[pager._consumed]
+            pager._consumed += 1
+        pages += 1
+        if pages % every_pages == 0 and page.next_page_token:
+            cursor_file.save(pager.cursor)
+    cursor_file.remove()
+
+
+__all__ = (
+    "checkpointed",
+    "decode_cursor",
+    "encode_cursor",
+    "resume",
+)
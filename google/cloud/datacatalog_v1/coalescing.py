@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Single-flight coalescing of identical read requests.
+
+While a read is in flight, identical reads -- the same request message,
+serialized, and the same metadata -- wait for it and share its result
+instead of sending a request of their own.
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Sequence, Tuple
+
+import proto  # type: ignore
+
+
+def request_key(request: Any, metadata: Sequence[Tuple[str, str]]) -> Hashable:
+    """Returns the key under which identical requests are coalesced."""
+    if isinstance(request, proto.Message):
+        payload = type(request).serialize(request)
+    else:
+        payload = request.SerializeToString()
+    return type(request).__name__, payload, tuple(metadata)
+
+
+def _copy(response: Any) -> Any:
+    # Waiters get their own copy, so that no caller sees another's changes.
+    if isinstance(response, proto.Message):
+        return type(response)(response)
+    copy = type(response)()
+    copy.CopyFrom(response)
+    return copy
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Coalesces identical blocking calls made from several threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def call(self, key: Hashable, send: Callable[[], Any]) -> Any:
+        """Returns the result of ``send()``, shared by calls with ``key``.
+
+        The first caller with a given key runs ``send``; callers arriving
+        while it is in flight block until it finishes, then get a copy of
+        its response or the same exception.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(flight.response)
+
+        try:
+            flight.response = send()
+            return flight.response
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """Coalesces identical calls made from several tasks."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    async def call(self, key: Hashable, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the result of ``await send()``, shared by calls with ``key``.
+
+        The call runs in a task of its own, so cancelling one waiter does
+        not cancel it for the others.
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            return _copy(await asyncio.shield(flight))
+
+        flight = asyncio.ensure_future(send())
+        self._flights[key] = flight
+        flight.add_done_callback(lambda _: self._flights.pop(key, None))
+        return await asyncio.shield(flight)
+
+
+__all__ = (
+    "AsyncSingleFlight",
+    "SingleFlight",
+    "request_key",
+)
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Columnar conversion of paged responses to Arrow tables.
+
+The messages of a repeated field are read straight from each page's
+protobuf message into one list per column, and each page becomes an
+Arrow record batch, so no proto-plus object is made for any row.
+
+A column is a field of the message, or a dotted path to a field of a
+nested message, such as ``source_system_timestamps.update_time``. Enums
+become their names, timestamps become UTC timestamps in microseconds,
+maps become Arrow maps and other messages their JSON form. Fields with
+presence, such as the members of a oneof, are null when they are not
+set.
+"""
+import json
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence
+
+from google.protobuf import descriptor as pb_descriptor
+from google.protobuf import json_format
+from google.protobuf import message as pb_message
+
+_FieldDescriptor = pb_descriptor.FieldDescriptor
+
+_TIMESTAMP = "google.protobuf.Timestamp"
+
+
+def _pyarrow():
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as exc:
+        raise ImportError(
+            "Columnar conversion requires pyarrow. Install it with "
+            "`pip install google-cloud-datacatalog[pandas]`."
+        ) from exc
+    return pyarrow
+
+
+def _is_repeated(field: _FieldDescriptor) -> bool:
+    if hasattr(field, "is_repeated"):
+        return field.is_repeated
+    return field.label == _FieldDescriptor.LABEL_REPEATED
+
+
+def _has_presence(field: _FieldDescriptor) -> bool:
+    if _is_repeated(field):
+        return False
+    return (
+        field.type == _FieldDescriptor.TYPE_MESSAGE
+        or field.containing_oneof is not None
+    )
+
+
+def _is_map(field: _FieldDescriptor) -> bool:
+    return (
+        _is_repeated(field)
+        and field.message_type is not None
+        and field.message_type.GetOptions().map_entry
+    )
+
+
+_SCALAR_TYPES = {
+    _FieldDescriptor.TYPE_STRING: "string",
+    _FieldDescriptor.TYPE_BYTES: "binary",
+    _FieldDescriptor.TYPE_BOOL: "bool_",
+    _FieldDescriptor.TYPE_DOUBLE: "float64",
+    _FieldDescriptor.TYPE_FLOAT: "float32",
+    _FieldDescriptor.TYPE_INT32: "int32",
+    _FieldDescriptor.TYPE_SINT32: "int32",
+    _FieldDescriptor.TYPE_SFIXED32: "int32",
+    _FieldDescriptor.TYPE_UINT32: "uint32",
+    _FieldDescriptor.TYPE_FIXED32: "uint32",
+    _FieldDescriptor.TYPE_INT64: "int64",
+    _FieldDescriptor.TYPE_SINT64: "int64",
+    _FieldDescriptor.TYPE_SFIXED64: "int64",
+    _FieldDescriptor.TYPE_UINT64: "uint64",
+    _FieldDescriptor.TYPE_FIXED64: "uint64",
+}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _timestamp_micros(value: pb_message.Message) -> int:
+    return value.seconds * 10 ** 6 + value.nanos // 1000
+
+
+def _message_json(value: pb_message.Message) -> str:
+    return json.dumps(
+        json_format.MessageToDict(value, preserving_proto_field_name=True),
+        separators=(",", ":"),
+    )
+
+
+def _element(field: _FieldDescriptor):
+    # The conversion of one value of the field, and its Arrow type.
+    if field.type == _FieldDescriptor.TYPE_ENUM:
+        values = {value.number: value.name for value in field.enum_type.values}
+
+        def enum_name(value: int) -> str:
+            return values.get(value, str(value))
+
+        return enum_name, lambda pa: pa.string()
+    if field.type == _FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name == _TIMESTAMP:
+            return _timestamp_micros, lambda pa: pa.timestamp("us", tz="UTC")
+        return _message_json, lambda pa: pa.string()
+    type_name = _SCALAR_TYPES[field.type]
+    return _identity, lambda pa: getattr(pa, type_name)()
+
+
+class _Column(NamedTuple):
+    name: str
+    # Reads the column's value from a message.
+    get: Callable[[pb_message.Message], Any]
+    # Returns the column's Arrow type, given the pyarrow module.
+    arrow_type: Callable[[Any], Any]
+
+
+def _column(descriptor: pb_descriptor.Descriptor, name: str) -> _Column:
+    fields = []
+    for part in name.split("."):
+        if descriptor is None or part not in descriptor.fields_by_name:
+            raise ValueError("Unknown column {!r}.".format(name))
+        field = descriptor.fields_by_name[part]
+        fields.append(field)
+        descriptor = field.message_type
+        if _is_repeated(field) or (
+            descriptor is not None and descriptor.full_name == _TIMESTAMP
+        ):
+            descriptor = None
+    *parents, leaf = fields
+
+    if _is_map(leaf):
+        key, value = leaf.message_type.fields
+        convert_value, value_type = _element(value)
+
+        def convert(values):
+            return [(k, convert_value(v)) for k, v in values.items()]
+
+        def arrow_type(pa):
+            return pa.map_(_element(key)[1](pa), value_type(pa))
+
+    elif _is_repeated(leaf):
+        convert_element, element_type = _element(leaf)
+
+        def convert(values):
+            return [convert_element(v) for v in values]
+
+        def arrow_type(pa):
+            return pa.list_(element_type(pa))
+
+    else:
+        convert, arrow_type = _element(leaf)
+
+    leaf_name = leaf.name
+    if not parents and not _has_presence(leaf):
+        if convert is _identity:
+
+            def get(message):
+                return getattr(message, leaf_name)
+
+        else:
+
+            def get(message):
+                return convert(getattr(message, leaf_name))
+
+        return _Column(name, get, arrow_type)
+
+    # Each parent is a singular message, which is null when not set.
+    parent_names = [field.name for field in parents]
+    leaf_presence = _has_presence(leaf)
+
+    def get(message):
+        for parent in parent_names:
+            if not message.HasField(parent):
+                return None
+            message = getattr(message, parent)
+        if leaf_presence and not message.HasField(leaf_name):
+            return None
+        return convert(getattr(message, leaf_name))
+
+    return _Column(name, get, arrow_type)
+
+
+def default_columns(descriptor: pb_descriptor.Descriptor) -> List[str]:
+    """Returns the columns converted when none are given.
+
+    These are the fields of the message that are not nested messages,
+    other than timestamps and maps.
+    """
+    return [
+        field.name
+        for field in descriptor.fields
+        if field.type != _FieldDescriptor.TYPE_MESSAGE
+        or _is_map(field)
+        or field.message_type.full_name == _TIMESTAMP
+    ]
+
+
+def _columns(
+    descriptor: pb_descriptor.Descriptor, names: Sequence[str] = None
+) -> List[_Column]:
+    if names is None:
+        names = default_columns(descriptor)
+    if isinstance(names, str):
+        raise TypeError("columns must be a sequence of column names.")
+    if len(set(names)) != len(names):
+        raise ValueError("Columns must not be repeated.")
+    return [_column(descriptor, name) for name in names]
+
+
+def _column_values(
+    messages: Sequence[pb_message.Message], columns: Sequence[_Column]
+) -> Dict[str, List]:
+    return {column.name: [column.get(m) for m in messages] for column in columns}
+
+
+def _page_messages(page: Any, field: str) -> Sequence[pb_message.Message]:
+    # Pages are protobuf messages already if the pager is raw.
+    if not isinstance(page, pb_message.Message):
+        page = type(page).pb(page)
+    return getattr(page, field)
+
+
+def to_arrow(
+    pages: Iterable[Any],
+    field: str,
+    descriptor: pb_descriptor.Descriptor,
+    columns: Sequence[str] = None,
+):
+    """Converts the messages of ``field`` on each page to an Arrow table.
+
+    Args:
+        pages (Iterable): The pages, as proto-plus or protobuf messages.
+        field (str): The repeated field of each page that holds the rows.
+        descriptor (google.protobuf.descriptor.Descriptor): The descriptor
+            of the messages of that field.
+        columns (Sequence[str]): The columns to convert. Defaults to
+            :func:`default_columns`.
+
+    Returns:
+        pyarrow.Table: One row per message, with one record batch per
+        page.
+
+    Raises:
+        ValueError: If a column is not a field of the message.
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    resolved = _columns(descriptor, columns)
+    pa = _pyarrow()
+    schema = pa.schema([(column.name, column.arrow_type(pa)) for column in resolved])
+    batches = []
+    for page in pages:
+        values = _column_values(_page_messages(page, field), resolved)
+        batches.append(
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array(values[column.name], type=schema.field(i).type)
+                    for i, column in enumerate(resolved)
+                ],
+                schema=schema,
+            )
+        )
+    return pa.Table.from_batches(batches, schema=schema)
+
+
+def to_pandas(
+    pages: Iterable[Any],
+    field: str,
+    descriptor: pb_descriptor.Descriptor,
+    columns: Sequence[str] = None,
+):
+    """Converts the messages of ``field`` on each page to a DataFrame.
+
+    This is :func:`to_arrow`, then ``pyarrow.Table.to_pandas``.
+
+    Raises:
+        ValueError: If a column is not a field of the message.
+        ImportError: If ``pyarrow`` or ``pandas`` is not installed.
+    """
+    try:
+        import pandas  # type: ignore  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "to_pandas requires pandas. Install it with "
+            "`pip install google-cloud-datacatalog[pandas]`."
+        ) from exc
+    return to_arrow(pages, field, descriptor, columns).to_pandas()
@@ -0,0 +1,1072 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An in-memory Data Catalog server for tests and load tests.
+
+:class:`DataCatalogEmulator` serves the ``DataCatalog``,
+``PolicyTagManager`` and ``PolicyTagManagerSerialization`` gRPC services
+of ``google.cloud.datacatalog.v1`` on localhost, so that clients can be
+pointed at it and measured end to end, serialization and channels
+included, without network access::
+
+    with DataCatalogEmulator(latency=0.005) as emulator:
+        client = DataCatalogClient(
+            transport=DataCatalogGrpcTransport(channel=emulator.channel())
+        )
+        client.create_entry_group(...)
+
+Resources are kept in memory. List and search calls are paged, update
+masks and read masks are applied, and searches go through a
+:class:`~.local_search.SearchIndex`. IAM policies are stored, but never
+enforced: every permission tested is granted. Each call can be delayed
+and can fail, at a given rate or on demand, to exercise retries.
+"""
+import bisect
+import collections
+import concurrent.futures
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import grpc  # type: ignore
+
+from google.cloud.datacatalog_v1 import local_search
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanager
+from google.cloud.datacatalog_v1.types import policytagmanagerserialization
+from google.cloud.datacatalog_v1.types import tags as gcd_tags
+from google.iam.v1 import iam_policy_pb2  # type: ignore
+from google.iam.v1 import policy_pb2  # type: ignore
+from google.protobuf import empty_pb2  # type: ignore
+from google.protobuf import field_mask_pb2  # type: ignore
+
+_PACKAGE = "google.cloud.datacatalog.v1."
+
+# Fields that proto-plus renames, by their name in update masks.
+_RENAMED_FIELDS = {"type": "type_"}
+
+_MAX_PAGE_SIZE = 1000
+
+
+class _Error(Exception):
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+def _not_found(name: str) -> _Error:
+    return _Error(grpc.StatusCode.NOT_FOUND, "Resource not found: {}".format(name))
+
+
+def _copy(message):
+    copy = type(message)()
+    copy.CopyFrom(message)
+    return copy
+
+
+def _mask(mask: field_mask_pb2.FieldMask, message) -> field_mask_pb2.FieldMask:
+    paths = [
+        ".".join(_RENAMED_FIELDS.get(part, part) for part in path.split("."))
+        for path in mask.paths
+    ]
+    mask = field_mask_pb2.FieldMask(paths=paths)
+    if not mask.IsValidForDescriptor(message.DESCRIPTOR):
+        raise _Error(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Invalid field mask: {}".format(", ".join(mask.paths)),
+        )
+    return mask
+
+
+def _update(target, source, update_mask: field_mask_pb2.FieldMask) -> None:
+    # Every field is replaced unless the mask names some.
+    if update_mask.paths:
+        _mask(update_mask, target).MergeMessage(
+            source, target, replace_message_field=True, replace_repeated_field=True
+        )
+    else:
+        name = target.name
+        target.CopyFrom(source)
+        target.name = name
+
+
+def _project(message, read_mask: field_mask_pb2.FieldMask):
+    if not read_mask.paths:
+        return _copy(message)
+    projection = type(message)()
+    _mask(read_mask, message).MergeMessage(message, projection)
+    return projection
+
+
+def _check_id(resource_id: str) -> None:
+    if not resource_id or "/" in resource_id:
+        raise _Error(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Invalid resource ID: {!r}".format(resource_id),
+        )
+
+
+class _Collection:
+    """Resources of one kind, by name, and the names of each parent's
+    children in order."""
+
+    def __init__(self):
+        self._resources: Dict[str, Any] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._parents: Dict[str, str] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._resources
+
+    def __iter__(self):
+        return iter(list(self._resources.values()))
+
+    def get(self, name: str):
+        try:
+            return self._resources[name]
+        except KeyError:
+            raise _not_found(name)
+
+    def add(self, parent: str, name: str, resource) -> None:
+        if name in self._resources:
+            raise _Error(
+                grpc.StatusCode.ALREADY_EXISTS, "Resource already exists: " + name
+            )
+        resource.name = name
+        self._resources[name] = resource
+        self._parents[name] = parent
+        bisect.insort(self._children.setdefault(parent, []), name)
+
+    def remove(self, name: str):
+        resource = self.get(name)
+        del self._resources[name]
+        siblings = self._children[self._parents.pop(name)]
+        del siblings[bisect.bisect_left(siblings, name)]
+        return resource
+
+    def children(self, parent: str) -> List:
+        return [self._resources[name] for name in self._children.get(parent, ())]
+
+    def page(self, parent: str, page_size: int, page_token: str, default: int):
+        names = self._children.get(parent, [])
+        start = bisect.bisect_right(names, page_token) if page_token else 0
+        page_size = _page_size(page_size, default)
+        page = names[start : start + page_size]
+        next_token = page[-1] if start + page_size < len(names) else ""
+        return [self._resources[name] for name in page], next_token
+
+
+def _page_size(page_size: int, default: int) -> int:
+    if page_size < 0 or page_size > _MAX_PAGE_SIZE:
+        raise _Error(
+            grpc.StatusCode.INVALID_ARGUMENT, "Invalid page size: {}".format(page_size),
+        )
+    return page_size or default
+
+
+class DataCatalogEmulator:
+    """An in-memory Data Catalog gRPC server on localhost."""
+
+    def __init__(
+        self,
+        *,
+        host: str = "localhost",
+        port: int = 0,
+        max_workers: int = 10,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        default_page_size: int = 10,
+        seed: Optional[int] = None,
+    ):
+        """Instantiate the emulator.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on. By default, a free port is
+                picked when the emulator starts.
+            max_workers (int): The number of threads serving calls.
+            latency (float): Seconds by which every call is delayed.
+            error_rate (float): The fraction of calls, from 0 to 1, that
+                fail with ``error_code`` instead of being served.
+            error_code (grpc.StatusCode): The status of those failures.
+            default_page_size (int): The page size of list and search
+                calls that do not set one.
+            seed (Optional[int]): Seeds the choice of failing calls.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.default_page_size = default_page_size
+        self.calls: collections.Counter = collections.Counter()
+        self._host = host
+        self._port = port
+        self._max_workers = max_workers
+        self._random = random.Random(seed)
+        self._failures: Dict[str, List[Tuple[grpc.StatusCode, int]]] = {}
+        self._server: Optional[grpc.Server] = None
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+
+        self.entry_groups = _Collection()
+        self.entries = _Collection()
+        self.tag_templates = _Collection()
+        self.tags = _Collection()
+        self.taxonomies = _Collection()
+        self.policy_tags = _Collection()
+        self._policies: Dict[str, policy_pb2.Policy] = {}
+        self._linked_resources: Dict[str, str] = {}
+        self._fully_qualified_names: Dict[str, str] = {}
+        self._search_index: Optional[local_search.SearchIndex] = None
+
+    @property
+    def address(self) -> str:
+        """The ``host:port`` the emulator listens on, once started."""
+        return "{}:{}".format(self._host, self._port)
+
+    def start(self) -> "DataCatalogEmulator":
+        """Starts serving calls."""
+        if self._server is not None:
+            raise ValueError("The emulator is already running.")
+        self._server = grpc.server(
+            concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        )
+        self._server.add_generic_rpc_handlers(self._handlers())
+        self._port = self._server.add_insecure_port(self.address)
+        self._server.start()
+        return self
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        """Stops serving calls, and waits for the server to shut down."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    def channel(self, options=None) -> grpc.Channel:
+        """Returns a new channel to the emulator, to pass to a transport."""
+        return grpc.insecure_channel(self.address, options=options)
+
+    def fail_next(
+        self,
+        method: str,
+        code: grpc.StatusCode = grpc.StatusCode.UNAVAILABLE,
+        count: int = 1,
+    ) -> None:
+        """Fails the next ``count`` calls to ``method``, such as
+        ``"GetEntry"``, with ``code``."""
+        with self._lock:
+            self._failures.setdefault(method, []).append((code, count))
+
+    def _handlers(self) -> Tuple[grpc.GenericRpcHandler, ...]:
+        iam = [
+            ("SetIamPolicy", iam_policy_pb2.SetIamPolicyRequest, self._set_iam_policy),
+            ("GetIamPolicy", iam_policy_pb2.GetIamPolicyRequest, self._get_iam_policy),
+            (
+                "TestIamPermissions",
+                iam_policy_pb2.TestIamPermissionsRequest,
+                self._test_iam_permissions,
+            ),
+        ]
+        services = {
+            "DataCatalog": [
+                (
+                    "SearchCatalog",
+                    datacatalog.SearchCatalogRequest,
+                    self._search_catalog,
+                ),
+                (
+                    "CreateEntryGroup",
+                    datacatalog.CreateEntryGroupRequest,
+                    self._create_entry_group,
+                ),
+                (
+                    "GetEntryGroup",
+                    datacatalog.GetEntryGroupRequest,
+                    self._get_entry_group,
+                ),
+                (
+                    "UpdateEntryGroup",
+                    datacatalog.UpdateEntryGroupRequest,
+                    self._update_entry_group,
+                ),
+                (
+                    "DeleteEntryGroup",
+                    datacatalog.DeleteEntryGroupRequest,
+                    self._delete_entry_group,
+                ),
+                (
+                    "ListEntryGroups",
+                    datacatalog.ListEntryGroupsRequest,
+                    self._list_entry_groups,
+                ),
+                ("CreateEntry", datacatalog.CreateEntryRequest, self._create_entry),
+                ("UpdateEntry", datacatalog.UpdateEntryRequest, self._update_entry),
+                ("DeleteEntry", datacatalog.DeleteEntryRequest, self._delete_entry),
+                ("GetEntry", datacatalog.GetEntryRequest, self._get_entry),
+                ("LookupEntry", datacatalog.LookupEntryRequest, self._lookup_entry),
+                ("ListEntries", datacatalog.ListEntriesRequest, self._list_entries),
+                (
+                    "CreateTagTemplate",
+                    datacatalog.CreateTagTemplateRequest,
+                    self._create_tag_template,
+                ),
+                (
+                    "GetTagTemplate",
+                    datacatalog.GetTagTemplateRequest,
+                    self._get_tag_template,
+                ),
+                (
+                    "UpdateTagTemplate",
+                    datacatalog.UpdateTagTemplateRequest,
+                    self._update_tag_template,
+                ),
+                (
+                    "DeleteTagTemplate",
+                    datacatalog.DeleteTagTemplateRequest,
+                    self._delete_tag_template,
+                ),
+                (
+                    "CreateTagTemplateField",
+                    datacatalog.CreateTagTemplateFieldRequest,
+                    self._create_tag_template_field,
+                ),
+                (
+                    "UpdateTagTemplateField",
+                    datacatalog.UpdateTagTemplateFieldRequest,
+                    self._update_tag_template_field,
+                ),
+                (
+                    "RenameTagTemplateField",
+                    datacatalog.RenameTagTemplateFieldRequest,
+                    self._rename_tag_template_field,
+                ),
+                (
+                    "RenameTagTemplateFieldEnumValue",
+                    datacatalog.RenameTagTemplateFieldEnumValueRequest,
+                    self._rename_tag_template_field_enum_value,
+                ),
+                (
+                    "DeleteTagTemplateField",
+                    datacatalog.DeleteTagTemplateFieldRequest,
+                    self._delete_tag_template_field,
+                ),
+                ("CreateTag", datacatalog.CreateTagRequest, self._create_tag),
+                ("UpdateTag", datacatalog.UpdateTagRequest, self._update_tag),
+                ("DeleteTag", datacatalog.DeleteTagRequest, self._delete_tag),
+                ("ListTags", datacatalog.ListTagsRequest, self._list_tags),
+            ]
+            + iam,
+            "PolicyTagManager": [
+                (
+                    "CreateTaxonomy",
+                    policytagmanager.CreateTaxonomyRequest,
+                    self._create_taxonomy,
+                ),
+                (
+                    "DeleteTaxonomy",
+                    policytagmanager.DeleteTaxonomyRequest,
+                    self._delete_taxonomy,
+                ),
+                (
+                    "UpdateTaxonomy",
+                    policytagmanager.UpdateTaxonomyRequest,
+                    self._update_taxonomy,
+                ),
+                (
+                    "ListTaxonomies",
+                    policytagmanager.ListTaxonomiesRequest,
+                    self._list_taxonomies,
+                ),
+                (
+                    "GetTaxonomy",
+                    policytagmanager.GetTaxonomyRequest,
+                    self._get_taxonomy,
+                ),
+                (
+                    "CreatePolicyTag",
+                    policytagmanager.CreatePolicyTagRequest,
+                    self._create_policy_tag,
+                ),
+                (
+                    "DeletePolicyTag",
+                    policytagmanager.DeletePolicyTagRequest,
+                    self._delete_policy_tag,
+                ),
+                (
+                    "UpdatePolicyTag",
+                    policytagmanager.UpdatePolicyTagRequest,
+                    self._update_policy_tag,
+                ),
+                (
+                    "ListPolicyTags",
+                    policytagmanager.ListPolicyTagsRequest,
+                    self._list_policy_tags,
+                ),
+                (
+                    "GetPolicyTag",
+                    policytagmanager.GetPolicyTagRequest,
+                    self._get_policy_tag,
+                ),
+            ]
+            + iam,
+            "PolicyTagManagerSerialization": [
+                (
+                    "ReplaceTaxonomy",
+                    policytagmanagerserialization.ReplaceTaxonomyRequest,
+                    self._replace_taxonomy,
+                ),
+                (
+                    "ImportTaxonomies",
+                    policytagmanagerserialization.ImportTaxonomiesRequest,
+                    self._import_taxonomies,
+                ),
+                (
+                    "ExportTaxonomies",
+                    policytagmanagerserialization.ExportTaxonomiesRequest,
+                    self._export_taxonomies,
+                ),
+            ],
+        }
+        return tuple(
+            grpc.method_handlers_generic_handler(
+                _PACKAGE + service,
+                {
+                    method: self._method_handler(method, request_type, handler)
+                    for method, request_type, handler in methods
+                },
+            )
+            for service, methods in services.items()
+        )
+
+    def _method_handler(
+        self, method: str, request_type, handler: Callable
+    ) -> grpc.RpcMethodHandler:
+        if hasattr(request_type, "pb"):
+            # The emulator works on the raw protobuf messages.
+            request_type = request_type.pb()
+
+        def handle(request, context):
+            self._inject(method, context)
+            try:
+                with self._lock:
+                    return handler(request)
+            except _Error as exc:
+                context.abort(exc.code, exc.details)
+
+        return grpc.unary_unary_rpc_method_handler(
+            handle,
+            request_deserializer=request_type.FromString,
+            response_serializer=lambda response: response.SerializeToString(),
+        )
+
+    def _inject(self, method: str, context: grpc.ServicerContext) -> None:
+        with self._lock:
+            self.calls[method] += 1
+            code = None
+            failures = self._failures.get(method)
+            if failures:
+                code, count = failures[0]
+                if count > 1:
+                    failures[0] = (code, count - 1)
+                else:
+                    failures.pop(0)
+            elif self.error_rate and self._random.random() < self.error_rate:
+                code = self.error_code
+        if self.latency:
+            time.sleep(self.latency)
+        if code is not None:
+            context.abort(code, "Injected failure of {}.".format(method))
+
+    def _new_id(self) -> str:
+        return str(next(self._ids))
+
+    # Entry groups and entries.
+
+    def _create_entry_group(self, request):
+        _check_id(request.entry_group_id)
+        entry_group = _copy(request.entry_group)
+        entry_group.data_catalog_timestamps.create_time.GetCurrentTime()
+        entry_group.data_catalog_timestamps.update_time.CopyFrom(
+            entry_group.data_catalog_timestamps.create_time
+        )
+        self.entry_groups.add(
+            request.parent,
+            "{}/entryGroups/{}".format(request.parent, request.entry_group_id),
+            entry_group,
+        )
+        return _copy(entry_group)
+
+    def _get_entry_group(self, request):
+        return _project(self.entry_groups.get(request.name), request.read_mask)
+
+    def _update_entry_group(self, request):
+        entry_group = self.entry_groups.get(request.entry_group.name)
+        timestamps = _copy(entry_group.data_catalog_timestamps)
+        _update(entry_group, request.entry_group, request.update_mask)
+        entry_group.data_catalog_timestamps.CopyFrom(timestamps)
+        entry_group.data_catalog_timestamps.update_time.GetCurrentTime()
+        return _copy(entry_group)
+
+    def _delete_entry_group(self, request):
+        self.entry_groups.get(request.name)
+        entries = self.entries.children(request.name)
+        if entries and not request.force:
+            raise _Error(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "Entry group is not empty: " + request.name,
+            )
+        for entry in entries:
+            self._remove_entry(entry.name)
+        for tag in self.tags.children(request.name):
+            self.tags.remove(tag.name)
+        self.entry_groups.remove(request.name)
+        self._policies.pop(request.name, None)
+        return empty_pb2.Empty()
+
+    def _list_entry_groups(self, request):
+        entry_groups, next_page_token = self.entry_groups.page(
+            request.parent,
+            request.page_size,
+            request.page_token,
+            self.default_page_size,
+        )
+        return datacatalog.ListEntryGroupsResponse.pb()(
+            entry_groups=entry_groups, next_page_token=next_page_token
+        )
+
+    def _index_entry(self, entry, add: bool) -> None:
+        for index, key in (
+            (self._linked_resources, entry.linked_resource),
+            (self._fully_qualified_names, entry.fully_qualified_name),
+        ):
+            if not key:
+                continue
+            if add:
+                index[key] = entry.name
+            elif index.get(key) == entry.name:
+                del index[key]
+        self._search_index = None
+
+    def _create_entry(self, request):
+        _check_id(request.entry_id)
+        self.entry_groups.get(request.parent)
+        entry = _copy(request.entry)
+        self.entries.add(
+            request.parent,
+            "{}/entries/{}".format(request.parent, request.entry_id),
+            entry,
+        )
+        self._index_entry(entry, add=True)
+        return _copy(entry)
+
+    def _update_entry(self, request):
+        entry = self.entries.get(request.entry.name)
+        self._index_entry(entry, add=False)
+        _update(entry, request.entry, request.update_mask)
+        self._index_entry(entry, add=True)
+        return _copy(entry)
+
+    def _remove_entry(self, name: str) -> None:
+        for tag in self.tags.children(name):
+            self.tags.remove(tag.name)
+        self._index_entry(self.entries.remove(name), add=False)
+
+    def _delete_entry(self, request):
+        self._remove_entry(request.name)
+        return empty_pb2.Empty()
+
+    def _get_entry(self, request):
+        return _copy(self.entries.get(request.name))
+
+    def _lookup_entry(self, request):
+        target = request.WhichOneof("target_name")
+        if target == "linked_resource":
+            name = self._linked_resources.get(request.linked_resource)
+        elif target == "fully_qualified_name":
+            name = self._fully_qualified_names.get(request.fully_qualified_name)
+        else:
+            raise _Error(
+                grpc.StatusCode.UNIMPLEMENTED,
+                "The emulator only looks up linked resources and fully qualified names.",
+            )
+        if name is None:
+            raise _not_found(getattr(request, target))
+        return _copy(self.entries.get(name))
+
+    def _list_entries(self, request):
+        self.entry_groups.get(request.parent)
+        entries, next_page_token = self.entries.page(
+            request.parent,
+            request.page_size,
+            request.page_token,
+            self.default_page_size,
+        )
+        return datacatalog.ListEntriesResponse.pb()(
+            entries=[_project(entry, request.read_mask) for entry in entries],
+            next_page_token=next_page_token,
+        )
+
+    def _search_catalog(self, request):
+        scope = request.scope
+        if not (
+            scope.include_org_ids
+            or scope.include_project_ids
+            or scope.include_gcp_public_datasets
+        ):
+            raise _Error(grpc.StatusCode.INVALID_ARGUMENT, "The search scope is empty.")
+        if self._search_index is None:
+            tags = collections.defaultdict(list)
+            for tag in self.tags:
+                tags[tag.name.rsplit("/tags/", 1)[0]].append(gcd_tags.Tag.wrap(tag))
+            self._search_index = local_search.SearchIndex(
+                [datacatalog.Entry.wrap(entry) for entry in self.entries], tags
+            )
+        try:
+            results = self._search_index.search_catalog(
+                datacatalog.SearchCatalogRequest.wrap(request)
+            )
+        except ValueError as exc:
+            raise _Error(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+        start = int(request.page_token or 0)
+        page_size = _page_size(request.page_size, self.default_page_size)
+        end = start + page_size
+        return datacatalog.SearchCatalogResponse.pb()(
+            results=[type(result).pb(result) for result in results[start:end]],
+            next_page_token=str(end) if end < len(results) else "",
+        )
+
+    # Tag templates and tags.
+
+    def _create_tag_template(self, request):
+        _check_id(request.tag_template_id)
+        template = _copy(request.tag_template)
+        name = "{}/tagTemplates/{}".format(request.parent, request.tag_template_id)
+        for field_id, field in template.fields.items():
+            field.name = "{}/fields/{}".format(name, field_id)
+        self.tag_templates.add(request.parent, name, template)
+        return _copy(template)
+
+    def _get_tag_template(self, request):
+        return _copy(self.tag_templates.get(request.name))
+
+    def _update_tag_template(self, request):
+        template = self.tag_templates.get(request.tag_template.name)
+        fields = dict(template.fields)
+        _update(template, request.tag_template, request.update_mask)
+        # Fields are changed with the tag template field methods only.
+        template.ClearField("fields")
+        for field_id, field in fields.items():
+            template.fields[field_id].CopyFrom(field)
+        return _copy(template)
+
+    def _template_tags(self, template: str) -> List:
+        return [tag for tag in self.tags if tag.template == template]
+
+    def _delete_tag_template(self, request):
+        self.tag_templates.get(request.name)
+        tags = self._template_tags(request.name)
+        if tags and not request.force:
+            raise _Error(
+                grpc.StatusCode.FAILED_PRECONDITION,
+                "Tag template is in use: " + request.name,
+            )
+        for tag in tags:
+            self.tags.remove(tag.name)
+        self.tag_templates.remove(request.name)
+        self._policies.pop(request.name, None)
+        self._search_index = None
+        return empty_pb2.Empty()
+
+    def _template_field(self, name: str):
+        template_name, _, field_id = name.partition("/fields/")
+        template = self.tag_templates.get(template_name)
+        if field_id not in template.fields:
+            raise _not_found(name)
+        return template, field_id
+
+    def _create_tag_template_field(self, request):
+        _check_id(request.tag_template_field_id)
+        template = self.tag_templates.get(request.parent)
+        if request.tag_template_field_id in template.fields:
+            raise _Error(
+                grpc.StatusCode.ALREADY_EXISTS,
+                "Field already exists: " + request.tag_template_field_id,
+            )
+        field = template.fields[request.tag_template_field_id]
+        field.CopyFrom(request.tag_template_field)
+        field.name = "{}/fields/{}".format(
+            request.parent, request.tag_template_field_id
+        )
+        return _copy(field)
+
+    def _update_tag_template_field(self, request):
+        template, field_id = self._template_field(request.name)
+        _update(
+            template.fields[field_id], request.tag_template_field, request.update_mask
+        )
+        return _copy(template.fields[field_id])
+
+    def _rename_tag_template_field(self, request):
+        template, field_id = self._template_field(request.name)
+        new_id = request.new_tag_template_field_id
+        _check_id(new_id)
+        if new_id in template.fields:
+            raise _Error(
+                grpc.StatusCode.ALREADY_EXISTS, "Field already exists: " + new_id
+            )
+        field = template.fields[new_id]
+        field.CopyFrom(template.fields[field_id])
+        field.name = "{}/fields/{}".format(template.name, new_id)
+        del template.fields[field_id]
+        for tag in self._template_tags(template.name):
+            if field_id in tag.fields:
+                tag.fields[new_id].CopyFrom(tag.fields[field_id])
+                del tag.fields[field_id]
+        self._search_index = None
+        return _copy(field)
+
+    def _rename_tag_template_field_enum_value(self, request):
+        field_name, _, display_name = request.name.partition("/enumValues/")
+        template, field_id = self._template_field(field_name)
+        field = template.fields[field_id]
+        values = field.type_.enum_type.allowed_values
+        new_name = request.new_enum_value_display_name
+        if any(value.display_name == new_name for value in values):
+            raise _Error(
+                grpc.StatusCode.ALREADY_EXISTS, "Enum value already exists: " + new_name
+            )
+        for value in values:
+            if value.display_name == display_name:
+                value.display_name = new_name
+                break
+        else:
+            raise _not_found(request.name)
+        for tag in self._template_tags(template.name):
+            tag_field = tag.fields.get(field_id)
+            if (
+                tag_field is not None
+                and tag_field.enum_value.display_name == display_name
+            ):
+                tag_field.enum_value.display_name = new_name
+        self._search_index = None
+        return _copy(field)
+
+    def _delete_tag_template_field(self, request):
+        template, field_id = self._template_field(request.name)
+        tags = [
+            tag for tag in self._template_tags(template.name) if field_id in tag.fields
+        ]
+        if tags and not request.force:
+            raise _Error(
+                grpc.StatusCode.FAILED_PRECONDITION, "Field is in use: " + request.name
+            )
+        for tag in tags:
+            del tag.fields[field_id]
+        del template.fields[field_id]
+        self._search_index = None
+        return empty_pb2.Empty()
+
+    def _create_tag(self, request):
+        if (
+            request.parent not in self.entries
+            and request.parent not in self.entry_groups
+        ):
+            raise _not_found(request.parent)
+        template = self.tag_templates.get(request.tag.template)
+        tag = _copy(request.tag)
+        tag.template_display_name = template.display_name
+        self.tags.add(
+            request.parent, "{}/tags/{}".format(request.parent, self._new_id()), tag
+        )
+        self._search_index = None
+        return _copy(tag)
+
+    def _update_tag(self, request):
+        tag = self.tags.get(request.tag.name)
+        template, template_display_name = tag.template, tag.template_display_name
+        _update(tag, request.tag, request.update_mask)
+        tag.template, tag.template_display_name = template, template_display_name
+        self._search_index = None
+        return _copy(tag)
+
+    def _delete_tag(self, request):
+        self.tags.remove(request.name)
+        self._search_index = None
+        return empty_pb2.Empty()
+
+    def _list_tags(self, request):
+        tags, next_page_token = self.tags.page(
+            request.parent,
+            request.page_size,
+            request.page_token,
+            self.default_page_size,
+        )
+        return datacatalog.ListTagsResponse.pb()(
+            tags=tags, next_page_token=next_page_token
+        )
+
+    # Taxonomies and policy tags.
+
+    def _taxonomy(self, taxonomy):
+        # Fills in the output only fields.
+        taxonomy = _copy(taxonomy)
+        taxonomy.policy_tag_count = len(self.policy_tags.children(taxonomy.name))
+        return taxonomy
+
+    def _policy_tag(self, policy_tag):
+        policy_tag = _copy(policy_tag)
+        taxonomy = policy_tag.name.rsplit("/policyTags/", 1)[0]
+        policy_tag.child_policy_tags[:] = [
+            child.name
+            for child in self.policy_tags.children(taxonomy)
+            if child.parent_policy_tag == policy_tag.name
+        ]
+        return policy_tag
+
+    def _add_taxonomy(self, parent: str, taxonomy):
+        taxonomy.taxonomy_timestamps.create_time.GetCurrentTime()
+        taxonomy.taxonomy_timestamps.update_time.CopyFrom(
+            taxonomy.taxonomy_timestamps.create_time
+        )
+        self.taxonomies.add(
+            parent, "{}/taxonomies/{}".format(parent, self._new_id()), taxonomy
+        )
+        return taxonomy
+
+    def _create_taxonomy(self, request):
+        taxonomy = _copy(request.taxonomy)
+        taxonomy.ClearField("policy_tag_count")
+        return self._taxonomy(self._add_taxonomy(request.parent, taxonomy))
+
+    def _delete_taxonomy(self, request):
+        for policy_tag in self.policy_tags.children(request.name):
+            self.policy_tags.remove(policy_tag.name)
+            self._policies.pop(policy_tag.name, None)
+        self.taxonomies.remove(request.name)
+        self._policies.pop(request.name, None)
+        return empty_pb2.Empty()
+
+    def _update_taxonomy(self, request):
+        taxonomy = self.taxonomies.get(request.taxonomy.name)
+        timestamps = _copy(taxonomy.taxonomy_timestamps)
+        _update(taxonomy, request.taxonomy, request.update_mask)
+        taxonomy.taxonomy_timestamps.CopyFrom(timestamps)
+        taxonomy.taxonomy_timestamps.update_time.GetCurrentTime()
+        return self._taxonomy(taxonomy)
+
+    def _list_taxonomies(self, request):
+        taxonomies, next_page_token = self.taxonomies.page(
+            request.parent,
+            request.page_size,
+            request.page_token,
+            self.default_page_size,
+        )
+        return policytagmanager.ListTaxonomiesResponse.pb()(
+            taxonomies=[self._taxonomy(taxonomy) for taxonomy in taxonomies],
+            next_page_token=next_page_token,
+        )
+
+    def _get_taxonomy(self, request):
+        return self._taxonomy(self.taxonomies.get(request.name))
+
+    def _add_policy_tag(self, taxonomy: str, policy_tag):
+        policy_tag.ClearField("child_policy_tags")
+        if policy_tag.parent_policy_tag:
+            if policy_tag.parent_policy_tag.rsplit("/policyTags/", 1)[0] != taxonomy:
+                raise _Error(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    "Parent policy tag is in another taxonomy: "
+                    + policy_tag.parent_policy_tag,
+                )
+            self.policy_tags.get(policy_tag.parent_policy_tag)
+        self.policy_tags.add(
+            taxonomy, "{}/policyTags/{}".format(taxonomy, self._new_id()), policy_tag
+        )
+        return policy_tag
+
+    def _create_policy_tag(self, request):
+        self.taxonomies.get(request.parent)
+        policy_tag = self._add_policy_tag(request.parent, _copy(request.policy_tag))
+        return self._policy_tag(policy_tag)
+
+    def _delete_policy_tag(self, request):
+        # Deletes the policy tag and its descendants.
+        names = [request.name]
+        self.policy_tags.get(request.name)
+        taxonomy = request.name.rsplit("/policyTags/", 1)[0]
+        siblings = self.policy_tags.children(taxonomy)
+        for name in names:
+            names.extend(tag.name for tag in siblings if tag.parent_policy_tag == name)
+        for name in names:
+            self.policy_tags.remove(name)
+            self._policies.pop(name, None)
+        return empty_pb2.Empty()
+
+    def _update_policy_tag(self, request):
+        policy_tag = self.policy_tags.get(request.policy_tag.name)
+        _update(policy_tag, request.policy_tag, request.update_mask)
+        policy_tag.ClearField("child_policy_tags")
+        return self._policy_tag(policy_tag)
+
+    def _list_policy_tags(self, request):
+        self.taxonomies.get(request.parent)
+        policy_tags, next_page_token = self.policy_tags.page(
+            request.parent,
+            request.page_size,
+            request.page_token,
+            self.default_page_size,
+        )
+        return policytagmanager.ListPolicyTagsResponse.pb()(
+            policy_tags=[self._policy_tag(policy_tag) for policy_tag in policy_tags],
+            next_page_token=next_page_token,
+        )
+
+    def _get_policy_tag(self, request):
+        return self._policy_tag(self.policy_tags.get(request.name))
+
+    # Taxonomy import and export.
+
+    def _import_policy_tags(self, taxonomy: str, serialized_tags, parent: str = ""):
+        for serialized in serialized_tags:
+            policy_tag = self._add_policy_tag(
+                taxonomy,
+                policytagmanager.PolicyTag.pb()(
+                    display_name=serialized.display_name,
+                    description=serialized.description,
+                    parent_policy_tag=parent,
+                ),
+            )
+            self._import_policy_tags(
+                taxonomy, serialized.child_policy_tags, policy_tag.name
+            )
+
+    def _import_taxonomy(self, parent: str, serialized):
+        taxonomy = self._add_taxonomy(
+            parent,
+            policytagmanager.Taxonomy.pb()(
+                display_name=serialized.display_name,
+                description=serialized.description,
+                activated_policy_types=serialized.activated_policy_types,
+            ),
+        )
+        self._import_policy_tags(taxonomy.name, serialized.policy_tags)
+        return self._taxonomy(taxonomy)
+
+    def _export_policy_tags(self, policy_tags, parent: str = "") -> List:
+        return [
+            policytagmanagerserialization.SerializedPolicyTag.pb()(
+                policy_tag=policy_tag.name,
+                display_name=policy_tag.display_name,
+                description=policy_tag.description,
+                child_policy_tags=self._export_policy_tags(
+                    policy_tags, policy_tag.name
+                ),
+            )
+            for policy_tag in policy_tags
+            if policy_tag.parent_policy_tag == parent
+        ]
+
+    def _export_taxonomy(self, name: str):
+        taxonomy = self.taxonomies.get(name)
+        return policytagmanagerserialization.SerializedTaxonomy.pb()(
+            display_name=taxonomy.display_name,
+            description=taxonomy.description,
+            policy_tags=self._export_policy_tags(self.policy_tags.children(name)),
+            activated_policy_types=taxonomy.activated_policy_types,
+        )
+
+    def _import_taxonomies(self, request):
+        source = request.WhichOneof("source")
+        if source == "inline_source":
+            serialized = list(request.inline_source.taxonomies)
+        elif source == "cross_regional_source":
+            serialized = [self._export_taxonomy(request.cross_regional_source.taxonomy)]
+        else:
+            raise _Error(grpc.StatusCode.INVALID_ARGUMENT, "No taxonomies to import.")
+        return policytagmanagerserialization.ImportTaxonomiesResponse.pb()(
+            taxonomies=[
+                self._import_taxonomy(request.parent, taxonomy)
+                for taxonomy in serialized
+            ]
+        )
+
+    def _export_taxonomies(self, request):
+        if not request.serialized_taxonomies:
+            raise _Error(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Only serialized_taxonomies is supported.",
+            )
+        return policytagmanagerserialization.ExportTaxonomiesResponse.pb()(
+            taxonomies=[self._export_taxonomy(name) for name in request.taxonomies]
+        )
+
+    def _replace_taxonomy(self, request):
+        # Policy tags are replaced by new ones, rather than matched by name.
+        taxonomy = self.taxonomies.get(request.name)
+        serialized = request.serialized_taxonomy
+        taxonomy.display_name = serialized.display_name
+        taxonomy.description = serialized.description
+        taxonomy.activated_policy_types[:] = serialized.activated_policy_types
+        taxonomy.taxonomy_timestamps.update_time.GetCurrentTime()
+        for policy_tag in self.policy_tags.children(request.name):
+            self.policy_tags.remove(policy_tag.name)
+            self._policies.pop(policy_tag.name, None)
+        self._import_policy_tags(request.name, serialized.policy_tags)
+        return self._taxonomy(taxonomy)
+
+    # IAM.
+
+    def _check_resource(self, name: str) -> None:
+        for collection in (
+            self.entry_groups,
+            self.tag_templates,
+            self.taxonomies,
+            self.policy_tags,
+        ):
+            if name in collection:
+                return
+        raise _not_found(name)
+
+    def _set_iam_policy(self, request):
+        self._check_resource(request.resource)
+        current = self._policies.get(request.resource, policy_pb2.Policy())
+        if request.policy.etag and request.policy.etag != current.etag:
+            raise _Error(grpc.StatusCode.ABORTED, "The policy has changed.")
+        policy = _copy(request.policy)
+        policy.etag = str(int(current.etag or b"0") + 1).encode()
+        self._policies[request.resource] = policy
+        return _copy(policy)
+
+    def _get_iam_policy(self, request):
+        self._check_resource(request.resource)
+        return _copy(self._policies.get(request.resource, policy_pb2.Policy()))
+
+    def _test_iam_permissions(self, request):
+        self._check_resource(request.resource)
+        return iam_policy_pb2.TestIamPermissionsResponse(
+            permissions=request.permissions
+        )
+
+
+__all__ = ("DataCatalogEmulator",)
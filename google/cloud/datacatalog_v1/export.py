@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Streaming export of search results to NDJSON or Parquet.
+
+A :class:`SearchResultExporter` pages through a search and writes each
+page as it arrives, so only one page, or one Parquet row group, is held
+in memory whatever the size of the catalog. After each checkpoint the
+exporter's :attr:`~SearchResultExporter.resume_token` says where the
+export got to; passing it to :meth:`~SearchResultExporter.export`
+continues an interrupted export from there. Given a ``token_path``, the
+exporter also saves the token to that file at each checkpoint, replacing
+it whole, so an export that dies with its process can be continued by
+running it again.
+
+NDJSON is written to a single file, one search result per line, and
+checkpointed after every page. Parquet is written to a directory of
+part files, each of ``row_groups_per_file`` row groups, and checkpointed
+whenever a part file is complete. Parquet needs ``pyarrow``, which is
+installed with the ``parquet`` extra.
+"""
+import base64
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+from google.protobuf import json_format
+from google.protobuf import message as pb_message
+
+from google.cloud.datacatalog_v1 import checkpoint
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import search
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+# One JSON object per line, in a single file.
+NDJSON = "ndjson"
+# A directory of Parquet part files.
+PARQUET = "parquet"
+
+_FORMATS = (NDJSON, PARQUET)
+
+_TOKEN_VERSION = 1
+
+_RESULT_FIELDS = search.SearchCatalogResult.pb().DESCRIPTOR.fields_by_name
+
+# The Parquet columns, in order, and the search result fields they hold.
+_STRING_COLUMNS = (
+    "relative_resource_name",
+    "linked_resource",
+    "search_result_subtype",
+    "user_specified_system",
+    "fully_qualified_name",
+    "display_name",
+    "description",
+)
+_ENUM_COLUMNS = ("search_result_type", "integrated_system")
+
+_PART_FILE = re.compile(r"^part-(\d+)\.parquet(\.inprogress)?$")
+
+
+def _parquet():
+    try:
+        import pyarrow  # type: ignore
+        import pyarrow.parquet  # type: ignore
+    except ImportError as exc:
+        raise ImportError(
+            "Exporting to Parquet requires pyarrow. Install it with "
+            "`pip install google-cloud-datacatalog[parquet]`."
+        ) from exc
+    return pyarrow
+
+
+def _parquet_schema(pyarrow):
+    fields = [pyarrow.field(name, pyarrow.string()) for name in _STRING_COLUMNS]
+    fields += [pyarrow.field(name, pyarrow.string()) for name in _ENUM_COLUMNS]
+    fields.append(pyarrow.field("modify_time", pyarrow.timestamp("us", tz="UTC")))
+    return pyarrow.schema(fields)
+
+
+def _enum_name(field: str, number: int) -> str:
+    value = _RESULT_FIELDS[field].enum_type.values_by_number.get(number)
+    return value.name if value is not None else str(number)
+
+
+def _request_digest(request: datacatalog.SearchCatalogRequest) -> str:
+    # Identifies the search a resume token belongs to, whatever its page.
+    request = datacatalog.SearchCatalogRequest(request)
+    request.page_token = ""
+    pb = datacatalog.SearchCatalogRequest.pb(request)
+    return hashlib.sha256(pb.SerializeToString(deterministic=True)).hexdigest()
+
+
+def _response_pb(page) -> pb_message.Message:
+    # Pages are protobuf messages already if the client is raw.
+    if isinstance(page, pb_message.Message):
+        return page
+    return datacatalog.SearchCatalogResponse.pb(page)
+
+
+class SearchResultExporter:
+    """Writes the results of a search to NDJSON or Parquet, page by page.
+
+    Each NDJSON line is the JSON form of one
+    :class:`~google.cloud.datacatalog_v1.types.SearchCatalogResult`, with
+    the field names of the proto and fields left at their default value
+    omitted. Parquet part files are named ``part-00000.parquet`` and so
+    on, and hold the string fields of each result, the names of its enum
+    fields and its ``modify_time`` in microseconds.
+
+    Attributes:
+        resume_token (Optional[str]): Where the last checkpoint of the
+            export was, or ``None`` before the first one.
+        count (int): The number of results written up to that checkpoint.
+    """
+
+    def __init__(
+        self,
+        client: DataCatalogClient,
+        request: Union[datacatalog.SearchCatalogRequest, dict],
+        path: str,
+        *,
+        format: str = NDJSON,
+        row_group_size: int = 10000,
+        row_groups_per_file: int = 16,
+        token_path: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        """Instantiate the exporter.
+
+        Args:
+            client (google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient):
+                The client used to search.
+            request (Union[google.cloud.datacatalog_v1.types.SearchCatalogRequest, dict]):
+                The search to export. Its ``page_size`` sets how many
+                results are held in memory at once.
+            path (str): The NDJSON file, or the directory of Parquet part
+                files, to write.
+            format (str): :data:`NDJSON` or :data:`PARQUET`.
+            row_group_size (int): The number of rows after which a
+                Parquet row group is written. Row groups end on page
+                boundaries, so they can be up to a page larger.
+            row_groups_per_file (int): The number of row groups in each
+                Parquet part file.
+            token_path (str): A file to save the resume token to at each
+                checkpoint. If it holds a token, :meth:`export` resumes
+                from it when not given one.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+        Raises:
+            ValueError: If the format or the Parquet sizes are invalid.
+            ImportError: If the format is Parquet and ``pyarrow`` is not
+                installed.
+        """
+        if format not in _FORMATS:
+            raise ValueError(
+                "format must be one of {}, not {!r}.".format(_FORMATS, format)
+            )
+        if row_group_size < 1 or row_groups_per_file < 1:
+            raise ValueError(
+                "row_group_size and row_groups_per_file must be at least 1."
+            )
+        if format == PARQUET:
+            self._pyarrow = _parquet()
+        self._client = client
+        self._request = datacatalog.SearchCatalogRequest(request)
+        self._digest = _request_digest(self._request)
+        self._path = path
+        self._format = format
+        self._row_group_size = row_group_size
+        self._row_groups_per_file = row_groups_per_file
+        self._token_file = (
+            checkpoint._CursorFile(token_path) if token_path is not None else None
+        )
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+        self.resume_token: Optional[str] = None
+        self.count = 0
+
+    def _decode(self, resume_token: str) -> dict:
+        try:
+            state = json.loads(base64.urlsafe_b64decode(resume_token.encode("ascii")))
+        except ValueError as exc:
+            raise ValueError("Invalid resume token.") from exc
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != _TOKEN_VERSION
+            or state.get("format") != self._format
+        ):
+            raise ValueError(
+                "The resume token is not for a {} export.".format(self._format)
+            )
+        if state.get("search") != self._digest:
+            raise ValueError("The resume token is for a different search.")
+        return state
+
+    def _checkpoint(self, page_token: Optional[str], position: int) -> None:
+        # A page token of None means the export is complete.
+        state = {
+            "version": _TOKEN_VERSION,
+            "format": self._format,
+            "search": self._digest,
+            "page_token": page_token,
+            "position": position,
+            "count": self.count,
+        }
+        self.resume_token = base64.urlsafe_b64encode(
+            json.dumps(state, sort_keys=True).encode("utf-8")
+        ).decode("ascii")
+        if self._token_file is not None:
+            self._token_file.save(self.resume_token)
+
+    def _pages(self, page_token: str):
+        request = datacatalog.SearchCatalogRequest(self._request)
+        request.page_token = page_token
+        pages = self._client.search_catalog(
+            request=request,
+            retry=self._retry,
+            timeout=self._timeout,
+            metadata=self._metadata,
+        ).pages
+        for page in pages:
+            yield _response_pb(page)
+
+    def export(self, resume_token: str = None) -> int:
+        """Runs the export, or continues it from ``resume_token``.
+
+        Starting afresh overwrites the file, or the part files, at
+        ``path``. Resuming keeps what was written up to the checkpoint
+        and discards anything written after it. The token file is kept
+        once the export is complete, so running it again writes nothing;
+        remove the file to start afresh.
+
+        Args:
+            resume_token (str): The :attr:`resume_token` of an earlier
+                run of the same search and format. Defaults to the token
+                saved at ``token_path``, if any.
+
+        Returns:
+            int: The number of results in the export, including those
+            written before it was resumed.
+
+        Raises:
+            ValueError: If the resume token is invalid, or belongs to
+                another search or format.
+        """
+        if resume_token is None and self._token_file is not None:
+            resume_token = self._token_file.load()
+        if resume_token is None:
+            state = {"page_token": "", "position": 0, "count": 0}
+        else:
+            state = self._decode(resume_token)
+        self.count = state["count"]
+        self.resume_token = resume_token
+        if state["page_token"] is None:
+            # The export was already complete.
+            return self.count
+        if self._format == NDJSON:
+            self._export_ndjson(state["page_token"], state["position"], resume_token)
+        else:
+            self._export_parquet(state["page_token"], state["position"])
+        return self.count
+
+    def _export_ndjson(
+        self, page_token: str, offset: int, resume_token: Optional[str]
+    ) -> None:
+        with open(self._path, "r+b" if resume_token is not None else "wb") as f:
+            f.truncate(offset)
+            f.seek(offset)
+            for page in self._pages(page_token):
+                lines = [
+                    json.dumps(
+                        json_format.MessageToDict(
+                            result, preserving_proto_field_name=True
+                        ),
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                    for result in page.results
+                ]
+                if lines:
+                    f.write(("\n".join(lines) + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                self.count += len(lines)
+                self._checkpoint(page.next_page_token or None, f.tell())
+
+    def _export_parquet(self, page_token: str, part: int) -> None:
+        pyarrow = self._pyarrow
+        schema = _parquet_schema(pyarrow)
+        os.makedirs(self._path, exist_ok=True)
+        # Part files from after the checkpoint are written again.
+        for name in os.listdir(self._path):
+            match = _PART_FILE.match(name)
+            if match and int(match.group(1)) >= part:
+                os.remove(os.path.join(self._path, name))
+        writer = None
+        row_groups = 0
+        written = 0
+        columns: Dict[str, List] = {name: [] for name in schema.names}
+
+        def part_path(part, suffix=""):
+            return os.path.join(
+                self._path, "part-{:05d}.parquet{}".format(part, suffix)
+            )
+
+        try:
+            for page in self._pages(page_token):
+                for result in page.results:
+                    for name in _STRING_COLUMNS:
+                        columns[name].append(getattr(result, name))
+                    for name in _ENUM_COLUMNS:
+                        columns[name].append(_enum_name(name, getattr(result, name)))
+                    if result.HasField("modify_time"):
+                        columns["modify_time"].append(
+                            result.modify_time.seconds * 10 ** 6
+                            + result.modify_time.nanos // 1000
+                        )
+                    else:
+                        columns["modify_time"].append(None)
+                buffered = len(columns["modify_time"])
+                if buffered < self._row_group_size and page.next_page_token:
+                    continue
+                if buffered:
+                    if writer is None:
+                        # Part files are written under a temporary name, so an
+                        # interrupted one is never mistaken for a complete one.
+                        writer = pyarrow.parquet.ParquetWriter(
+                            part_path(part, ".inprogress"), schema
+                        )
+                    writer.write_table(
+                        pyarrow.Table.from_pydict(columns, schema=schema),
+                        row_group_size=buffered,
+                    )
+                    row_groups += 1
+                    written += buffered
+                    for values in columns.values():
+                        values.clear()
+                if writer is not None and (
+                    row_groups == self._row_groups_per_file or not page.next_page_token
+                ):
+                    writer.close()
+                    writer = None
+                    os.replace(part_path(part, ".inprogress"), part_path(part))
+                    part += 1
+                    row_groups = 0
+                    self.count += written
+                    written = 0
+                    self._checkpoint(page.next_page_token or None, part)
+        finally:
+            if writer is not None:
+                # The part file is left incomplete, to be written again.
+                writer.close()
+        self._checkpoint(None, part)
+
+
+__all__ = (
+    "NDJSON",
+    "PARQUET",
+    "SearchResultExporter",
+)
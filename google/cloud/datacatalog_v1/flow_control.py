@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side flow control for RPC methods."""
+import asyncio
+import collections
+import functools
+import threading
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions as core_exceptions
+
+# Errors that mean the service is overloaded, so fewer calls should be sent.
+OVERLOAD_ERRORS: Tuple[Type[Exception], ...] = (
+    core_exceptions.ResourceExhausted,
+    core_exceptions.ServiceUnavailable,
+)
+
+_OVERLOAD_CODES: FrozenSet[grpc.StatusCode] = frozenset(
+    error.grpc_status_code for error in OVERLOAD_ERRORS
+)
+
+
+def _outcome(exc: Exception) -> Optional[bool]:
+    # Attempts are limited below the retry, where errors are still the
+    # grpc.RpcError raised by the stub.
+    if isinstance(exc, OVERLOAD_ERRORS):
+        return False
+    if isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        if exc.code() in _OVERLOAD_CODES:
+            return False
+    return None
+
+
+class _Waiter:
+    __slots__ = ("wake", "granted", "epoch")
+
+    def __init__(self, wake: Callable[[], None]):
+        self.wake = wake
+        self.granted = False
+        # The epoch when the permit was granted.
+        self.epoch = 0
+
+
+class _MethodLimit:
+    """The adaptive limit on in-flight calls of one method."""
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter"):
+        self._limiter = limiter
+        self._lock = threading.Lock()
+        self._waiters: collections.deque = collections.deque()
+        self.limit = float(limiter.initial_limit)
+        self.in_flight = 0
+        # Counts the cuts to the limit. A call that started before the
+        # latest cut does not cut it again.
+        self._epoch = 0
+
+    def _has_permit_locked(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def _wake_locked(self) -> None:
+        # Permits are handed to waiters in arrival order.
+        while self._waiters and self._has_permit_locked():
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            waiter.epoch = self._epoch
+            self.in_flight += 1
+            waiter.wake()
+
+    def acquire(self) -> int:
+        """Blocks until a permit is free; returns the current epoch."""
+        with self._lock:
+            if not self._waiters and self._has_permit_locked():
+                self.in_flight += 1
+                return self._epoch
+            event = threading.Event()
+            waiter = _Waiter(event.set)
+            self._waiters.append(waiter)
+        event.wait()
+        return waiter.epoch
+
+    async def acquire_async(self) -> int:
+        """Waits until a permit is free; returns the current epoch."""
+        with self._lock:
+            if not self._waiters and self._has_permit_locked():
+                self.in_flight += 1
+                return self._epoch
+            loop = asyncio.get_event_loop()
+            future = loop.create_future()
+
+            def wake():
+                loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_result(None)
+                )
+
+            waiter = _Waiter(wake)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self.in_flight -= 1
+                    self._wake_locked()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+        return waiter.epoch
+
+    def release(self, epoch: int, outcome: Optional[bool]) -> None:
+        """Returns a permit and adjusts the limit.
+
+        Args:
+            epoch (int): The epoch returned when the permit was acquired.
+            outcome (Optional[bool]): ``True`` if the call succeeded,
+                ``False`` if the service was overloaded, and ``None`` if it
+                failed for another reason.
+        """
+        limiter = self._limiter
+        with self._lock:
+            if outcome:
+                # Only grow a limit that is actually holding calls back.
+                if self.in_flight + len(self._waiters) >= int(self.limit):
+                    self.limit = min(
+                        limiter.max_limit, self.limit + limiter.increase / self.limit
+                    )
+            elif outcome is False and epoch == self._epoch:
+                self.limit = max(limiter.min_limit, self.limit * limiter.decrease)
+                self._epoch += 1
+            self.in_flight -= 1
+            self._wake_locked()
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the calls in flight per RPC method, adapting to overload.
+
+    Each method starts at ``initial_limit`` in-flight calls. While calls
+    succeed and the limit is holding calls back, it rises by about
+    ``increase`` per round of ``limit`` calls. Each time a call fails
+    with ``ResourceExhausted`` or ``ServiceUnavailable`` it is multiplied
+    by ``decrease``; calls that started before a cut do not cut again.
+    Calls over the limit wait, in arrival order, for a permit.
+
+    Pass an instance as the ``concurrency_limiter`` of a transport. The
+    limit applies to each attempt of a call, so a call holds no permit
+    while it backs off between retries, and each failed attempt counts.
+    One limiter may be shared by several transports.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        """Instantiate the limiter.
+
+        Args:
+            initial_limit (int): The limit each method starts at.
+            min_limit (int): The lowest the limit is cut to.
+            max_limit (int): The highest the limit rises to.
+            increase (float): The additive increase per round of calls.
+            decrease (float): The factor the limit is cut by on overload.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            )
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1.")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodLimit] = {}
+
+    def _method(self, name: str) -> _MethodLimit:
+        with self._lock:
+            method = self._methods.get(name)
+            if method is None:
+                method = self._methods[name] = _MethodLimit(self)
+            return method
+
+    def metrics(self) -> Dict[str, Dict[str, int]]:
+        """Returns the current ``limit``, ``in_flight`` calls and ``queued``
+        calls of each limited method, keyed by method name."""
+        with self._lock:
+            methods = dict(self._methods)
+        return {name: method.metrics() for name, method in methods.items()}
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Returns ``func``, limited as the method called ``name``."""
+        method = self._method(name)
+
+        @functools.wraps(func)
+        def limited(*args, **kwargs):
+            epoch = method.acquire()
+            outcome = None
+            try:
+                response = func(*args, **kwargs)
+                outcome = True
+                return response
+            except Exception as exc:
+                outcome = _outcome(exc)
+                raise
+            finally:
+                method.release(epoch, outcome)
+
+        return limited
+
+    def wrap_async(
+        self, name: str, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Returns ``func``, which returns an awaitable, limited as the
+        method called ``name``."""
+        method = self._method(name)
+
+        @functools.wraps(func)
+        async def limited(*args, **kwargs):
+            epoch = await method.acquire_async()
+            outcome = None
+            try:
+                response = await func(*args, **kwargs)
+                outcome = True
+                return response
+            except Exception as exc:
+                outcome = _outcome(exc)
+                raise
+            finally:
+                method.release(epoch, outcome)
+
+        return limited
+
+
+class TokenBucket:
+    """Paces calls to an average ``rate`` per second.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens
+    per second. Each call takes a token, waiting for one if the bucket is
+    empty. Waiting calls reserve their tokens in arrival order.
+
+    Instances are safe to share between threads, and between the methods
+    of a group that should share a limit.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiate the bucket.
+
+        Args:
+            rate (float): The average number of calls per second.
+            burst (Optional[float]): The number of calls that may be made
+                at once after an idle period. Defaults to ``rate``, or 1
+                if ``rate`` is lower.
+            timer (Callable[[], float]): The clock used for refills.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = timer()
+
+    def reserve(self) -> float:
+        """Takes a token; returns the seconds to wait before using it."""
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # The balance goes negative while calls are waiting for tokens.
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks until a token is available and takes it."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits until a token is available and takes it."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Paces calls per RPC method with token buckets.
+
+    ``buckets`` maps method names, such as ``"get_entry"``, to the bucket
+    that paces them. Methods mapped to the same bucket share its rate, so
+    a group of methods can be given one limit::
+
+        reads = TokenBucket(50)
+        limiter = RateLimiter(
+            {"get_entry": reads, "lookup_entry": reads, "create_tag": TokenBucket(5)}
+        )
+
+    Pass an instance as the ``rate_limiter`` of a transport. Each attempt
+    of a call, so each retry too, takes one token.
+    """
+
+    def __init__(
+        self,
+        buckets: Mapping[str, TokenBucket],
+        *,
+        default: Optional[TokenBucket] = None,
+    ):
+        """Instantiate the limiter.
+
+        Args:
+            buckets (Mapping[str, TokenBucket]): The bucket of each method.
+            default (Optional[TokenBucket]): The bucket of methods not in
+                ``buckets``. If ``None``, those methods are not paced.
+        """
+        self._buckets = dict(buckets)
+        self._default = default
+
+    def bucket(self, name: str) -> Optional[TokenBucket]:
+        """Returns the bucket that paces the method called ``name``."""
+        return self._buckets.get(name, self._default)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Returns ``func``, paced as the method called ``name``."""
+        bucket = self.bucket(name)
+        if bucket is None:
+            return func
+
+        @functools.wraps(func)
+        def paced(*args, **kwargs):
+            bucket.acquire()
+            return func(*args, **kwargs)
+
+        return paced
+
+    def wrap_async(
+        self, name: str, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Returns ``func``, which returns an awaitable, paced as the
+        method called ``name``."""
+        bucket = self.bucket(name)
+        if bucket is None:
+            return func
+
+        @functools.wraps(func)
+        async def paced(*args, **kwargs):
+            await bucket.acquire_async()
+            return await func(*args, **kwargs)
+
+        return paced
+
+
+__all__ = (
+    "AdaptiveConcurrencyLimiter",
+    "RateLimiter",
+    "TokenBucket",
+)
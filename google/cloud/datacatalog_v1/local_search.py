@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Searches a local set of entries with the Data Catalog search syntax.
+
+A :class:`SearchIndex` holds inverted indexes over the names, display
+names, descriptions, columns and tags of some entries, and answers
+queries such as ``name:orders column:customer_id -description:legacy``
+with the :class:`~google.cloud.datacatalog_v1.types.SearchCatalogResult`
+messages that :meth:`DataCatalogClient.search_catalog` would return.
+
+Supported predicates:
+
+-  ``xyz``: a word in the name, display name, description, a column name
+   or a tag value starts with ``xyz``.
+-  ``name:x``: ``x`` is a substring of the entry ID, of the last part of
+   its linked resource, or of its display name.
+-  ``displayname:x`` and ``description:x``: a word in that field starts
+   with ``x``.
+-  ``column:x``: ``x`` is a substring of a column name, nested columns
+   included.
+-  ``type=table`` and ``system=bigquery``: the entry type or source
+   system is exactly that.
+-  ``tag:template``, ``tag:template.field``, ``tag:template.field:value``
+   and ``tag:template.field=value``: the entry, or one of its columns,
+   has a tag from that template, with that field, or with a word of the
+   field's value starting with ``value`` (``:``) or equal to it (``=``).
+
+Terms are joined with ``AND`` by default, or with ``OR``; ``-term`` and
+``NOT term`` negate a term. Matching is case insensitive. Parentheses
+and the other predicates of the remote search are not supported.
+"""
+import bisect
+import re
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from google.cloud.datacatalog_v1.types import common
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import search as gcd_search
+from google.cloud.datacatalog_v1.types import tags as gcd_tags
+
+_WORD = re.compile(r"[0-9a-z]+")
+_TERM = re.compile(r'\s*(-?)(?:([A-Za-z]+)([:=]))?((?:"[^"]*"|[^\s"])+)')
+_TAG_TERM = re.compile(r"^([^.:=]+)(?:\.([^.:=]+)(?:([:=])(.+))?)?$")
+
+# Fields a plain word is looked up in.
+_PLAIN_FIELDS = ("name", "displayname", "description", "column", "tag_value")
+
+_ORDERS = ("relevance", "default", "last_modified_timestamp")
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _Index:
+    """An inverted index from the values of one field, and the words and
+    trigrams in them, to the entries that have them."""
+
+    def __init__(self):
+        self._values: Dict[str, Set[int]] = {}
+        self._words: Dict[str, Set[int]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._sorted_words: List[str] = []
+
+    def add(self, doc: int, value: str) -> None:
+        value = value.lower()
+        if not value:
+            return
+        if value not in self._values:
+            self._values[value] = set()
+            for trigram in _trigrams(value):
+                self._trigrams.setdefault(trigram, set()).add(value)
+        self._values[value].add(doc)
+        for word in _words(value):
+            self._words.setdefault(word, set()).add(doc)
+
+    def freeze(self) -> None:
+        self._sorted_words = sorted(self._words)
+
+    def exact(self, value: str) -> Set[int]:
+        return set(self._values.get(value.lower(), ()))
+
+    def prefix(self, text: str) -> Set[int]:
+        """Entries with a word starting with each word of ``text``."""
+        docs: Optional[Set[int]] = None
+        for word in _words(text):
+            matches: Set[int] = set()
+            position = bisect.bisect_left(self._sorted_words, word)
+            while position < len(self._sorted_words):
+                candidate = self._sorted_words[position]
+                if not candidate.startswith(word):
+                    break
+                matches |= self._words[candidate]
+                position += 1
+            docs = matches if docs is None else docs & matches
+        return docs or set()
+
+    def substring(self, text: str) -> Set[int]:
+        text = text.lower()
+        trigrams = _trigrams(text)
+        if trigrams:
+            # Start from the rarest trigram, so that the others only filter it.
+            candidates = set.intersection(
+                *sorted(
+                    (self._trigrams.get(trigram, set()) for trigram in trigrams),
+                    key=len,
+                )
+            )
+        else:
+            candidates = set(self._values)
+        docs: Set[int] = set()
+        for value in candidates:
+            if text in value:
+                docs |= self._values[value]
+        return docs
+
+
+def _subtype(entry) -> str:
+    if entry.WhichOneof("entry_type") == "type_":
+        first, *rest = datacatalog.EntryType(entry.type_).name.lower().split("_")
+        return "entry." + first + "".join(part.title() for part in rest)
+    return "entry." + entry.user_specified_type
+
+
+def _tag_value(field) -> str:
+    kind = field.WhichOneof("kind")
+    if kind == "enum_value":
+        return field.enum_value.display_name
+    if kind == "timestamp_value":
+        return field.timestamp_value.ToJsonString()
+    if kind is None:
+        return ""
+    return str(getattr(field, kind))
+
+
+class SearchIndex:
+    """A searchable set of entries and their tags."""
+
+    def __init__(
+        self,
+        entries: Iterable[datacatalog.Entry],
+        tags: Optional[Mapping[str, Sequence[gcd_tags.Tag]]] = None,
+    ):
+        """Index entries and their tags.
+
+        Args:
+            entries (Iterable[google.cloud.datacatalog_v1.types.Entry]):
+                The entries to search.
+            tags (Mapping[str, Sequence[google.cloud.datacatalog_v1.types.Tag]]):
+                The tags on each entry and its columns, by entry name.
+        """
+        tags = tags or {}
+        self._indexes: Dict[str, _Index] = {}
+        self._names: List[str] = []
+        self._modified: List[int] = []
+        # Results are built once, as raw messages, and copied for each search.
+        self._results: List[Any] = []
+        for doc, entry in enumerate(entries):
+            # Reading the raw messages is several times faster.
+            entry = datacatalog.Entry.pb(entry)
+            self._names.append(entry.name)
+            self._add(
+                doc, entry, [gcd_tags.Tag.pb(tag) for tag in tags.get(entry.name, ())]
+            )
+        for index in self._indexes.values():
+            index.freeze()
+        self._ranks = [0] * len(self._names)
+        for rank, doc in enumerate(
+            sorted(range(len(self._names)), key=self._names.__getitem__)
+        ):
+            self._ranks[doc] = rank
+
+    @classmethod
+    def from_mirror(cls, mirror) -> "SearchIndex":
+        """Index every entry in a :class:`~.mirror.CatalogMirror`."""
+        connection = mirror.connection
+        tags: Dict[str, List[gcd_tags.Tag]] = {}
+        for name, tag in connection.execute(
+            "SELECT entry, tag FROM tags ORDER BY name"
+        ):
+            tags.setdefault(name, []).append(gcd_tags.Tag.deserialize(tag))
+        entries = [
+            datacatalog.Entry.deserialize(row[0])
+            for row in connection.execute("SELECT entry FROM entries ORDER BY name")
+        ]
+        return cls(entries, tags)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _index(self, field: str) -> _Index:
+        if field not in self._indexes:
+            self._indexes[field] = _Index()
+        return self._indexes[field]
+
+    def _add(self, doc: int, entry, tags: Sequence) -> None:
+        name = self._index("name")
+        name.add(doc, entry.name.rsplit("/", 1)[-1])
+        name.add(doc, entry.linked_resource.rsplit("/", 1)[-1])
+        name.add(doc, entry.display_name)
+        self._index("displayname").add(doc, entry.display_name)
+        self._index("description").add(doc, entry.description)
+        # Both TABLE and the subtype's table, DATA_STREAM and dataStream.
+        subtype = _subtype(entry)
+        if entry.WhichOneof("entry_type") == "type_":
+            self._index("type").add(doc, datacatalog.EntryType(entry.type_).name)
+        self._index("type").add(doc, subtype[len("entry.") :])
+        if entry.WhichOneof("system") == "integrated_system":
+            system = common.IntegratedSystem(entry.integrated_system).name
+        else:
+            system = entry.user_specified_system
+        self._index("system").add(doc, system)
+
+        columns = [(column, "") for column in entry.schema.columns]
+        while columns:
+            column, prefix = columns.pop()
+            self._index("column").add(doc, prefix + column.column)
+            columns.extend(
+                (subcolumn, prefix + column.column + ".")
+                for subcolumn in column.subcolumns
+            )
+
+        for tag in tags:
+            template = tag.template.rsplit("/", 1)[-1]
+            self._index("tag").add(doc, template)
+            for field_id, field in tag.fields.items():
+                value = _tag_value(field)
+                self._index("tag").add(doc, template + "." + field_id)
+                self._index("tag_value").add(doc, value)
+                self._index("tag:" + (template + "." + field_id).lower()).add(
+                    doc, value
+                )
+
+        result = gcd_search.SearchCatalogResult.pb()(
+            search_result_type=gcd_search.SearchResultType.ENTRY,
+            search_result_subtype=subtype,
+            relative_resource_name=entry.name,
+            linked_resource=entry.linked_resource,
+            fully_qualified_name=entry.fully_qualified_name,
+            display_name=entry.display_name,
+            description=entry.description,
+        )
+        timestamps = entry.source_system_timestamps
+        if timestamps.HasField("update_time"):
+            result.modify_time.CopyFrom(timestamps.update_time)
+        if entry.WhichOneof("system") == "integrated_system":
+            result.integrated_system = entry.integrated_system
+        elif entry.user_specified_system:
+            result.user_specified_system = entry.user_specified_system
+        self._results.append(result)
+        self._modified.append(
+            timestamps.update_time.seconds * 10 ** 9 + timestamps.update_time.nanos
+        )
+
+    def _lookup(self, field: str) -> _Index:
+        # Unlike _index, does not add indexes for unknown fields.
+        return self._indexes.get(field) or _Index()
+
+    def _match(self, qualifier: str, operator: str, value: str) -> Set[int]:
+        if not qualifier:
+            docs: Set[int] = set()
+            for field in _PLAIN_FIELDS:
+                docs |= self._lookup(field).prefix(value)
+            return docs
+        qualifier = qualifier.lower()
+        if qualifier in ("name", "column"):
+            return self._lookup(qualifier).substring(value)
+        if qualifier in ("displayname", "description"):
+            index = self._lookup(qualifier)
+            return index.exact(value) if operator == "=" else index.prefix(value)
+        if qualifier in ("type", "system"):
+            return self._lookup(qualifier).exact(value)
+        if qualifier == "tag":
+            match = _TAG_TERM.match(value)
+            if match is None:
+                raise ValueError("Invalid tag predicate: {!r}.".format(value))
+            template, field_id, field_operator, field_value = match.groups()
+            if field_value is None:
+                key = template if field_id is None else template + "." + field_id
+                return self._lookup("tag").exact(key)
+            index = self._lookup("tag:" + (template + "." + field_id).lower())
+            if field_operator == "=":
+                return index.exact(field_value)
+            return index.prefix(field_value)
+        raise ValueError("Unsupported search predicate: {!r}.".format(qualifier))
+
+    def _query(self, query: str) -> Set[int]:
+        # A list of conjunctions, each a list of (negated, docs) terms.
+        clauses: List[List] = [[]]
+        negate = False
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            match = _TERM.match(query, position)
+            if match is None:
+                raise ValueError("Invalid search query: {!r}.".format(query))
+            position = match.end()
+            minus, qualifier, operator, value = match.groups()
+            if not minus and not qualifier and value in ("AND", "OR", "NOT"):
+                if value == "OR":
+                    clauses.append([])
+                negate = value == "NOT"
+                continue
+            value = value.replace('"', "")
+            clauses[-1].append(
+                (negate or bool(minus), self._match(qualifier, operator, value))
+            )
+            negate = False
+
+        docs: Set[int] = set()
+        for clause in clauses:
+            positive = [term for negated, term in clause if not negated]
+            if positive:
+                matches = set.intersection(*positive)
+            else:
+                matches = set(range(len(self._names)))
+            for negated, term in clause:
+                if negated:
+                    matches -= term
+            docs |= matches
+        return docs
+
+    def _docs(self, query: str, order_by: str) -> List[int]:
+        words = order_by.split()
+        if (
+            len(words) > 2
+            or words[:1]
+            and words[0] not in _ORDERS
+            or words[1:2] not in ([], ["asc"], ["desc"])
+        ):
+            raise ValueError("Unsupported order: {!r}.".format(order_by))
+        docs = sorted(self._query(query), key=self._ranks.__getitem__)
+        if words[:1] == ["last_modified_timestamp"]:
+            docs.sort(
+                key=self._modified.__getitem__, reverse=words[1:] != ["asc"],
+            )
+        return docs
+
+    def _wrap(self, docs: Iterable[int]) -> List[gcd_search.SearchCatalogResult]:
+        # Each caller gets its own results, so none sees another's changes.
+        results = []
+        for doc in docs:
+            result = gcd_search.SearchCatalogResult.pb()()
+            result.CopyFrom(self._results[doc])
+            results.append(gcd_search.SearchCatalogResult.wrap(result))
+        return results
+
+    def search(
+        self, query: str = "", order_by: str = ""
+    ) -> List[gcd_search.SearchCatalogResult]:
+        """Returns the entries that match ``query``.
+
+        Args:
+            query (str): The query, in the syntax described in this
+                module. An empty query matches every entry.
+            order_by (str): ``last_modified_timestamp`` (descending
+                unless followed by ``asc``), or ``relevance`` and
+                ``default``, which both order results by entry name.
+
+        Returns:
+            List[google.cloud.datacatalog_v1.types.SearchCatalogResult]:
+                The results, in order.
+
+        Raises:
+            ValueError: If the query or order is not supported.
+        """
+        return self._wrap(self._docs(query, order_by))
+
+    def search_catalog(
+        self,
+        request: Optional[datacatalog.SearchCatalogRequest] = None,
+        *,
+        scope: Optional[datacatalog.SearchCatalogRequest.Scope] = None,
+        query: Optional[str] = None,
+    ) -> List[gcd_search.SearchCatalogResult]:
+        """Searches like :meth:`DataCatalogClient.search_catalog`, so that
+        callers can use either.
+
+        Only the ``include_project_ids`` of the scope, the query and the
+        order of the request are used. All results are returned at once.
+        """
+        request = datacatalog.SearchCatalogRequest(request or {})
+        if scope is not None:
+            request.scope = scope
+        if query is not None:
+            request.query = query
+        docs = self._docs(request.query, request.order_by)
+        projects = request.scope.include_project_ids
+        if projects and not request.scope.include_org_ids:
+            prefixes = tuple("projects/{}/".format(project) for project in projects)
+            docs = [doc for doc in docs if self._names[doc].startswith(prefixes)]
+        return self._wrap(docs)
+
+
+__all__ = ("SearchIndex",)
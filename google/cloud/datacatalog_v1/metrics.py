@@ -0,0 +1,501 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side metrics of RPC methods."""
+import bisect
+import functools
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+import grpc  # type: ignore
+
+# Upper bounds of the latency buckets, in seconds.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Upper bounds of the payload size buckets, in bytes.
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+)
+
+
+class _Attempts:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+class _ThreadLocalVar:
+    """The part of ``contextvars.ContextVar`` used here, with one value per
+    thread, for Python 3.6."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self, default: Any) -> Any:
+        return getattr(self._local, "value", default)
+
+    def set(self, value: Any) -> Any:
+        token = self.get(None)
+        self._local.value = value
+        return token
+
+    def reset(self, token: Any) -> None:
+        self._local.value = token
+
+
+# The attempts of the call in progress. Tasks started by an asyncio call,
+# such as a timeout's, get a copy of the context that shares the counter.
+if sys.version_info < (3, 7):  # pragma: NO COVER
+    # Python 3.6 has no contextvars. Calls made by concurrent asyncio tasks
+    # then share the thread's counter, so their attempts may be miscounted.
+    _attempts = _ThreadLocalVar()
+else:
+    import contextvars
+
+    _attempts = contextvars.ContextVar("datacatalog_attempts")
+
+
+def _status_code(exc: BaseException) -> str:
+    # Errors are mapped to GoogleAPICallError above the retry, but attempts
+    # see the grpc.RpcError raised by the stub.
+    code = getattr(exc, "grpc_status_code", None)
+    if code is None and isinstance(exc, grpc.RpcError) and hasattr(exc, "code"):
+        code = exc.code()
+    return code.name if isinstance(code, grpc.StatusCode) else "UNKNOWN"
+
+
+def _byte_size(message: Any) -> int:
+    # Proto-plus messages are sized through their protobuf message; the
+    # IAM methods send and return protobuf messages directly.
+    pb = getattr(type(message), "pb", None)
+    if pb is not None:
+        message = pb(message)
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else 0
+
+
+class MetricsSink:
+    """Receives the metrics of the RPC methods of a transport.
+
+    Pass an instance as the ``metrics_sink`` of a transport. Each attempt
+    of a call, which sends the request once, is passed to
+    :meth:`record_attempt`; each call as made by the client, including
+    its retries and any time spent in flow control, is passed to
+    :meth:`record_call` once it finishes.
+
+    Subclasses override those two methods to export the metrics, and
+    must be safe to call from several threads. One sink may be shared by
+    several transports.
+    """
+
+    def record_attempt(
+        self,
+        service: str,
+        method: str,
+        *,
+        latency: float,
+        code: str,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """Records one attempt of a call.
+
+        Args:
+            service (str): The service, such as ``"DataCatalog"``.
+            method (str): The method, such as ``"get_entry"``.
+            latency (float): The seconds the attempt took.
+            code (str): The name of its :class:`grpc.StatusCode`.
+            request_bytes (int): The serialized size of the request.
+            response_bytes (int): The serialized size of the response,
+                or 0 if the attempt failed.
+        """
+
+    def record_call(
+        self, service: str, method: str, *, latency: float, code: str, attempts: int,
+    ) -> None:
+        """Records a call.
+
+        Args:
+            service (str): The service, such as ``"DataCatalog"``.
+            method (str): The method, such as ``"get_entry"``.
+            latency (float): The seconds the call took.
+            code (str): The name of its :class:`grpc.StatusCode`.
+            attempts (int): The number of attempts made; 0 if the call
+                failed before sending the request.
+        """
+
+    def wrap_attempt(
+        self, service: str, method: str, func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Returns the stub ``func``, recording each call as an attempt."""
+
+        @functools.wraps(func)
+        def measured(request, *args, **kwargs):
+            attempts = _attempts.get(None)
+            if attempts is not None:
+                attempts.count += 1
+            start = time.perf_counter()
+            code = "OK"
+            response = None
+            try:
+                response = func(request, *args, **kwargs)
+                return response
+            except Exception as exc:
+                code = _status_code(exc)
+                raise
+            finally:
+                self.record_attempt(
+                    service,
+                    method,
+                    latency=time.perf_counter() - start,
+                    code=code,
+                    request_bytes=_byte_size(request),
+                    response_bytes=_byte_size(response),
+                )
+
+        return measured
+
+    def wrap_attempt_async(
+        self, service: str, method: str, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Returns the stub ``func``, which returns an awaitable, recording
+        each call as an attempt."""
+
+        @functools.wraps(func)
+        async def measured(request, *args, **kwargs):
+            attempts = _attempts.get(None)
+            if attempts is not None:
+                attempts.count += 1
+            start = time.perf_counter()
+            code = "OK"
+            response = None
+            try:
+                response = await func(request, *args, **kwargs)
+                return response
+            except Exception as exc:
+                code = _status_code(exc)
+                raise
+            finally:
+                self.record_attempt(
+                    service,
+                    method,
+                    latency=time.perf_counter() - start,
+                    code=code,
+                    request_bytes=_byte_size(request),
+                    response_bytes=_byte_size(response),
+                )
+
+        return measured
+
+    def wrap_call(
+        self, service: str, method: str, func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Returns the wrapped method ``func``, recording each call."""
+
+        @functools.wraps(func)
+        def measured(*args, **kwargs):
+            attempts = _Attempts()
+            token = _attempts.set(attempts)
+            start = time.perf_counter()
+            code = "OK"
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                code = _status_code(exc)
+                raise
+            finally:
+                _attempts.reset(token)
+                self.record_call(
+                    service,
+                    method,
+                    latency=time.perf_counter() - start,
+                    code=code,
+                    attempts=attempts.count,
+                )
+
+        return measured
+
+    def wrap_call_async(
+        self, service: str, method: str, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Returns the wrapped method ``func``, which returns an awaitable,
+        recording each call."""
+
+        @functools.wraps(func)
+        async def measured(*args, **kwargs):
+            attempts = _Attempts()
+            token = _attempts.set(attempts)
+            start = time.perf_counter()
+            code = "OK"
+            try:
+                return await func(*args, **kwargs)
+            except Exception as exc:
+                code = _status_code(exc)
+                raise
+            finally:
+                _attempts.reset(token)
+                self.record_call(
+                    service,
+                    method,
+                    latency=time.perf_counter() - start,
+                    code=code,
+                    attempts=attempts.count,
+                )
+
+        return measured
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        # The last count is of values above every bound.
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            buckets.append((bound, total))
+        return {
+            "count": total + self.counts[-1],
+            "sum": self.sum,
+            "buckets": buckets,
+        }
+
+
+class _MethodMetrics:
+    def __init__(self, latency_buckets, size_buckets):
+        self.calls: Dict[str, int] = {}
+        self.attempts: Dict[str, int] = {}
+        self.retries = 0
+        self.call_latency = _Histogram(latency_buckets)
+        self.attempt_latency = _Histogram(latency_buckets)
+        self.request_bytes = _Histogram(size_buckets)
+        self.response_bytes = _Histogram(size_buckets)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": dict(self.calls),
+            "attempts": dict(self.attempts),
+            "retries": self.retries,
+            "call_latency": self.call_latency.snapshot(),
+            "attempt_latency": self.attempt_latency.snapshot(),
+            "request_bytes": self.request_bytes.snapshot(),
+            "response_bytes": self.response_bytes.snapshot(),
+        }
+
+
+# The histograms of a method, with their Prometheus names and help.
+_HISTOGRAMS = (
+    ("call_latency", "call_latency_seconds", "Latency of calls, including retries."),
+    ("attempt_latency", "attempt_latency_seconds", "Latency of attempts."),
+    ("request_bytes", "request_bytes", "Serialized size of requests sent."),
+    ("response_bytes", "response_bytes", "Serialized size of responses received."),
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(
+        '{}="{}"'.format(name, _escape(value)) for name, value in labels.items()
+    )
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class InMemoryMetrics(MetricsSink):
+    """Keeps the metrics of each method in memory.
+
+    Calls and attempts are counted by status code, and their latencies,
+    along with request and response sizes, are kept as histograms. The
+    metrics can be read with :meth:`snapshot`, or rendered in the
+    Prometheus text format with :meth:`prometheus_text` to be served from
+    a metrics endpoint::
+
+        metrics_sink = InMemoryMetrics()
+        transport = DataCatalogGrpcTransport(metrics_sink=metrics_sink)
+        ...
+        print(metrics_sink.prometheus_text())
+    """
+
+    def __init__(
+        self,
+        *,
+        prefix: str = "datacatalog_client",
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = DEFAULT_SIZE_BUCKETS,
+    ):
+        """Instantiate the sink.
+
+        Args:
+            prefix (str): The prefix of the Prometheus metric names.
+            latency_buckets (Sequence[float]): The upper bounds of the
+                latency histogram buckets, in seconds.
+            size_buckets (Sequence[float]): The upper bounds of the size
+                histogram buckets, in bytes.
+        """
+        self.prefix = prefix
+        self._latency_buckets = tuple(sorted(map(float, latency_buckets)))
+        self._size_buckets = tuple(sorted(size_buckets))
+        self._lock = threading.Lock()
+        self._methods: Dict[Tuple[str, str], _MethodMetrics] = {}
+
+    def _method_locked(self, service: str, method: str) -> _MethodMetrics:
+        metrics = self._methods.get((service, method))
+        if metrics is None:
+            metrics = self._methods[service, method] = _MethodMetrics(
+                self._latency_buckets, self._size_buckets
+            )
+        return metrics
+
+    def record_attempt(
+        self,
+        service: str,
+        method: str,
+        *,
+        latency: float,
+        code: str,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        with self._lock:
+            metrics = self._method_locked(service, method)
+            metrics.attempts[code] = metrics.attempts.get(code, 0) + 1
+            metrics.attempt_latency.observe(latency)
+            metrics.request_bytes.observe(request_bytes)
+            if code == "OK":
+                metrics.response_bytes.observe(response_bytes)
+
+    def record_call(
+        self, service: str, method: str, *, latency: float, code: str, attempts: int,
+    ) -> None:
+        with self._lock:
+            metrics = self._method_locked(service, method)
+            metrics.calls[code] = metrics.calls.get(code, 0) + 1
+            metrics.retries += max(0, attempts - 1)
+            metrics.call_latency.observe(latency)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the metrics of each method called so far.
+
+        The metrics are keyed by ``"Service.method"``. Each has the
+        ``calls`` and ``attempts`` by status code, the number of
+        ``retries``, and the ``call_latency``, ``attempt_latency``,
+        ``request_bytes`` and ``response_bytes`` histograms, each with
+        its ``count``, ``sum`` and cumulative ``buckets`` as
+        ``(upper bound, count)`` pairs.
+        """
+        with self._lock:
+            return {
+                "{}.{}".format(service, method): metrics.snapshot()
+                for (service, method), metrics in self._methods.items()
+            }
+
+    def prometheus_text(self) -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            methods = sorted(
+                (key, metrics.snapshot()) for key, metrics in self._methods.items()
+            )
+
+        lines: List[str] = []
+
+        def header(name, kind, help_text):
+            lines.append("# HELP {}_{} {}".format(self.prefix, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(self.prefix, name, kind))
+
+        def sample(name, labels, value):
+            lines.append("{}_{}{{{}}} {}".format(self.prefix, name, labels, value))
+
+        for key, name, help_text in (
+            ("calls", "calls_total", "Calls by status code."),
+            ("attempts", "attempts_total", "Attempts by status code."),
+        ):
+            header(name, "counter", help_text)
+            for (service, method), metrics in methods:
+                for code, count in sorted(metrics[key].items()):
+                    sample(
+                        name, _labels(service=service, method=method, code=code), count
+                    )
+
+        header("retries_total", "counter", "Attempts after the first of each call.")
+        for (service, method), metrics in methods:
+            sample(
+                "retries_total",
+                _labels(service=service, method=method),
+                metrics["retries"],
+            )
+
+        for key, name, help_text in _HISTOGRAMS:
+            header(name, "histogram", help_text)
+            for (service, method), metrics in methods:
+                labels = _labels(service=service, method=method)
+                histogram = metrics[key]
+                for bound, count in histogram["buckets"]:
+                    sample(
+                        name + "_bucket",
+                        '{},le="{}"'.format(labels, _number(bound)),
+                        count,
+                    )
+                sample(
+                    name + "_bucket", '{},le="+Inf"'.format(labels), histogram["count"],
+                )
+                sample(name + "_sum", labels, _number(histogram["sum"]))
+                sample(name + "_count", labels, histogram["count"])
+
+        return "\n".join(lines) + "\n"
+
+
+__all__ = (
+    "InMemoryMetrics",
+    "MetricsSink",
+)
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A local SQLite mirror of the entries, schemas and tags in Data Catalog.
+
+The first sync lists every entry group, entry and tag under the mirrored
+locations. Later syncs search the catalog for entries modified since the
+last one, newest first, and fetch only those again. Deleted entries are
+removed when a changed entry can no longer be fetched, and on every full
+sync.
+"""
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from google.api_core import exceptions as core_exceptions
+
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import search
+from google.cloud.datacatalog_v1.types import tags
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    name TEXT PRIMARY KEY,
+    entry_group TEXT NOT NULL,
+    linked_resource TEXT,
+    fully_qualified_name TEXT,
+    type TEXT,
+    display_name TEXT,
+    description TEXT,
+    entry BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_entry_group ON entries (entry_group);
+CREATE INDEX IF NOT EXISTS entries_linked_resource ON entries (linked_resource);
+CREATE TABLE IF NOT EXISTS columns (
+    entry TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    type TEXT,
+    mode TEXT,
+    description TEXT,
+    PRIMARY KEY (entry, position)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    name TEXT PRIMARY KEY,
+    entry TEXT NOT NULL,
+    template TEXT NOT NULL,
+    column TEXT,
+    tag BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tags_entry ON tags (entry);
+CREATE INDEX IF NOT EXISTS tags_template ON tags (template);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
+
+# The order in which search returns recently modified entries first.
+_NEWEST_FIRST = "last_modified_timestamp desc"
+
+
+def _nanos(timestamp) -> int:
+    # Search results carry modify_time as a DatetimeWithNanoseconds.
+    pb = timestamp.timestamp_pb()
+    return pb.seconds * 10 ** 9 + pb.nanos
+
+
+def _columns(columns: Iterable, prefix: str = ""):
+    # Flattens nested columns into dotted paths, parents first.
+    for column in columns:
+        path = prefix + column.column
+        yield path, column.type_, column.mode, column.description
+        yield from _columns(column.subcolumns, path + ".")
+
+
+class CatalogMirror:
+    """A SQLite copy of the entries and tags in some Data Catalog locations.
+
+    Reads never call the API: :meth:`get_entry`, :meth:`lookup_entry`,
+    :meth:`list_entries` and :meth:`list_tags` read the local database,
+    which holds the ``entries``, ``columns`` and ``tags`` tables and can
+    also be queried directly through :attr:`connection`. Call
+    :meth:`sync` to bring it up to date.
+    """
+
+    def __init__(
+        self,
+        client: DataCatalogClient,
+        parents: Sequence[str],
+        database: str = ":memory:",
+        *,
+        query: str = "",
+        scope: Optional[datacatalog.SearchCatalogRequest.Scope] = None,
+    ):
+        """Instantiate the mirror.
+
+        Args:
+            client (google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient):
+                The client used to sync the mirror. It must not have been
+                built with ``raw_responses``.
+            parents (Sequence[str]): The locations to mirror, such as
+                ``projects/{project}/locations/{location}``.
+            database (str): The SQLite database file. The mirror is kept
+                in memory by default. A file keeps its contents, and the
+                time of its last sync, between runs.
+            query (str): The search query that finds modified entries.
+                Entries it does not match are only updated by full syncs.
+            scope (google.cloud.datacatalog_v1.types.SearchCatalogRequest.Scope):
+                The scope of that search. Defaults to the projects of
+                ``parents``.
+        Raises:
+            ValueError: If ``parents`` is empty or the client returns raw
+                protobuf messages.
+        """
+        if not parents:
+            raise ValueError("A mirror needs at least one location.")
+        if getattr(client, "_raw_responses", False):
+            raise ValueError("A mirror cannot sync from a raw_responses client.")
+        self._client = client
+        self._parents = tuple(parents)
+        self._query = query
+        if scope is None:
+            projects = []
+            for parent in self._parents:
+                project = client.parse_common_location_path(parent).get("project")
+                if project and project not in projects:
+                    projects.append(project)
+            scope = datacatalog.SearchCatalogRequest.Scope(include_project_ids=projects)
+        self._scope = scope
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        with self.connection:
+            self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self._lock:
+            self.connection.close()
+
+    @property
+    def watermark(self) -> Optional[int]:
+        """The latest ``modify_time`` seen by a sync, in nanoseconds since
+        the epoch, or ``None`` before the first sync."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value FROM sync_state WHERE key = 'watermark'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, full: bool = False) -> int:
+        """Brings the mirror up to date.
+
+        Args:
+            full (bool): Reload every entry, even if the mirror has synced
+                before. This also removes deleted entries that incremental
+                syncs cannot see.
+
+        Returns:
+            int: The number of entries written or removed.
+        """
+        with self._lock:
+            watermark = None if full else self.watermark
+            if watermark is None:
+                return self._full_sync()
+            return self._incremental_sync(watermark)
+
+    def _modified(self):
+        # The search results in scope, most recently modified first.
+        return self._client.search_catalog(
+            request=datacatalog.SearchCatalogRequest(
+                scope=self._scope, query=self._query, order_by=_NEWEST_FIRST,
+            )
+        )
+
+    def _in_scope(self, result: search.SearchCatalogResult) -> bool:
+        if result.search_result_type != search.SearchResultType.ENTRY:
+            return False
+        name = result.relative_resource_name
+        return any(name.startswith(parent + "/") for parent in self._parents)
+
+    def _full_sync(self) -> int:
+        # Read the watermark first, so that entries modified while the
+        # catalog is listed are fetched again by the next sync.
+        watermark = None
+        for result in self._modified():
+            if result.modify_time:
+                watermark = _nanos(result.modify_time)
+            break
+
+        count = 0
+        with self.connection:
+            for table in ("entries", "columns", "tags"):
+                self.connection.execute("DELETE FROM {}".format(table))
+            for parent in self._parents:
+                for group in self._client.list_entry_groups(parent=parent):
+                    for entry in self._client.list_entries(parent=group.name):
+                        self._write_entry(entry)
+                        count += 1
+            self._set_watermark(watermark or 0)
+        return count
+
+    def _incremental_sync(self, watermark: int) -> int:
+        latest = watermark
+        # The names of the modified entries, once each, in search order.
+        names: Dict[str, None] = {}
+        for result in self._modified():
+            if not result.modify_time:
+                continue
+            modified = _nanos(result.modify_time)
+            if modified < watermark:
+                break
+            latest = max(latest, modified)
+            if self._in_scope(result):
+                names[result.relative_resource_name] = None
+
+        with self.connection:
+            for name in names:
+                try:
+                    entry = self._client.get_entry(name=name)
+                except core_exceptions.NotFound:
+                    self._delete_entry(name)
+                else:
+                    self._write_entry(entry)
+            self._set_watermark(latest)
+        return len(names)
+
+    def _set_watermark(self, watermark: int) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES ('watermark', ?)", (watermark,)
+        )
+
+    def _delete_entry(self, name: str) -> None:
+        for statement in (
+            "DELETE FROM entries WHERE name = ?",
+            "DELETE FROM columns WHERE entry = ?",
+            "DELETE FROM tags WHERE entry = ?",
+        ):
+            self.connection.execute(statement, (name,))
+
+    def _write_entry(self, entry: datacatalog.Entry) -> None:
+        self._delete_entry(entry.name)
+        if entry.type_:
+            entry_type = entry.type_.name
+        else:
+            entry_type = entry.user_specified_type
+        self.connection.execute(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.name,
+                entry.name.rsplit("/entries/", 1)[0],
+                entry.linked_resource,
+                entry.fully_qualified_name,
+                entry_type,
+                entry.display_name,
+                entry.description,
+                datacatalog.Entry.serialize(entry),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO columns VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (entry.name, position) + column
+                for position, column in enumerate(_columns(entry.schema.columns))
+            ],
+        )
+        self.connection.executemany(
+            "INSERT INTO tags VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    tag.name,
+                    entry.name,
+                    tag.template,
+                    tag.column,
+                    tags.Tag.serialize(tag),
+                )
+                for tag in self._client.list_tags(parent=entry.name)
+            ],
+        )
+
+    def _entries(self, where: str, *args) -> List[datacatalog.Entry]:
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT entry FROM entries WHERE {} ORDER BY name".format(where), args
+            ).fetchall()
+        return [datacatalog.Entry.deserialize(row[0]) for row in rows]
+
+    def get_entry(self, name: str) -> Optional[datacatalog.Entry]:
+        """Returns the entry called ``name``, or ``None`` if the mirror
+        does not hold it."""
+        entries = self._entries("name = ?", name)
+        return entries[0] if entries else None
+
+    def lookup_entry(self, linked_resource: str) -> Optional[datacatalog.Entry]:
+        """Returns the entry of a Google Cloud resource, by its full name,
+        or ``None`` if the mirror does not hold it."""
+        entries = self._entries("linked_resource = ?", linked_resource)
+        return entries[0] if entries else None
+
+    def list_entries(self, entry_group: str) -> List[datacatalog.Entry]:
+        """Returns the entries in an entry group, ordered by name."""
+        return self._entries("entry_group = ?", entry_group)
+
+    def list_tags(self, entry: str) -> List[tags.Tag]:
+        """Returns the tags on an entry and its columns, ordered by name."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT tag FROM tags WHERE entry = ? ORDER BY name", (entry,)
+            ).fetchall()
+        return [tags.Tag.deserialize(row[0]) for row in rows]
+
+
+__all__ = ("CatalogMirror",)
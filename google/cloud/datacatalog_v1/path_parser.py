@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Parsers for resource names such as ``projects/{project}/locations/{location}``."""
+import operator
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_VARIABLE = re.compile(r"^\{(\w+)\}$")
+
+# Returned by PathParser._split for names only the regular expression can parse.
+_SLOW_PATH = object()
+
+
+def _getter(indices: Sequence[int]) -> Callable[[Sequence[str]], Tuple[str, ...]]:
+    """Returns a function that picks the items at ``indices`` as a tuple."""
+    if not indices:
+        return lambda parts: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda parts: (parts[index],)
+    return operator.itemgetter(*indices)
+
+
+class PathParser:
+    """Parses resource names that follow one path template.
+
+    Results are the same as matching the name against the template's
+    regular expression, in which each ``{variable}`` is a lazy ``.+?``
+    group. Most names have one path segment per template segment; those
+    are parsed by splitting on ``/``, and only the others, whose values
+    contain ``/`` or newlines, fall back to the regular expression.
+    """
+
+    def __init__(self, template: str):
+        """Instantiate the parser.
+
+        Args:
+            template (str): The path template, such as
+                ``"projects/{project}/locations/{location}"``.
+        """
+        self.template = template
+        segments = template.split("/")
+        self._size = len(segments)
+        literals = [
+            (index, segment)
+            for index, segment in enumerate(segments)
+            if not _VARIABLE.match(segment)
+        ]
+        variables = [
+            (index, _VARIABLE.match(segment).group(1))
+            for index, segment in enumerate(segments)
+            if _VARIABLE.match(segment)
+        ]
+        self.names = tuple(name for _, name in variables)
+        self._literals = tuple(literal for _, literal in literals)
+        self._get_literals = _getter([index for index, _ in literals])
+        self._get_values = _getter([index for index, _ in variables])
+        self._regex = re.compile(
+            "^{}$".format(re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template))
+        )
+
+    def _split(self, path: str) -> Any:
+        # Returns the values of path, None if it does not follow the
+        # template, or _SLOW_PATH if only the regular expression can tell.
+        parts = path.split("/")
+        if len(parts) != self._size or "\n" in path:
+            # A value contains "/", or the name does not match at all.
+            return _SLOW_PATH
+        # With one part per segment, values cannot contain "/", so every
+        # literal must be in place and every value non-empty.
+        values = self._get_values(parts)
+        if self._get_literals(parts) != self._literals or not all(values):
+            return None
+        return values
+
+    def parse(self, path: str) -> Dict[str, str]:
+        """Parses ``path`` into its variables; returns ``{}`` if it does not
+        follow the template."""
+        values = self._split(path)
+        if values is _SLOW_PATH:
+            match = self._regex.match(path)
+            return match.groupdict() if match else {}
+        return dict(zip(self.names, values)) if values else {}
+
+    def parse_batch(self, paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses ``paths`` into one column per variable.
+
+        The columns are parallel to ``paths``: the ``i``-th value of each
+        column comes from the ``i``-th path, and is ``None`` if that path
+        does not follow the template.
+        """
+        missing = (None,) * len(self.names)
+        rows = []
+        for path in paths:
+            values = self._split(path)
+            if values is _SLOW_PATH:
+                match = self._regex.match(path)
+                values = match.groups() if match else None
+            rows.append(values or missing)
+        if not rows:
+            return {name: [] for name in self.names}
+        return {name: list(column) for name, column in zip(self.names, zip(*rows))}
+
+
+__all__ = ("PathParser",)
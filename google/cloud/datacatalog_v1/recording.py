@@ -0,0 +1,445 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Recording of unary gRPC calls, and their replay without a network.
+
+A :class:`RecordingChannel` sends each unary call on another channel and
+appends it to a recording file: the method, the serialized request, the
+serialized response or error, the time the call started and how long it
+took. A :class:`ReplayChannel` answers calls from such a file, mapped
+into memory, without a connection, optionally taking as long as the
+recorded calls did.
+
+A recording is a header followed by records, each a fixed-size header
+and then the method, request and response bytes. Records are only ever
+appended, so several runs can record to one file; a record cut short by
+a crash is ignored when the file is read.
+"""
+import collections
+import mmap
+import struct
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import grpc  # type: ignore
+import proto  # type: ignore
+
+from google.protobuf import message as pb_message
+
+# Record calls sent on another channel.
+RECORD = "record"
+# Answer calls from a recording.
+REPLAY = "replay"
+
+_MAGIC = b"datacatalog-recording/1\n"
+
+# Start time, latency, status code and the lengths of the method, request
+# and response.
+_RECORD_HEADER = struct.Struct("<ddBHII")
+
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+class Record(NamedTuple):
+    """A recorded call.
+
+    Attributes:
+        method (str): The full method name, such as
+            ``"/google.cloud.datacatalog.v1.DataCatalog/GetEntry"``.
+        start_time (float): When the call started, in seconds since the
+            epoch.
+        latency (float): How long the call took, in seconds.
+        code (grpc.StatusCode): The status of the call.
+        request (bytes): The serialized request.
+        response (bytes): The serialized response, or the error details
+            if the call failed.
+    """
+
+    method: str
+    start_time: float
+    latency: float
+    code: grpc.StatusCode
+    request: bytes
+    response: bytes
+
+
+def _serialize_request(request, request_serializer: Optional[Callable]) -> bytes:
+    # Requests are recorded and looked up by their deterministic bytes, as
+    # the order in which map fields are serialized may otherwise differ
+    # between equal requests.
+    if isinstance(request, proto.Message):
+        request = type(request).pb(request)
+    if isinstance(request, pb_message.Message):
+        return request.SerializeToString(deterministic=True)
+    if request_serializer is not None:
+        return request_serializer(request)
+    return request
+
+
+def _open_recording(path: str) -> Tuple[mmap.mmap, int]:
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[: len(_MAGIC)] != _MAGIC:
+        data.close()
+        raise ValueError("{} is not a recording.".format(path))
+    return data, len(_MAGIC)
+
+
+def _scan(data: mmap.mmap, offset: int) -> Iterator[Tuple[int, tuple]]:
+    # Yields the offset of the bytes of each complete record, and its header.
+    while offset + _RECORD_HEADER.size <= len(data):
+        header = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        end = offset + header[3] + header[4] + header[5]
+        if end > len(data):
+            return
+        yield offset, header
+        offset = end
+
+
+def read_records(path: str) -> Iterator[Record]:
+    """Yields the calls recorded in ``path``, in the order they finished."""
+    data, offset = _open_recording(path)
+    try:
+        for offset, header in _scan(data, offset):
+            (
+                start_time,
+                latency,
+                code,
+                method_length,
+                request_length,
+                response_length,
+            ) = header
+            request_offset = offset + method_length
+            response_offset = request_offset + request_length
+            yield Record(
+                method=data[offset:request_offset].decode("utf-8"),
+                start_time=start_time,
+                latency=latency,
+                code=_STATUS_CODES[code],
+                request=data[request_offset:response_offset],
+                response=data[response_offset : response_offset + response_length],
+            )
+    finally:
+        data.close()
+
+
+class _Recorder:
+    """Appends records to a file, from any thread."""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+
+    def append(
+        self,
+        method: bytes,
+        start_time: float,
+        latency: float,
+        code: grpc.StatusCode,
+        request: bytes,
+        response: bytes,
+    ) -> None:
+        header = _RECORD_HEADER.pack(
+            start_time,
+            latency,
+            code.value[0],
+            len(method),
+            len(request),
+            len(response),
+        )
+        with self._lock:
+            self._file.write(header + method + request + response)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class _RecordingUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self,
+        recorder: _Recorder,
+        method: str,
+        callable_: grpc.UnaryUnaryMultiCallable,
+        request_serializer: Optional[Callable],
+        response_deserializer: Optional[Callable],
+    ):
+        self._recorder = recorder
+        self._method = method.encode("utf-8")
+        self._callable = callable_
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+
+    def with_call(self, request, *args, **kwargs):
+        request = _serialize_request(request, self._request_serializer)
+        start_time = time.time()
+        start = time.perf_counter()
+        try:
+            response, call = self._callable.with_call(request, *args, **kwargs)
+        except grpc.RpcError as exc:
+            self._recorder.append(
+                self._method,
+                start_time,
+                time.perf_counter() - start,
+                exc.code(),
+                request,
+                (exc.details() or "").encode("utf-8"),
+            )
+            raise
+        self._recorder.append(
+            self._method,
+            start_time,
+            time.perf_counter() - start,
+            grpc.StatusCode.OK,
+            request,
+            response,
+        )
+        if self._response_deserializer is not None:
+            response = self._response_deserializer(response)
+        return response, call
+
+    def __call__(self, request, *args, **kwargs):
+        return self.with_call(request, *args, **kwargs)[0]
+
+    def future(self, request, *args, **kwargs):
+        raise NotImplementedError("Recorded calls cannot be made as futures.")
+
+
+class RecordingChannel(grpc.Channel):
+    """A :class:`grpc.Channel` that records the unary calls sent on another.
+
+    Calls are sent on ``channel`` and appended to the recording at
+    ``path``, which is created if it does not exist. Closing the channel
+    closes ``channel`` and the recording.
+    """
+
+    def __init__(self, channel: grpc.Channel, path: str):
+        self.channel = channel
+        self._recorder = _Recorder(path)
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        # The calls on the wrapped channel send and receive bytes.
+        return _RecordingUnaryUnaryMultiCallable(
+            self._recorder,
+            method,
+            self.channel.unary_unary(method, **kwargs),
+            request_serializer,
+            response_deserializer,
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        return self.channel.unary_stream(method, *args, **kwargs)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return self.channel.stream_unary(method, *args, **kwargs)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return self.channel.stream_stream(method, *args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def flush(self) -> None:
+        """Writes the records buffered so far to the file."""
+        self._recorder.flush()
+
+    def close(self):
+        self.channel.close()
+        self._recorder.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _ReplayedCall(grpc.Call):
+    """A replayed call, which is complete and has no metadata."""
+
+    def __init__(self, code: grpc.StatusCode, details: Optional[str] = None):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return ()
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+
+class _ReplayedRpcError(grpc.RpcError, _ReplayedCall):
+    """A recorded error, raised as the channel would have raised it."""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        grpc.RpcError.__init__(self, details)
+        _ReplayedCall.__init__(self, code, details)
+
+
+class _ReplayUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    def __init__(
+        self,
+        channel: "ReplayChannel",
+        method: str,
+        request_serializer: Optional[Callable],
+        response_deserializer: Optional[Callable],
+    ):
+        self._channel = channel
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+
+    def with_call(self, request, *args, **kwargs):
+        request = _serialize_request(request, self._request_serializer)
+        latency, code, response = self._channel._replay(self._method, request)
+        if self._channel.reproduce_latency:
+            time.sleep(latency)
+        if code is not grpc.StatusCode.OK:
+            raise _ReplayedRpcError(code, response.decode("utf-8"))
+        if self._response_deserializer is not None:
+            response = self._response_deserializer(response)
+        return response, _ReplayedCall(code)
+
+    def __call__(self, request, *args, **kwargs):
+        return self.with_call(request, *args, **kwargs)[0]
+
+    def future(self, request, *args, **kwargs):
+        raise NotImplementedError("Replayed calls cannot be made as futures.")
+
+
+class ReplayChannel(grpc.Channel):
+    """A :class:`grpc.Channel` that answers unary calls from a recording.
+
+    The recording at ``path`` is mapped into memory, and each call is
+    answered with the response, or error, recorded for the same method
+    and request, serialized deterministically. Calls made more often than
+    they were recorded get the recorded responses in turn, the last one
+    repeating. A call that was never recorded raises :class:`LookupError`.
+
+    If ``reproduce_latency`` is set, each call takes as long as the
+    recorded call did.
+    """
+
+    def __init__(self, path: str, *, reproduce_latency: bool = False):
+        self.reproduce_latency = reproduce_latency
+        self._data, offset = _open_recording(path)
+        self._lock = threading.Lock()
+        # The records of each method and request, as the offset of the
+        # response and the record header, and how many have been replayed.
+        self._records: Dict[
+            Tuple[str, bytes], List[Tuple[int, tuple]]
+        ] = collections.defaultdict(list)
+        self._replayed: collections.Counter = collections.Counter()
+        for offset, header in _scan(self._data, offset):
+            method_end = offset + header[3]
+            request_end = method_end + header[4]
+            key = (
+                self._data[offset:method_end].decode("utf-8"),
+                self._data[method_end:request_end],
+            )
+            self._records[key].append((request_end, header))
+
+    def _replay(
+        self, method: str, request: bytes
+    ) -> Tuple[float, grpc.StatusCode, bytes]:
+        key = (method, request)
+        records = self._records.get(key)
+        if not records:
+            raise LookupError(
+                "No recorded call of {} matches the request.".format(method)
+            )
+        with self._lock:
+            index = min(self._replayed[key], len(records) - 1)
+            self._replayed[key] += 1
+        offset, (_, latency, code, _, _, response_length) = records[index]
+        return (
+            latency,
+            _STATUS_CODES[code],
+            self._data[offset : offset + response_length],
+        )
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        return _ReplayUnaryUnaryMultiCallable(
+            self, method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("Only unary calls are replayed.")
+
+    def stream_unary(self, method, *args, **kwargs):
+        raise NotImplementedError("Only unary calls are replayed.")
+
+    def stream_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("Only unary calls are replayed.")
+
+    def subscribe(self, callback, try_to_connect=False):
+        callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback):
+        pass
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+__all__ = (
+    "RECORD",
+    "REPLAY",
+    "Record",
+    "RecordingChannel",
+    "ReplayChannel",
+    "read_records",
+)
@@ -13,10 +13,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 from collections import OrderedDict
 import functools
+import heapq
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
 
 from google.api_core.client_options import ClientOptions
@@ -31,6 +47,8 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.datacatalog_v1 import coalescing
+from google.cloud.datacatalog_v1.services.data_catalog import cache
 from google.cloud.datacatalog_v1.services.data_catalog import pagers
 from google.cloud.datacatalog_v1.types import common
 from google.cloud.datacatalog_v1.types import data_source
@@ -48,6 +66,8 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from .transports.base import DataCatalogTransport, DEFAULT_CLIENT_INFO
 from .transports.grpc_asyncio import DataCatalogGrpcAsyncIOTransport
 from .client import DataCatalogClient
+from .client import _entry_parent_and_id, _lookup_entry_requests, _read_mask
+from .client import _partition_search_scope, _search_result_sort_key
 
 
 class DataCatalogAsyncClient:
@@ -62,42 +82,67 @@ class DataCatalogAsyncClient:
 
     entry_path = staticmethod(DataCatalogClient.entry_path)
     parse_entry_path = staticmethod(DataCatalogClient.parse_entry_path)
+    parse_entry_paths = staticmethod(DataCatalogClient.parse_entry_paths)
     entry_group_path = staticmethod(DataCatalogClient.entry_group_path)
     parse_entry_group_path = staticmethod(DataCatalogClient.parse_entry_group_path)
+    parse_entry_group_paths = staticmethod(DataCatalogClient.parse_entry_group_paths)
     tag_path = staticmethod(DataCatalogClient.tag_path)
     parse_tag_path = staticmethod(DataCatalogClient.parse_tag_path)
+    parse_tag_paths = staticmethod(DataCatalogClient.parse_tag_paths)
     tag_template_path = staticmethod(DataCatalogClient.tag_template_path)
     parse_tag_template_path = staticmethod(DataCatalogClient.parse_tag_template_path)
+    parse_tag_template_paths = staticmethod(DataCatalogClient.parse_tag_template_paths)
     tag_template_field_path = staticmethod(DataCatalogClient.tag_template_field_path)
     parse_tag_template_field_path = staticmethod(
         DataCatalogClient.parse_tag_template_field_path
     )
+    parse_tag_template_field_paths = staticmethod(
+        DataCatalogClient.parse_tag_template_field_paths
+    )
     tag_template_field_enum_value_path = staticmethod(
         DataCatalogClient.tag_template_field_enum_value_path
     )
     parse_tag_template_field_enum_value_path = staticmethod(
         DataCatalogClient.parse_tag_template_field_enum_value_path
     )
+    parse_tag_template_field_enum_value_paths = staticmethod(
+        DataCatalogClient.parse_tag_template_field_enum_value_paths
+    )
     common_billing_account_path = staticmethod(
         DataCatalogClient.common_billing_account_path
     )
     parse_common_billing_account_path = staticmethod(
         DataCatalogClient.parse_common_billing_account_path
     )
+    parse_common_billing_account_paths = staticmethod(
+        DataCatalogClient.parse_common_billing_account_paths
+    )
     common_folder_path = staticmethod(DataCatalogClient.common_folder_path)
     parse_common_folder_path = staticmethod(DataCatalogClient.parse_common_folder_path)
+    parse_common_folder_paths = staticmethod(
+        DataCatalogClient.parse_common_folder_paths
+    )
     common_organization_path = staticmethod(DataCatalogClient.common_organization_path)
     parse_common_organization_path = staticmethod(
         DataCatalogClient.parse_common_organization_path
     )
+    parse_common_organization_paths = staticmethod(
+        DataCatalogClient.parse_common_organization_paths
+    )
     common_project_path = staticmethod(DataCatalogClient.common_project_path)
     parse_common_project_path = staticmethod(
         DataCatalogClient.parse_common_project_path
     )
+    parse_common_project_paths = staticmethod(
+        DataCatalogClient.parse_common_project_paths
+    )
     common_location_path = staticmethod(DataCatalogClient.common_location_path)
     parse_common_location_path = staticmethod(
         DataCatalogClient.parse_common_location_path
     )
+    parse_common_location_paths = staticmethod(
+        DataCatalogClient.parse_common_location_paths
+    )
 
     @classmethod
     def from_service_account_info(cls, info: dict, *args, **kwargs):
@@ -188,6 +233,9 @@ class DataCatalogAsyncClient:
         transport: Union[str, DataCatalogTransport] = "grpc_asyncio",
         client_options: ClientOptions = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        entry_cache: Optional[cache.EntryCache] = None,
+        coalesce_reads: bool = False,
+        raw_responses: bool = False,
     ) -> None:
         """Instantiates the data catalog client.
 
@@ -216,6 +264,19 @@ class DataCatalogAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            entry_cache (Optional[google.cloud.datacatalog_v1.services.data_catalog.cache.EntryCache]):
+                An optional cache for ``get_entry`` and ``lookup_entry``
+                results. Entries updated or deleted through this client
+                are dropped from it.
+            coalesce_reads (bool): If ``True``, identical read requests
+                made concurrently, with the same metadata, share a single
+                in-flight call and its result. This applies to
+                ``get_entry``, ``lookup_entry``, ``get_entry_group`` and
+                ``get_tag_template``.
+            raw_responses (bool): If ``True``, methods return the
+                protobuf messages underlying the usual proto-plus
+                responses, and pagers iterate over protobuf messages. Field
+                access on these skips proto-plus conversion.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -226,7 +287,10 @@ class DataCatalogAsyncClient:
             transport=transport,
             client_options=client_options,
             client_info=client_info,
+            entry_cache=entry_cache,
+            raw_responses=raw_responses,
         )
+        self._single_flight = coalescing.AsyncSingleFlight() if coalesce_reads else None
 
     async def search_catalog(
         self,
@@ -237,6 +301,7 @@ class DataCatalogAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.SearchCatalogAsyncPager:
         r"""Searches Data Catalog for multiple resources like entries and
         tags that match a query.
@@ -294,6 +359,10 @@ class DataCatalogAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.data_catalog.pagers.SearchCatalogAsyncPager:
@@ -325,8 +394,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.search_catalog,
+        rpc = self._client._transport._wrap_async(
+            "search_catalog",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -346,12 +415,193 @@ class DataCatalogAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.SearchCatalogAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
+            raw=self._client._raw_responses,
         )
 
         # Done; return the response.
         return response
 
+    async def search_catalog_partitioned(
+        self,
+        request: Union[datacatalog.SearchCatalogRequest, dict] = None,
+        *,
+        scope: datacatalog.SearchCatalogRequest.Scope = None,
+        query: str = None,
+        max_workers: int = 8,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> AsyncIterator[search.SearchCatalogResult]:
+        r"""Searches Data Catalog with one concurrent search per scope
+        partition.
+
+        The scope is split into one sub-scope per organization ID, per
+        project ID and, if included, one for GCP public datasets. The
+        sub-scopes are paged through concurrently and their results are
+        merged into a single async iterator. Results that appear in more
+        than one partition are returned once, keyed by
+        ``relative_resource_name``.
+
+        If ``order_by`` is ``last_modified_timestamp [asc|desc]``, the
+        partitions are merged in that order. Otherwise results are
+        returned in the order their pages arrive.
+
+        Args:
+            request (Union[google.cloud.datacatalog_v1.types.SearchCatalogRequest, dict]):
+                The request object. Request message for
+                [SearchCatalog][google.cloud.datacatalog.v1.DataCatalog.SearchCatalog].
+            scope (:class:`google.cloud.datacatalog_v1.types.SearchCatalogRequest.Scope`):
+                Required. The scope of this search request.
+
+                This corresponds to the ``scope`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            query (:class:`str`):
+                Optional. The query string, as for
+                [search_catalog][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient.search_catalog].
+
+                This corresponds to the ``query`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            max_workers (int): The maximum number of search requests
+                in flight at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            AsyncIterator[google.cloud.datacatalog_v1.types.SearchCatalogResult]:
+                The merged results of all partitions. Closing the
+                iterator cancels the outstanding requests.
+
+        """
+        has_flattened_params = any([scope, query])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        request = datacatalog.SearchCatalogRequest(request)
+        if scope is not None:
+            request.scope = scope
+        if query is not None:
+            request.query = query
+
+        partitions = []
+        for partition_scope in _partition_search_scope(request.scope):
+            partition = datacatalog.SearchCatalogRequest(request)
+            partition.scope = partition_scope
+            partitions.append(partition)
+        if not partitions:
+            raise ValueError(
+                "The scope must include at least one organization, project "
+                "or the GCP public datasets."
+            )
+
+        return self._search_partitions(
+            partitions,
+            sort_key=_search_result_sort_key(request.order_by),
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def _search_partitions(
+        self,
+        partitions: Sequence[datacatalog.SearchCatalogRequest],
+        *,
+        sort_key: Optional[Callable[[search.SearchCatalogResult], Tuple[int, int]]],
+        max_workers: int,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> AsyncIterator[search.SearchCatalogResult]:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def partition_pages(partition):
+            pager = await self.search_catalog(
+                request=partition, retry=retry, timeout=timeout, metadata=metadata,
+            )
+            async for page in pager.pages:
+                yield page
+
+        async def next_page(pages):
+            async with semaphore:
+                try:
+                    return await pages.__anext__()
+                except StopAsyncIteration:
+                    return None
+
+        # Each partition has at most one page request outstanding; the next
+        # one is scheduled as soon as the previous page arrives.
+        pending = {}
+        for pages in [partition_pages(partition) for partition in partitions]:
+            pending[asyncio.ensure_future(next_page(pages))] = pages
+
+        seen = set()
+        try:
+            if sort_key is None:
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        pages = pending.pop(task)
+                        page = task.result()
+                        if page is None:
+                            continue
+                        pending[asyncio.ensure_future(next_page(pages))] = pages
+                        for result in page.results:
+                            if result.relative_resource_name not in seen:
+                                seen.add(result.relative_resource_name)
+                                yield result
+                return
+
+            # Merge the partitions by keeping the head result of each in a heap.
+            tasks = list(pending)
+            all_pages = [pending[task] for task in tasks]
+            buffers = [[] for _ in tasks]
+            heap = []
+
+            async def advance(index):
+                while not buffers[index]:
+                    if tasks[index] is None:
+                        return
+                    page = await tasks[index]
+                    del pending[tasks[index]]
+                    if page is None:
+                        tasks[index] = None
+                        return
+                    task = asyncio.ensure_future(next_page(all_pages[index]))
+                    pending[task] = all_pages[index]
+                    tasks[index] = task
+                    buffers[index] = list(reversed(page.results))
+                result = buffers[index].pop()
+                heapq.heappush(heap, (sort_key(result), index, result))
+
+            for index in range(len(tasks)):
+                await advance(index)
+            while heap:
+                _, index, result = heapq.heappop(heap)
+                if result.relative_resource_name not in seen:
+                    seen.add(result.relative_resource_name)
+                    yield result
+                await advance(index)
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def create_entry_group(
         self,
         request: Union[datacatalog.CreateEntryGroupRequest, dict] = None,
@@ -465,10 +715,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_entry_group,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "create_entry_group", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -481,7 +729,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def get_entry_group(
         self,
@@ -489,6 +737,7 @@ class DataCatalogAsyncClient:
         *,
         name: str = None,
         read_mask: field_mask_pb2.FieldMask = None,
+        fields: Sequence[str] = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
@@ -513,6 +762,12 @@ class DataCatalogAsyncClient:
                 This corresponds to the ``read_mask`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            fields (Sequence[str]):
+                The fields of the entry group to return, such as
+                ``["name", "display_name"]``. A shorthand for
+                ``read_mask``, which should then not be set.
+
+                If ``request`` is provided, this should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -531,12 +786,14 @@ class DataCatalogAsyncClient:
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([name, read_mask])
+        has_flattened_params = any([name, read_mask]) or fields is not None
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
                 "the individual field arguments should be set."
             )
+        if read_mask is not None and fields is not None:
+            raise ValueError("Only one of `read_mask` and `fields` may be set.")
 
         request = datacatalog.GetEntryGroupRequest(request)
 
@@ -546,11 +803,13 @@ class DataCatalogAsyncClient:
             request.name = name
         if read_mask is not None:
             request.read_mask = read_mask
+        if fields is not None:
+            request.read_mask = _read_mask(datacatalog.EntryGroup, fields)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_entry_group,
+        rpc = self._client._transport._wrap_async(
+            "get_entry_group",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -570,11 +829,13 @@ class DataCatalogAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = await self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def update_entry_group(
         self,
@@ -652,10 +913,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_entry_group,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "update_entry_group", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -670,7 +929,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def delete_entry_group(
         self,
@@ -724,10 +983,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_entry_group,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "delete_entry_group", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -749,6 +1006,7 @@ class DataCatalogAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListEntryGroupsAsyncPager:
         r"""Lists entry groups.
 
@@ -769,6 +1027,10 @@ class DataCatalogAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.data_catalog.pagers.ListEntryGroupsAsyncPager:
@@ -798,8 +1060,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_entry_groups,
+        rpc = self._client._transport._wrap_async(
+            "list_entry_groups",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -825,7 +1087,12 @@ class DataCatalogAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListEntryGroupsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
+            raw=self._client._raw_responses,
         )
 
         # Done; return the response.
@@ -929,10 +1196,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_entry,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "create_entry", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -944,8 +1209,12 @@ class DataCatalogAsyncClient:
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The new entry may have been cached as not found, by name or lookup.
+        if self._client._entry_cache is not None:
+            self._client._entry_cache.invalidate_entry(response)
+
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def update_entry(
         self,
@@ -1052,10 +1321,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_entry,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "update_entry", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1069,8 +1336,13 @@ class DataCatalogAsyncClient:
         # Send the request.
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Drop the cached copies of the entry that was changed, and lookups
+        # cached as not found that may now find it.
+        if self._client._entry_cache is not None:
+            self._client._entry_cache.invalidate_entry(response)
+
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def delete_entry(
         self,
@@ -1128,10 +1400,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_entry,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "delete_entry", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1145,6 +1415,28 @@ class DataCatalogAsyncClient:
             request, retry=retry, timeout=timeout, metadata=metadata,
         )
 
+        # Drop the cached copies of the entry that was deleted.
+        if self._client._entry_cache is not None:
+            self._client._entry_cache.invalidate(request.name)
+
+    async def _send_read(
+        self,
+        rpc: Callable[..., Awaitable[Any]],
+        request: Any,
+        *,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> Any:
+        def send():
+            return rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        if self._single_flight is None:
+            return await send()
+        return await self._single_flight.call(
+            coalescing.request_key(request, metadata), send
+        )
+
     async def get_entry(
         self,
         request: Union[datacatalog.GetEntryRequest, dict] = None,
@@ -1207,8 +1499,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_entry,
+        rpc = self._client._transport._wrap_async(
+            "get_entry",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -1228,11 +1520,16 @@ class DataCatalogAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, unless the entry is cached.
+        response = await self._read_entry(
+            cache.get_entry_key(request.name),
+            lambda: self._send_read(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            ),
+        )
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def lookup_entry(
         self,
@@ -1276,8 +1573,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.lookup_entry,
+        rpc = self._client._transport._wrap_async(
+            "lookup_entry",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -1291,20 +1588,296 @@ class DataCatalogAsyncClient:
             client_info=DEFAULT_CLIENT_INFO,
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, unless the entry is cached.
+        response = await self._read_entry(
+            cache.lookup_entry_key(request),
+            lambda: self._send_read(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            ),
+        )
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
+
+    async def _read_entry(
+        self,
+        key: Optional[cache.CacheKey],
+        read: Callable[[], Awaitable[datacatalog.Entry]],
+    ) -> datacatalog.Entry:
+        entry_cache = self._client._entry_cache
+        if entry_cache is None or key is None:
+            return await read()
+        entry = entry_cache.get(key)
+        if entry is not None:
+            return entry
+        try:
+            entry = await read()
+        except core_exceptions.NotFound as exc:
+            entry_cache.put_not_found(key, exc)
+            raise
+        entry_cache.put(key, entry)
+        return entry
+
+    async def batch_get_entries(
+        self,
+        names: Sequence[str],
+        *,
+        max_workers: int = 16,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[Union[datacatalog.Entry, Exception]]:
+        r"""Gets many entries with concurrent
+        [get_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient.get_entry]
+        calls.
+
+        Args:
+            names (Sequence[str]):
+                The names of the entries to get.
+            max_workers (int): The maximum number of requests in flight
+                at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            List[Union[google.cloud.datacatalog_v1.types.Entry, Exception]]:
+                One item per name, in input order: the entry, or the
+                exception raised while getting it.
+
+        """
+        requests = [datacatalog.GetEntryRequest(name=name) for name in names]
+        return await self._batch_call(
+            self.get_entry,
+            requests,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def batch_lookup_entries(
+        self,
+        *,
+        linked_resources: Sequence[str] = None,
+        sql_resources: Sequence[str] = None,
+        fully_qualified_names: Sequence[str] = None,
+        max_workers: int = 16,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[Union[datacatalog.Entry, Exception]]:
+        r"""Looks up many entries with concurrent
+        [lookup_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient.lookup_entry]
+        calls.
+
+        Exactly one of ``linked_resources``, ``sql_resources`` and
+        ``fully_qualified_names`` must be set.
+
+        Args:
+            linked_resources (Sequence[str]):
+                The full names of the Google Cloud Platform resources
+                to look up.
+            sql_resources (Sequence[str]):
+                The names of the resources to look up, in SQL syntax.
+            fully_qualified_names (Sequence[str]):
+                The fully qualified names of the resources to look up.
+            max_workers (int): The maximum number of requests in flight
+                at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            List[Union[google.cloud.datacatalog_v1.types.Entry, Exception]]:
+                One item per target, in input order: the entry, or the
+                exception raised while looking it up.
+
+        """
+        requests = _lookup_entry_requests(
+            linked_resources=linked_resources,
+            sql_resources=sql_resources,
+            fully_qualified_names=fully_qualified_names,
+        )
+        return await self._batch_call(
+            self.lookup_entry,
+            requests,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def _batch_call(
+        self,
+        method: Callable[..., Any],
+        requests: Sequence[Any],
+        *,
+        max_workers: int,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> List[Any]:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(request):
+            async with semaphore:
+                try:
+                    return await method(
+                        request=request,
+                        retry=retry,
+                        timeout=timeout,
+                        metadata=metadata,
+                    )
+                except Exception as exc:
+                    return exc
+
+        return list(await asyncio.gather(*[call(request) for request in requests]))
+
+    async def bulk_upsert_entries(
+        self,
+        entries: Union[Iterable[datacatalog.Entry], AsyncIterable[datacatalog.Entry]],
+        *,
+        max_in_flight: int = 16,
+        update_mask: field_mask_pb2.FieldMask = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> AsyncIterator[Tuple[datacatalog.Entry, Union[datacatalog.Entry, Exception]]]:
+        r"""Creates or updates many entries with concurrent requests.
+
+        Each entry's ``name`` must be the full name it is to have, in the
+        form ``projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}``.
+        The entry is first created with
+        [create_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient.create_entry];
+        if it already exists, it is updated with
+        [update_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient.update_entry]
+        instead.
+
+        ``entries`` may be a generator or an async generator. It is read
+        only while fewer than ``max_in_flight`` entries are being
+        written, so a producer that outpaces the service is held back
+        rather than buffered.
+
+        Args:
+            entries (Union[Iterable[:class:`google.cloud.datacatalog_v1.types.Entry`], AsyncIterable[:class:`google.cloud.datacatalog_v1.types.Entry`]]):
+                The entries to write.
+            max_in_flight (int): The maximum number of entries being
+                written at once.
+            update_mask (:class:`google.protobuf.field_mask_pb2.FieldMask`):
+                The fields to overwrite when an entry is updated. If
+                absent, all modifiable fields are overwritten.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            AsyncIterator[Tuple[google.cloud.datacatalog_v1.types.Entry, Union[google.cloud.datacatalog_v1.types.Entry, Exception]]]:
+                One ``(entry, outcome)`` pair per input entry, in the
+                order the writes finish. The outcome is the created or
+                updated entry, or the exception raised while writing it.
+                Entries are only written as the iterator is consumed;
+                closing it cancels the writes in flight.
+
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        return self._bulk_upsert(
+            entries,
+            max_in_flight=max_in_flight,
+            update_mask=update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def _upsert_entry(
+        self,
+        entry: datacatalog.Entry,
+        *,
+        update_mask: Optional[field_mask_pb2.FieldMask],
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> datacatalog.Entry:
+        parent, entry_id = _entry_parent_and_id(entry.name)
+        try:
+            return await self.create_entry(
+                parent=parent,
+                entry_id=entry_id,
+                entry=entry,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        except core_exceptions.AlreadyExists:
+            return await self.update_entry(
+                entry=entry,
+                update_mask=update_mask,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+    async def _bulk_upsert(
+        self,
+        entries: Union[Iterable[datacatalog.Entry], AsyncIterable[datacatalog.Entry]],
+        *,
+        max_in_flight: int,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[datacatalog.Entry, Union[datacatalog.Entry, Exception]]]:
+        async def upsert(entry):
+            try:
+                return await self._upsert_entry(entry, **kwargs)
+            except Exception as exc:
+                return exc
+
+        async def entry_stream():
+            if isinstance(entries, AsyncIterable):
+                async for entry in entries:
+                    yield entry
+            else:
+                for entry in entries:
+                    yield entry
+
+        in_flight = {}
+
+        async def completed():
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            return [(in_flight.pop(task), task.result()) for task in done]
+
+        try:
+            async for entry in entry_stream():
+                # Wait for a free slot before reading the next entry.
+                while len(in_flight) >= max_in_flight:
+                    for outcome in await completed():
+                        yield outcome
+                in_flight[asyncio.ensure_future(upsert(entry))] = entry
+            while in_flight:
+                for outcome in await completed():
+                    yield outcome
+        finally:
+            for task in in_flight:
+                task.cancel()
 
     async def list_entries(
         self,
         request: Union[datacatalog.ListEntriesRequest, dict] = None,
         *,
         parent: str = None,
+        fields: Sequence[str] = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListEntriesAsyncPager:
         r"""Lists entries.
 
@@ -1324,11 +1897,23 @@ class DataCatalogAsyncClient:
                 This corresponds to the ``parent`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            fields (Sequence[str]):
+                The fields of each entry to return, such as
+                ``["name", "linked_resource"]``, or dotted paths into
+                nested messages. They are sent as the request's
+                ``read_mask``, so the other fields are neither sent
+                nor parsed.
+
+                If ``request`` is provided, this should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.data_catalog.pagers.ListEntriesAsyncPager:
@@ -1342,7 +1927,7 @@ class DataCatalogAsyncClient:
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
+        has_flattened_params = any([parent]) or fields is not None
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
@@ -1355,11 +1940,13 @@ class DataCatalogAsyncClient:
         # request, apply these.
         if parent is not None:
             request.parent = parent
+        if fields is not None:
+            request.read_mask = _read_mask(datacatalog.Entry, fields)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_entries,
+        rpc = self._client._transport._wrap_async(
+            "list_entries",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -1385,7 +1972,12 @@ class DataCatalogAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListEntriesAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
+            raw=self._client._raw_responses,
         )
 
         # Done; return the response.
@@ -1481,8 +2073,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_tag_template,
+        rpc = self._client._transport._wrap_async(
+            "create_tag_template",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1497,7 +2089,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def get_tag_template(
         self,
@@ -1561,10 +2153,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_tag_template,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "get_tag_template", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1573,11 +2163,13 @@ class DataCatalogAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = await self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def update_tag_template(
         self,
@@ -1672,8 +2264,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_tag_template,
+        rpc = self._client._transport._wrap_async(
+            "update_tag_template",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1690,7 +2282,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def delete_tag_template(
         self,
@@ -1756,8 +2348,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_tag_template,
+        rpc = self._client._transport._wrap_async(
+            "delete_tag_template",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1860,8 +2452,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_tag_template_field,
+        rpc = self._client._transport._wrap_async(
+            "create_tag_template_field",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1876,7 +2468,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def update_tag_template_field(
         self,
@@ -1972,8 +2564,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_tag_template_field,
+        rpc = self._client._transport._wrap_async(
+            "update_tag_template_field",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1988,7 +2580,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def rename_tag_template_field(
         self,
@@ -2058,8 +2650,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.rename_tag_template_field,
+        rpc = self._client._transport._wrap_async(
+            "rename_tag_template_field",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -2074,7 +2666,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def rename_tag_template_field_enum_value(
         self,
@@ -2140,8 +2732,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.rename_tag_template_field_enum_value,
+        rpc = self._client._transport._wrap_async(
+            "rename_tag_template_field_enum_value",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -2156,7 +2748,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def delete_tag_template_field(
         self,
@@ -2223,8 +2815,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_tag_template_field,
+        rpc = self._client._transport._wrap_async(
+            "delete_tag_template_field",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -2327,10 +2919,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "create_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -2343,7 +2933,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def update_tag(
         self,
@@ -2419,10 +3009,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "update_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -2435,7 +3023,7 @@ class DataCatalogAsyncClient:
         response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._client._unwrap(response)
 
     async def delete_tag(
         self,
@@ -2484,10 +3072,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "delete_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -2509,6 +3095,7 @@ class DataCatalogAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListTagsAsyncPager:
         r"""Lists tags assigned to an
         [Entry][google.cloud.datacatalog.v1.Entry].
@@ -2534,6 +3121,10 @@ class DataCatalogAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.data_catalog.pagers.ListTagsAsyncPager:
@@ -2563,8 +3154,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_tags,
+        rpc = self._client._transport._wrap_async(
+            "list_tags",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -2590,7 +3181,12 @@ class DataCatalogAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListTagsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
+            raw=self._client._raw_responses,
         )
 
         # Done; return the response.
@@ -2723,10 +3319,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_iam_policy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "set_iam_policy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -2872,8 +3466,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_iam_policy,
+        rpc = self._client._transport._wrap_async(
+            "get_iam_policy",
             default_retry=retries.Retry(
                 initial=0.1,
                 maximum=60.0,
@@ -2944,8 +3538,8 @@ class DataCatalogAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.test_iam_permissions,
+        rpc = self._client._transport._wrap_async(
+            "test_iam_permissions",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
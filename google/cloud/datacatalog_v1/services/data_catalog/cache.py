@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from collections import OrderedDict
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from google.api_core import exceptions as core_exceptions
+
+from google.cloud.datacatalog_v1.types import datacatalog
+
+# A cache key: ("name", entry_name) for ``get_entry`` or, for
+# ``lookup_entry``, the name and value of the request's ``target_name``.
+CacheKey = Tuple[str, str]
+
+
+def lookup_entry_key(request: datacatalog.LookupEntryRequest) -> Optional[CacheKey]:
+    """Returns the cache key of a lookup request, if its target is set."""
+    target = datacatalog.LookupEntryRequest.pb(request).WhichOneof("target_name")
+    if target is None:
+        return None
+    return target, getattr(request, target)
+
+
+def get_entry_key(name: str) -> CacheKey:
+    """Returns the cache key of the entry called ``name``."""
+    return "name", name
+
+
+class EntryCache:
+    """A size-bounded LRU cache of entries, with per-entry expiry.
+
+    The cache holds entries returned by ``get_entry`` and ``lookup_entry``,
+    keyed by entry name and by lookup target. It can also hold
+    ``NotFound`` results, which usually expire sooner.
+
+    Pass an instance as the ``entry_cache`` of
+    :class:`~google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient`
+    or
+    :class:`~google.cloud.datacatalog_v1.services.data_catalog.DataCatalogAsyncClient`.
+    The client then serves reads from it, and drops an entry when it
+    creates, updates or deletes that entry, along with any ``NotFound``
+    result that a lookup of the entry would now contradict. Changes made
+    by other clients become visible once the cached copy expires.
+
+    Instances are safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        *,
+        negative_ttl: Optional[float] = 30.0,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Instantiate the cache.
+
+        Args:
+            max_size (int): The maximum number of cached results. The
+                least recently used result is evicted beyond this size.
+            ttl (float): Seconds for which an entry is served from the
+                cache.
+            negative_ttl (Optional[float]): Seconds for which a ``NotFound``
+                result is served from the cache. If ``None``, ``NotFound``
+                results are not cached.
+            timer (Callable[[], float]): The clock used for expiry.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._timer = timer
+        self._lock = threading.Lock()
+        # Maps a key to (expiry, entry or NotFound message).
+        self._items = OrderedDict()  # type: OrderedDict
+        # Maps an entry name to the lookup keys that resolved to it.
+        self._aliases = {}  # type: Dict[str, Set[CacheKey]]
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of reads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of reads not found in the cache, or expired."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: CacheKey) -> Optional[datacatalog.Entry]:
+        """Returns a copy of the entry cached under ``key``.
+
+        Returns:
+            Optional[google.cloud.datacatalog_v1.types.Entry]: The cached
+                entry, or ``None`` on a miss.
+
+        Raises:
+            google.api_core.exceptions.NotFound: If a ``NotFound`` result
+                is cached under ``key``.
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] <= self._timer():
+                if item is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            value = item[1]
+        if isinstance(value, str):
+            raise core_exceptions.NotFound(value)
+        return datacatalog.Entry(value)
+
+    def put(self, key: CacheKey, entry: datacatalog.Entry) -> None:
+        """Caches ``entry`` under ``key`` and under its name."""
+        entry = datacatalog.Entry(entry)
+        expiry = self._timer() + self._ttl
+        with self._lock:
+            self._set(key, expiry, entry)
+            name_key = get_entry_key(entry.name)
+            if entry.name and key != name_key:
+                self._aliases.setdefault(entry.name, set()).add(key)
+                self._set(name_key, expiry, entry)
+
+    def put_not_found(self, key: CacheKey, error: core_exceptions.NotFound) -> None:
+        """Caches a ``NotFound`` result under ``key``."""
+        if self._negative_ttl is None:
+            return
+        expiry = self._timer() + self._negative_ttl
+        with self._lock:
+            self._set(key, expiry, error.message)
+
+    def invalidate(self, name: str) -> None:
+        """Drops the entry called ``name``, under every key it is cached."""
+        with self._lock:
+            self._invalidate_locked(name)
+
+    def invalidate_entry(self, entry: datacatalog.Entry) -> None:
+        """Drops ``entry``, which was just created or changed, and the
+        ``NotFound`` results that lookups of it may have cached.
+
+        Those are the results for its name, linked resource and fully
+        qualified name. As a SQL resource name cannot be matched to an
+        entry, every ``NotFound`` result of a SQL lookup is dropped too.
+        """
+        keys = {
+            ("linked_resource", entry.linked_resource),
+            ("fully_qualified_name", entry.fully_qualified_name),
+        }
+        with self._lock:
+            self._invalidate_locked(entry.name)
+            for key, item in list(self._items.items()):
+                if isinstance(item[1], str) and (
+                    key in keys or key[0] == "sql_resource"
+                ):
+                    del self._items[key]
+
+    def clear(self) -> None:
+        """Drops every cached result. The counters are kept."""
+        with self._lock:
+            self._items.clear()
+            self._aliases.clear()
+
+    def _invalidate_locked(self, name: str) -> None:
+        self._items.pop(get_entry_key(name), None)
+        for key in self._aliases.pop(name, ()):
+            self._items.pop(key, None)
+
+    def _set(self, key: CacheKey, expiry: float, value) -> None:
+        self._remove(key)
+        self._items[key] = (expiry, value)
+        while len(self._items) > self._max_size:
+            self._remove(next(iter(self._items)))
+
+    def _remove(self, key: CacheKey) -> None:
+        item = self._items.pop(key, None)
+        if item is None or key[0] == "name" or isinstance(item[1], str):
+            return
+        aliases = self._aliases.get(item[1].name)
+        if aliases is not None:
+            aliases.discard(key)
+            if not aliases:
+                del self._aliases[item[1].name]
+
+
+__all__ = ("EntryCache",)
@@ -14,10 +14,25 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+from concurrent import futures
+import heapq
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
+import proto  # type: ignore
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -34,6 +49,9 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.datacatalog_v1 import coalescing
+from google.cloud.datacatalog_v1 import path_parser
+from google.cloud.datacatalog_v1.services.data_catalog import cache
 from google.cloud.datacatalog_v1.services.data_catalog import pagers
 from google.cloud.datacatalog_v1.types import common
 from google.cloud.datacatalog_v1.types import data_source
@@ -51,6 +69,166 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from .transports.base import DataCatalogTransport, DEFAULT_CLIENT_INFO
 from .transports.grpc import DataCatalogGrpcTransport
 from .transports.grpc_asyncio import DataCatalogGrpcAsyncIOTransport
+from .transports.grpc_pooled import DataCatalogGrpcPooledTransport
+from .transports.grpc_pooled_asyncio import DataCatalogGrpcPooledAsyncIOTransport
+
+
+def _partition_search_scope(
+    scope: datacatalog.SearchCatalogRequest.Scope,
+) -> List[datacatalog.SearchCatalogRequest.Scope]:
+    """Splits a search scope into one sub-scope per organization and project.
+
+    GCP public datasets get a sub-scope of their own. Options that do not
+    select resources, such as ``restricted_locations``, are kept on every
+    sub-scope.
+    """
+    shared = {
+        "restricted_locations": list(scope.restricted_locations),
+        "include_public_tag_templates": scope.include_public_tag_templates,
+    }
+    partitions = []
+    for org_id in scope.include_org_ids:
+        partitions.append(
+            datacatalog.SearchCatalogRequest.Scope(include_org_ids=[org_id], **shared)
+        )
+    for project_id in scope.include_project_ids:
+        partitions.append(
+            datacatalog.SearchCatalogRequest.Scope(
+                include_project_ids=[project_id], **shared
+            )
+        )
+    if scope.include_gcp_public_datasets:
+        partitions.append(
+            datacatalog.SearchCatalogRequest.Scope(
+                include_gcp_public_datasets=True, **shared
+            )
+        )
+    return partitions
+
+
+def _search_result_sort_key(
+    order_by: str,
+) -> Optional[Callable[[search.SearchCatalogResult], Tuple[int, int]]]:
+    """Returns a merge key matching ``order_by``, if results can be merged.
+
+    Only ``last_modified_timestamp [asc|desc]`` can be reproduced on the
+    client; relevance scores are not part of the results.
+    """
+    terms = order_by.split()
+    if not terms or terms[0] != "last_modified_timestamp":
+        return None
+    sign = 1 if terms[1:] == ["asc"] else -1
+
+    def key(result: search.SearchCatalogResult) -> Tuple[int, int]:
+        # Results are protobuf messages already if the client is raw.
+        if isinstance(result, search.SearchCatalogResult):
+            result = search.SearchCatalogResult.pb(result)
+        modify_time = result.modify_time
+        return sign * modify_time.seconds, sign * modify_time.nanos
+
+    return key
+
+
+def _lookup_entry_requests(
+    *,
+    linked_resources: Optional[Sequence[str]],
+    sql_resources: Optional[Sequence[str]],
+    fully_qualified_names: Optional[Sequence[str]],
+) -> List[datacatalog.LookupEntryRequest]:
+    """Builds one lookup request per target of the single kind given."""
+    targets = [
+        (field, values)
+        for field, values in (
+            ("linked_resource", linked_resources),
+            ("sql_resource", sql_resources),
+            ("fully_qualified_name", fully_qualified_names),
+        )
+        if values is not None
+    ]
+    if len(targets) != 1:
+        raise ValueError(
+            "Exactly one of `linked_resources`, `sql_resources` and "
+            "`fully_qualified_names` must be set."
+        )
+    field, values = targets[0]
+    return [datacatalog.LookupEntryRequest({field: value}) for value in values]
+
+
+def _read_mask(
+    message_type: Type[proto.Message], fields: Sequence[str]
+) -> field_mask_pb2.FieldMask:
+    """Builds the read mask that projects ``message_type`` onto ``fields``.
+
+    Fields are named as on the message, such as ``type_``, or as in the
+    API, such as ``type``, and may be dotted paths into nested messages.
+    """
+    if isinstance(fields, str):
+        raise TypeError("`fields` must be a sequence of field names.")
+    if not fields:
+        raise ValueError("`fields` must name at least one field.")
+    paths = []
+    for field in fields:
+        descriptor = message_type.pb().DESCRIPTOR
+        parts = []
+        for part in field.split("."):
+            field_descriptor = None
+            if descriptor is not None:
+                field_descriptor = descriptor.fields_by_name.get(
+                    part
+                ) or descriptor.fields_by_name.get(part + "_")
+            if field_descriptor is None:
+                raise ValueError(
+                    "{!r} is not a field of {}.".format(field, message_type.__name__)
+                )
+            # Fields renamed in Python, such as `type_`, keep their API name
+            # in masks.
+            parts.append(field_descriptor.name.rstrip("_"))
+            descriptor = field_descriptor.message_type
+        paths.append(".".join(parts))
+    return field_mask_pb2.FieldMask(paths=paths)
+
+
+_ENTRY_NAME = re.compile(
+    r"^(?P<parent>.+/entryGroups/[^/]+)/entries/(?P<entry_id>[^/]+)$"
+)
+
+
+def _entry_parent_and_id(name: str) -> Tuple[str, str]:
+    """Splits a full entry name into its entry group name and entry ID."""
+    m = _ENTRY_NAME.match(name)
+    if m is None:
+        raise ValueError("Not a full entry name: {!r}.".format(name))
+    return m.group("parent"), m.group("entry_id")
+
+
+# Parsers for the resource names handled by the client.
+_ENTRY_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}"
+)
+_ENTRY_GROUP_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/entryGroups/{entry_group}"
+)
+_TAG_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}/tags/{tag}"
+)
+_TAG_TEMPLATE_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/tagTemplates/{tag_template}"
+)
+_TAG_TEMPLATE_FIELD_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/tagTemplates/{tag_template}/fields/{field}"
+)
+_TAG_TEMPLATE_FIELD_ENUM_VALUE_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/tagTemplates/{tag_template}/fields/{tag_template_field_id}/enumValues/{enum_value_display_name}"
+)
+_COMMON_BILLING_ACCOUNT_PATH = path_parser.PathParser(
+    "billingAccounts/{billing_account}"
+)
+_COMMON_FOLDER_PATH = path_parser.PathParser("folders/{folder}")
+_COMMON_ORGANIZATION_PATH = path_parser.PathParser("organizations/{organization}")
+_COMMON_PROJECT_PATH = path_parser.PathParser("projects/{project}")
+_COMMON_LOCATION_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}"
+)
 
 
 class DataCatalogClientMeta(type):
@@ -64,6 +242,8 @@ class DataCatalogClientMeta(type):
     _transport_registry = OrderedDict()  # type: Dict[str, Type[DataCatalogTransport]]
     _transport_registry["grpc"] = DataCatalogGrpcTransport
     _transport_registry["grpc_asyncio"] = DataCatalogGrpcAsyncIOTransport
+    _transport_registry["grpc_pooled"] = DataCatalogGrpcPooledTransport
+    _transport_registry["grpc_pooled_asyncio"] = DataCatalogGrpcPooledAsyncIOTransport
 
     def get_transport_class(cls, label: str = None,) -> Type[DataCatalogTransport]:
         """Returns an appropriate transport class.
@@ -181,11 +361,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_entry_path(path: str) -> Dict[str, str]:
         """Parses a entry path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/entryGroups/(?P<entry_group>.+?)/entries/(?P<entry>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _ENTRY_PATH.parse(path)
+
+    @staticmethod
+    def parse_entry_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses entry paths into parallel lists of their component segments."""
+        return _ENTRY_PATH.parse_batch(paths)
 
     @staticmethod
     def entry_group_path(project: str, location: str, entry_group: str,) -> str:
@@ -197,11 +378,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_entry_group_path(path: str) -> Dict[str, str]:
         """Parses a entry_group path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/entryGroups/(?P<entry_group>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _ENTRY_GROUP_PATH.parse(path)
+
+    @staticmethod
+    def parse_entry_group_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses entry_group paths into parallel lists of their component segments."""
+        return _ENTRY_GROUP_PATH.parse_batch(paths)
 
     @staticmethod
     def tag_path(
@@ -219,11 +401,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_tag_path(path: str) -> Dict[str, str]:
         """Parses a tag path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/entryGroups/(?P<entry_group>.+?)/entries/(?P<entry>.+?)/tags/(?P<tag>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _TAG_PATH.parse(path)
+
+    @staticmethod
+    def parse_tag_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses tag paths into parallel lists of their component segments."""
+        return _TAG_PATH.parse_batch(paths)
 
     @staticmethod
     def tag_template_path(project: str, location: str, tag_template: str,) -> str:
@@ -235,11 +418,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_tag_template_path(path: str) -> Dict[str, str]:
         """Parses a tag_template path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/tagTemplates/(?P<tag_template>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _TAG_TEMPLATE_PATH.parse(path)
+
+    @staticmethod
+    def parse_tag_template_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses tag_template paths into parallel lists of their component segments."""
+        return _TAG_TEMPLATE_PATH.parse_batch(paths)
 
     @staticmethod
     def tag_template_field_path(
@@ -253,11 +439,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_tag_template_field_path(path: str) -> Dict[str, str]:
         """Parses a tag_template_field path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/tagTemplates/(?P<tag_template>.+?)/fields/(?P<field>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _TAG_TEMPLATE_FIELD_PATH.parse(path)
+
+    @staticmethod
+    def parse_tag_template_field_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses tag_template_field paths into parallel lists of their component segments."""
+        return _TAG_TEMPLATE_FIELD_PATH.parse_batch(paths)
 
     @staticmethod
     def tag_template_field_enum_value_path(
@@ -279,11 +468,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_tag_template_field_enum_value_path(path: str) -> Dict[str, str]:
         """Parses a tag_template_field_enum_value path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/tagTemplates/(?P<tag_template>.+?)/fields/(?P<tag_template_field_id>.+?)/enumValues/(?P<enum_value_display_name>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _TAG_TEMPLATE_FIELD_ENUM_VALUE_PATH.parse(path)
+
+    @staticmethod
+    def parse_tag_template_field_enum_value_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses tag_template_field_enum_value paths into parallel lists of their component segments."""
+        return _TAG_TEMPLATE_FIELD_ENUM_VALUE_PATH.parse_batch(paths)
 
     @staticmethod
     def common_billing_account_path(billing_account: str,) -> str:
@@ -295,8 +487,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_BILLING_ACCOUNT_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_billing_account_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses billing_account paths into parallel lists of their component segments."""
+        return _COMMON_BILLING_ACCOUNT_PATH.parse_batch(paths)
 
     @staticmethod
     def common_folder_path(folder: str,) -> str:
@@ -306,8 +504,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_FOLDER_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_folder_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses folder paths into parallel lists of their component segments."""
+        return _COMMON_FOLDER_PATH.parse_batch(paths)
 
     @staticmethod
     def common_organization_path(organization: str,) -> str:
@@ -317,8 +521,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_ORGANIZATION_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_organization_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses organization paths into parallel lists of their component segments."""
+        return _COMMON_ORGANIZATION_PATH.parse_batch(paths)
 
     @staticmethod
     def common_project_path(project: str,) -> str:
@@ -328,8 +538,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_PROJECT_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_project_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses project paths into parallel lists of their component segments."""
+        return _COMMON_PROJECT_PATH.parse_batch(paths)
 
     @staticmethod
     def common_location_path(project: str, location: str,) -> str:
@@ -341,8 +557,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_LOCATION_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_location_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses location paths into parallel lists of their component segments."""
+        return _COMMON_LOCATION_PATH.parse_batch(paths)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -418,6 +640,9 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         transport: Union[str, DataCatalogTransport, None] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        entry_cache: Optional[cache.EntryCache] = None,
+        coalesce_reads: bool = False,
+        raw_responses: bool = False,
     ) -> None:
         """Instantiates the data catalog client.
 
@@ -451,11 +676,28 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            entry_cache (Optional[google.cloud.datacatalog_v1.services.data_catalog.cache.EntryCache]):
+                An optional cache for ``get_entry`` and ``lookup_entry``
+                results. Entries updated or deleted through this client
+                are dropped from it.
+            coalesce_reads (bool): If ``True``, identical read requests
+                made concurrently, with the same metadata, share a single
+                in-flight call and its result. This applies to
+                ``get_entry``, ``lookup_entry``, ``get_entry_group`` and
+                ``get_tag_template``.
+            raw_responses (bool): If ``True``, methods return the
+                protobuf messages underlying the usual proto-plus
+                responses, and pagers iterate over protobuf messages. Field
+                access on these skips proto-plus conversion.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
                 creation failed for any reason.
         """
+        self._raw_responses = raw_responses
+        self._single_flight = coalescing.SingleFlight() if coalesce_reads else None
+        self._entry_cache = entry_cache
+
         if isinstance(client_options, dict):
             client_options = client_options_lib.from_dict(client_options)
         if client_options is None:
@@ -509,6 +751,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
                 always_use_jwt_access=True,
             )
 
+    def _unwrap(self, response: Any) -> Any:
+        # In raw mode, return the protobuf message under the proto-plus one.
+        if self._raw_responses:
+            return type(response).pb(response)
+        return response
+
     def search_catalog(
         self,
         request: Union[datacatalog.SearchCatalogRequest, dict] = None,
@@ -518,6 +766,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.SearchCatalogPager:
         r"""Searches Data Catalog for multiple resources like entries and
         tags that match a query.
@@ -575,6 +824,10 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of upcoming result pages
+                to fetch on a background thread while the current page
+                is iterated. Defaults to ``0``, which fetches each page
+                only once the previous one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.data_catalog.pagers.SearchCatalogPager:
@@ -610,7 +863,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.search_catalog]
+        rpc = self._transport._wrapped_methods["search_catalog"]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
@@ -618,12 +871,182 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.SearchCatalogPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
+            raw=self._raw_responses,
         )
 
         # Done; return the response.
         return response
 
+    def search_catalog_partitioned(
+        self,
+        request: Union[datacatalog.SearchCatalogRequest, dict] = None,
+        *,
+        scope: datacatalog.SearchCatalogRequest.Scope = None,
+        query: str = None,
+        max_workers: int = 8,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[search.SearchCatalogResult]:
+        r"""Searches Data Catalog with one concurrent search per scope
+        partition.
+
+        The scope is split into one sub-scope per organization ID, per
+        project ID and, if included, one for GCP public datasets. The
+        sub-scopes are paged through on a thread pool and their results
+        are merged into a single iterator. Results that appear in more
+        than one partition are returned once, keyed by
+        ``relative_resource_name``.
+
+        If ``order_by`` is ``last_modified_timestamp [asc|desc]``, the
+        partitions are merged in that order. Otherwise results are
+        returned in the order their pages arrive.
+
+        Args:
+            request (Union[google.cloud.datacatalog_v1.types.SearchCatalogRequest, dict]):
+                The request object. Request message for
+                [SearchCatalog][google.cloud.datacatalog.v1.DataCatalog.SearchCatalog].
+            scope (google.cloud.datacatalog_v1.types.SearchCatalogRequest.Scope):
+                Required. The scope of this search request.
+
+                This corresponds to the ``scope`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            query (str):
+                Optional. The query string, as for
+                [search_catalog][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient.search_catalog].
+
+                This corresponds to the ``query`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            max_workers (int): The maximum number of search requests
+                in flight at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            Iterator[google.cloud.datacatalog_v1.types.SearchCatalogResult]:
+                The merged results of all partitions. Stopping iteration
+                cancels the requests that have not started yet.
+
+        """
+        has_flattened_params = any([scope, query])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        request = datacatalog.SearchCatalogRequest(request)
+        if scope is not None:
+            request.scope = scope
+        if query is not None:
+            request.query = query
+
+        partitions = []
+        for partition_scope in _partition_search_scope(request.scope):
+            partition = datacatalog.SearchCatalogRequest(request)
+            partition.scope = partition_scope
+            partitions.append(partition)
+        if not partitions:
+            raise ValueError(
+                "The scope must include at least one organization, project "
+                "or the GCP public datasets."
+            )
+
+        return self._search_partitions(
+            partitions,
+            sort_key=_search_result_sort_key(request.order_by),
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def _search_partitions(
+        self,
+        partitions: Sequence[datacatalog.SearchCatalogRequest],
+        *,
+        sort_key: Optional[Callable[[search.SearchCatalogResult], Tuple[int, int]]],
+        max_workers: int,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> Iterator[search.SearchCatalogResult]:
+        def partition_pages(partition):
+            yield from self.search_catalog(
+                request=partition, retry=retry, timeout=timeout, metadata=metadata,
+            ).pages
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        # Each partition has at most one page request outstanding; the next
+        # one is submitted as soon as the previous page arrives.
+        outstanding = set()
+
+        def fetch(pages):
+            future = executor.submit(next, pages, None)
+            outstanding.add(future)
+            return future
+
+        def take(future):
+            outstanding.discard(future)
+            return future.result()
+
+        def partition_results(pages, future):
+            while True:
+                page = take(future)
+                if page is None:
+                    return
+                future = fetch(pages)
+                yield from page.results
+
+        try:
+            seen = set()
+            all_pages = [partition_pages(partition) for partition in partitions]
+            if sort_key is not None:
+                # Submit every first page before the merge blocks on any.
+                first = [fetch(pages) for pages in all_pages]
+                results = heapq.merge(
+                    *[
+                        partition_results(pages, future)
+                        for pages, future in zip(all_pages, first)
+                    ],
+                    key=sort_key,
+                )
+                for result in results:
+                    if result.relative_resource_name not in seen:
+                        seen.add(result.relative_resource_name)
+                        yield result
+                return
+
+            pending = {fetch(pages): pages for pages in all_pages}
+            while pending:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    pages = pending.pop(future)
+                    page = take(future)
+                    if page is None:
+                        continue
+                    pending[fetch(pages)] = pages
+                    for result in page.results:
+                        if result.relative_resource_name not in seen:
+                            seen.add(result.relative_resource_name)
+                            yield result
+        finally:
+            for future in outstanding:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def create_entry_group(
         self,
         request: Union[datacatalog.CreateEntryGroupRequest, dict] = None,
@@ -741,7 +1164,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_entry_group]
+        rpc = self._transport._wrapped_methods["create_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -753,7 +1176,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def get_entry_group(
         self,
@@ -761,6 +1184,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         *,
         name: str = None,
         read_mask: field_mask_pb2.FieldMask = None,
+        fields: Sequence[str] = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
@@ -785,6 +1209,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
                 This corresponds to the ``read_mask`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            fields (Sequence[str]):
+                The fields of the entry group to return, such as
+                ``["name", "display_name"]``. A shorthand for
+                ``read_mask``, which should then not be set.
+
+                If ``request`` is provided, this should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -803,12 +1233,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([name, read_mask])
+        has_flattened_params = any([name, read_mask]) or fields is not None
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
                 "the individual field arguments should be set."
             )
+        if read_mask is not None and fields is not None:
+            raise ValueError("Only one of `read_mask` and `fields` may be set.")
 
         # Minor optimization to avoid making a copy if the user passes
         # in a datacatalog.GetEntryGroupRequest.
@@ -822,10 +1254,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
                 request.name = name
             if read_mask is not None:
                 request.read_mask = read_mask
+            if fields is not None:
+                request.read_mask = _read_mask(datacatalog.EntryGroup, fields)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_entry_group]
+        rpc = self._transport._wrapped_methods["get_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -833,11 +1267,13 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def update_entry_group(
         self,
@@ -919,7 +1355,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_entry_group]
+        rpc = self._transport._wrapped_methods["update_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -933,7 +1369,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def delete_entry_group(
         self,
@@ -991,7 +1427,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_entry_group]
+        rpc = self._transport._wrapped_methods["delete_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1065,7 +1501,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_entry_groups]
+        rpc = self._transport._wrapped_methods["list_entry_groups"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1079,7 +1515,11 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListEntryGroupsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            raw=self._raw_responses,
         )
 
         # Done; return the response.
@@ -1187,7 +1627,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_entry]
+        rpc = self._transport._wrapped_methods["create_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1198,8 +1638,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # The new entry may have been cached as not found, by name or lookup.
+        if self._entry_cache is not None:
+            self._entry_cache.invalidate_entry(response)
+
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def update_entry(
         self,
@@ -1310,7 +1754,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_entry]
+        rpc = self._transport._wrapped_methods["update_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1323,8 +1767,13 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
+        # Drop the cached copies of the entry that was changed, and lookups
+        # cached as not found that may now find it.
+        if self._entry_cache is not None:
+            self._entry_cache.invalidate_entry(response)
+
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def delete_entry(
         self,
@@ -1386,7 +1835,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_entry]
+        rpc = self._transport._wrapped_methods["delete_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1399,6 +1848,26 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             request, retry=retry, timeout=timeout, metadata=metadata,
         )
 
+        # Drop the cached copies of the entry that was deleted.
+        if self._entry_cache is not None:
+            self._entry_cache.invalidate(request.name)
+
+    def _send_read(
+        self,
+        rpc: Callable[..., Any],
+        request: Any,
+        *,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> Any:
+        def send():
+            return rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        if self._single_flight is None:
+            return send()
+        return self._single_flight.call(coalescing.request_key(request, metadata), send)
+
     def get_entry(
         self,
         request: Union[datacatalog.GetEntryRequest, dict] = None,
@@ -1465,7 +1934,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_entry]
+        rpc = self._transport._wrapped_methods["get_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1473,11 +1942,16 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, unless the entry is cached.
+        response = self._read_entry(
+            cache.get_entry_key(request.name),
+            lambda: self._send_read(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            ),
+        )
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def lookup_entry(
         self,
@@ -1526,19 +2000,275 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.lookup_entry]
+        rpc = self._transport._wrapped_methods["lookup_entry"]
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, unless the entry is cached.
+        response = self._read_entry(
+            cache.lookup_entry_key(request),
+            lambda: self._send_read(
+                rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+            ),
+        )
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
+
+    def _read_entry(
+        self, key: Optional[cache.CacheKey], read: Callable[[], datacatalog.Entry],
+    ) -> datacatalog.Entry:
+        if self._entry_cache is None or key is None:
+            return read()
+        entry = self._entry_cache.get(key)
+        if entry is not None:
+            return entry
+        try:
+            entry = read()
+        except core_exceptions.NotFound as exc:
+            self._entry_cache.put_not_found(key, exc)
+            raise
+        self._entry_cache.put(key, entry)
+        return entry
+
+    def batch_get_entries(
+        self,
+        names: Sequence[str],
+        *,
+        max_workers: int = 16,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[Union[datacatalog.Entry, Exception]]:
+        r"""Gets many entries with concurrent
+        [get_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient.get_entry]
+        calls.
+
+        Args:
+            names (Sequence[str]):
+                The names of the entries to get.
+            max_workers (int): The maximum number of requests in flight
+                at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            List[Union[google.cloud.datacatalog_v1.types.Entry, Exception]]:
+                One item per name, in input order: the entry, or the
+                exception raised while getting it.
+
+        """
+        requests = [datacatalog.GetEntryRequest(name=name) for name in names]
+        return self._batch_call(
+            self.get_entry,
+            requests,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def batch_lookup_entries(
+        self,
+        *,
+        linked_resources: Sequence[str] = None,
+        sql_resources: Sequence[str] = None,
+        fully_qualified_names: Sequence[str] = None,
+        max_workers: int = 16,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> List[Union[datacatalog.Entry, Exception]]:
+        r"""Looks up many entries with concurrent
+        [lookup_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient.lookup_entry]
+        calls.
+
+        Exactly one of ``linked_resources``, ``sql_resources`` and
+        ``fully_qualified_names`` must be set.
+
+        Args:
+            linked_resources (Sequence[str]):
+                The full names of the Google Cloud Platform resources
+                to look up.
+            sql_resources (Sequence[str]):
+                The names of the resources to look up, in SQL syntax.
+            fully_qualified_names (Sequence[str]):
+                The fully qualified names of the resources to look up.
+            max_workers (int): The maximum number of requests in flight
+                at once.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            List[Union[google.cloud.datacatalog_v1.types.Entry, Exception]]:
+                One item per target, in input order: the entry, or the
+                exception raised while looking it up.
+
+        """
+        requests = _lookup_entry_requests(
+            linked_resources=linked_resources,
+            sql_resources=sql_resources,
+            fully_qualified_names=fully_qualified_names,
+        )
+        return self._batch_call(
+            self.lookup_entry,
+            requests,
+            max_workers=max_workers,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def _batch_call(
+        self,
+        method: Callable[..., Any],
+        requests: Sequence[Any],
+        *,
+        max_workers: int,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> List[Any]:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        def call(request):
+            try:
+                return method(
+                    request=request, retry=retry, timeout=timeout, metadata=metadata,
+                )
+            except Exception as exc:
+                return exc
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, requests))
+
+    def bulk_upsert_entries(
+        self,
+        entries: Iterable[datacatalog.Entry],
+        *,
+        max_in_flight: int = 16,
+        update_mask: field_mask_pb2.FieldMask = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: float = None,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[Tuple[datacatalog.Entry, Union[datacatalog.Entry, Exception]]]:
+        r"""Creates or updates many entries with concurrent requests.
+
+        Each entry's ``name`` must be the full name it is to have, in the
+        form ``projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}``.
+        The entry is first created with
+        [create_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient.create_entry];
+        if it already exists, it is updated with
+        [update_entry][google.cloud.datacatalog_v1.services.data_catalog.DataCatalogClient.update_entry]
+        instead.
+
+        ``entries`` may be a generator. It is read only while fewer than
+        ``max_in_flight`` entries are being written, so a producer that
+        outpaces the service is held back rather than buffered.
+
+        Args:
+            entries (Iterable[google.cloud.datacatalog_v1.types.Entry]):
+                The entries to write.
+            max_in_flight (int): The maximum number of entries being
+                written at once.
+            update_mask (google.protobuf.field_mask_pb2.FieldMask):
+                The fields to overwrite when an entry is updated. If
+                absent, all modifiable fields are overwritten.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[Tuple[google.cloud.datacatalog_v1.types.Entry, Union[google.cloud.datacatalog_v1.types.Entry, Exception]]]:
+                One ``(entry, outcome)`` pair per input entry, in the
+                order the writes finish. The outcome is the created or
+                updated entry, or the exception raised while writing it.
+                Entries are only written as the iterator is consumed;
+                closing it cancels the writes not yet started.
+
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        return self._bulk_upsert(
+            entries,
+            max_in_flight=max_in_flight,
+            update_mask=update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def _upsert_entry(
+        self,
+        entry: datacatalog.Entry,
+        *,
+        update_mask: Optional[field_mask_pb2.FieldMask],
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> datacatalog.Entry:
+        parent, entry_id = _entry_parent_and_id(entry.name)
+        try:
+            return self.create_entry(
+                parent=parent,
+                entry_id=entry_id,
+                entry=entry,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        except core_exceptions.AlreadyExists:
+            return self.update_entry(
+                entry=entry,
+                update_mask=update_mask,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+    def _bulk_upsert(
+        self, entries: Iterable[datacatalog.Entry], *, max_in_flight: int, **kwargs
+    ) -> Iterator[Tuple[datacatalog.Entry, Union[datacatalog.Entry, Exception]]]:
+        def upsert(entry):
+            try:
+                return self._upsert_entry(entry, **kwargs)
+            except Exception as exc:
+                return exc
+
+        executor = futures.ThreadPoolExecutor(max_workers=max_in_flight)
+        in_flight = {}
+
+        def completed():
+            done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                yield in_flight.pop(future), future.result()
+
+        try:
+            for entry in entries:
+                # Wait for a free slot before reading the next entry.
+                while len(in_flight) >= max_in_flight:
+                    yield from completed()
+                in_flight[executor.submit(upsert, entry)] = entry
+            while in_flight:
+                yield from completed()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def list_entries(
         self,
         request: Union[datacatalog.ListEntriesRequest, dict] = None,
         *,
         parent: str = None,
+        fields: Sequence[str] = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
@@ -1561,6 +2291,14 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
                 This corresponds to the ``parent`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            fields (Sequence[str]):
+                The fields of each entry to return, such as
+                ``["name", "linked_resource"]``, or dotted paths into
+                nested messages. They are sent as the request's
+                ``read_mask``, so the other fields are neither sent
+                nor parsed.
+
+                If ``request`` is provided, this should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -1579,7 +2317,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([parent])
+        has_flattened_params = any([parent]) or fields is not None
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
@@ -1596,10 +2334,12 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             # request, apply these.
             if parent is not None:
                 request.parent = parent
+            if fields is not None:
+                request.read_mask = _read_mask(datacatalog.Entry, fields)
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_entries]
+        rpc = self._transport._wrapped_methods["list_entries"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1613,7 +2353,11 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListEntriesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            raw=self._raw_responses,
         )
 
         # Done; return the response.
@@ -1713,7 +2457,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_tag_template]
+        rpc = self._transport._wrapped_methods["create_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1725,7 +2469,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def get_tag_template(
         self,
@@ -1793,7 +2537,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_tag_template]
+        rpc = self._transport._wrapped_methods["get_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1801,11 +2545,13 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def update_tag_template(
         self,
@@ -1904,7 +2650,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_tag_template]
+        rpc = self._transport._wrapped_methods["update_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1918,7 +2664,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def delete_tag_template(
         self,
@@ -1988,7 +2734,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_tag_template]
+        rpc = self._transport._wrapped_methods["delete_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2092,9 +2838,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.create_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["create_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2106,7 +2850,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def update_tag_template_field(
         self,
@@ -2206,9 +2950,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.update_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["update_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2220,7 +2962,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def rename_tag_template_field(
         self,
@@ -2294,9 +3036,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.rename_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["rename_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2308,7 +3048,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def rename_tag_template_field_enum_value(
         self,
@@ -2378,9 +3118,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.rename_tag_template_field_enum_value
-        ]
+        rpc = self._transport._wrapped_methods["rename_tag_template_field_enum_value"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2392,7 +3130,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def delete_tag_template_field(
         self,
@@ -2463,9 +3201,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.delete_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["delete_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2569,7 +3305,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_tag]
+        rpc = self._transport._wrapped_methods["create_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2581,7 +3317,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def update_tag(
         self,
@@ -2661,7 +3397,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_tag]
+        rpc = self._transport._wrapped_methods["update_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2673,7 +3409,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # Done; return the response.
-        return response
+        return self._unwrap(response)
 
     def delete_tag(
         self,
@@ -2726,7 +3462,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_tag]
+        rpc = self._transport._wrapped_methods["delete_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2805,7 +3541,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_tags]
+        rpc = self._transport._wrapped_methods["list_tags"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2819,7 +3555,11 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListTagsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            raw=self._raw_responses,
         )
 
         # Done; return the response.
@@ -2955,7 +3695,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_iam_policy]
+        rpc = self._transport._wrapped_methods["set_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -3103,7 +3843,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_iam_policy]
+        rpc = self._transport._wrapped_methods["get_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -3165,7 +3905,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.test_iam_permissions]
+        rpc = self._transport._wrapped_methods["test_iam_permissions"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
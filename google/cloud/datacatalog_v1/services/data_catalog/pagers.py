@@ -23,12 +23,127 @@ from typing import (
     Optional,
     Iterator,
 )
+import asyncio
+import queue
+import threading
 
+from google.cloud.datacatalog_v1 import checkpoint
+from google.cloud.datacatalog_v1 import columnar
 from google.cloud.datacatalog_v1.types import datacatalog
 from google.cloud.datacatalog_v1.types import search
 from google.cloud.datacatalog_v1.types import tags
 
 
+def _unwrap(response: Any, raw: bool) -> Any:
+    """Returns the protobuf message under ``response`` if ``raw`` is set."""
+    return type(response).pb(response) if raw else response
+
+
+# Marks the end of the pages produced by a prefetching thread or task.
+_PREFETCH_DONE = object()
+
+
+def _prefetch(
+    method: Callable[..., Any],
+    request: Any,
+    metadata: Sequence[Tuple[str, str]],
+    depth: int,
+) -> Iterator[Tuple[str, Any]]:
+    """Fetch pages on a background thread, keeping up to ``depth`` ahead.
+
+    Starting from ``request.page_token``, a daemon thread calls ``method``
+    for each page and hands ``(page_token, response)`` pairs over a
+    bounded queue. Errors raised by ``method`` are re-raised here, in
+    page order. Closing the generator stops the thread once its current
+    call returns.
+    """
+    buffer = queue.Queue(maxsize=depth)  # type: queue.Queue
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            while not stopped.is_set():
+                page_token = request.page_token
+                response = method(request, metadata=metadata)
+                if not put((page_token, response)):
+                    return
+                if not response.next_page_token:
+                    break
+                request.page_token = response.next_page_token
+        except Exception as exc:
+            put(exc)
+            return
+        put(_PREFETCH_DONE)
+
+    thread = threading.Thread(
+        target=produce, name="datacatalog-page-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+async def _prefetch_async(
+    method: Callable[..., Awaitable[Any]],
+    request: Any,
+    metadata: Sequence[Tuple[str, str]],
+    depth: int,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Fetch pages in a producer task, keeping up to ``depth`` ahead.
+
+    Starting from ``request.page_token``, a task awaits ``method`` for each
+    page and hands ``(page_token, response)`` pairs over a bounded
+    :class:`asyncio.Queue`. Errors raised by ``method`` are re-raised here,
+    in page order. Closing the generator cancels the producer task.
+    """
+    buffer = asyncio.Queue(maxsize=depth)  # type: asyncio.Queue
+
+    async def produce() -> None:
+        try:
+            while True:
+                page_token = request.page_token
+                response = await method(request, metadata=metadata)
+                await buffer.put((page_token, response))
+                if not response.next_page_token:
+                    break
+                request.page_token = response.next_page_token
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await buffer.put(exc)
+            return
+        await buffer.put(_PREFETCH_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
 class SearchCatalogPager:
     """A pager for iterating through ``search_catalog`` requests.
 
@@ -42,18 +157,30 @@ class SearchCatalogPager:
     through the ``results`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, up to that many upcoming pages are
+    requested on a background thread while the current one is iterated.
+    The thread stops once iteration is abandoned.
+
+    The :attr:`cursor` of the pager records how far iteration got, and
+    :func:`google.cloud.datacatalog_v1.checkpoint.resume` continues from
+    it, in this process or another.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.SearchCatalogResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
     """
 
+    _items_field = "results"
+
     def __init__(
         self,
         method: Callable[..., datacatalog.SearchCatalogResponse],
         request: datacatalog.SearchCatalogRequest,
         response: datacatalog.SearchCatalogResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
+        raw: bool = False
     ):
         """Instantiate the pager.
 
@@ -66,26 +193,104 @@ class SearchCatalogPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The number of upcoming pages to fetch on
+                a background thread while the current page is consumed.
+                If ``0``, pages are fetched only when they are needed.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.SearchCatalogRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        # The number of items of the current page consumed by __iter__.
+        self._consumed = 0
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     def pages(self) -> Iterator[datacatalog.SearchCatalogResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
+        if self._prefetch_pages > 0:
+            yield from self._prefetched_pages()
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
-            yield self._response
+            self._consumed = 0
+            yield _unwrap(self._response, self._raw)
+
+    def _prefetched_pages(self) -> Iterator[datacatalog.SearchCatalogResponse]:
+        if not self._response.next_page_token:
+            return
+        request = datacatalog.SearchCatalogRequest(self._request)
+        request.page_token = self._response.next_page_token
+        for page_token, response in _prefetch(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            self._consumed = 0
+            yield _unwrap(self._response, self._raw)
 
     def __iter__(self) -> Iterator[search.SearchCatalogResult]:
         for page in self.pages:
-            yield from page.results
+            items = page.results
+            while self._consumed < len(items):
+                yield items[self._consumed]
+                self._consumed += 1
+
+    @property
+    def cursor(self) -> str:
+        """A string from which iteration can be resumed.
+
+        It holds the request with the page token of the current page,
+        and how many of the page's results have been consumed. An item
+        counts as consumed once the next one is asked for. When
+        iterating over :attr:`pages` instead, resuming starts at the
+        beginning of the last page.
+        """
+        request, consumed = self._request, self._consumed
+        if consumed and consumed >= len(self._response.results):
+            if self._response.next_page_token:
+                request = datacatalog.SearchCatalogRequest(request)
+                request.page_token = self._response.next_page_token
+                consumed = 0
+        return checkpoint.encode_cursor(request, consumed)
+
+    def to_arrow(self, columns: Sequence[str] = None) -> Any:
+        """Converts the remaining results to a ``pyarrow.Table``.
+
+        Each page's ``results`` are read into columns straight from the
+        protobuf message, without making a proto-plus object per row.
+
+        Args:
+            columns (Sequence[str]): The fields to convert, such as
+                ``["relative_resource_name", "modify_time"]``. Defaults
+                to every field.
+
+        Returns:
+            pyarrow.Table: One row per item, with a record batch per page.
+        """
+        return columnar.to_arrow(
+            self.pages, "results", search.SearchCatalogResult.pb().DESCRIPTOR, columns
+        )
+
+    def to_pandas(self, columns: Sequence[str] = None) -> Any:
+        """Converts the remaining results to a ``pandas.DataFrame``.
+
+        Args:
+            columns (Sequence[str]): The columns, as for :meth:`to_arrow`.
+
+        Returns:
+            pandas.DataFrame: One row per item.
+        """
+        return columnar.to_pandas(
+            self.pages, "results", search.SearchCatalogResult.pb().DESCRIPTOR, columns
+        )
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -104,6 +309,10 @@ class SearchCatalogAsyncPager:
     through the ``results`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.SearchCatalogResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -115,7 +324,9 @@ class SearchCatalogAsyncPager:
         request: datacatalog.SearchCatalogRequest,
         response: datacatalog.SearchCatalogResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
+        raw: bool = False
     ):
         """Instantiates the pager.
 
@@ -128,22 +339,47 @@ class SearchCatalogAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.SearchCatalogRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     async def pages(self) -> AsyncIterator[datacatalog.SearchCatalogResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
+
+    async def _prefetched_pages(
+        self,
+    ) -> AsyncIterator[datacatalog.SearchCatalogResponse]:
+        if not self._response.next_page_token:
+            return
+        request = datacatalog.SearchCatalogRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield _unwrap(self._response, self._raw)
 
     def __aiter__(self) -> AsyncIterator[search.SearchCatalogResult]:
         async def async_generator():
@@ -181,7 +417,8 @@ class ListEntryGroupsPager:
         request: datacatalog.ListEntryGroupsRequest,
         response: datacatalog.ListEntryGroupsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False
     ):
         """Instantiate the pager.
 
@@ -194,22 +431,25 @@ class ListEntryGroupsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListEntryGroupsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     def pages(self) -> Iterator[datacatalog.ListEntryGroupsResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
 
     def __iter__(self) -> Iterator[datacatalog.EntryGroup]:
         for page in self.pages:
@@ -232,6 +472,10 @@ class ListEntryGroupsAsyncPager:
     through the ``entry_groups`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListEntryGroupsResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -243,7 +487,9 @@ class ListEntryGroupsAsyncPager:
         request: datacatalog.ListEntryGroupsRequest,
         response: datacatalog.ListEntryGroupsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
+        raw: bool = False
     ):
         """Instantiates the pager.
 
@@ -256,22 +502,47 @@ class ListEntryGroupsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListEntryGroupsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     async def pages(self) -> AsyncIterator[datacatalog.ListEntryGroupsResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
+
+    async def _prefetched_pages(
+        self,
+    ) -> AsyncIterator[datacatalog.ListEntryGroupsResponse]:
+        if not self._response.next_page_token:
+            return
+        request = datacatalog.ListEntryGroupsRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield _unwrap(self._response, self._raw)
 
     def __aiter__(self) -> AsyncIterator[datacatalog.EntryGroup]:
         async def async_generator():
@@ -298,18 +569,25 @@ class ListEntriesPager:
     through the ``entries`` field on the
     corresponding responses.
 
+    The :attr:`cursor` of the pager records how far iteration got, and
+    :func:`google.cloud.datacatalog_v1.checkpoint.resume` continues from
+    it, in this process or another.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListEntriesResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
     """
 
+    _items_field = "entries"
+
     def __init__(
         self,
         method: Callable[..., datacatalog.ListEntriesResponse],
         request: datacatalog.ListEntriesRequest,
         response: datacatalog.ListEntriesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False
     ):
         """Instantiate the pager.
 
@@ -322,26 +600,86 @@ class ListEntriesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListEntriesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        # The number of items of the current page consumed by __iter__.
+        self._consumed = 0
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     def pages(self) -> Iterator[datacatalog.ListEntriesResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
-            yield self._response
+            self._consumed = 0
+            yield _unwrap(self._response, self._raw)
 
     def __iter__(self) -> Iterator[datacatalog.Entry]:
         for page in self.pages:
-            yield from page.entries
+            items = page.entries
+            while self._consumed < len(items):
+                yield items[self._consumed]
+                self._consumed += 1
+
+    @property
+    def cursor(self) -> str:
+        """A string from which iteration can be resumed.
+
+        It holds the request with the page token of the current page,
+        and how many of the page's entries have been consumed. An item
+        counts as consumed once the next one is asked for. When
+        iterating over :attr:`pages` instead, resuming starts at the
+        beginning of the last page.
+        """
+        request, consumed = self._request, self._consumed
+        if consumed and consumed >= len(self._response.entries):
+            if self._response.next_page_token:
+                request = datacatalog.ListEntriesRequest(request)
+                request.page_token = self._response.next_page_token
+                consumed = 0
+        return checkpoint.encode_cursor(request, consumed)
+
+    def to_arrow(self, columns: Sequence[str] = None) -> Any:
+        """Converts the remaining entries to a ``pyarrow.Table``.
+
+        Each page's ``entries`` are read into columns straight from the
+        protobuf message, without making a proto-plus object per row.
+
+        Args:
+            columns (Sequence[str]): The fields to convert, or dotted
+                paths into nested messages, such as
+                ``"source_system_timestamps.update_time"``. Defaults to
+                the fields that are not nested messages, other than
+                timestamps and maps.
+
+        Returns:
+            pyarrow.Table: One row per item, with a record batch per page.
+        """
+        return columnar.to_arrow(
+            self.pages, "entries", datacatalog.Entry.pb().DESCRIPTOR, columns
+        )
+
+    def to_pandas(self, columns: Sequence[str] = None) -> Any:
+        """Converts the remaining entries to a ``pandas.DataFrame``.
+
+        Args:
+            columns (Sequence[str]): The columns, as for :meth:`to_arrow`.
+
+        Returns:
+            pandas.DataFrame: One row per item.
+        """
+        return columnar.to_pandas(
+            self.pages, "entries", datacatalog.Entry.pb().DESCRIPTOR, columns
+        )
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -360,6 +698,10 @@ class ListEntriesAsyncPager:
     through the ``entries`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListEntriesResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -371,7 +713,9 @@ class ListEntriesAsyncPager:
         request: datacatalog.ListEntriesRequest,
         response: datacatalog.ListEntriesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
+        raw: bool = False
     ):
         """Instantiates the pager.
 
@@ -384,22 +728,45 @@ class ListEntriesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListEntriesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     async def pages(self) -> AsyncIterator[datacatalog.ListEntriesResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
+
+    async def _prefetched_pages(self) -> AsyncIterator[datacatalog.ListEntriesResponse]:
+        if not self._response.next_page_token:
+            return
+        request = datacatalog.ListEntriesRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield _unwrap(self._response, self._raw)
 
     def __aiter__(self) -> AsyncIterator[datacatalog.Entry]:
         async def async_generator():
@@ -437,7 +804,8 @@ class ListTagsPager:
         request: datacatalog.ListTagsRequest,
         response: datacatalog.ListTagsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False
     ):
         """Instantiate the pager.
 
@@ -450,22 +818,25 @@ class ListTagsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListTagsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     def pages(self) -> Iterator[datacatalog.ListTagsResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
 
     def __iter__(self) -> Iterator[tags.Tag]:
         for page in self.pages:
@@ -488,6 +859,10 @@ class ListTagsAsyncPager:
     through the ``tags`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListTagsResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -499,7 +874,9 @@ class ListTagsAsyncPager:
         request: datacatalog.ListTagsRequest,
         response: datacatalog.ListTagsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
+        raw: bool = False
     ):
         """Instantiates the pager.
 
@@ -512,22 +889,45 @@ class ListTagsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
+            raw (bool): If ``True``, pages and items are the protobuf
+                messages underlying the usual proto-plus ones.
         """
         self._method = method
         self._request = datacatalog.ListTagsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self._response, name)
+        return getattr(_unwrap(self._response, self._raw), name)
 
     @property
     async def pages(self) -> AsyncIterator[datacatalog.ListTagsResponse]:
-        yield self._response
+        yield _unwrap(self._response, self._raw)
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
-            yield self._response
+            yield _unwrap(self._response, self._raw)
+
+    async def _prefetched_pages(self) -> AsyncIterator[datacatalog.ListTagsResponse]:
+        if not self._response.next_page_token:
+            return
+        request = datacatalog.ListTagsRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield _unwrap(self._response, self._raw)
 
     def __aiter__(self) -> AsyncIterator[tags.Tag]:
         async def async_generator():
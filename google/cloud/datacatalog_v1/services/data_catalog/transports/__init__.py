@@ -19,15 +19,23 @@ from typing import Dict, Type
 from .base import DataCatalogTransport
 from .grpc import DataCatalogGrpcTransport
 from .grpc_asyncio import DataCatalogGrpcAsyncIOTransport
+from .grpc_pooled import DataCatalogGrpcPooledTransport
+from .grpc_pooled_asyncio import DataCatalogGrpcPooledAsyncIOTransport
+from .grpc_record_replay import DataCatalogGrpcRecordReplayTransport
 
 
 # Compile a registry of transports.
 _transport_registry = OrderedDict()  # type: Dict[str, Type[DataCatalogTransport]]
 _transport_registry["grpc"] = DataCatalogGrpcTransport
 _transport_registry["grpc_asyncio"] = DataCatalogGrpcAsyncIOTransport
+_transport_registry["grpc_pooled"] = DataCatalogGrpcPooledTransport
+_transport_registry["grpc_pooled_asyncio"] = DataCatalogGrpcPooledAsyncIOTransport
 
 __all__ = (
     "DataCatalogTransport",
     "DataCatalogGrpcTransport",
     "DataCatalogGrpcAsyncIOTransport",
+    "DataCatalogGrpcPooledTransport",
+    "DataCatalogGrpcPooledAsyncIOTransport",
+    "DataCatalogGrpcRecordReplayTransport",
 )
@@ -25,6 +25,9 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import flow_control
+from google.cloud.datacatalog_v1 import metrics
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1.types import datacatalog
 from google.cloud.datacatalog_v1.types import tags
 from google.iam.v1 import iam_policy_pb2  # type: ignore
@@ -40,6 +43,25 @@ try:
 except pkg_resources.DistributionNotFound:
     DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
 
+# The default retry and timeout of the methods that have them.
+_DEFAULT_RETRY = retries.Retry(
+    initial=0.1,
+    maximum=60.0,
+    multiplier=1.3,
+    predicate=retries.if_exception_type(core_exceptions.ServiceUnavailable,),
+    deadline=60.0,
+)
+_METHOD_DEFAULTS = {
+    "search_catalog": (_DEFAULT_RETRY, 60.0),
+    "get_entry_group": (_DEFAULT_RETRY, 60.0),
+    "list_entry_groups": (_DEFAULT_RETRY, 60.0),
+    "get_entry": (_DEFAULT_RETRY, 60.0),
+    "lookup_entry": (_DEFAULT_RETRY, 60.0),
+    "list_entries": (_DEFAULT_RETRY, 60.0),
+    "list_tags": (_DEFAULT_RETRY, 60.0),
+    "get_iam_policy": (_DEFAULT_RETRY, 60.0),
+}
+
 
 class DataCatalogTransport(abc.ABC):
     """Abstract transport class for DataCatalog."""
@@ -58,6 +80,9 @@ class DataCatalogTransport(abc.ABC):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        concurrency_limiter: Optional[flow_control.AdaptiveConcurrencyLimiter] = None,
+        rate_limiter: Optional[flow_control.RateLimiter] = None,
+        metrics_sink: Optional[metrics.MetricsSink] = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -83,6 +108,15 @@ class DataCatalogTransport(abc.ABC):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            concurrency_limiter (Optional[google.cloud.datacatalog_v1.flow_control.AdaptiveConcurrencyLimiter]):
+                Limits the calls in flight of each method, adapting to
+                overload. If ``None``, calls are not limited.
+            rate_limiter (Optional[google.cloud.datacatalog_v1.flow_control.RateLimiter]):
+                Paces the calls of each method. If ``None``, calls are not
+                paced.
+            metrics_sink (Optional[google.cloud.datacatalog_v1.metrics.MetricsSink]):
+                Receives the latency, status and payload sizes of each call
+                and attempt. If ``None``, calls are not measured.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -121,194 +155,89 @@ class DataCatalogTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        self._concurrency_limiter = concurrency_limiter
+        self._rate_limiter = rate_limiter
+        self._metrics_sink = metrics_sink
+
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.search_catalog: gapic_v1.method.wrap_method(
-                self.search_catalog,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_entry_group: gapic_v1.method.wrap_method(
-                self.create_entry_group, default_timeout=None, client_info=client_info,
-            ),
-            self.get_entry_group: gapic_v1.method.wrap_method(
-                self.get_entry_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_entry_group: gapic_v1.method.wrap_method(
-                self.update_entry_group, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_entry_group: gapic_v1.method.wrap_method(
-                self.delete_entry_group, default_timeout=None, client_info=client_info,
-            ),
-            self.list_entry_groups: gapic_v1.method.wrap_method(
-                self.list_entry_groups,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_entry: gapic_v1.method.wrap_method(
-                self.create_entry, default_timeout=None, client_info=client_info,
-            ),
-            self.update_entry: gapic_v1.method.wrap_method(
-                self.update_entry, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_entry: gapic_v1.method.wrap_method(
-                self.delete_entry, default_timeout=None, client_info=client_info,
-            ),
-            self.get_entry: gapic_v1.method.wrap_method(
-                self.get_entry,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.lookup_entry: gapic_v1.method.wrap_method(
-                self.lookup_entry,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_entries: gapic_v1.method.wrap_method(
-                self.list_entries,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_tag_template: gapic_v1.method.wrap_method(
-                self.create_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.get_tag_template: gapic_v1.method.wrap_method(
-                self.get_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.update_tag_template: gapic_v1.method.wrap_method(
-                self.update_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_tag_template: gapic_v1.method.wrap_method(
-                self.delete_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.create_tag_template_field: gapic_v1.method.wrap_method(
-                self.create_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_tag_template_field: gapic_v1.method.wrap_method(
-                self.update_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.rename_tag_template_field: gapic_v1.method.wrap_method(
-                self.rename_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.rename_tag_template_field_enum_value: gapic_v1.method.wrap_method(
-                self.rename_tag_template_field_enum_value,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_tag_template_field: gapic_v1.method.wrap_method(
-                self.delete_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.create_tag: gapic_v1.method.wrap_method(
-                self.create_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.update_tag: gapic_v1.method.wrap_method(
-                self.update_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_tag: gapic_v1.method.wrap_method(
-                self.delete_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.list_tags: gapic_v1.method.wrap_method(
-                self.list_tags,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        rpc = getattr(self, name)
+        default_retry, default_timeout = _METHOD_DEFAULTS.get(name, (None, None))
+        # Apply client-side flow control, if asked to. Each attempt is
+        # limited, so that the limiter sees the errors that are retried.
+        rpc = gapic_v1.method.wrap_method(
+            self._limit(name, self._measure_attempts(name, rpc)),
+            default_retry=default_retry,
+            default_timeout=default_timeout,
+            client_info=client_info,
+        )
+        return self._measure_calls(name, rpc)
+
+    def _wrap_async(
+        self,
+        name: str,
+        default_retry: Optional[retries.Retry] = None,
+        default_timeout: Optional[float] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    ) -> Callable:
+        # The asyncio client wraps its methods on each call. As for the
+        # wrapped methods, each attempt is measured and limited, inside the
+        # retry, and each call is measured.
+        stub = getattr(self, name)
+        rpc = self._limit_async(name, self._measure_attempts_async(name, stub))
+        if rpc is not stub:
+            rpc = wrapped_methods.AsyncUnaryUnaryAttempt(rpc)
+        rpc = gapic_v1.method_async.wrap_method(
+            rpc,
+            default_retry=default_retry,
+            default_timeout=default_timeout,
+            client_info=client_info,
+        )
+        return self._measure_calls_async(name, rpc)
+
+    def _limit(self, name: str, rpc: Callable) -> Callable:
+        # Calls wait for a rate token before taking a concurrency permit,
+        # so that no permit is held while pacing.
+        if self._concurrency_limiter is not None:
+            rpc = self._concurrency_limiter.wrap(name, rpc)
+        if self._rate_limiter is not None:
+            rpc = self._rate_limiter.wrap(name, rpc)
+        return rpc
+
+    def _limit_async(self, name: str, rpc: Callable) -> Callable:
+        # The asyncio client wraps its methods on each call, so it limits
+        # their attempts on each call too.
+        if self._concurrency_limiter is not None:
+            rpc = self._concurrency_limiter.wrap_async(name, rpc)
+        if self._rate_limiter is not None:
+            rpc = self._rate_limiter.wrap_async(name, rpc)
+        return rpc
+
+    def _measure_attempts(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt("DataCatalog", name, rpc)
+
+    def _measure_calls(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call("DataCatalog", name, rpc)
+
+    def _measure_attempts_async(self, name: str, rpc: Callable) -> Callable:
+        # The asyncio client wraps its methods on each call, so it
+        # measures their stubs, and their calls, on each call too.
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt_async("DataCatalog", name, rpc)
+
+    def _measure_calls_async(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call_async("DataCatalog", name, rpc)
 
     def close(self):
         """Closes resources associated with the transport.
@@ -24,6 +24,8 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
 
+from google.cloud.datacatalog_v1 import flow_control
+from google.cloud.datacatalog_v1 import metrics
 from google.cloud.datacatalog_v1.types import datacatalog
 from google.cloud.datacatalog_v1.types import tags
 from google.iam.v1 import iam_policy_pb2  # type: ignore
@@ -63,6 +65,9 @@ class DataCatalogGrpcTransport(DataCatalogTransport):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        concurrency_limiter: Optional[flow_control.AdaptiveConcurrencyLimiter] = None,
+        rate_limiter: Optional[flow_control.RateLimiter] = None,
+        metrics_sink: Optional[metrics.MetricsSink] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -105,6 +110,15 @@ class DataCatalogGrpcTransport(DataCatalogTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            concurrency_limiter (Optional[google.cloud.datacatalog_v1.flow_control.AdaptiveConcurrencyLimiter]):
+                Limits the calls in flight of each method, adapting to
+                overload. If ``None``, calls are not limited.
+            rate_limiter (Optional[google.cloud.datacatalog_v1.flow_control.RateLimiter]):
+                Paces the calls of each method. If ``None``, calls are not
+                paced.
+            metrics_sink (Optional[google.cloud.datacatalog_v1.metrics.MetricsSink]):
+                Receives the latency, status and payload sizes of each call
+                and attempt. If ``None``, calls are not measured.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -158,6 +172,9 @@ class DataCatalogGrpcTransport(DataCatalogTransport):
             quota_project_id=quota_project_id,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            metrics_sink=metrics_sink,
         )
 
         if not self._grpc_channel:
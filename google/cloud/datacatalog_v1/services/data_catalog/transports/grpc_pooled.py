@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import Optional
+
+import grpc  # type: ignore
+
+from google.cloud.datacatalog_v1 import channel_pool
+from .base import DEFAULT_CLIENT_INFO
+from .grpc import DataCatalogGrpcTransport
+
+# The default number of channels in a pool.
+DEFAULT_POOL_SIZE = 4
+
+
+class DataCatalogGrpcPooledTransport(DataCatalogGrpcTransport):
+    """gRPC backend transport for DataCatalog over a pool of channels.
+
+    This transport behaves like :class:`DataCatalogGrpcTransport`, but
+    opens ``pool_size`` channels, each with its own connection, and sends
+    each call on one of them. This lifts the cap that a single HTTP/2
+    connection's concurrent stream limit puts on calls in flight.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        dispatch: str = channel_pool.ROUND_ROBIN,
+        channel: grpc.Channel = None,
+        **kwargs,
+    ) -> None:
+        """Instantiate the transport.
+
+        Args:
+            pool_size (int): The number of channels to open. Ignored if
+                ``channel`` is provided.
+            dispatch (str): How calls are spread over the channels:
+                :data:`~google.cloud.datacatalog_v1.channel_pool.ROUND_ROBIN`
+                or :data:`~google.cloud.datacatalog_v1.channel_pool.LEAST_BUSY`.
+            channel (Optional[grpc.Channel]): A ``Channel`` instance through
+                which to make all calls, instead of a pool.
+            kwargs: The other arguments of :class:`DataCatalogGrpcTransport`.
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1.")
+        super().__init__(channel=channel, **kwargs)
+        if channel is not None:
+            return
+
+        channels = [self._grpc_channel]
+        for _ in range(pool_size - 1):
+            channels.append(
+                type(self).create_channel(
+                    self._host,
+                    credentials=self._credentials,
+                    scopes=self._scopes,
+                    ssl_credentials=self._ssl_channel_credentials,
+                    quota_project_id=kwargs.get("quota_project_id"),
+                    options=[
+                        ("grpc.max_send_message_length", -1),
+                        ("grpc.max_receive_message_length", -1),
+                    ],
+                )
+            )
+        self._grpc_channel = channel_pool.ChannelPool(channels, dispatch)
+
+        # Recreate the stubs on the pool.
+        self._stubs = {}
+        self._prep_wrapped_messages(kwargs.get("client_info", DEFAULT_CLIENT_INFO))
+
+    @classmethod
+    def create_channel(cls, *args, **kwargs) -> grpc.Channel:
+        """Create and return a gRPC channel object with its own connection.
+
+        This is :meth:`DataCatalogGrpcTransport.create_channel`, with
+        :data:`~google.cloud.datacatalog_v1.channel_pool.CHANNEL_OPTIONS`
+        added to the ``options`` of the channel, so that every channel of
+        the pool, the first included, has a connection of its own.
+        """
+        options = list(kwargs.pop("options", ())) + list(channel_pool.CHANNEL_OPTIONS)
+        return super().create_channel(*args, options=options, **kwargs)
+
+
+__all__ = ("DataCatalogGrpcPooledTransport",)
@@ -16,7 +16,17 @@
 from collections import OrderedDict
 import functools
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
 
 from google.api_core.client_options import ClientOptions
@@ -31,6 +41,7 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.datacatalog_v1 import coalescing
 from google.cloud.datacatalog_v1.services.policy_tag_manager import pagers
 from google.cloud.datacatalog_v1.types import policytagmanager
 from google.cloud.datacatalog_v1.types import timestamps
@@ -57,32 +68,49 @@ class PolicyTagManagerAsyncClient:
 
     policy_tag_path = staticmethod(PolicyTagManagerClient.policy_tag_path)
     parse_policy_tag_path = staticmethod(PolicyTagManagerClient.parse_policy_tag_path)
+    parse_policy_tag_paths = staticmethod(PolicyTagManagerClient.parse_policy_tag_paths)
     taxonomy_path = staticmethod(PolicyTagManagerClient.taxonomy_path)
     parse_taxonomy_path = staticmethod(PolicyTagManagerClient.parse_taxonomy_path)
+    parse_taxonomy_paths = staticmethod(PolicyTagManagerClient.parse_taxonomy_paths)
     common_billing_account_path = staticmethod(
         PolicyTagManagerClient.common_billing_account_path
     )
     parse_common_billing_account_path = staticmethod(
         PolicyTagManagerClient.parse_common_billing_account_path
     )
+    parse_common_billing_account_paths = staticmethod(
+        PolicyTagManagerClient.parse_common_billing_account_paths
+    )
     common_folder_path = staticmethod(PolicyTagManagerClient.common_folder_path)
     parse_common_folder_path = staticmethod(
         PolicyTagManagerClient.parse_common_folder_path
     )
+    parse_common_folder_paths = staticmethod(
+        PolicyTagManagerClient.parse_common_folder_paths
+    )
     common_organization_path = staticmethod(
         PolicyTagManagerClient.common_organization_path
     )
     parse_common_organization_path = staticmethod(
         PolicyTagManagerClient.parse_common_organization_path
     )
+    parse_common_organization_paths = staticmethod(
+        PolicyTagManagerClient.parse_common_organization_paths
+    )
     common_project_path = staticmethod(PolicyTagManagerClient.common_project_path)
     parse_common_project_path = staticmethod(
         PolicyTagManagerClient.parse_common_project_path
     )
+    parse_common_project_paths = staticmethod(
+        PolicyTagManagerClient.parse_common_project_paths
+    )
     common_location_path = staticmethod(PolicyTagManagerClient.common_location_path)
     parse_common_location_path = staticmethod(
         PolicyTagManagerClient.parse_common_location_path
     )
+    parse_common_location_paths = staticmethod(
+        PolicyTagManagerClient.parse_common_location_paths
+    )
 
     @classmethod
     def from_service_account_info(cls, info: dict, *args, **kwargs):
@@ -173,6 +201,7 @@ class PolicyTagManagerAsyncClient:
         transport: Union[str, PolicyTagManagerTransport] = "grpc_asyncio",
         client_options: ClientOptions = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        coalesce_reads: bool = False,
     ) -> None:
         """Instantiates the policy tag manager client.
 
@@ -201,6 +230,10 @@ class PolicyTagManagerAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            coalesce_reads (bool): If ``True``, identical read requests
+                made concurrently, with the same metadata, share a single
+                in-flight call and its result. This applies to
+                ``get_taxonomy`` and ``get_policy_tag``.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -212,6 +245,7 @@ class PolicyTagManagerAsyncClient:
             client_options=client_options,
             client_info=client_info,
         )
+        self._single_flight = coalescing.AsyncSingleFlight() if coalesce_reads else None
 
     async def create_taxonomy(
         self,
@@ -287,10 +321,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_taxonomy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "create_taxonomy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -356,10 +388,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_taxonomy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "delete_taxonomy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -438,10 +468,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_taxonomy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "update_taxonomy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -466,6 +494,7 @@ class PolicyTagManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListTaxonomiesAsyncPager:
         r"""Lists all taxonomies in a project in a particular
         location that you have a permission to view.
@@ -486,6 +515,10 @@ class PolicyTagManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.policy_tag_manager.pagers.ListTaxonomiesAsyncPager:
@@ -515,10 +548,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_taxonomies,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "list_taxonomies", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -533,12 +564,34 @@ class PolicyTagManagerAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListTaxonomiesAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
         return response
 
+    async def _send_read(
+        self,
+        rpc: Callable[..., Awaitable[Any]],
+        request: Any,
+        *,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> Any:
+        def send():
+            return rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        if self._single_flight is None:
+            return await send()
+        return await self._single_flight.call(
+            coalescing.request_key(request, metadata), send
+        )
+
     async def get_taxonomy(
         self,
         request: Union[policytagmanager.GetTaxonomyRequest, dict] = None,
@@ -602,10 +655,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_taxonomy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "get_taxonomy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -614,8 +665,10 @@ class PolicyTagManagerAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = await self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
         return response
@@ -689,10 +742,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.create_policy_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "create_policy_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -761,10 +812,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.delete_policy_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "delete_policy_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -840,10 +889,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.update_policy_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "update_policy_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -868,6 +915,7 @@ class PolicyTagManagerAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: float = None,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0,
     ) -> pagers.ListPolicyTagsAsyncPager:
         r"""Lists all policy tags in a taxonomy.
 
@@ -887,6 +935,10 @@ class PolicyTagManagerAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages
+                to request ahead of iteration and keep queued. Defaults
+                to ``0``, which fetches each page only once the previous
+                one has been consumed.
 
         Returns:
             google.cloud.datacatalog_v1.services.policy_tag_manager.pagers.ListPolicyTagsAsyncPager:
@@ -916,10 +968,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_policy_tags,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "list_policy_tags", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -934,7 +984,11 @@ class PolicyTagManagerAsyncClient:
         # This method is paged; wrap the response in a pager, which provides
         # an `__aiter__` convenience method.
         response = pagers.ListPolicyTagsAsyncPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch_pages=prefetch_pages,
         )
 
         # Done; return the response.
@@ -1000,10 +1054,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_policy_tag,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "get_policy_tag", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1012,8 +1064,10 @@ class PolicyTagManagerAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = await self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
         return response
@@ -1105,10 +1159,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.get_iam_policy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "get_iam_policy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1210,10 +1262,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.set_iam_policy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "set_iam_policy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -1261,8 +1311,8 @@ class PolicyTagManagerAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.test_iam_permissions,
+        rpc = self._client._transport._wrap_async(
+            "test_iam_permissions",
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -16,7 +16,18 @@
 from collections import OrderedDict
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 import pkg_resources
 
 from google.api_core import client_options as client_options_lib
@@ -34,6 +45,8 @@ try:
 except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
+from google.cloud.datacatalog_v1 import coalescing
+from google.cloud.datacatalog_v1 import path_parser
 from google.cloud.datacatalog_v1.services.policy_tag_manager import pagers
 from google.cloud.datacatalog_v1.types import policytagmanager
 from google.cloud.datacatalog_v1.types import timestamps
@@ -44,6 +57,24 @@ from .transports.grpc import PolicyTagManagerGrpcTransport
 from .transports.grpc_asyncio import PolicyTagManagerGrpcAsyncIOTransport
 
 
+# Parsers for the resource names handled by the client.
+_POLICY_TAG_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/taxonomies/{taxonomy}/policyTags/{policy_tag}"
+)
+_TAXONOMY_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}/taxonomies/{taxonomy}"
+)
+_COMMON_BILLING_ACCOUNT_PATH = path_parser.PathParser(
+    "billingAccounts/{billing_account}"
+)
+_COMMON_FOLDER_PATH = path_parser.PathParser("folders/{folder}")
+_COMMON_ORGANIZATION_PATH = path_parser.PathParser("organizations/{organization}")
+_COMMON_PROJECT_PATH = path_parser.PathParser("projects/{project}")
+_COMMON_LOCATION_PATH = path_parser.PathParser(
+    "projects/{project}/locations/{location}"
+)
+
+
 class PolicyTagManagerClientMeta(type):
     """Metaclass for the PolicyTagManager client.
 
@@ -183,11 +214,12 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_policy_tag_path(path: str) -> Dict[str, str]:
         """Parses a policy_tag path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/taxonomies/(?P<taxonomy>.+?)/policyTags/(?P<policy_tag>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _POLICY_TAG_PATH.parse(path)
+
+    @staticmethod
+    def parse_policy_tag_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses policy_tag paths into parallel lists of their component segments."""
+        return _POLICY_TAG_PATH.parse_batch(paths)
 
     @staticmethod
     def taxonomy_path(project: str, location: str, taxonomy: str,) -> str:
@@ -199,11 +231,12 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_taxonomy_path(path: str) -> Dict[str, str]:
         """Parses a taxonomy path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/taxonomies/(?P<taxonomy>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return _TAXONOMY_PATH.parse(path)
+
+    @staticmethod
+    def parse_taxonomy_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Parses taxonomy paths into parallel lists of their component segments."""
+        return _TAXONOMY_PATH.parse_batch(paths)
 
     @staticmethod
     def common_billing_account_path(billing_account: str,) -> str:
@@ -215,8 +248,14 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_common_billing_account_path(path: str) -> Dict[str, str]:
         """Parse a billing_account path into its component segments."""
-        m = re.match(r"^billingAccounts/(?P<billing_account>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_BILLING_ACCOUNT_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_billing_account_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses billing_account paths into parallel lists of their component segments."""
+        return _COMMON_BILLING_ACCOUNT_PATH.parse_batch(paths)
 
     @staticmethod
     def common_folder_path(folder: str,) -> str:
@@ -226,8 +265,14 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_common_folder_path(path: str) -> Dict[str, str]:
         """Parse a folder path into its component segments."""
-        m = re.match(r"^folders/(?P<folder>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_FOLDER_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_folder_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses folder paths into parallel lists of their component segments."""
+        return _COMMON_FOLDER_PATH.parse_batch(paths)
 
     @staticmethod
     def common_organization_path(organization: str,) -> str:
@@ -237,8 +282,14 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_common_organization_path(path: str) -> Dict[str, str]:
         """Parse a organization path into its component segments."""
-        m = re.match(r"^organizations/(?P<organization>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_ORGANIZATION_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_organization_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses organization paths into parallel lists of their component segments."""
+        return _COMMON_ORGANIZATION_PATH.parse_batch(paths)
 
     @staticmethod
     def common_project_path(project: str,) -> str:
@@ -248,8 +299,14 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_common_project_path(path: str) -> Dict[str, str]:
         """Parse a project path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_PROJECT_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_project_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses project paths into parallel lists of their component segments."""
+        return _COMMON_PROJECT_PATH.parse_batch(paths)
 
     @staticmethod
     def common_location_path(project: str, location: str,) -> str:
@@ -261,8 +318,14 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
     @staticmethod
     def parse_common_location_path(path: str) -> Dict[str, str]:
         """Parse a location path into its component segments."""
-        m = re.match(r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)$", path)
-        return m.groupdict() if m else {}
+        return _COMMON_LOCATION_PATH.parse(path)
+
+    @staticmethod
+    def parse_common_location_paths(
+        paths: Iterable[str],
+    ) -> Dict[str, List[Optional[str]]]:
+        """Parses location paths into parallel lists of their component segments."""
+        return _COMMON_LOCATION_PATH.parse_batch(paths)
 
     @classmethod
     def get_mtls_endpoint_and_cert_source(
@@ -338,6 +401,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
         transport: Union[str, PolicyTagManagerTransport, None] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        coalesce_reads: bool = False,
     ) -> None:
         """Instantiates the policy tag manager client.
 
@@ -371,11 +435,16 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            coalesce_reads (bool): If ``True``, identical read requests
+                made concurrently, with the same metadata, share a single
+                in-flight call and its result. This applies to
+                ``get_taxonomy`` and ``get_policy_tag``.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
                 creation failed for any reason.
         """
+        self._single_flight = coalescing.SingleFlight() if coalesce_reads else None
         if isinstance(client_options, dict):
             client_options = client_options_lib.from_dict(client_options)
         if client_options is None:
@@ -507,7 +576,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_taxonomy]
+        rpc = self._transport._wrapped_methods["create_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -576,7 +645,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_taxonomy]
+        rpc = self._transport._wrapped_methods["delete_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -658,7 +727,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_taxonomy]
+        rpc = self._transport._wrapped_methods["update_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -735,7 +804,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_taxonomies]
+        rpc = self._transport._wrapped_methods["list_taxonomies"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -755,6 +824,22 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
         # Done; return the response.
         return response
 
+    def _send_read(
+        self,
+        rpc: Callable[..., Any],
+        request: Any,
+        *,
+        retry: OptionalRetry,
+        timeout: Optional[float],
+        metadata: Sequence[Tuple[str, str]],
+    ) -> Any:
+        def send():
+            return rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        if self._single_flight is None:
+            return send()
+        return self._single_flight.call(coalescing.request_key(request, metadata), send)
+
     def get_taxonomy(
         self,
         request: Union[policytagmanager.GetTaxonomyRequest, dict] = None,
@@ -822,7 +907,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_taxonomy]
+        rpc = self._transport._wrapped_methods["get_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -830,8 +915,10 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
         return response
@@ -909,7 +996,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_policy_tag]
+        rpc = self._transport._wrapped_methods["create_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -981,7 +1068,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_policy_tag]
+        rpc = self._transport._wrapped_methods["delete_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1060,7 +1147,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_policy_tag]
+        rpc = self._transport._wrapped_methods["update_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1136,7 +1223,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_policy_tags]
+        rpc = self._transport._wrapped_methods["list_policy_tags"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1220,7 +1307,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_policy_tag]
+        rpc = self._transport._wrapped_methods["get_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1228,8 +1315,10 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        # Send the request, sharing it with identical requests in flight.
+        response = self._send_read(
+            rpc, request, retry=retry, timeout=timeout, metadata=metadata,
+        )
 
         # Done; return the response.
         return response
@@ -1324,7 +1413,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_iam_policy]
+        rpc = self._transport._wrapped_methods["get_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1428,7 +1517,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_iam_policy]
+        rpc = self._transport._wrapped_methods["set_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1478,7 +1567,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.test_iam_permissions]
+        rpc = self._transport._wrapped_methods["test_iam_permissions"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -23,10 +23,59 @@ from typing import (
     Optional,
     Iterator,
 )
+import asyncio
 
 from google.cloud.datacatalog_v1.types import policytagmanager
 
 
+# Marks the end of the pages produced by a prefetching task.
+_PREFETCH_DONE = object()
+
+
+async def _prefetch_async(
+    method: Callable[..., Awaitable[Any]],
+    request: Any,
+    metadata: Sequence[Tuple[str, str]],
+    depth: int,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Fetch pages in a producer task, keeping up to ``depth`` ahead.
+
+    Starting from ``request.page_token``, a task awaits ``method`` for each
+    page and hands ``(page_token, response)`` pairs over a bounded
+    :class:`asyncio.Queue`. Errors raised by ``method`` are re-raised here,
+    in page order. Closing the generator cancels the producer task.
+    """
+    buffer = asyncio.Queue(maxsize=depth)  # type: asyncio.Queue
+
+    async def produce() -> None:
+        try:
+            while True:
+                page_token = request.page_token
+                response = await method(request, metadata=metadata)
+                await buffer.put((page_token, response))
+                if not response.next_page_token:
+                    break
+                request.page_token = response.next_page_token
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await buffer.put(exc)
+            return
+        await buffer.put(_PREFETCH_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
+
 class ListTaxonomiesPager:
     """A pager for iterating through ``list_taxonomies`` requests.
 
@@ -102,6 +151,10 @@ class ListTaxonomiesAsyncPager:
     through the ``taxonomies`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListTaxonomiesResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -113,7 +166,8 @@ class ListTaxonomiesAsyncPager:
         request: policytagmanager.ListTaxonomiesRequest,
         response: policytagmanager.ListTaxonomiesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0
     ):
         """Instantiates the pager.
 
@@ -126,11 +180,15 @@ class ListTaxonomiesAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
         """
         self._method = method
         self._request = policytagmanager.ListTaxonomiesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -138,11 +196,29 @@ class ListTaxonomiesAsyncPager:
     @property
     async def pages(self) -> AsyncIterator[policytagmanager.ListTaxonomiesResponse]:
         yield self._response
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    async def _prefetched_pages(
+        self,
+    ) -> AsyncIterator[policytagmanager.ListTaxonomiesResponse]:
+        if not self._response.next_page_token:
+            return
+        request = policytagmanager.ListTaxonomiesRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield self._response
+
     def __aiter__(self) -> AsyncIterator[policytagmanager.Taxonomy]:
         async def async_generator():
             async for page in self.pages:
@@ -230,6 +306,10 @@ class ListPolicyTagsAsyncPager:
     through the ``policy_tags`` field on the
     corresponding responses.
 
+    If ``prefetch_pages`` is set, a producer task keeps up to that many
+    upcoming pages in a bounded queue while the current one is iterated.
+    The task is cancelled once iteration is abandoned.
+
     All the usual :class:`google.cloud.datacatalog_v1.types.ListPolicyTagsResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
@@ -241,7 +321,8 @@ class ListPolicyTagsAsyncPager:
         request: policytagmanager.ListPolicyTagsRequest,
         response: policytagmanager.ListPolicyTagsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch_pages: int = 0
     ):
         """Instantiates the pager.
 
@@ -254,11 +335,15 @@ class ListPolicyTagsAsyncPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch_pages (int): The maximum number of upcoming pages a
+                producer task keeps queued while the current page is
+                consumed. If ``0``, pages are fetched only when needed.
         """
         self._method = method
         self._request = policytagmanager.ListPolicyTagsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch_pages = prefetch_pages
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -266,11 +351,29 @@ class ListPolicyTagsAsyncPager:
     @property
     async def pages(self) -> AsyncIterator[policytagmanager.ListPolicyTagsResponse]:
         yield self._response
+        if self._prefetch_pages > 0:
+            async for page in self._prefetched_pages():
+                yield page
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = await self._method(self._request, metadata=self._metadata)
             yield self._response
 
+    async def _prefetched_pages(
+        self,
+    ) -> AsyncIterator[policytagmanager.ListPolicyTagsResponse]:
+        if not self._response.next_page_token:
+            return
+        request = policytagmanager.ListPolicyTagsRequest(self._request)
+        request.page_token = self._response.next_page_token
+        async for page_token, response in _prefetch_async(
+            self._method, request, self._metadata, self._prefetch_pages
+        ):
+            self._request.page_token = page_token
+            self._response = response
+            yield self._response
+
     def __aiter__(self) -> AsyncIterator[policytagmanager.PolicyTag]:
         async def async_generator():
             async for page in self.pages:
@@ -19,6 +19,7 @@ from typing import Dict, Type
 from .base import PolicyTagManagerTransport
 from .grpc import PolicyTagManagerGrpcTransport
 from .grpc_asyncio import PolicyTagManagerGrpcAsyncIOTransport
+from .grpc_record_replay import PolicyTagManagerGrpcRecordReplayTransport
 
 
 # Compile a registry of transports.
@@ -30,4 +31,5 @@ __all__ = (
     "PolicyTagManagerTransport",
     "PolicyTagManagerGrpcTransport",
     "PolicyTagManagerGrpcAsyncIOTransport",
+    "PolicyTagManagerGrpcRecordReplayTransport",
 )
@@ -25,6 +25,9 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import flow_control
+from google.cloud.datacatalog_v1 import metrics
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1.types import policytagmanager
 from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
@@ -57,6 +60,8 @@ class PolicyTagManagerTransport(abc.ABC):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        rate_limiter: Optional[flow_control.RateLimiter] = None,
+        metrics_sink: Optional[metrics.MetricsSink] = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -82,6 +87,12 @@ class PolicyTagManagerTransport(abc.ABC):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            rate_limiter (Optional[google.cloud.datacatalog_v1.flow_control.RateLimiter]):
+                Paces the calls of each method. If ``None``, calls are not
+                paced.
+            metrics_sink (Optional[google.cloud.datacatalog_v1.metrics.MetricsSink]):
+                Receives the latency, status and payload sizes of each call
+                and attempt. If ``None``, calls are not measured.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -120,51 +131,77 @@ class PolicyTagManagerTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        self._rate_limiter = rate_limiter
+        self._metrics_sink = metrics_sink
+
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.create_taxonomy: gapic_v1.method.wrap_method(
-                self.create_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_taxonomy: gapic_v1.method.wrap_method(
-                self.delete_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.update_taxonomy: gapic_v1.method.wrap_method(
-                self.update_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.list_taxonomies: gapic_v1.method.wrap_method(
-                self.list_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-            self.get_taxonomy: gapic_v1.method.wrap_method(
-                self.get_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.create_policy_tag: gapic_v1.method.wrap_method(
-                self.create_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_policy_tag: gapic_v1.method.wrap_method(
-                self.delete_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.update_policy_tag: gapic_v1.method.wrap_method(
-                self.update_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.list_policy_tags: gapic_v1.method.wrap_method(
-                self.list_policy_tags, default_timeout=None, client_info=client_info,
-            ),
-            self.get_policy_tag: gapic_v1.method.wrap_method(
-                self.get_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        rpc = getattr(self, name)
+        rpc = self._measure_attempts(name, rpc)
+
+        # Apply client-side flow control, if asked to. Each attempt is
+        # limited, so that retries take a token too.
+        if self._rate_limiter is not None:
+            rpc = self._rate_limiter.wrap(name, rpc)
+        rpc = gapic_v1.method.wrap_method(
+            rpc, default_timeout=None, client_info=client_info,
+        )
+        return self._measure_calls(name, rpc)
+
+    def _wrap_async(
+        self,
+        name: str,
+        default_retry: Optional[retries.Retry] = None,
+        default_timeout: Optional[float] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    ) -> Callable:
+        # The asyncio client wraps its methods on each call. As for the
+        # wrapped methods, each attempt is measured and limited, inside the
+        # retry, and each call is measured.
+        stub = getattr(self, name)
+        rpc = self._limit_async(name, self._measure_attempts_async(name, stub))
+        if rpc is not stub:
+            rpc = wrapped_methods.AsyncUnaryUnaryAttempt(rpc)
+        rpc = gapic_v1.method_async.wrap_method(
+            rpc,
+            default_retry=default_retry,
+            default_timeout=default_timeout,
+            client_info=client_info,
+        )
+        return self._measure_calls_async(name, rpc)
+
+    def _limit_async(self, name: str, rpc: Callable) -> Callable:
+        # The asyncio client wraps its methods on each call, so it limits
+        # their attempts on each call too.
+        if self._rate_limiter is not None:
+            rpc = self._rate_limiter.wrap_async(name, rpc)
+        return rpc
+
+    def _measure_attempts(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt("PolicyTagManager", name, rpc)
+
+    def _measure_calls(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call("PolicyTagManager", name, rpc)
+
+    def _measure_attempts_async(self, name: str, rpc: Callable) -> Callable:
+        # The asyncio client wraps its methods on each call, so it
+        # measures their stubs, and their calls, on each call too.
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt_async("PolicyTagManager", name, rpc)
+
+    def _measure_calls_async(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call_async("PolicyTagManager", name, rpc)
 
     def close(self):
         """Closes resources associated with the transport.
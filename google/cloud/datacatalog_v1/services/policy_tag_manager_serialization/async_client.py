@@ -271,10 +271,8 @@ class PolicyTagManagerSerializationAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.replace_taxonomy,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "replace_taxonomy", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -329,10 +327,8 @@ class PolicyTagManagerSerializationAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.import_taxonomies,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "import_taxonomies", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -386,10 +382,8 @@ class PolicyTagManagerSerializationAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.export_taxonomies,
-            default_timeout=None,
-            client_info=DEFAULT_CLIENT_INFO,
+        rpc = self._client._transport._wrap_async(
+            "export_taxonomies", default_timeout=None, client_info=DEFAULT_CLIENT_INFO,
         )
 
         # Certain fields should be provided within the metadata header;
@@ -19,6 +19,7 @@ from typing import Dict, Type
 from .base import PolicyTagManagerSerializationTransport
 from .grpc import PolicyTagManagerSerializationGrpcTransport
 from .grpc_asyncio import PolicyTagManagerSerializationGrpcAsyncIOTransport
+from .grpc_record_replay import PolicyTagManagerSerializationGrpcRecordReplayTransport
 
 
 # Compile a registry of transports.
@@ -32,4 +33,5 @@ __all__ = (
     "PolicyTagManagerSerializationTransport",
     "PolicyTagManagerSerializationGrpcTransport",
     "PolicyTagManagerSerializationGrpcAsyncIOTransport",
+    "PolicyTagManagerSerializationGrpcRecordReplayTransport",
 )
@@ -25,6 +25,8 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import metrics
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1.types import policytagmanager
 from google.cloud.datacatalog_v1.types import policytagmanagerserialization
 
@@ -55,6 +57,7 @@ class PolicyTagManagerSerializationTransport(abc.ABC):
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        metrics_sink: Optional[metrics.MetricsSink] = None,
         **kwargs,
     ) -> None:
         """Instantiate the transport.
@@ -80,6 +83,9 @@ class PolicyTagManagerSerializationTransport(abc.ABC):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            metrics_sink (Optional[google.cloud.datacatalog_v1.metrics.MetricsSink]):
+                Receives the latency, status and payload sizes of each call
+                and attempt. If ``None``, calls are not measured.
         """
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
@@ -118,19 +124,71 @@ class PolicyTagManagerSerializationTransport(abc.ABC):
         # Save the credentials.
         self._credentials = credentials
 
+        self._metrics_sink = metrics_sink
+
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.replace_taxonomy: gapic_v1.method.wrap_method(
-                self.replace_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.import_taxonomies: gapic_v1.method.wrap_method(
-                self.import_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-            self.export_taxonomies: gapic_v1.method.wrap_method(
-                self.export_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        rpc = getattr(self, name)
+        rpc = gapic_v1.method.wrap_method(
+            self._measure_attempts(name, rpc),
+            default_timeout=None,
+            client_info=client_info,
+        )
+        return self._measure_calls(name, rpc)
+
+    def _wrap_async(
+        self,
+        name: str,
+        default_retry: Optional[retries.Retry] = None,
+        default_timeout: Optional[float] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    ) -> Callable:
+        # The asyncio client wraps its methods on each call. As for the
+        # wrapped methods, each attempt is measured, inside the retry, and
+        # each call is measured.
+        stub = getattr(self, name)
+        rpc = self._measure_attempts_async(name, stub)
+        if rpc is not stub:
+            rpc = wrapped_methods.AsyncUnaryUnaryAttempt(rpc)
+        rpc = gapic_v1.method_async.wrap_method(
+            rpc,
+            default_retry=default_retry,
+            default_timeout=default_timeout,
+            client_info=client_info,
+        )
+        return self._measure_calls_async(name, rpc)
+
+    def _measure_attempts(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt(
+            "PolicyTagManagerSerialization", name, rpc
+        )
+
+    def _measure_calls(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call("PolicyTagManagerSerialization", name, rpc)
+
+    def _measure_attempts_async(self, name: str, rpc: Callable) -> Callable:
+        # The asyncio client wraps its methods on each call, so it
+        # measures their stubs, and their calls, on each call too.
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_attempt_async(
+            "PolicyTagManagerSerialization", name, rpc
+        )
+
+    def _measure_calls_async(self, name: str, rpc: Callable) -> Callable:
+        if self._metrics_sink is None:
+            return rpc
+        return self._metrics_sink.wrap_call_async(
+            "PolicyTagManagerSerialization", name, rpc
+        )
 
     def close(self):
         """Closes resources associated with the transport.
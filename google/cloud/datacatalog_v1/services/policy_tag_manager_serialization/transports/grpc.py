@@ -24,6 +24,7 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 
 import grpc  # type: ignore
 
+from google.cloud.datacatalog_v1 import metrics
 from google.cloud.datacatalog_v1.types import policytagmanager
 from google.cloud.datacatalog_v1.types import policytagmanagerserialization
 from .base import PolicyTagManagerSerializationTransport, DEFAULT_CLIENT_INFO
@@ -64,6 +65,7 @@ class PolicyTagManagerSerializationGrpcTransport(
         quota_project_id: Optional[str] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
+        metrics_sink: Optional[metrics.MetricsSink] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -106,6 +108,9 @@ class PolicyTagManagerSerializationGrpcTransport(
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            metrics_sink (Optional[google.cloud.datacatalog_v1.metrics.MetricsSink]):
+                Receives the latency, status and payload sizes of each call
+                and attempt. If ``None``, calls are not measured.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -159,6 +164,7 @@ class PolicyTagManagerSerializationGrpcTransport(
             quota_project_id=quota_project_id,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
+            metrics_sink=metrics_sink,
         )
 
         if not self._grpc_channel:
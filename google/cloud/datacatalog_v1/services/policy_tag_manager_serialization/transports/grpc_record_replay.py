@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import grpc  # type: ignore
+
+from google.cloud.datacatalog_v1 import recording
+from .base import DEFAULT_CLIENT_INFO
+from .grpc import PolicyTagManagerSerializationGrpcTransport
+
+
+class PolicyTagManagerSerializationGrpcRecordReplayTransport(
+    PolicyTagManagerSerializationGrpcTransport
+):
+    """gRPC backend transport for PolicyTagManagerSerialization that records or replays calls.
+
+    In :data:`~google.cloud.datacatalog_v1.recording.RECORD` mode, this
+    transport behaves like :class:`PolicyTagManagerSerializationGrpcTransport`, and appends
+    each call, with its request and response bytes and timing, to the
+    recording at ``path``. In
+    :data:`~google.cloud.datacatalog_v1.recording.REPLAY` mode, it makes
+    no connection, and answers each call from that recording; see
+    :class:`~google.cloud.datacatalog_v1.recording.ReplayChannel`.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str,
+        mode: str = recording.REPLAY,
+        reproduce_latency: bool = False,
+        channel: grpc.Channel = None,
+        **kwargs,
+    ) -> None:
+        """Instantiate the transport.
+
+        Args:
+            path (str): The recording to append calls to, or replay.
+            mode (str): :data:`~google.cloud.datacatalog_v1.recording.RECORD`
+                or :data:`~google.cloud.datacatalog_v1.recording.REPLAY`.
+            reproduce_latency (bool): Whether replayed calls take as long
+                as the recorded calls did.
+            channel (Optional[grpc.Channel]): In record mode, a ``Channel``
+                instance through which to make all calls.
+            kwargs: The other arguments of :class:`PolicyTagManagerSerializationGrpcTransport`.
+        """
+        if mode == recording.REPLAY:
+            super().__init__(
+                channel=recording.ReplayChannel(
+                    path, reproduce_latency=reproduce_latency
+                ),
+                **kwargs,
+            )
+            return
+        if mode != recording.RECORD:
+            raise ValueError("Unknown mode: {!r}.".format(mode))
+
+        super().__init__(channel=channel, **kwargs)
+        self._grpc_channel = recording.RecordingChannel(self._grpc_channel, path)
+        # Recreate the stubs on the recording channel.
+        self._stubs = {}
+        self._prep_wrapped_messages(kwargs.get("client_info", DEFAULT_CLIENT_INFO))
+
+
+__all__ = ("PolicyTagManagerSerializationGrpcRecordReplayTransport",)
@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Sessions that build the Data Catalog clients on one shared channel.
+
+A session resolves credentials and opens a gRPC channel once. Every
+client built from it sends its calls over that channel. Each client holds
+a lease on the channel, and closing the client (or its transport) returns
+the lease; the channel is closed when the session and every client built
+from it have been closed.
+"""
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import grpc_helpers
+from google.api_core import grpc_helpers_async
+import google.auth  # type: ignore
+from google.auth import credentials as ga_credentials  # type: ignore
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog.transports import (
+    DataCatalogGrpcAsyncIOTransport,
+    DataCatalogGrpcTransport,
+)
+from google.cloud.datacatalog_v1.services.data_catalog.transports.base import (
+    DEFAULT_CLIENT_INFO,
+    DataCatalogTransport,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerAsyncClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager.transports import (
+    PolicyTagManagerGrpcAsyncIOTransport,
+    PolicyTagManagerGrpcTransport,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationAsyncClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization.transports import (
+    PolicyTagManagerSerializationGrpcAsyncIOTransport,
+    PolicyTagManagerSerializationGrpcTransport,
+)
+
+_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
+
+class _Session:
+    """Resolves credentials once and counts the leases on the channel."""
+
+    def __init__(
+        self,
+        *,
+        host: str,
+        credentials: Optional[ga_credentials.Credentials],
+        credentials_file: Optional[str],
+        scopes: Optional[Sequence[str]],
+        quota_project_id: Optional[str],
+        client_info: gapic_v1.client_info.ClientInfo,
+    ):
+        if credentials and credentials_file:
+            raise core_exceptions.DuplicateCredentialArgs(
+                "'credentials_file' and 'credentials' are mutually exclusive"
+            )
+        scopes_kwargs = {
+            "scopes": scopes,
+            "default_scopes": DataCatalogTransport.AUTH_SCOPES,
+        }
+        if credentials_file is not None:
+            credentials, _ = google.auth.load_credentials_from_file(
+                credentials_file, **scopes_kwargs, quota_project_id=quota_project_id
+            )
+        elif credentials is None:
+            credentials, _ = google.auth.default(
+                **scopes_kwargs, quota_project_id=quota_project_id
+            )
+
+        # Default to port 443 (HTTPS) if none is specified.
+        if ":" not in host:
+            host += ":443"
+        self._host = host
+        self._credentials = credentials
+        self._scopes = scopes
+        self._quota_project_id = quota_project_id
+        self._client_info = client_info
+        self._lock = threading.Lock()
+        # The session holds one reference itself, until it is closed.
+        self._references = 1
+        self._closed = False
+
+    @property
+    def credentials(self) -> ga_credentials.Credentials:
+        """The credentials shared by the session's clients."""
+        return self._credentials
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._references == 0:
+                raise ValueError("The session's channel is closed.")
+            self._references += 1
+
+    def _release(self) -> bool:
+        # Returns whether the caller held the last reference.
+        with self._lock:
+            self._references -= 1
+            return self._references == 0
+
+    def _release_session(self) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+        return self._release()
+
+    def _transport(self, transport_class, lease, options):
+        return transport_class(
+            host=self._host,
+            channel=lease,
+            client_info=self._client_info,
+            **(options or {}),
+        )
+
+
+class _ChannelLease(grpc.Channel):
+    """One client's use of a session's channel."""
+
+    def __init__(self, session: "DataCatalogSession"):
+        session._acquire()
+        self._session = session
+        self._channel = session.grpc_channel
+        self._closed = False
+
+    def unary_unary(self, *args, **kwargs):
+        return self._channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self._channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self._channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self._channel.stream_stream(*args, **kwargs)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channel.unsubscribe(callback)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._session._release():
+            self._channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class DataCatalogSession(_Session):
+    """Builds the Data Catalog clients on one shared channel.
+
+    The session resolves credentials once, opens one gRPC channel and
+    builds :class:`DataCatalogClient`, :class:`PolicyTagManagerClient` and
+    :class:`PolicyTagManagerSerializationClient` instances over it::
+
+        with DataCatalogSession() as session:
+            catalog = session.data_catalog_client()
+            policy_tags = session.policy_tag_manager_client()
+
+    The channel is closed once the session and every client built from it
+    have been closed, whichever comes last. Instances are safe to share
+    between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = DataCatalogTransport.DEFAULT_HOST,
+        credentials: ga_credentials.Credentials = None,
+        credentials_file: Optional[str] = None,
+        scopes: Optional[Sequence[str]] = None,
+        quota_project_id: Optional[str] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        channel: grpc.Channel = None,
+    ):
+        """Instantiate the session.
+
+        Args:
+            host (Optional[str]): The hostname to connect to.
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. If none
+                are specified, they are ascertained from the environment.
+                Ignored if ``channel`` is provided.
+            credentials_file (Optional[str]): A file with credentials that can
+                be loaded with :func:`google.auth.load_credentials_from_file`.
+                This argument is mutually exclusive with credentials.
+            scopes (Optional[Sequence[str]]): A list of scopes.
+            quota_project_id (Optional[str]): An optional project to use for billing
+                and quota.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info used to send a user-agent string along with
+                API requests.
+            channel (Optional[grpc.Channel]): A ``Channel`` instance through
+                which to make calls, such as a
+                :class:`~google.cloud.datacatalog_v1.channel_pool.ChannelPool`.
+                The session takes ownership of it.
+        """
+        if channel is not None:
+            credentials = ga_credentials.AnonymousCredentials()
+            credentials_file = None
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            credentials_file=credentials_file,
+            scopes=scopes,
+            quota_project_id=quota_project_id,
+            client_info=client_info,
+        )
+        if channel is None:
+            channel = grpc_helpers.create_channel(
+                self._host,
+                credentials=self._credentials,
+                scopes=self._scopes,
+                default_scopes=DataCatalogTransport.AUTH_SCOPES,
+                default_host=DataCatalogTransport.DEFAULT_HOST,
+                quota_project_id=self._quota_project_id,
+                options=_CHANNEL_OPTIONS,
+            )
+        self._grpc_channel = channel
+
+    @property
+    def grpc_channel(self) -> grpc.Channel:
+        """The channel shared by the session's clients."""
+        return self._grpc_channel
+
+    def data_catalog_client(
+        self, *, transport_options: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> DataCatalogClient:
+        """Returns a new :class:`DataCatalogClient` on the shared channel.
+
+        Args:
+            transport_options (Optional[Dict[str, Any]]): Extra arguments
+                for the transport, such as ``rate_limiter``.
+            kwargs: Extra arguments for the client, such as
+                ``entry_cache``.
+        """
+        return DataCatalogClient(
+            transport=self._transport(
+                DataCatalogGrpcTransport, _ChannelLease(self), transport_options
+            ),
+            **kwargs,
+        )
+
+    def policy_tag_manager_client(
+        self, *, transport_options: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> PolicyTagManagerClient:
+        """Returns a new :class:`PolicyTagManagerClient` on the shared
+        channel.
+
+        Args:
+            transport_options (Optional[Dict[str, Any]]): Extra arguments
+                for the transport, such as ``rate_limiter``.
+            kwargs: Extra arguments for the client.
+        """
+        return PolicyTagManagerClient(
+            transport=self._transport(
+                PolicyTagManagerGrpcTransport, _ChannelLease(self), transport_options
+            ),
+            **kwargs,
+        )
+
+    def policy_tag_manager_serialization_client(
+        self, **kwargs
+    ) -> PolicyTagManagerSerializationClient:
+        """Returns a new :class:`PolicyTagManagerSerializationClient` on the
+        shared channel.
+
+        Args:
+            kwargs: Extra arguments for the client.
+        """
+        return PolicyTagManagerSerializationClient(
+            transport=self._transport(
+                PolicyTagManagerSerializationGrpcTransport, _ChannelLease(self), None
+            ),
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        """Releases the session's own hold on the channel.
+
+        The channel is closed now if every client built from the session
+        has been closed, or else when the last of them is.
+        """
+        if self._release_session():
+            self._grpc_channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class _AsyncChannelLease(aio.Channel):
+    """One client's use of a session's asyncio channel."""
+
+    def __init__(self, session: "DataCatalogAsyncSession"):
+        session._acquire()
+        self._session = session
+        self._channel = session.grpc_channel
+        self._closed = False
+
+    def unary_unary(self, *args, **kwargs):
+        return self._channel.unary_unary(*args, **kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        return self._channel.unary_stream(*args, **kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        return self._channel.stream_unary(*args, **kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        return self._channel.stream_stream(*args, **kwargs)
+
+    def get_state(self, try_to_connect: bool = False):
+        return self._channel.get_state(try_to_connect)
+
+    async def wait_for_state_change(self, last_observed_state):
+        await self._channel.wait_for_state_change(last_observed_state)
+
+    async def channel_ready(self):
+        await self._channel.channel_ready()
+
+    async def close(self, grace=None):
+        if self._closed:
+            return
+        self._closed = True
+        if self._session._release():
+            await self._channel.close(grace)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class DataCatalogAsyncSession(_Session):
+    """Builds the asyncio Data Catalog clients on one shared channel.
+
+    The asyncio counterpart of :class:`DataCatalogSession`; it builds
+    :class:`DataCatalogAsyncClient`, :class:`PolicyTagManagerAsyncClient`
+    and :class:`PolicyTagManagerSerializationAsyncClient` instances::
+
+        async with DataCatalogAsyncSession() as session:
+            catalog = session.data_catalog_client()
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = DataCatalogTransport.DEFAULT_HOST,
+        credentials: ga_credentials.Credentials = None,
+        credentials_file: Optional[str] = None,
+        scopes: Optional[Sequence[str]] = None,
+        quota_project_id: Optional[str] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        channel: aio.Channel = None,
+    ):
+        """Instantiate the session.
+
+        Args:
+            host (Optional[str]): The hostname to connect to.
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. If none
+                are specified, they are ascertained from the environment.
+                Ignored if ``channel`` is provided.
+            credentials_file (Optional[str]): A file with credentials that can
+                be loaded with :func:`google.auth.load_credentials_from_file`.
+                This argument is mutually exclusive with credentials.
+            scopes (Optional[Sequence[str]]): A list of scopes.
+            quota_project_id (Optional[str]): An optional project to use for billing
+                and quota.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info used to send a user-agent string along with
+                API requests.
+            channel (Optional[aio.Channel]): A ``Channel`` instance through
+                which to make calls, such as a
+                :class:`~google.cloud.datacatalog_v1.channel_pool.AsyncChannelPool`.
+                The session takes ownership of it.
+        """
+        if channel is not None:
+            credentials = ga_credentials.AnonymousCredentials()
+            credentials_file = None
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            credentials_file=credentials_file,
+            scopes=scopes,
+            quota_project_id=quota_project_id,
+            client_info=client_info,
+        )
+        if channel is None:
+            channel = grpc_helpers_async.create_channel(
+                self._host,
+                credentials=self._credentials,
+                scopes=self._scopes,
+                default_scopes=DataCatalogTransport.AUTH_SCOPES,
+                default_host=DataCatalogTransport.DEFAULT_HOST,
+                quota_project_id=self._quota_project_id,
+                options=_CHANNEL_OPTIONS,
+            )
+        self._grpc_channel = channel
+
+    @property
+    def grpc_channel(self) -> aio.Channel:
+        """The channel shared by the session's clients."""
+        return self._grpc_channel
+
+    def data_catalog_client(
+        self, *, transport_options: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> DataCatalogAsyncClient:
+        """Returns a new :class:`DataCatalogAsyncClient` on the shared
+        channel.
+
+        Args:
+            transport_options (Optional[Dict[str, Any]]): Extra arguments
+                for the transport, such as ``rate_limiter``.
+            kwargs: Extra arguments for the client, such as
+                ``entry_cache``.
+        """
+        return DataCatalogAsyncClient(
+            transport=self._transport(
+                DataCatalogGrpcAsyncIOTransport,
+                _AsyncChannelLease(self),
+                transport_options,
+            ),
+            **kwargs,
+        )
+
+    def policy_tag_manager_client(
+        self, *, transport_options: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> PolicyTagManagerAsyncClient:
+        """Returns a new :class:`PolicyTagManagerAsyncClient` on the shared
+        channel.
+
+        Args:
+            transport_options (Optional[Dict[str, Any]]): Extra arguments
+                for the transport, such as ``rate_limiter``.
+            kwargs: Extra arguments for the client.
+        """
+        return PolicyTagManagerAsyncClient(
+            transport=self._transport(
+                PolicyTagManagerGrpcAsyncIOTransport,
+                _AsyncChannelLease(self),
+                transport_options,
+            ),
+            **kwargs,
+        )
+
+    def policy_tag_manager_serialization_client(
+        self, **kwargs
+    ) -> PolicyTagManagerSerializationAsyncClient:
+        """Returns a new :class:`PolicyTagManagerSerializationAsyncClient`
+        on the shared channel.
+
+        Args:
+            kwargs: Extra arguments for the client.
+        """
+        return PolicyTagManagerSerializationAsyncClient(
+            transport=self._transport(
+                PolicyTagManagerSerializationGrpcAsyncIOTransport,
+                _AsyncChannelLease(self),
+                None,
+            ),
+            **kwargs,
+        )
+
+    async def close(self) -> None:
+        """Releases the session's own hold on the channel.
+
+        The channel is closed now if every client built from the session
+        has been closed, or else when the last of them is.
+        """
+        if self._release_session():
+            await self._grpc_channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+__all__ = (
+    "DataCatalogAsyncSession",
+    "DataCatalogSession",
+)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers for the wrapping of the transports' methods."""
+from typing import Any, Awaitable, Callable
+
+from grpc.experimental import aio  # type: ignore
+
+from google.api_core import gapic_v1
+
+
+class WrappedMethods(dict):
+    """The wrapped methods of a transport, keyed by method name, such as
+    ``"get_entry"``.
+
+    Each method is wrapped, by the transport's ``_wrap_method``, the first
+    time it is looked up, so that a transport does no work up front for
+    methods never called. Threads that race on a lookup may each wrap the
+    method; any of the results is fine.
+    """
+
+    def __init__(self, transport: Any, client_info: gapic_v1.client_info.ClientInfo):
+        super().__init__()
+        self._transport = transport
+        self._client_info = client_info
+
+    def __missing__(self, name: str) -> Callable:
+        wrapped = self[name] = self._transport._wrap_method(name, self._client_info)
+        return wrapped
+
+
+class AsyncUnaryUnaryAttempt(aio.UnaryUnaryMultiCallable):
+    """An asyncio unary stub, as wrapped by ``func`` to measure or limit
+    each attempt of a call.
+
+    ``gapic_v1.method_async.wrap_method`` maps the errors of what it wraps
+    as those of a unary call only if it is an ``aio.UnaryUnaryMultiCallable``
+    in google-api-core 1.x, and raises ``TypeError`` otherwise.
+    """
+
+    def __init__(self, func: Callable[..., Awaitable[Any]]):
+        self._func = func
+
+    def __call__(self, request, **kwargs) -> Awaitable[Any]:
+        return self._func(request, **kwargs)
+
+
+__all__ = (
+    "AsyncUnaryUnaryAttempt",
+    "WrappedMethods",
+)
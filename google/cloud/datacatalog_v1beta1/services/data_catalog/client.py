@@ -582,7 +582,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.search_catalog]
+        rpc = self._transport._wrapped_methods["search_catalog"]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
@@ -692,7 +692,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_entry_group]
+        rpc = self._transport._wrapped_methods["create_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -781,7 +781,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_entry_group]
+        rpc = self._transport._wrapped_methods["update_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -867,7 +867,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_entry_group]
+        rpc = self._transport._wrapped_methods["get_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -937,7 +937,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_entry_group]
+        rpc = self._transport._wrapped_methods["delete_entry_group"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1013,7 +1013,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_entry_groups]
+        rpc = self._transport._wrapped_methods["list_entry_groups"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1132,7 +1132,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_entry]
+        rpc = self._transport._wrapped_methods["create_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1251,7 +1251,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_entry]
+        rpc = self._transport._wrapped_methods["update_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1325,7 +1325,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_entry]
+        rpc = self._transport._wrapped_methods["delete_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1406,7 +1406,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_entry]
+        rpc = self._transport._wrapped_methods["get_entry"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1469,7 +1469,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.lookup_entry]
+        rpc = self._transport._wrapped_methods["lookup_entry"]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
@@ -1539,7 +1539,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_entries]
+        rpc = self._transport._wrapped_methods["list_entries"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1650,7 +1650,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_tag_template]
+        rpc = self._transport._wrapped_methods["create_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1729,7 +1729,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_tag_template]
+        rpc = self._transport._wrapped_methods["get_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1832,7 +1832,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_tag_template]
+        rpc = self._transport._wrapped_methods["update_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1917,7 +1917,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_tag_template]
+        rpc = self._transport._wrapped_methods["delete_tag_template"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2020,9 +2020,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.create_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["create_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2130,9 +2128,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.update_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["update_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2218,9 +2214,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.rename_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["rename_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2304,9 +2298,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.delete_tag_template_field
-        ]
+        rpc = self._transport._wrapped_methods["delete_tag_template_field"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2401,7 +2393,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_tag]
+        rpc = self._transport._wrapped_methods["create_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2489,7 +2481,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_tag]
+        rpc = self._transport._wrapped_methods["update_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2555,7 +2547,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_tag]
+        rpc = self._transport._wrapped_methods["delete_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2636,7 +2628,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_tags]
+        rpc = self._transport._wrapped_methods["list_tags"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2783,7 +2775,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_iam_policy]
+        rpc = self._transport._wrapped_methods["set_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2928,7 +2920,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_iam_policy]
+        rpc = self._transport._wrapped_methods["get_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -2990,7 +2982,7 @@ class DataCatalogClient(metaclass=DataCatalogClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.test_iam_permissions]
+        rpc = self._transport._wrapped_methods["test_iam_permissions"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
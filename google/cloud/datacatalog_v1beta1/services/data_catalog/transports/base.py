@@ -25,6 +25,7 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1beta1.types import datacatalog
 from google.cloud.datacatalog_v1beta1.types import tags
 from google.iam.v1 import iam_policy_pb2  # type: ignore
@@ -40,6 +41,29 @@ try:
 except pkg_resources.DistributionNotFound:
     DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
 
+# The default retry and timeout of the methods that have them.
+_DEFAULT_RETRY = retries.Retry(
+    initial=0.1,
+    maximum=60.0,
+    multiplier=1.3,
+    predicate=retries.if_exception_type(
+        core_exceptions.DeadlineExceeded, core_exceptions.ServiceUnavailable,
+    ),
+    deadline=60.0,
+)
+_METHOD_DEFAULTS = {
+    "get_entry_group": (_DEFAULT_RETRY, 60.0),
+    "delete_entry_group": (_DEFAULT_RETRY, 60.0),
+    "delete_entry": (_DEFAULT_RETRY, 60.0),
+    "get_entry": (_DEFAULT_RETRY, 60.0),
+    "lookup_entry": (_DEFAULT_RETRY, 60.0),
+    "get_tag_template": (_DEFAULT_RETRY, 60.0),
+    "delete_tag_template": (_DEFAULT_RETRY, 60.0),
+    "delete_tag_template_field": (_DEFAULT_RETRY, 60.0),
+    "delete_tag": (_DEFAULT_RETRY, 60.0),
+    "list_tags": (_DEFAULT_RETRY, 60.0),
+}
+
 
 class DataCatalogTransport(abc.ABC):
     """Abstract transport class for DataCatalog."""
@@ -122,218 +146,20 @@ class DataCatalogTransport(abc.ABC):
         self._credentials = credentials
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.search_catalog: gapic_v1.method.wrap_method(
-                self.search_catalog, default_timeout=None, client_info=client_info,
-            ),
-            self.create_entry_group: gapic_v1.method.wrap_method(
-                self.create_entry_group, default_timeout=None, client_info=client_info,
-            ),
-            self.update_entry_group: gapic_v1.method.wrap_method(
-                self.update_entry_group, default_timeout=None, client_info=client_info,
-            ),
-            self.get_entry_group: gapic_v1.method.wrap_method(
-                self.get_entry_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.delete_entry_group: gapic_v1.method.wrap_method(
-                self.delete_entry_group,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_entry_groups: gapic_v1.method.wrap_method(
-                self.list_entry_groups, default_timeout=None, client_info=client_info,
-            ),
-            self.create_entry: gapic_v1.method.wrap_method(
-                self.create_entry, default_timeout=None, client_info=client_info,
-            ),
-            self.update_entry: gapic_v1.method.wrap_method(
-                self.update_entry, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_entry: gapic_v1.method.wrap_method(
-                self.delete_entry,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.get_entry: gapic_v1.method.wrap_method(
-                self.get_entry,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.lookup_entry: gapic_v1.method.wrap_method(
-                self.lookup_entry,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_entries: gapic_v1.method.wrap_method(
-                self.list_entries, default_timeout=None, client_info=client_info,
-            ),
-            self.create_tag_template: gapic_v1.method.wrap_method(
-                self.create_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.get_tag_template: gapic_v1.method.wrap_method(
-                self.get_tag_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.update_tag_template: gapic_v1.method.wrap_method(
-                self.update_tag_template, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_tag_template: gapic_v1.method.wrap_method(
-                self.delete_tag_template,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_tag_template_field: gapic_v1.method.wrap_method(
-                self.create_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.update_tag_template_field: gapic_v1.method.wrap_method(
-                self.update_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.rename_tag_template_field: gapic_v1.method.wrap_method(
-                self.rename_tag_template_field,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-            self.delete_tag_template_field: gapic_v1.method.wrap_method(
-                self.delete_tag_template_field,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.create_tag: gapic_v1.method.wrap_method(
-                self.create_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.update_tag: gapic_v1.method.wrap_method(
-                self.update_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_tag: gapic_v1.method.wrap_method(
-                self.delete_tag,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.list_tags: gapic_v1.method.wrap_method(
-                self.list_tags,
-                default_retry=retries.Retry(
-                    initial=0.1,
-                    maximum=60.0,
-                    multiplier=1.3,
-                    predicate=retries.if_exception_type(
-                        core_exceptions.DeadlineExceeded,
-                        core_exceptions.ServiceUnavailable,
-                    ),
-                    deadline=60.0,
-                ),
-                default_timeout=60.0,
-                client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        rpc = getattr(self, name)
+        default_retry, default_timeout = _METHOD_DEFAULTS.get(name, (None, None))
+        rpc = gapic_v1.method.wrap_method(
+            rpc,
+            default_retry=default_retry,
+            default_timeout=default_timeout,
+            client_info=client_info,
+        )
+        return rpc
 
     def close(self):
         """Closes resources associated with the transport.
@@ -494,7 +494,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_taxonomy]
+        rpc = self._transport._wrapped_methods["create_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -562,7 +562,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_taxonomy]
+        rpc = self._transport._wrapped_methods["delete_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -636,7 +636,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_taxonomy]
+        rpc = self._transport._wrapped_methods["update_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -713,7 +713,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_taxonomies]
+        rpc = self._transport._wrapped_methods["list_taxonomies"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -794,7 +794,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_taxonomy]
+        rpc = self._transport._wrapped_methods["get_taxonomy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -880,7 +880,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.create_policy_tag]
+        rpc = self._transport._wrapped_methods["create_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -947,7 +947,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.delete_policy_tag]
+        rpc = self._transport._wrapped_methods["delete_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1024,7 +1024,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_policy_tag]
+        rpc = self._transport._wrapped_methods["update_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1100,7 +1100,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_policy_tags]
+        rpc = self._transport._wrapped_methods["list_policy_tags"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1183,7 +1183,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_policy_tag]
+        rpc = self._transport._wrapped_methods["get_policy_tag"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1287,7 +1287,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.get_iam_policy]
+        rpc = self._transport._wrapped_methods["get_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1391,7 +1391,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.set_iam_policy]
+        rpc = self._transport._wrapped_methods["set_iam_policy"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1441,7 +1441,7 @@ class PolicyTagManagerClient(metaclass=PolicyTagManagerClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.test_iam_permissions]
+        rpc = self._transport._wrapped_methods["test_iam_permissions"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
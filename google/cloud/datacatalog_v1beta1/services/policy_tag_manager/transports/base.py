@@ -25,6 +25,7 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1beta1.types import policytagmanager
 from google.iam.v1 import iam_policy_pb2  # type: ignore
 from google.iam.v1 import policy_pb2  # type: ignore
@@ -121,50 +122,14 @@ class PolicyTagManagerTransport(abc.ABC):
         self._credentials = credentials
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.create_taxonomy: gapic_v1.method.wrap_method(
-                self.create_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_taxonomy: gapic_v1.method.wrap_method(
-                self.delete_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.update_taxonomy: gapic_v1.method.wrap_method(
-                self.update_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.list_taxonomies: gapic_v1.method.wrap_method(
-                self.list_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-            self.get_taxonomy: gapic_v1.method.wrap_method(
-                self.get_taxonomy, default_timeout=None, client_info=client_info,
-            ),
-            self.create_policy_tag: gapic_v1.method.wrap_method(
-                self.create_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.delete_policy_tag: gapic_v1.method.wrap_method(
-                self.delete_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.update_policy_tag: gapic_v1.method.wrap_method(
-                self.update_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.list_policy_tags: gapic_v1.method.wrap_method(
-                self.list_policy_tags, default_timeout=None, client_info=client_info,
-            ),
-            self.get_policy_tag: gapic_v1.method.wrap_method(
-                self.get_policy_tag, default_timeout=None, client_info=client_info,
-            ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
-            ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
-                client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        return gapic_v1.method.wrap_method(
+            getattr(self, name), default_timeout=None, client_info=client_info,
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -452,7 +452,7 @@ class PolicyTagManagerSerializationClient(
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.import_taxonomies]
+        rpc = self._transport._wrapped_methods["import_taxonomies"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -510,7 +510,7 @@ class PolicyTagManagerSerializationClient(
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.export_taxonomies]
+        rpc = self._transport._wrapped_methods["export_taxonomies"]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
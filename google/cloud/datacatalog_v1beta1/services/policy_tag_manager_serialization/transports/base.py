@@ -25,6 +25,7 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.datacatalog_v1 import wrapped_methods
 from google.cloud.datacatalog_v1beta1.types import policytagmanagerserialization
 
 try:
@@ -118,15 +119,14 @@ class PolicyTagManagerSerializationTransport(abc.ABC):
         self._credentials = credentials
 
     def _prep_wrapped_messages(self, client_info):
-        # Precompute the wrapped methods.
-        self._wrapped_methods = {
-            self.import_taxonomies: gapic_v1.method.wrap_method(
-                self.import_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-            self.export_taxonomies: gapic_v1.method.wrap_method(
-                self.export_taxonomies, default_timeout=None, client_info=client_info,
-            ),
-        }
+        # Methods are wrapped, and their stubs created, on first use, so
+        # that a transport does no work up front for methods never called.
+        self._wrapped_methods = wrapped_methods.WrappedMethods(self, client_info)
+
+    def _wrap_method(self, name: str, client_info) -> Callable:
+        return gapic_v1.method.wrap_method(
+            getattr(self, name), default_timeout=None, client_info=client_info,
+        )
 
     def close(self):
         """Closes resources associated with the transport.
@@ -94,7 +94,7 @@ def default(session):
         constraints_path,
     )
 
-    session.install("-e", ".", "-c", constraints_path)
+    session.install("-e", ".[pandas,parquet]", "-c", constraints_path)
 
     # Run py.test against the unit tests.
     session.run(
@@ -36,6 +36,10 @@ dependencies = [
     "libcst >= 0.2.5",
     "proto-plus >= 1.4.0",
 ]
+extras = {
+    "pandas": ["pandas >= 1.0.0", "pyarrow >= 3.0.0"],
+    "parquet": ["pyarrow >= 3.0.0"],
+}
 
 package_root = os.path.abspath(os.path.dirname(__file__))
 
@@ -84,6 +88,7 @@ setuptools.setup(
     ],
     namespace_packages=namespaces,
     install_requires=dependencies,
+    extras_require=extras,
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1 import channel_pool
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+
+
+def test_picker_round_robin():
+    picker = channel_pool._Picker(3, channel_pool.ROUND_ROBIN)
+    assert [picker.acquire() for _ in range(4)] == [0, 1, 2, 0]
+    assert picker.in_flight == [2, 1, 1]
+
+    with pytest.raises(ValueError):
+        channel_pool._Picker(3, "random")
+
+
+def test_picker_least_busy():
+    picker = channel_pool._Picker(3, channel_pool.LEAST_BUSY)
+    assert [picker.acquire() for _ in range(3)] == [0, 1, 2]
+    picker.release(1)
+    assert picker.acquire() == 1
+    picker.release(0)
+    picker.release(2)
+    # Ties go to the channel after the last one picked.
+    assert picker.acquire() == 2
+    assert picker.acquire() == 0
+
+
+def test_channel_pool_unary_unary():
+    channels = [mock.Mock(spec=grpc.Channel) for _ in range(2)]
+    for i, channel in enumerate(channels):
+        channel.unary_unary.return_value.return_value = i
+    pool = channel_pool.ChannelPool(channels)
+
+    stub = pool.unary_unary("/Service/Method", request_serializer=str)
+    assert isinstance(stub, grpc.UnaryUnaryMultiCallable)
+    assert [stub("request") for _ in range(3)] == [0, 1, 0]
+    assert pool.in_flight == [0, 0]
+    for channel in channels:
+        channel.unary_unary.assert_called_once_with(
+            "/Service/Method", request_serializer=str
+        )
+
+    # A future counts as in flight until it completes.
+    future = stub.future("request")
+    assert pool.in_flight == [0, 1]
+    (callback,), _ = future.add_done_callback.call_args
+    callback(future)
+    assert pool.in_flight == [0, 0]
+
+    pool.close()
+    for channel in channels:
+        channel.close.assert_called_once_with()
+
+    with pytest.raises(ValueError):
+        channel_pool.ChannelPool([])
+
+
+def test_channel_pool_streaming_stubs():
+    channels = [mock.Mock(spec=grpc.Channel) for _ in range(2)]
+    pool = channel_pool.ChannelPool(channels)
+
+    pool.unary_stream("/Service/A")
+    pool.stream_stream("/Service/B")
+
+    channels[0].unary_stream.assert_called_once_with("/Service/A")
+    channels[1].stream_stream.assert_called_once_with("/Service/B")
+
+
+def test_async_channel_pool_unary_unary():
+    channels = [mock.Mock(spec=aio.Channel) for _ in range(2)]
+    pool = channel_pool.AsyncChannelPool(channels, channel_pool.LEAST_BUSY)
+
+    stub = pool.unary_unary("/Service/Method")
+    assert isinstance(stub, aio.UnaryUnaryMultiCallable)
+    first = stub("request")
+    stub("request")
+    assert pool.in_flight == [1, 1]
+
+    # Calls count as in flight until they complete.
+    (callback,), _ = first.add_done_callback.call_args
+    callback(first)
+    assert pool.in_flight == [0, 1]
+    assert stub("request") is channels[0].unary_unary.return_value.return_value
+
+
+def test_grpc_pooled_transport():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="grpc_pooled",
+    )
+    assert isinstance(client.transport, transports.DataCatalogGrpcPooledTransport)
+    assert isinstance(client.transport.grpc_channel, channel_pool.ChannelPool)
+    assert len(client.transport.grpc_channel.channels) == 4
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        assert client.get_entry(name="entries/e1").name == "entries/e1"
+
+
+def test_grpc_pooled_transport_channel_options():
+    with mock.patch.object(
+        transports.DataCatalogGrpcTransport, "create_channel"
+    ) as create_channel:
+        transports.DataCatalogGrpcPooledTransport(
+            credentials=ga_credentials.AnonymousCredentials(), pool_size=2,
+        )
+
+    # The first channel, made by the base transport, has its own
+    # connection too.
+    assert create_channel.call_count == 2
+    for _, kwargs in create_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in kwargs["options"]
+        assert ("grpc.max_send_message_length", -1) in kwargs["options"]
+
+
+def test_grpc_pooled_transport_options():
+    channel = grpc.insecure_channel("localhost:1")
+    transport = transports.DataCatalogGrpcPooledTransport(
+        credentials=ga_credentials.AnonymousCredentials(), channel=channel,
+    )
+    assert transport.grpc_channel is channel
+
+    transport = transports.DataCatalogGrpcPooledTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        pool_size=2,
+        dispatch=channel_pool.LEAST_BUSY,
+    )
+    assert len(transport.grpc_channel.channels) == 2
+
+    with pytest.raises(ValueError):
+        transports.DataCatalogGrpcPooledTransport(
+            credentials=ga_credentials.AnonymousCredentials(), pool_size=0,
+        )
+
+
+def test_grpc_pooled_asyncio_transport():
+    assert (
+        DataCatalogClient.get_transport_class("grpc_pooled_asyncio")
+        is transports.DataCatalogGrpcPooledAsyncIOTransport
+    )
+    with mock.patch.object(
+        transports.DataCatalogGrpcAsyncIOTransport, "create_channel"
+    ) as create_channel:
+        transport = transports.DataCatalogGrpcPooledAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(), pool_size=3,
+        )
+
+    assert create_channel.call_count == 3
+    assert isinstance(transport.grpc_channel, channel_pool.AsyncChannelPool)
+    for _, kwargs in create_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in kwargs["options"]
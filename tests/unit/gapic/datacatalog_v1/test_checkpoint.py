@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import os
+
+import pytest
+
+from google.cloud.datacatalog_v1 import checkpoint
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+
+ENTRY_GROUP = "projects/p1/locations/us/entryGroups/g1"
+
+SEARCH = datacatalog.SearchCatalogRequest(
+    scope=datacatalog.SearchCatalogRequest.Scope(include_project_ids=["p1"]),
+    query="type=table",
+)
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with emulator_module.DataCatalogEmulator(default_page_size=3) as emulator:
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+        )
+        client.create_entry_group(
+            parent="projects/p1/locations/us",
+            entry_group_id="g1",
+            entry_group=datacatalog.EntryGroup(),
+        )
+        for i in range(7):
+            client.create_entry(
+                parent=ENTRY_GROUP,
+                entry_id="e{}".format(i),
+                entry=datacatalog.Entry(type_=datacatalog.EntryType.TABLE),
+            )
+        client.transport.close()
+        yield emulator
+
+
+@pytest.fixture
+def client(emulator):
+    client = DataCatalogClient(
+        transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+    )
+    yield client
+    client.transport.close()
+
+
+def test_pager_cursor(client):
+    all_names = [entry.name for entry in client.list_entries(parent=ENTRY_GROUP)]
+    assert len(all_names) == 7
+
+    pager = client.list_entries(parent=ENTRY_GROUP)
+    items = iter(pager)
+    names = [next(items).name for _ in range(5)]
+    # The fifth entry is not consumed until the sixth is asked for.
+    request, consumed = checkpoint.decode_cursor(pager.cursor)
+    assert request.parent == ENTRY_GROUP
+    assert request.page_token
+    assert consumed == 1
+
+    resumed = checkpoint.resume(client.list_entries, pager.cursor)
+    assert [entry.name for entry in resumed] == all_names[4:]
+    assert names == all_names[:5]
+
+    # A cursor at the end of a page points at the start of the next one.
+    pager = client.list_entries(parent=ENTRY_GROUP)
+    items = iter(pager)
+    for _ in range(4):
+        next(items)
+    request, consumed = checkpoint.decode_cursor(pager.cursor)
+    assert consumed == 0
+    assert [
+        entry.name for entry in checkpoint.resume(client.list_entries, pager.cursor)
+    ] == all_names[3:]
+
+
+def test_search_cursor_with_prefetch(client):
+    all_names = [
+        result.relative_resource_name
+        for result in client.search_catalog(request=SEARCH)
+    ]
+    pager = client.search_catalog(request=SEARCH, prefetch_pages=2)
+    items = iter(pager)
+    for _ in range(3):
+        next(items)
+    cursor = pager.cursor
+    items.close()
+
+    resumed = checkpoint.resume(client.search_catalog, cursor, prefetch_pages=2)
+    assert [result.relative_resource_name for result in resumed] == all_names[2:]
+
+
+def test_checkpointed(client, emulator, tmp_path):
+    path = str(tmp_path / "crawl.cursor")
+    request = datacatalog.ListEntriesRequest(parent=ENTRY_GROUP)
+    all_names = [entry.name for entry in client.list_entries(request=request)]
+
+    seen = []
+    with pytest.raises(RuntimeError):
+        for entry in checkpoint.checkpointed(
+            client.list_entries, request, path=path, every_pages=2
+        ):
+            if len(seen) == 6:
+                raise RuntimeError("crash")
+            seen.append(entry.name)
+    # The cursor was saved after the second page.
+    assert os.path.exists(path)
+    with open(path) as f:
+        _, consumed = checkpoint.decode_cursor(f.read())
+    assert consumed == 0
+
+    calls = emulator.calls["ListEntries"]
+    rest = [
+        entry.name
+        for entry in checkpoint.checkpointed(
+            client.list_entries, request, path=path, every_pages=2
+        )
+    ]
+    assert rest == all_names[6:]
+    assert emulator.calls["ListEntries"] - calls == 1
+    assert not os.path.exists(path)
+
+
+def test_invalid_cursor(client):
+    for cursor in ("", "not a cursor", checkpoint.encode_cursor(SEARCH, -1)):
+        with pytest.raises(ValueError):
+            checkpoint.resume(client.search_catalog, cursor)
+    with pytest.raises(ValueError):
+        list(checkpoint.checkpointed(client.list_entries, path="x", every_pages=0))
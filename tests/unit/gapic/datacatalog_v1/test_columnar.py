@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import sys
+
+import pytest
+
+from google.cloud.datacatalog_v1 import columnar
+from google.cloud.datacatalog_v1.services.data_catalog import pagers
+from google.cloud.datacatalog_v1.types import common
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import timestamps
+from google.protobuf import timestamp_pb2  # type: ignore
+
+ENTRY_DESCRIPTOR = datacatalog.Entry.pb().DESCRIPTOR
+
+
+def _entries():
+    return [
+        datacatalog.Entry(
+            name="entries/e0",
+            type_=datacatalog.EntryType.TABLE,
+            integrated_system=common.IntegratedSystem.BIGQUERY,
+            labels={"team": "a"},
+            schema=schema.Schema(columns=[schema.ColumnSchema(column="id")]),
+            source_system_timestamps=timestamps.SystemTimestamps(
+                update_time=timestamp_pb2.Timestamp(seconds=10, nanos=5000)
+            ),
+        ),
+        datacatalog.Entry(name="entries/e1", user_specified_type="view"),
+    ]
+
+
+def _pager(raw=False):
+    entries = _entries()
+    method = mock.Mock(
+        return_value=datacatalog.ListEntriesResponse(entries=entries[1:])
+    )
+    pager = pagers.ListEntriesPager(
+        method=method,
+        request=datacatalog.ListEntriesRequest(parent="entryGroups/g1"),
+        response=datacatalog.ListEntriesResponse(
+            entries=entries[:1], next_page_token="1"
+        ),
+        raw=raw,
+    )
+    return pager
+
+
+def test_column_values():
+    columns = columnar._columns(
+        ENTRY_DESCRIPTOR,
+        [
+            "name",
+            "type_",
+            "user_specified_type",
+            "integrated_system",
+            "labels",
+            "source_system_timestamps.update_time",
+            "source_system_timestamps.create_time",
+            "schema",
+        ],
+    )
+    values = columnar._column_values(
+        [datacatalog.Entry.pb(entry) for entry in _entries()], columns
+    )
+    assert values == {
+        "name": ["entries/e0", "entries/e1"],
+        # Members of a oneof are null unless they are the one set.
+        "type_": ["TABLE", None],
+        "user_specified_type": [None, "view"],
+        "integrated_system": ["BIGQUERY", None],
+        "labels": [[("team", "a")], []],
+        "source_system_timestamps.update_time": [10000005, None],
+        "source_system_timestamps.create_time": [None, None],
+        "schema": ['{"columns":[{"column":"id"}]}', None],
+    }
+
+
+def test_default_columns():
+    columns = columnar.default_columns(ENTRY_DESCRIPTOR)
+    assert columns[:3] == ["name", "linked_resource", "fully_qualified_name"]
+    assert "labels" in columns
+    assert "schema" not in columns
+    assert "bigquery_table_spec" not in columns
+
+
+def test_unknown_columns():
+    for columns in (["nope"], ["name.first"], ["schema.columns.column"]):
+        with pytest.raises(ValueError):
+            _pager().to_arrow(columns)
+    with pytest.raises(ValueError):
+        _pager().to_arrow(["name", "name"])
+    with pytest.raises(TypeError):
+        _pager().to_arrow("name")
+
+
+def test_to_arrow_without_pyarrow():
+    with mock.patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ImportError) as exc_info:
+            _pager().to_arrow()
+    assert "[pandas]" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_to_arrow(raw):
+    pa = pytest.importorskip("pyarrow")
+    table = _pager(raw=raw).to_arrow(
+        ["name", "type_", "labels", "source_system_timestamps.update_time"]
+    )
+    assert table.num_rows == 2
+    assert table.column("name").num_chunks == 2
+    assert table.schema.field("source_system_timestamps.update_time").type == (
+        pa.timestamp("us", tz="UTC")
+    )
+    assert table.column("type_").to_pylist() == ["TABLE", None]
+    assert table.column("labels").to_pylist() == [[("team", "a")], []]
+
+
+def test_to_pandas():
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    frame = _pager().to_pandas(["name", "user_specified_type"])
+    assert list(frame["name"]) == ["entries/e0", "entries/e1"]
+    assert frame["user_specified_type"].isna().tolist() == [True, False]
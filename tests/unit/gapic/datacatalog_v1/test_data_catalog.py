@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import os
 import mock
 
@@ -20,6 +21,8 @@ import grpc
 from grpc.experimental import aio
 import math
 import pytest
+import threading
+import time
 from proto.marshal.rules.dates import DurationRule, TimestampRule
 
 
@@ -804,6 +807,91 @@ def test_search_catalog_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_search_catalog_pager_prefetch(transport_name: str = "grpc"):
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            datacatalog.SearchCatalogResponse(
+                results=[
+                    search.SearchCatalogResult(),
+                    search.SearchCatalogResult(),
+                    search.SearchCatalogResult(),
+                ],
+                next_page_token="abc",
+            ),
+            datacatalog.SearchCatalogResponse(results=[], next_page_token="def",),
+            datacatalog.SearchCatalogResponse(
+                results=[search.SearchCatalogResult(),], next_page_token="ghi",
+            ),
+            datacatalog.SearchCatalogResponse(
+                results=[search.SearchCatalogResult(), search.SearchCatalogResult(),],
+            ),
+            RuntimeError,
+        )
+        pager = client.search_catalog(request={}, prefetch_pages=2)
+        pages = list(pager.pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+        assert len(pages) == 4
+        assert pager._request.page_token == "ghi"
+        assert call.call_count == 4
+
+        # Each page is requested with the token of the previous one.
+        _, args, _ = call.mock_calls[3]
+        assert args[0].page_token == "ghi"
+
+
+def test_search_catalog_pager_prefetch_error():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        call.side_effect = (
+            datacatalog.SearchCatalogResponse(
+                results=[search.SearchCatalogResult(),], next_page_token="abc",
+            ),
+            core_exceptions.InvalidArgument("bad page"),
+        )
+        pager = client.search_catalog(request={}, prefetch_pages=1)
+        results = []
+        with pytest.raises(core_exceptions.InvalidArgument):
+            for result in pager:
+                results.append(result)
+        assert len(results) == 1
+
+
+def test_search_catalog_pager_prefetch_stops():
+    fetched = []
+
+    def method(request, metadata=()):
+        fetched.append(request.page_token)
+        return datacatalog.SearchCatalogResponse(
+            results=[search.SearchCatalogResult(),], next_page_token=str(len(fetched)),
+        )
+
+    pager = pagers.SearchCatalogPager(
+        method=method,
+        request=datacatalog.SearchCatalogRequest(),
+        response=datacatalog.SearchCatalogResponse(next_page_token="0"),
+        prefetch_pages=2,
+    )
+    pages = pager.pages
+    next(pages)
+    next(pages)
+    pages.close()
+
+    # The background thread stops shortly after iteration is abandoned.
+    time.sleep(0.3)
+    count = len(fetched)
+    time.sleep(0.3)
+    assert len(fetched) == count
+    assert count <= 4
+
+
 @pytest.mark.asyncio
 async def test_search_catalog_async_pager():
     client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials,)
@@ -875,6 +963,364 @@ async def test_search_catalog_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_search_catalog_async_pages_prefetch():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.search_catalog), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            datacatalog.SearchCatalogResponse(
+                results=[
+                    search.SearchCatalogResult(),
+                    search.SearchCatalogResult(),
+                    search.SearchCatalogResult(),
+                ],
+                next_page_token="abc",
+            ),
+            datacatalog.SearchCatalogResponse(results=[], next_page_token="def",),
+            datacatalog.SearchCatalogResponse(
+                results=[search.SearchCatalogResult(),], next_page_token="ghi",
+            ),
+            datacatalog.SearchCatalogResponse(
+                results=[search.SearchCatalogResult(), search.SearchCatalogResult(),],
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.search_catalog(request={}, prefetch_pages=2)
+        pages = []
+        async for page_ in async_pager.pages:
+            pages.append(page_)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+        assert len(pages) == 4
+        assert async_pager._request.page_token == "ghi"
+
+
+@pytest.mark.asyncio
+async def test_list_tags_async_pager_prefetch_error():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(
+        type(client.transport.list_tags), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = (
+            datacatalog.ListTagsResponse(tags=[tags.Tag(),], next_page_token="abc",),
+            core_exceptions.InvalidArgument("bad page"),
+        )
+        async_pager = await client.list_tags(request={}, prefetch_pages=1)
+        responses = []
+        with pytest.raises(core_exceptions.InvalidArgument):
+            async for response in async_pager:
+                responses.append(response)
+        assert len(responses) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_entries_async_pager_prefetch_cancel():
+    fetched = []
+
+    async def method(request, metadata=()):
+        fetched.append(request.page_token)
+        return datacatalog.ListEntriesResponse(
+            entries=[datacatalog.Entry(),], next_page_token=str(len(fetched)),
+        )
+
+    async_pager = pagers.ListEntriesAsyncPager(
+        method=method,
+        request=datacatalog.ListEntriesRequest(),
+        response=datacatalog.ListEntriesResponse(next_page_token="0"),
+        prefetch_pages=2,
+    )
+    pages = async_pager.pages
+    await pages.__anext__()
+    await pages.__anext__()
+    await pages.aclose()
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # The producer is cancelled once the bounded queue is abandoned.
+    count = len(fetched)
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert len(fetched) == count
+    assert count <= 4
+
+
+def _partitioned_search_side_effect(request, **kwargs):
+    # Two pages per project; "shared" shows up in every partition.
+    project = request.scope.include_project_ids[0]
+    if not request.page_token:
+        return datacatalog.SearchCatalogResponse(
+            results=[
+                search.SearchCatalogResult(
+                    relative_resource_name="{}/a".format(project),
+                    modify_time=timestamp_pb2.Timestamp(seconds=len(project)),
+                ),
+                search.SearchCatalogResult(
+                    relative_resource_name="shared",
+                    modify_time=timestamp_pb2.Timestamp(seconds=50),
+                ),
+            ],
+            next_page_token="next",
+        )
+    return datacatalog.SearchCatalogResponse(
+        results=[
+            search.SearchCatalogResult(
+                relative_resource_name="{}/b".format(project),
+                modify_time=timestamp_pb2.Timestamp(seconds=100 + len(project)),
+            ),
+        ],
+    )
+
+
+def test_partition_search_scope():
+    from google.cloud.datacatalog_v1.services.data_catalog.client import (
+        _partition_search_scope,
+    )
+
+    scope = datacatalog.SearchCatalogRequest.Scope(
+        include_org_ids=["o1"],
+        include_project_ids=["p1", "p2"],
+        include_gcp_public_datasets=True,
+        restricted_locations=["us"],
+    )
+    partitions = _partition_search_scope(scope)
+    assert [list(p.include_org_ids) for p in partitions] == [["o1"], [], [], []]
+    assert [list(p.include_project_ids) for p in partitions] == [
+        [],
+        ["p1"],
+        ["p2"],
+        [],
+    ]
+    assert partitions[3].include_gcp_public_datasets
+    assert all(list(p.restricted_locations) == ["us"] for p in partitions)
+
+
+def test_search_catalog_partitioned():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        call.side_effect = _partitioned_search_side_effect
+        results = client.search_catalog_partitioned(
+            scope=datacatalog.SearchCatalogRequest.Scope(
+                include_project_ids=["p1", "p22", "p333"],
+            ),
+            query="q",
+            max_workers=2,
+        )
+        names = [r.relative_resource_name for r in results]
+
+    assert sorted(names) == sorted(
+        ["p1/a", "p1/b", "p22/a", "p22/b", "p333/a", "p333/b", "shared"]
+    )
+    assert call.call_count == 6
+    assert all(args[0].query == "q" for _, args, _ in call.mock_calls)
+
+
+def test_search_catalog_partitioned_order_by():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        call.side_effect = _partitioned_search_side_effect
+        results = client.search_catalog_partitioned(
+            request={
+                "scope": {"include_project_ids": ["p1", "p22", "p333"]},
+                "order_by": "last_modified_timestamp asc",
+            },
+        )
+        names = [r.relative_resource_name for r in results]
+
+    assert names == [
+        "p1/a",
+        "p22/a",
+        "p333/a",
+        "shared",
+        "p1/b",
+        "p22/b",
+        "p333/b",
+    ]
+
+
+def test_search_catalog_partitioned_flattened_error():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with pytest.raises(ValueError):
+        client.search_catalog_partitioned(
+            datacatalog.SearchCatalogRequest(), query="query_value",
+        )
+    with pytest.raises(ValueError):
+        client.search_catalog_partitioned(query="query_value", max_workers=0)
+
+
+def test_search_catalog_partitioned_empty_scope():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        with pytest.raises(ValueError):
+            client.search_catalog_partitioned(
+                scope=datacatalog.SearchCatalogRequest.Scope(
+                    restricted_locations=["us"]
+                ),
+                query="query_value",
+            )
+    assert not call.called
+
+
+@pytest.mark.asyncio
+async def test_search_catalog_partitioned_empty_scope_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with pytest.raises(ValueError):
+        await client.search_catalog_partitioned(query="query_value")
+
+
+@pytest.mark.asyncio
+async def test_search_catalog_partitioned_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(
+        type(client.transport.search_catalog), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = _partitioned_search_side_effect
+        results = await client.search_catalog_partitioned(
+            scope=datacatalog.SearchCatalogRequest.Scope(
+                include_project_ids=["p1", "p22", "p333"],
+            ),
+            max_workers=2,
+        )
+        names = [r.relative_resource_name async for r in results]
+
+    assert sorted(names) == sorted(
+        ["p1/a", "p1/b", "p22/a", "p22/b", "p333/a", "p333/b", "shared"]
+    )
+    assert call.call_count == 6
+
+
+@pytest.mark.asyncio
+async def test_search_catalog_partitioned_async_order_by():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials,)
+
+    with mock.patch.object(
+        type(client.transport.search_catalog), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = _partitioned_search_side_effect
+        results = await client.search_catalog_partitioned(
+            request={
+                "scope": {"include_project_ids": ["p1", "p22", "p333"]},
+                "order_by": "last_modified_timestamp asc",
+            },
+        )
+        names = [r.relative_resource_name async for r in results]
+
+    assert names == [
+        "p1/a",
+        "p22/a",
+        "p333/a",
+        "shared",
+        "p1/b",
+        "p22/b",
+        "p333/b",
+    ]
+
+
+def test_search_result_sort_key():
+    from google.cloud.datacatalog_v1.services.data_catalog.client import (
+        _search_result_sort_key,
+    )
+
+    older = search.SearchCatalogResult(modify_time=timestamp_pb2.Timestamp(seconds=1))
+    newer = search.SearchCatalogResult(modify_time=timestamp_pb2.Timestamp(seconds=2))
+    assert _search_result_sort_key("") is None
+    assert _search_result_sort_key("relevance") is None
+    ascending = _search_result_sort_key("last_modified_timestamp asc")
+    assert ascending(older) < ascending(newer)
+    descending = _search_result_sort_key("last_modified_timestamp")
+    assert descending(newer) < descending(older)
+
+
+def test_search_catalog_partitioned_raw_responses():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials, raw_responses=True,
+    )
+
+    with mock.patch.object(type(client.transport.search_catalog), "__call__") as call:
+        call.side_effect = _partitioned_search_side_effect
+        results = list(
+            client.search_catalog_partitioned(
+                request={
+                    "scope": {"include_project_ids": ["p1", "p22"]},
+                    "order_by": "last_modified_timestamp asc",
+                },
+            )
+        )
+
+    assert all(isinstance(r, search.SearchCatalogResult.pb()) for r in results)
+    assert [r.relative_resource_name for r in results] == [
+        "p1/a",
+        "p22/a",
+        "shared",
+        "p1/b",
+        "p22/b",
+    ]
+
+
+def test_raw_responses():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(), raw_responses=True,
+    )
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="name_value")
+        response = client.get_entry(name="name_value")
+    assert isinstance(response, datacatalog.Entry.pb())
+    assert response.name == "name_value"
+
+    with mock.patch.object(type(client.transport.list_entries), "__call__") as call:
+        call.side_effect = (
+            datacatalog.ListEntriesResponse(
+                entries=[datacatalog.Entry(name="e1")], next_page_token="abc",
+            ),
+            datacatalog.ListEntriesResponse(entries=[datacatalog.Entry(name="e2")]),
+        )
+        pager = client.list_entries(parent="parent_value")
+        assert pager.next_page_token == "abc"
+        pages = list(pager.pages)
+    assert all(isinstance(p, datacatalog.ListEntriesResponse.pb()) for p in pages)
+    assert [e.name for p in pages for e in p.entries] == ["e1", "e2"]
+
+
+@pytest.mark.asyncio
+async def test_raw_responses_async():
+    client = DataCatalogAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), raw_responses=True,
+    )
+
+    with mock.patch.object(
+        type(client.transport.get_tag_template), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.return_value = tags.TagTemplate(name="name_value")
+        response = await client.get_tag_template(name="name_value")
+    assert isinstance(response, tags.TagTemplate.pb())
+
+    with mock.patch.object(
+        type(client.transport.list_tags), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = (
+            datacatalog.ListTagsResponse(
+                tags=[tags.Tag(name="t1")], next_page_token="abc"
+            ),
+            datacatalog.ListTagsResponse(tags=[tags.Tag(name="t2")]),
+        )
+        pager = await client.list_tags(parent="parent_value")
+        results = [t async for t in pager]
+    assert all(isinstance(t, tags.Tag.pb()) for t in results)
+    assert [t.name for t in results] == ["t1", "t2"]
+
+
 @pytest.mark.parametrize("request_type", [datacatalog.CreateEntryGroupRequest, dict,])
 def test_create_entry_group(request_type, transport: str = "grpc"):
     client = DataCatalogClient(
@@ -1300,6 +1746,28 @@ def test_get_entry_group_flattened_error():
         )
 
 
+def test_get_entry_group_fields():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.get_entry_group), "__call__") as call:
+        call.return_value = datacatalog.EntryGroup()
+        client.get_entry_group(
+            name="name_value", fields=["display_name", "data_catalog_timestamps"]
+        )
+
+        _, args, _ = call.mock_calls[0]
+        assert args[0].read_mask == field_mask_pb2.FieldMask(
+            paths=["display_name", "data_catalog_timestamps"]
+        )
+
+    with pytest.raises(ValueError):
+        client.get_entry_group(
+            name="name_value",
+            read_mask=field_mask_pb2.FieldMask(paths=["name"]),
+            fields=["name"],
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_entry_group_flattened_async():
     client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
@@ -3148,6 +3616,191 @@ async def test_lookup_entry_async_from_dict():
     await test_lookup_entry_async(request_type=dict)
 
 
+def _batch_entry_side_effect(request, **kwargs):
+    if isinstance(request, datacatalog.GetEntryRequest):
+        key = request.name
+    else:
+        key = request.linked_resource or request.fully_qualified_name
+    if key.endswith("missing"):
+        raise core_exceptions.NotFound("no such entry")
+    return datacatalog.Entry(name="entries/" + key.split("/")[-1])
+
+
+def test_batch_get_entries():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.side_effect = _batch_entry_side_effect
+        names = ["entries/e{}".format(i) for i in range(20)] + ["entries/missing"]
+        results = client.batch_get_entries(names, max_workers=4)
+
+    assert call.call_count == 21
+    assert [r.name for r in results[:20]] == names[:20]
+    assert isinstance(results[20], core_exceptions.NotFound)
+
+
+def test_batch_lookup_entries():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.lookup_entry), "__call__") as call:
+        call.side_effect = _batch_entry_side_effect
+        results = client.batch_lookup_entries(
+            linked_resources=["//bq/t1", "//bq/missing", "//bq/t2"],
+        )
+
+    assert results[0].name == "entries/t1"
+    assert isinstance(results[1], core_exceptions.NotFound)
+    assert results[2].name == "entries/t2"
+    _, args, _ = call.mock_calls[0]
+    assert args[0].linked_resource
+
+
+def test_batch_lookup_entries_target_error():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with pytest.raises(ValueError):
+        client.batch_lookup_entries()
+    with pytest.raises(ValueError):
+        client.batch_lookup_entries(linked_resources=["a"], sql_resources=["b"])
+
+
+@pytest.mark.asyncio
+async def test_batch_get_entries_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = _batch_entry_side_effect
+        names = ["entries/e{}".format(i) for i in range(20)] + ["entries/missing"]
+        results = await client.batch_get_entries(names, max_workers=4)
+
+    assert [r.name for r in results[:20]] == names[:20]
+    assert isinstance(results[20], core_exceptions.NotFound)
+
+
+@pytest.mark.asyncio
+async def test_batch_lookup_entries_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(
+        type(client.transport.lookup_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = _batch_entry_side_effect
+        results = await client.batch_lookup_entries(
+            fully_qualified_names=["bigquery:p.d.missing", "bigquery:p.d.t"],
+        )
+
+    assert isinstance(results[0], core_exceptions.NotFound)
+    assert results[1].name == "entries/bigquery:p.d.t"
+
+
+def _upsert_entries(count, produced):
+    for i in range(count):
+        produced.append(i)
+        yield datacatalog.Entry(
+            name="projects/p/locations/l/entryGroups/g/entries/e{}".format(i),
+            description="new",
+        )
+
+
+def _upsert_side_effect(request, **kwargs):
+    if isinstance(request, datacatalog.UpdateEntryRequest):
+        return request.entry
+    # Even-numbered entries already exist.
+    if int(request.entry_id[1:]) % 2 == 0:
+        raise core_exceptions.AlreadyExists("entry exists")
+    return datacatalog.Entry(
+        name="{}/entries/{}".format(request.parent, request.entry_id),
+        description=request.entry.description,
+    )
+
+
+def test_bulk_upsert_entries():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+    produced = []
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def upsert(request, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.001)
+        with lock:
+            in_flight[0] -= 1
+        return _upsert_side_effect(request)
+
+    # The create_entry and update_entry stubs share a type.
+    with mock.patch.object(type(client.transport.create_entry), "__call__") as call:
+        call.side_effect = upsert
+        outcomes = client.bulk_upsert_entries(
+            _upsert_entries(10, produced), max_in_flight=3
+        )
+        next(outcomes)
+        # The producer is held back until writes complete.
+        assert len(produced) <= 4
+        outcomes = [next(outcomes) for _ in range(9)]
+
+    requests = [args[0] for _, args, _ in call.mock_calls]
+    creates = [r for r in requests if isinstance(r, datacatalog.CreateEntryRequest)]
+    assert len(creates) == 10
+    assert len(requests) == 15
+    assert creates[0].parent == "projects/p/locations/l/entryGroups/g"
+    assert in_flight[1] <= 3
+    for entry, outcome in outcomes:
+        assert outcome.name == entry.name
+        assert outcome.description == "new"
+
+
+def test_bulk_upsert_entries_errors():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+    entries = [
+        datacatalog.Entry(name="entries/e1"),
+        datacatalog.Entry(name="projects/p/locations/l/entryGroups/g/entries/e1"),
+    ]
+
+    with pytest.raises(ValueError):
+        client.bulk_upsert_entries(entries, max_in_flight=0)
+
+    with mock.patch.object(type(client.transport.create_entry), "__call__") as call:
+        call.side_effect = core_exceptions.PermissionDenied("denied")
+        outcomes = dict(
+            (entry.name, outcome)
+            for entry, outcome in client.bulk_upsert_entries(entries)
+        )
+
+    assert isinstance(outcomes["entries/e1"], ValueError)
+    assert isinstance(
+        outcomes["projects/p/locations/l/entryGroups/g/entries/e1"],
+        core_exceptions.PermissionDenied,
+    )
+    assert call.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_entries_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
+    produced = []
+
+    async def entries():
+        for entry in _upsert_entries(6, produced):
+            yield entry
+
+    with mock.patch.object(
+        type(client.transport.create_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = _upsert_side_effect
+        outcomes = await client.bulk_upsert_entries(entries(), max_in_flight=2)
+        outcomes = [outcome async for outcome in outcomes]
+
+    assert call.call_count == 9
+    assert len(outcomes) == 6
+    assert sorted(outcome.name for _, outcome in outcomes) == sorted(
+        entry.name for entry, _ in outcomes
+    )
+
+
 @pytest.mark.parametrize("request_type", [datacatalog.ListEntriesRequest, dict,])
 def test_list_entries(request_type, transport: str = "grpc"):
     client = DataCatalogClient(
@@ -3345,6 +3998,50 @@ async def test_list_entries_flattened_error_async():
         )
 
 
+def test_list_entries_fields():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.list_entries), "__call__") as call:
+        call.return_value = datacatalog.ListEntriesResponse()
+        client.list_entries(
+            parent="parent_value",
+            fields=["name", "type_", "source_system_timestamps.update_time"],
+        )
+
+        _, args, _ = call.mock_calls[0]
+        assert args[0].read_mask == field_mask_pb2.FieldMask(
+            paths=["name", "type", "source_system_timestamps.update_time"]
+        )
+
+
+def test_list_entries_fields_error():
+    client = DataCatalogClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.list_entries), "__call__") as call:
+        for fields in (["nmae"], ["name.first"], []):
+            with pytest.raises(ValueError):
+                client.list_entries(parent="parent_value", fields=fields)
+        with pytest.raises(TypeError):
+            client.list_entries(parent="parent_value", fields="name")
+        with pytest.raises(ValueError):
+            client.list_entries(datacatalog.ListEntriesRequest(), fields=["name"])
+    assert not call.called
+
+
+@pytest.mark.asyncio
+async def test_list_entries_fields_async():
+    client = DataCatalogAsyncClient(credentials=ga_credentials.AnonymousCredentials(),)
+
+    with mock.patch.object(type(client.transport.list_entries), "__call__") as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            datacatalog.ListEntriesResponse()
+        )
+        await client.list_entries(parent="parent_value", fields=["linked_resource"])
+
+        _, args, _ = call.mock_calls[0]
+        assert args[0].read_mask == field_mask_pb2.FieldMask(paths=["linked_resource"])
+
+
 def test_list_entries_pager(transport_name: str = "grpc"):
     client = DataCatalogClient(
         credentials=ga_credentials.AnonymousCredentials, transport=transport_name,
@@ -7818,6 +8515,45 @@ def test_client_with_default_client_info():
         prep.assert_called_once_with(client_info)
 
 
+def test_transport_wraps_methods_on_first_use():
+    transport = transports.DataCatalogGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert transport._stubs == {}
+    assert len(transport._wrapped_methods) == 0
+
+    client = DataCatalogClient(transport=transport)
+    with mock.patch.object(type(transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="name_value")
+        client.get_entry(name="name_value")
+        client.get_entry(name="name_value")
+
+    assert list(transport._stubs) == ["get_entry"]
+    assert len(transport._wrapped_methods) == 1
+    wrapped = transport._wrapped_methods["get_entry"]
+    assert wrapped._timeout == 60.0
+    assert wrapped._retry._predicate(core_exceptions.ServiceUnavailable("unavailable"))
+    assert transport._wrapped_methods["create_entry"]._retry is None
+
+
+def test_transport_wraps_methods_by_name():
+    # A transport that does not keep its stubs in _stubs.
+    class Transport(transports.DataCatalogTransport):
+        get_entry = mock.Mock(return_value=datacatalog.Entry(name="name_value"))
+
+    transport = Transport(credentials=ga_credentials.AnonymousCredentials())
+    transport._prep_wrapped_messages(None)
+    with mock.patch.object(
+        transports.DataCatalogTransport, "create_entry", new_callable=mock.PropertyMock
+    ) as create_entry:
+        wrapped = transport._wrapped_methods["get_entry"]
+        assert wrapped(datacatalog.GetEntryRequest()).name == "name_value"
+
+    # No other stub is looked up to find the method.
+    create_entry.assert_not_called()
+    assert list(transport._wrapped_methods) == ["get_entry"]
+
+
 @pytest.mark.asyncio
 async def test_transport_close_async():
     client = DataCatalogAsyncClient(
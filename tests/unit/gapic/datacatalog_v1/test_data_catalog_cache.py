@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import cache
+from google.cloud.datacatalog_v1.types import datacatalog
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lookup_entry_key():
+    request = datacatalog.LookupEntryRequest(sql_resource="bigquery.table.p.d.t")
+    assert cache.lookup_entry_key(request) == ("sql_resource", "bigquery.table.p.d.t")
+    assert cache.lookup_entry_key(datacatalog.LookupEntryRequest()) is None
+
+
+def test_entry_cache_hit_and_miss():
+    entry_cache = cache.EntryCache()
+    key = cache.get_entry_key("entries/e1")
+
+    assert entry_cache.get(key) is None
+    entry_cache.put(key, datacatalog.Entry(name="entries/e1"))
+    entry = entry_cache.get(key)
+
+    assert entry.name == "entries/e1"
+    assert entry_cache.hits == 1
+    assert entry_cache.misses == 1
+
+    # Callers get copies, so mutating one does not change the cache.
+    entry.display_name = "changed"
+    assert entry_cache.get(key).display_name == ""
+
+
+def test_entry_cache_ttl():
+    timer = FakeTimer()
+    entry_cache = cache.EntryCache(ttl=10, negative_ttl=1, timer=timer)
+    entry_cache.put(cache.get_entry_key("e1"), datacatalog.Entry(name="e1"))
+    entry_cache.put_not_found(
+        cache.get_entry_key("e2"), core_exceptions.NotFound("no e2")
+    )
+
+    with pytest.raises(core_exceptions.NotFound):
+        entry_cache.get(cache.get_entry_key("e2"))
+
+    timer.now = 5
+    assert entry_cache.get(cache.get_entry_key("e1")).name == "e1"
+    assert entry_cache.get(cache.get_entry_key("e2")) is None
+
+    timer.now = 10
+    assert entry_cache.get(cache.get_entry_key("e1")) is None
+    assert len(entry_cache) == 0
+
+
+def test_entry_cache_no_negative_caching():
+    entry_cache = cache.EntryCache(negative_ttl=None)
+    entry_cache.put_not_found(cache.get_entry_key("e1"), core_exceptions.NotFound(""))
+    assert entry_cache.get(cache.get_entry_key("e1")) is None
+
+
+def test_entry_cache_lru_eviction():
+    entry_cache = cache.EntryCache(max_size=2)
+    for name in ("e1", "e2"):
+        entry_cache.put(cache.get_entry_key(name), datacatalog.Entry(name=name))
+
+    # Reading e1 makes e2 the least recently used.
+    entry_cache.get(cache.get_entry_key("e1"))
+    entry_cache.put(cache.get_entry_key("e3"), datacatalog.Entry(name="e3"))
+
+    assert entry_cache.get(cache.get_entry_key("e2")) is None
+    assert entry_cache.get(cache.get_entry_key("e1")) is not None
+    assert entry_cache.get(cache.get_entry_key("e3")) is not None
+
+
+def test_entry_cache_invalidate_lookup_aliases():
+    entry_cache = cache.EntryCache()
+    key = ("linked_resource", "//bigquery/t1")
+    entry_cache.put(key, datacatalog.Entry(name="e1"))
+
+    # The lookup result is also cached under the entry's name.
+    assert entry_cache.get(cache.get_entry_key("e1")).name == "e1"
+
+    entry_cache.invalidate("e1")
+    assert entry_cache.get(key) is None
+    assert entry_cache.get(cache.get_entry_key("e1")) is None
+
+
+def test_entry_cache_invalidate_entry_not_found():
+    entry_cache = cache.EntryCache()
+    entry = datacatalog.Entry(
+        name="e1", linked_resource="//bigquery/t1", fully_qualified_name="bigquery:t1"
+    )
+    keys = [
+        cache.get_entry_key("e1"),
+        ("linked_resource", "//bigquery/t1"),
+        ("fully_qualified_name", "bigquery:t1"),
+        ("sql_resource", "bigquery.table.p.d.t1"),
+    ]
+    for key in keys:
+        entry_cache.put_not_found(key, core_exceptions.NotFound("no e1"))
+    other = ("linked_resource", "//bigquery/t2")
+    entry_cache.put_not_found(other, core_exceptions.NotFound("no t2"))
+
+    entry_cache.invalidate_entry(entry)
+    for key in keys:
+        assert entry_cache.get(key) is None
+    with pytest.raises(core_exceptions.NotFound):
+        entry_cache.get(other)
+
+
+def test_get_entry_cached():
+    entry_cache = cache.EntryCache()
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(), entry_cache=entry_cache,
+    )
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        first = client.get_entry(name="entries/e1")
+        second = client.get_entry(name="entries/e1")
+
+    assert call.call_count == 1
+    assert first == second
+    assert entry_cache.hits == 1
+    assert entry_cache.misses == 1
+
+
+def test_lookup_entry_cached_not_found():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        entry_cache=cache.EntryCache(),
+    )
+
+    with mock.patch.object(type(client.transport.lookup_entry), "__call__") as call:
+        call.side_effect = core_exceptions.NotFound("no such table")
+        for _ in range(2):
+            with pytest.raises(core_exceptions.NotFound):
+                client.lookup_entry(request={"linked_resource": "//bigquery/t1"})
+
+    assert call.call_count == 1
+
+
+def test_update_and_delete_entry_invalidate():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        entry_cache=cache.EntryCache(),
+    )
+
+    with mock.patch.object(type(client.transport.lookup_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        client.lookup_entry(request={"linked_resource": "//bigquery/t1"})
+
+    with mock.patch.object(type(client.transport.update_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1", description="new")
+        client.update_entry(entry=datacatalog.Entry(name="entries/e1"))
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1", description="new")
+        assert client.get_entry(name="entries/e1").description == "new"
+        assert client.get_entry(name="entries/e1").description == "new"
+        assert call.call_count == 1
+
+    with mock.patch.object(type(client.transport.delete_entry), "__call__") as call:
+        call.return_value = None
+        client.delete_entry(name="entries/e1")
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.side_effect = core_exceptions.NotFound("deleted")
+        with pytest.raises(core_exceptions.NotFound):
+            client.get_entry(name="entries/e1")
+        assert call.call_count == 1
+
+
+def test_create_entry_invalidates_not_found_lookup():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        entry_cache=cache.EntryCache(),
+    )
+    entry = datacatalog.Entry(name="entries/e1", linked_resource="//bigquery/t1")
+
+    with mock.patch.object(type(client.transport.lookup_entry), "__call__") as call:
+        call.side_effect = core_exceptions.NotFound("no such table")
+        with pytest.raises(core_exceptions.NotFound):
+            client.lookup_entry(request={"linked_resource": "//bigquery/t1"})
+
+    with mock.patch.object(type(client.transport.create_entry), "__call__") as call:
+        call.return_value = entry
+        client.create_entry(parent="entryGroups/g1", entry_id="e1", entry=entry)
+
+    with mock.patch.object(type(client.transport.lookup_entry), "__call__") as call:
+        call.return_value = entry
+        assert client.lookup_entry(request={"linked_resource": "//bigquery/t1"}) == (
+            entry
+        )
+        assert call.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_entry_cached_async():
+    entry_cache = cache.EntryCache()
+    client = DataCatalogAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), entry_cache=entry_cache,
+    )
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        await client.get_entry(name="entries/e1")
+        entry = await client.get_entry(name="entries/e1")
+
+    assert entry.name == "entries/e1"
+    assert call.call_count == 1
+    assert entry_cache.hits == 1
+
+    with mock.patch.object(
+        type(client.transport.delete_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.return_value = None
+        await client.delete_entry(name="entries/e1")
+
+    assert len(entry_cache) == 0
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import grpc
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import (
+    transports as data_catalog_transports,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    transports as policy_tag_manager_transports,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    transports as serialization_transports,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanager
+from google.cloud.datacatalog_v1.types import policytagmanagerserialization
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import tags
+from google.iam.v1 import policy_pb2  # type: ignore
+from google.protobuf import field_mask_pb2  # type: ignore
+
+LOCATION = "projects/p1/locations/us"
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with emulator_module.DataCatalogEmulator(default_page_size=2) as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def client(emulator):
+    return DataCatalogClient(
+        transport=data_catalog_transports.DataCatalogGrpcTransport(
+            channel=emulator.channel()
+        )
+    )
+
+
+def _entry_group(client, entry_group_id, entries=0):
+    entry_group = client.create_entry_group(
+        parent=LOCATION,
+        entry_group_id=entry_group_id,
+        entry_group=datacatalog.EntryGroup(display_name=entry_group_id),
+    )
+    for i in range(entries):
+        client.create_entry(
+            parent=entry_group.name,
+            entry_id="e{}".format(i),
+            entry=datacatalog.Entry(
+                user_specified_type="table",
+                user_specified_system="warehouse",
+                linked_resource="//warehouse/{}/e{}".format(entry_group_id, i),
+                display_name="orders {}".format(i),
+                schema=schema.Schema(
+                    columns=[schema.ColumnSchema(column="customer_id", type_="STRING")]
+                ),
+            ),
+        )
+    return entry_group
+
+
+def test_entries(client):
+    entry_group = _entry_group(client, "entries", entries=5)
+    assert entry_group.name == LOCATION + "/entryGroups/entries"
+    assert entry_group.data_catalog_timestamps.create_time
+
+    pager = client.list_entries(parent=entry_group.name)
+    assert [entry.name.rsplit("/", 1)[-1] for entry in pager] == [
+        "e0",
+        "e1",
+        "e2",
+        "e3",
+        "e4",
+    ]
+    response = client.list_entries(
+        request=datacatalog.ListEntriesRequest(
+            parent=entry_group.name,
+            page_size=3,
+            read_mask=field_mask_pb2.FieldMask(paths=["name"]),
+        )
+    )
+    first_page = next(iter(response.pages))
+    assert len(first_page.entries) == 3
+    assert first_page.next_page_token
+    assert first_page.entries[0] == datacatalog.Entry(
+        name=entry_group.name + "/entries/e0"
+    )
+
+    entry = client.lookup_entry(request={"linked_resource": "//warehouse/entries/e3"})
+    assert entry.name == entry_group.name + "/entries/e3"
+    assert entry.schema.columns[0].column == "customer_id"
+
+    entry.display_name = "renamed"
+    entry.description = "ignored"
+    updated = client.update_entry(
+        entry=entry, update_mask=field_mask_pb2.FieldMask(paths=["display_name"])
+    )
+    assert updated.display_name == "renamed"
+    assert updated.description == ""
+    assert client.get_entry(name=entry.name) == updated
+
+    client.delete_entry(name=entry.name)
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_entry(name=entry.name)
+    with pytest.raises(core_exceptions.NotFound):
+        client.lookup_entry(request={"linked_resource": "//warehouse/entries/e3"})
+    with pytest.raises(core_exceptions.AlreadyExists):
+        _entry_group(client, "entries")
+    with pytest.raises(core_exceptions.FailedPrecondition):
+        client.delete_entry_group(name=entry_group.name)
+    client.delete_entry_group(request={"name": entry_group.name, "force": True})
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_entry(name=entry_group.name + "/entries/e0")
+
+
+def test_projected_list_entries(client):
+    entry_group = _entry_group(client, "projected", entries=2)
+    entries = list(
+        client.list_entries(
+            parent=entry_group.name,
+            fields=["name", "linked_resource", "user_specified_type"],
+        )
+    )
+    assert entries[1] == datacatalog.Entry(
+        name=entry_group.name + "/entries/e1",
+        linked_resource="//warehouse/projected/e1",
+        user_specified_type="table",
+    )
+
+
+def test_search(client):
+    _entry_group(client, "search", entries=3)
+    scope = datacatalog.SearchCatalogRequest.Scope(include_project_ids=["p1"])
+    results = list(client.search_catalog(scope=scope, query="name:orders"))
+    assert {result.relative_resource_name for result in results} >= {
+        LOCATION + "/entryGroups/search/entries/e0",
+        LOCATION + "/entryGroups/search/entries/e2",
+    }
+    assert results[0].search_result_subtype == "entry.table"
+
+    with pytest.raises(core_exceptions.InvalidArgument):
+        list(client.search_catalog(scope=scope, query="label:x"))
+    with pytest.raises(core_exceptions.InvalidArgument):
+        list(
+            client.search_catalog(
+                scope=datacatalog.SearchCatalogRequest.Scope(), query="orders"
+            )
+        )
+
+
+def test_tag_templates_and_tags(client):
+    entry_group = _entry_group(client, "tags", entries=1)
+    entry = entry_group.name + "/entries/e0"
+    template = client.create_tag_template(
+        parent=LOCATION,
+        tag_template_id="quality",
+        tag_template=tags.TagTemplate(
+            display_name="Quality",
+            fields={
+                "grade": tags.TagTemplateField(
+                    type_=tags.FieldType(
+                        enum_type=tags.FieldType.EnumType(
+                            allowed_values=[
+                                tags.FieldType.EnumType.EnumValue(display_name="Gold")
+                            ]
+                        )
+                    )
+                )
+            },
+        ),
+    )
+    assert template.fields["grade"].name == template.name + "/fields/grade"
+    client.create_tag_template_field(
+        parent=template.name,
+        tag_template_field_id="owner",
+        tag_template_field=tags.TagTemplateField(
+            type_=tags.FieldType(primitive_type=tags.FieldType.PrimitiveType.STRING)
+        ),
+    )
+
+    tag = client.create_tag(
+        parent=entry,
+        tag=tags.Tag(
+            template=template.name,
+            fields={
+                "grade": tags.TagField(
+                    enum_value=tags.TagField.EnumValue(display_name="Gold")
+                ),
+                "owner": tags.TagField(string_value="sales"),
+            },
+        ),
+    )
+    assert tag.name.startswith(entry + "/tags/")
+    assert tag.template_display_name == "Quality"
+
+    client.rename_tag_template_field_enum_value(
+        name=template.name + "/fields/grade/enumValues/Gold",
+        new_enum_value_display_name="Platinum",
+    )
+    client.rename_tag_template_field(
+        name=template.name + "/fields/owner", new_tag_template_field_id="steward"
+    )
+    (tag,) = client.list_tags(parent=entry)
+    assert tag.fields["grade"].enum_value.display_name == "Platinum"
+    assert tag.fields["steward"].string_value == "sales"
+
+    with pytest.raises(core_exceptions.FailedPrecondition):
+        client.delete_tag_template_field(name=template.name + "/fields/steward")
+    client.delete_tag_template_field(name=template.name + "/fields/steward", force=True)
+    assert "steward" not in client.get_tag_template(name=template.name).fields
+    client.delete_tag_template(name=template.name, force=True)
+    assert list(client.list_tags(parent=entry)) == []
+
+
+def test_iam(client):
+    entry_group = _entry_group(client, "iam")
+    policy = client.set_iam_policy(
+        request={
+            "resource": entry_group.name,
+            "policy": policy_pb2.Policy(
+                bindings=[policy_pb2.Binding(role="roles/viewer", members=["user:a"])]
+            ),
+        }
+    )
+    assert policy.etag
+    assert client.get_iam_policy(request={"resource": entry_group.name}) == policy
+    response = client.test_iam_permissions(
+        request={"resource": entry_group.name, "permissions": ["a.b.c"]}
+    )
+    assert list(response.permissions) == ["a.b.c"]
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_iam_policy(request={"resource": LOCATION + "/entryGroups/none"})
+
+
+def test_policy_tags(emulator):
+    client = PolicyTagManagerClient(
+        transport=policy_tag_manager_transports.PolicyTagManagerGrpcTransport(
+            channel=emulator.channel()
+        )
+    )
+    serialization = PolicyTagManagerSerializationClient(
+        transport=serialization_transports.PolicyTagManagerSerializationGrpcTransport(
+            channel=emulator.channel()
+        )
+    )
+    taxonomy = client.create_taxonomy(
+        parent=LOCATION, taxonomy=policytagmanager.Taxonomy(display_name="PII")
+    )
+    parent = client.create_policy_tag(
+        parent=taxonomy.name,
+        policy_tag=policytagmanager.PolicyTag(display_name="Contact"),
+    )
+    child = client.create_policy_tag(
+        parent=taxonomy.name,
+        policy_tag=policytagmanager.PolicyTag(
+            display_name="Email", parent_policy_tag=parent.name
+        ),
+    )
+    assert client.get_policy_tag(name=parent.name).child_policy_tags == [child.name]
+    assert client.get_taxonomy(name=taxonomy.name).policy_tag_count == 2
+
+    exported = serialization.export_taxonomies(
+        request={
+            "parent": LOCATION,
+            "taxonomies": [taxonomy.name],
+            "serialized_taxonomies": True,
+        }
+    )
+    (serialized,) = exported.taxonomies
+    assert serialized.policy_tags[0].child_policy_tags[0].display_name == "Email"
+
+    imported = serialization.import_taxonomies(
+        request={
+            "parent": "projects/p1/locations/eu",
+            "inline_source": {"taxonomies": [serialized]},
+        }
+    )
+    (copy,) = imported.taxonomies
+    assert copy.policy_tag_count == 2
+    assert copy.name != taxonomy.name
+
+    replaced = serialization.replace_taxonomy(
+        request={
+            "name": copy.name,
+            "serialized_taxonomy": policytagmanagerserialization.SerializedTaxonomy(
+                display_name="Renamed"
+            ),
+        }
+    )
+    assert replaced.display_name == "Renamed"
+    assert replaced.policy_tag_count == 0
+
+    client.delete_policy_tag(name=parent.name)
+    assert list(client.list_policy_tags(parent=taxonomy.name)) == []
+    client.delete_taxonomy(name=taxonomy.name)
+    with pytest.raises(core_exceptions.NotFound):
+        client.get_taxonomy(name=taxonomy.name)
+
+
+def test_injected_failures(client, emulator):
+    entry_group = _entry_group(client, "failures")
+    emulator.fail_next("GetEntryGroup", grpc.StatusCode.PERMISSION_DENIED)
+    with pytest.raises(core_exceptions.PermissionDenied):
+        client.get_entry_group(name=entry_group.name)
+    assert client.get_entry_group(name=entry_group.name) == entry_group
+    assert emulator.calls["GetEntryGroup"] == 2
+
+    emulator.error_rate = 1.0
+    try:
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            client.get_entry_group(name=entry_group.name, retry=None)
+    finally:
+        emulator.error_rate = 0.0
+
+
+def test_emulator_lifecycle():
+    emulator = emulator_module.DataCatalogEmulator()
+    emulator.start()
+    with pytest.raises(ValueError):
+        emulator.start()
+    assert emulator.address.startswith("localhost:")
+    assert not emulator.address.endswith(":0")
+    emulator.stop()
+    emulator.stop()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import os
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1 import export
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import timestamps
+from google.protobuf import timestamp_pb2  # type: ignore
+
+REQUEST = {
+    "scope": {"include_project_ids": ["p1"]},
+    "query": "type=table",
+    "page_size": 2,
+}
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with emulator_module.DataCatalogEmulator() as emulator:
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+        )
+        entry_group = client.create_entry_group(
+            parent="projects/p1/locations/us",
+            entry_group_id="g1",
+            entry_group=datacatalog.EntryGroup(),
+        )
+        for i in range(5):
+            client.create_entry(
+                parent=entry_group.name,
+                entry_id="e{}".format(i),
+                entry=datacatalog.Entry(
+                    type_=datacatalog.EntryType.TABLE,
+                    description="table {} \N{SNOWMAN}".format(i),
+                    user_specified_system="lake",
+                    source_system_timestamps=timestamps.SystemTimestamps(
+                        update_time=timestamp_pb2.Timestamp(seconds=1600000000 + i)
+                    ),
+                ),
+            )
+        yield emulator
+
+
+@pytest.fixture
+def client(emulator):
+    client = DataCatalogClient(
+        transport=transports.DataCatalogGrpcTransport(channel=emulator.channel())
+    )
+    yield client
+    client.transport.close()
+
+
+def _read_ndjson(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_export_ndjson(client, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    exporter = export.SearchResultExporter(client, REQUEST, path)
+    assert exporter.export() == 5
+
+    rows = _read_ndjson(path)
+    assert [row["relative_resource_name"] for row in rows] == [
+        result.relative_resource_name
+        for result in client.search_catalog(request=REQUEST)
+    ]
+    assert rows[0]["search_result_type"] == "ENTRY"
+    assert rows[0]["description"].endswith("\N{SNOWMAN}")
+    assert rows[0]["user_specified_system"] == "lake"
+
+    # Resuming a complete export writes nothing more.
+    assert exporter.export(exporter.resume_token) == 5
+    assert len(_read_ndjson(path)) == 5
+
+
+def test_export_ndjson_resume(client, emulator, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    exporter = export.SearchResultExporter(client, REQUEST, path)
+    # The third page fails after two have been written.
+    original_pages = exporter._pages
+
+    def failing_pages(page_token):
+        for i, page in enumerate(original_pages(page_token)):
+            if i == 2:
+                raise core_exceptions.ServiceUnavailable("down")
+            yield page
+
+    exporter._pages = failing_pages
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        exporter.export()
+    assert exporter.count == 4
+    token = exporter.resume_token
+    calls = emulator.calls["SearchCatalog"]
+    # Anything written after the checkpoint is discarded on resume.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"partial"')
+
+    resumed = export.SearchResultExporter(client, REQUEST, path)
+    assert resumed.export(token) == 5
+    # Only the last page is searched again.
+    assert emulator.calls["SearchCatalog"] - calls == 1
+    names = [row["relative_resource_name"] for row in _read_ndjson(path)]
+    assert len(names) == len(set(names)) == 5
+
+
+def test_export_ndjson_token_path(client, emulator, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    token_path = str(tmp_path / "results.token")
+    exporter = export.SearchResultExporter(client, REQUEST, path, token_path=token_path)
+    original_pages = exporter._pages
+
+    def failing_pages(page_token):
+        for i, page in enumerate(original_pages(page_token)):
+            if i == 2:
+                raise core_exceptions.ServiceUnavailable("down")
+            yield page
+
+    exporter._pages = failing_pages
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        exporter.export()
+    with open(token_path, encoding="ascii") as f:
+        assert f.read() == exporter.resume_token
+    assert not os.path.exists(token_path + ".partial")
+
+    # A new exporter, as in a new process, resumes from the saved token.
+    calls = emulator.calls["SearchCatalog"]
+    resumed = export.SearchResultExporter(client, REQUEST, path, token_path=token_path)
+    assert resumed.export() == 5
+    assert emulator.calls["SearchCatalog"] - calls == 1
+    assert len(_read_ndjson(path)) == 5
+
+    # The token of the complete export is kept, so running it again is a no-op.
+    calls = emulator.calls["SearchCatalog"]
+    assert resumed.export() == 5
+    assert emulator.calls["SearchCatalog"] == calls
+
+
+def test_export_resume_token_mismatch(client, tmp_path):
+    path = str(tmp_path / "results.ndjson")
+    exporter = export.SearchResultExporter(client, REQUEST, path)
+    exporter.export()
+
+    other = export.SearchResultExporter(
+        client, dict(REQUEST, query="type=fileset"), path
+    )
+    with pytest.raises(ValueError):
+        other.export(exporter.resume_token)
+    with pytest.raises(ValueError):
+        exporter.export("not a token")
+    with pytest.raises(ValueError):
+        export.SearchResultExporter(client, REQUEST, path, format="csv")
+
+
+def test_export_parquet(client, emulator, tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    path = str(tmp_path / "results")
+    exporter = export.SearchResultExporter(
+        client,
+        REQUEST,
+        path,
+        format=export.PARQUET,
+        row_group_size=2,
+        row_groups_per_file=2,
+    )
+    original_pages = exporter._pages
+
+    def failing_pages(page_token):
+        for i, page in enumerate(original_pages(page_token)):
+            if i == 2:
+                raise core_exceptions.ServiceUnavailable("down")
+            yield page
+
+    exporter._pages = failing_pages
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        exporter.export()
+    assert exporter.count == 4
+    assert sorted(os.listdir(path)) == ["part-00000.parquet"]
+
+    exporter._pages = original_pages
+    assert exporter.export(exporter.resume_token) == 5
+    assert sorted(os.listdir(path)) == ["part-00000.parquet", "part-00001.parquet"]
+    assert (
+        pyarrow.parquet.ParquetFile(
+            os.path.join(path, "part-00000.parquet")
+        ).num_row_groups
+        == 2
+    )
+    table = pyarrow.parquet.read_table(path)
+    assert table.num_rows == 5
+    assert set(table.column("search_result_type").to_pylist()) == {"ENTRY"}
+    modify_times = table.column("modify_time").to_pylist()
+    assert sorted(t.timestamp() for t in modify_times) == [
+        1600000000 + i for i in range(5)
+    ]
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+
+import mock
+
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1 import flow_control
+from google.cloud.datacatalog_v1 import metrics
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerAsyncClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    transports as policy_tag_manager_transports,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanager
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_concurrency_limiter_arguments():
+    with pytest.raises(ValueError):
+        flow_control.AdaptiveConcurrencyLimiter(4, min_limit=8)
+    with pytest.raises(ValueError):
+        flow_control.AdaptiveConcurrencyLimiter(decrease=1.0)
+
+
+def test_concurrency_limiter_aimd():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(2, max_limit=3)
+    method = limiter._method("get_entry")
+
+    # An idle limit does not grow.
+    method.release(method.acquire(), True)
+    assert method.limit == 2
+
+    # A saturated one does, up to max_limit.
+    for _ in range(20):
+        epochs = [method.acquire(), method.acquire()]
+        for epoch in epochs:
+            method.release(epoch, True)
+    assert method.limit == 3
+
+    # Overload cuts the limit once per round of calls in flight.
+    epochs = [method.acquire() for _ in range(3)]
+    for epoch in epochs:
+        method.release(epoch, False)
+    assert method.limit == 1.5
+    method.release(method.acquire(), False)
+    assert method.limit == 1
+
+    # Other errors leave it alone.
+    method.release(method.acquire(), None)
+    assert limiter.metrics() == {"get_entry": {"limit": 1, "in_flight": 0, "queued": 0}}
+
+
+def test_concurrency_limiter_queues_calls():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(1)
+    release = threading.Event()
+    order = []
+
+    def call(i):
+        order.append(i)
+        release.wait()
+
+    limited = limiter.wrap("get_entry", call)
+    threads = [threading.Thread(target=limited, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    while limiter.metrics()["get_entry"]["queued"] < 2:
+        time.sleep(0.001)
+
+    assert limiter.metrics()["get_entry"]["in_flight"] == 1
+    assert len(order) == 1
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(order) == 3
+    assert limiter.metrics()["get_entry"]["in_flight"] == 0
+
+
+def test_concurrency_limiter_queued_epoch():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(2)
+    method = limiter._method("get_entry")
+    first, second = method.acquire(), method.acquire()
+    epochs = []
+    thread = threading.Thread(target=lambda: epochs.append(method.acquire()))
+    thread.start()
+    while limiter.metrics()["get_entry"]["queued"] < 1:
+        time.sleep(0.001)
+
+    # The queued call is granted its permit before the limit is cut, so it
+    # does not cut it again, however late it wakes up.
+    method.release(first, True)
+    method.release(second, False)
+    thread.join()
+    assert epochs == [0]
+    limit = method.limit
+    method.release(epochs[0], False)
+    assert method.limit == limit
+
+
+def test_transport_concurrency_limiter():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(4)
+    transport = transports.DataCatalogGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(), concurrency_limiter=limiter,
+    )
+    client = DataCatalogClient(transport=transport)
+
+    with mock.patch.object(type(client.transport.create_entry), "__call__") as call:
+        call.side_effect = core_exceptions.ResourceExhausted("quota")
+        with pytest.raises(core_exceptions.ResourceExhausted):
+            client.create_entry(parent="p", entry_id="e", entry=datacatalog.Entry())
+
+    # Only the methods called so far are limited.
+    assert limiter.metrics() == {
+        "create_entry": {"limit": 2, "in_flight": 0, "queued": 0}
+    }
+
+
+def test_transport_concurrency_limiter_retried_attempts():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(4)
+    transport = transports.DataCatalogGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(), concurrency_limiter=limiter,
+    )
+    client = DataCatalogClient(transport=transport)
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__"
+    ) as call, mock.patch("time.sleep"):
+        call.side_effect = [
+            core_exceptions.ServiceUnavailable("down"),
+            datacatalog.Entry(name="entries/e1"),
+        ]
+        assert client.get_entry(name="entries/e1").name == "entries/e1"
+
+    # The limiter saw the attempt that was retried.
+    assert limiter.metrics() == {"get_entry": {"limit": 2, "in_flight": 0, "queued": 0}}
+
+
+def test_transport_concurrency_limiter_over_grpc():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(4)
+    with emulator_module.DataCatalogEmulator() as emulator:
+        client = DataCatalogClient(
+            transport=transports.DataCatalogGrpcTransport(
+                channel=emulator.channel(), concurrency_limiter=limiter
+            )
+        )
+        emulator.fail_next("GetEntry", grpc.StatusCode.UNAVAILABLE)
+        with mock.patch("time.sleep"), pytest.raises(core_exceptions.NotFound):
+            client.get_entry(name="projects/p1/locations/us/entryGroups/g/entries/e")
+
+    assert emulator.calls["GetEntry"] == 2
+    assert limiter.metrics()["get_entry"]["limit"] == 2
+
+
+@pytest.mark.asyncio
+async def test_transport_concurrency_limiter_async():
+    limiter = flow_control.AdaptiveConcurrencyLimiter(2, max_limit=2)
+    transport = transports.DataCatalogGrpcAsyncIOTransport(
+        credentials=ga_credentials.AnonymousCredentials(), concurrency_limiter=limiter,
+    )
+    client = DataCatalogAsyncClient(transport=transport)
+    in_flight = [0, 0]
+
+    async def get_entry(request, **kwargs):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        return datacatalog.Entry(name=request.name)
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = get_entry
+        entries = await asyncio.gather(
+            *[client.get_entry(name="entries/e{}".format(i)) for i in range(6)]
+        )
+
+    assert len(entries) == 6
+    assert in_flight[1] == 2
+    assert limiter.metrics()["get_entry"]["in_flight"] == 0
+
+
+def _wrap_errors_api_core_1(callable_):
+    # google-api-core 1.x takes anything that is not a unary-unary stub
+    # for a streaming one.
+    if isinstance(callable_, aio.UnaryUnaryMultiCallable):
+        return grpc_helpers_async._wrap_unary_errors(callable_)
+    raise TypeError("Unexpected type of call")
+
+
+@pytest.mark.asyncio
+async def test_transport_limiters_async_api_core_1():
+    concurrency_limiter = flow_control.AdaptiveConcurrencyLimiter(2)
+    transport = transports.DataCatalogGrpcAsyncIOTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        concurrency_limiter=concurrency_limiter,
+        rate_limiter=flow_control.RateLimiter(
+            {}, default=flow_control.TokenBucket(100)
+        ),
+        metrics_sink=metrics.InMemoryMetrics(),
+    )
+    client = DataCatalogAsyncClient(transport=transport)
+
+    with mock.patch.object(
+        grpc_helpers_async, "wrap_errors", _wrap_errors_api_core_1
+    ), mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        assert (await client.get_entry(name="entries/e1")).name == "entries/e1"
+
+    assert concurrency_limiter.metrics()["get_entry"]["in_flight"] == 0
+
+
+def test_token_bucket():
+    timer = FakeTimer()
+    bucket = flow_control.TokenBucket(2, burst=3, timer=timer)
+
+    # The burst is available at once; later calls wait their turn.
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+    # Tokens refill at the rate, up to the burst.
+    timer.now = 10
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+    with pytest.raises(ValueError):
+        flow_control.TokenBucket(0)
+
+
+def test_rate_limiter_groups():
+    reads = flow_control.TokenBucket(10)
+    limiter = flow_control.RateLimiter(
+        {"get_taxonomy": reads, "list_taxonomies": reads},
+        default=flow_control.TokenBucket(1),
+    )
+
+    assert limiter.bucket("get_taxonomy") is limiter.bucket("list_taxonomies")
+    assert limiter.bucket("create_taxonomy").rate == 1
+
+    def func():
+        pass
+
+    assert flow_control.RateLimiter({}).wrap("get_taxonomy", func) is func
+
+
+def test_transport_rate_limiter():
+    timer = FakeTimer()
+    limiter = flow_control.RateLimiter(
+        {"get_taxonomy": flow_control.TokenBucket(1, timer=timer)}
+    )
+    transport = policy_tag_manager_transports.PolicyTagManagerGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(), rate_limiter=limiter,
+    )
+    client = PolicyTagManagerClient(transport=transport)
+
+    with mock.patch.object(
+        type(client.transport.get_taxonomy), "__call__"
+    ) as call, mock.patch.object(flow_control.time, "sleep") as sleep:
+        call.return_value = policytagmanager.Taxonomy(name="taxonomies/t1")
+        for _ in range(3):
+            client.get_taxonomy(name="taxonomies/t1")
+        client.list_taxonomies(parent="projects/p/locations/l")
+
+    assert call.call_count == 4
+    assert sleep.call_args_list == [mock.call(1.0), mock.call(2.0)]
+
+
+def test_transport_rate_and_concurrency_limiters():
+    concurrency_limiter = flow_control.AdaptiveConcurrencyLimiter(1)
+    rate_limiter = flow_control.RateLimiter({}, default=flow_control.TokenBucket(100))
+    transport = transports.DataCatalogGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        concurrency_limiter=concurrency_limiter,
+        rate_limiter=rate_limiter,
+    )
+    client = DataCatalogClient(transport=transport)
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        assert client.get_entry(name="entries/e1").name == "entries/e1"
+
+    assert concurrency_limiter.metrics()["get_entry"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transport_rate_limiter_async():
+    limiter = flow_control.RateLimiter({"get_policy_tag": flow_control.TokenBucket(1)})
+    transport = policy_tag_manager_transports.PolicyTagManagerGrpcAsyncIOTransport(
+        credentials=ga_credentials.AnonymousCredentials(), rate_limiter=limiter,
+    )
+    client = PolicyTagManagerAsyncClient(transport=transport)
+
+    with mock.patch.object(
+        type(client.transport.get_policy_tag), "__call__", new_callable=mock.AsyncMock
+    ) as call, mock.patch.object(
+        flow_control.asyncio, "sleep", new_callable=mock.AsyncMock
+    ) as sleep:
+        call.return_value = policytagmanager.PolicyTag(name="policyTags/p1")
+        await client.get_policy_tag(name="policyTags/p1")
+        await client.get_policy_tag(name="policyTags/p1")
+
+    assert call.call_count == 2
+    assert sleep.call_count == 1
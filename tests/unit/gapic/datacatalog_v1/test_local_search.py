@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import pytest
+
+from google.cloud.datacatalog_v1 import local_search
+from google.cloud.datacatalog_v1 import mirror
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.types import common
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import search
+from google.cloud.datacatalog_v1.types import tags
+from google.cloud.datacatalog_v1.types import timestamps
+from google.protobuf import timestamp_pb2  # type: ignore
+
+GROUP = "projects/p1/locations/us/entryGroups/g1"
+
+
+def _entry(entry_id, seconds=0, **kwargs):
+    return datacatalog.Entry(
+        name=GROUP + "/entries/" + entry_id,
+        source_system_timestamps=timestamps.SystemTimestamps(
+            update_time=timestamp_pb2.Timestamp(seconds=seconds)
+        ),
+        **kwargs
+    )
+
+
+def _tag(entry_id, template, **fields):
+    return tags.Tag(
+        name="{}/entries/{}/tags/{}".format(GROUP, entry_id, template),
+        template="projects/p1/locations/us/tagTemplates/" + template,
+        fields=fields,
+    )
+
+
+ENTRIES = [
+    _entry(
+        "orders",
+        300,
+        linked_resource="//bigquery.googleapis.com/projects/p1/datasets/sales/tables/daily_orders",
+        type_=datacatalog.EntryType.TABLE,
+        integrated_system=common.IntegratedSystem.BIGQUERY,
+        display_name="Daily Orders",
+        description="One row per customer order, refreshed nightly.",
+        schema=schema.Schema(
+            columns=[
+                schema.ColumnSchema(column="order_id"),
+                schema.ColumnSchema(
+                    column="customer",
+                    subcolumns=[schema.ColumnSchema(column="customer_id")],
+                ),
+            ]
+        ),
+    ),
+    _entry(
+        "events",
+        100,
+        type_=datacatalog.EntryType.DATA_STREAM,
+        integrated_system=common.IntegratedSystem.CLOUD_PUBSUB,
+        description="Legacy click events.",
+    ),
+    _entry(
+        "feed",
+        200,
+        user_specified_type="feed",
+        user_specified_system="kafka",
+        display_name="Customer feed",
+    ),
+]
+
+TAGS = {
+    GROUP
+    + "/entries/orders": [
+        _tag(
+            "orders",
+            "governance",
+            owner=tags.TagField(string_value="Sales Analytics"),
+            pii=tags.TagField(bool_value=True),
+        )
+    ],
+    GROUP
+    + "/entries/feed": [
+        _tag(
+            "feed",
+            "quality",
+            grade=tags.TagField(
+                enum_value=tags.TagField.EnumValue(display_name="Gold")
+            ),
+        )
+    ],
+}
+
+
+@pytest.fixture
+def index():
+    return local_search.SearchIndex(ENTRIES, TAGS)
+
+
+def _ids(results):
+    return [result.relative_resource_name.rsplit("/", 1)[-1] for result in results]
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("", ["events", "feed", "orders"]),
+        ("customer", ["feed", "orders"]),
+        ("CUST", ["feed", "orders"]),
+        ("name:ord", ["orders"]),
+        ("name:daily_ord", ["orders"]),
+        ("name:eed", ["feed"]),
+        ("displayname:customer", ["feed"]),
+        ("description:click", ["events"]),
+        ("description:nightly", ["orders"]),
+        ("column:customer_id", ["orders"]),
+        ("column:customer.cust", ["orders"]),
+        ("column:der_", ["orders"]),
+        ("type=table", ["orders"]),
+        ("type=data_stream", ["events"]),
+        ("type=dataStream", ["events"]),
+        ("type=feed", ["feed"]),
+        ("type=tab", []),
+        ("system=bigquery", ["orders"]),
+        ("system=kafka", ["feed"]),
+        ("tag:governance", ["orders"]),
+        ("tag:governance.owner", ["orders"]),
+        ("tag:governance.owner:sales", ["orders"]),
+        ('tag:governance.owner="sales analytics"', ["orders"]),
+        ("tag:governance.owner=sales", []),
+        ("tag:quality.grade:gold", ["feed"]),
+        ("gold", ["feed"]),
+        ("customer -description:order", ["feed"]),
+        ("customer NOT type=feed", ["orders"]),
+        ("description:click OR system=kafka", ["events", "feed"]),
+        ("customer AND column:order", ["orders"]),
+        ('"daily orders"', ["orders"]),
+        ("nothing", []),
+    ],
+)
+def test_search(index, query, expected):
+    assert _ids(index.search(query)) == expected
+
+
+def test_search_result(index):
+    (result,) = index.search("name:orders")
+    assert result == search.SearchCatalogResult(
+        search_result_type=search.SearchResultType.ENTRY,
+        search_result_subtype="entry.table",
+        relative_resource_name=GROUP + "/entries/orders",
+        linked_resource=ENTRIES[0].linked_resource,
+        modify_time=timestamp_pb2.Timestamp(seconds=300),
+        integrated_system=common.IntegratedSystem.BIGQUERY,
+        display_name="Daily Orders",
+        description=ENTRIES[0].description,
+    )
+    (result,) = index.search("type=dataStream")
+    assert result.search_result_subtype == "entry.dataStream"
+    (result,) = index.search("type=feed")
+    assert result.search_result_subtype == "entry.feed"
+    assert result.user_specified_system == "kafka"
+
+
+def test_search_order(index):
+    assert _ids(index.search(order_by="last_modified_timestamp")) == [
+        "orders",
+        "feed",
+        "events",
+    ]
+    assert _ids(index.search(order_by="last_modified_timestamp asc")) == [
+        "events",
+        "feed",
+        "orders",
+    ]
+    assert _ids(index.search(order_by="relevance")) == ["events", "feed", "orders"]
+
+    for order_by in ("name", "relevance asc desc", "last_modified_timestamp up"):
+        with pytest.raises(ValueError):
+            index.search(order_by=order_by)
+
+
+def test_search_invalid_query(index):
+    with pytest.raises(ValueError):
+        index.search("label:team")
+    with pytest.raises(ValueError):
+        index.search("tag:a.b.c")
+
+
+def test_search_catalog(index):
+    request = datacatalog.SearchCatalogRequest(
+        scope=datacatalog.SearchCatalogRequest.Scope(include_project_ids=["p1"]),
+        query="customer",
+        order_by="last_modified_timestamp",
+    )
+    assert _ids(index.search_catalog(request)) == ["orders", "feed"]
+    assert _ids(index.search_catalog(request, query="click")) == ["events"]
+    assert (
+        index.search_catalog(
+            request,
+            scope=datacatalog.SearchCatalogRequest.Scope(include_project_ids=["p2"]),
+        )
+        == []
+    )
+
+
+def test_from_mirror():
+    client = mock.Mock(spec=DataCatalogClient)
+    client._raw_responses = False
+    client.parse_common_location_path = DataCatalogClient.parse_common_location_path
+    client.search_catalog.return_value = []
+    client.list_entry_groups.return_value = [datacatalog.EntryGroup(name=GROUP)]
+    client.list_entries.return_value = ENTRIES
+    client.list_tags.side_effect = lambda parent: TAGS.get(parent, [])
+    catalog = mirror.CatalogMirror(client, ["projects/p1/locations/us"])
+    catalog.sync()
+
+    index = local_search.SearchIndex.from_mirror(catalog)
+    assert len(index) == 3
+    assert _ids(index.search("gold OR tag:governance.pii:true")) == ["feed", "orders"]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import grpc
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1 import metrics
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    transports as serialization_transports,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanagerserialization
+
+
+class RecordingSink(metrics.MetricsSink):
+    def __init__(self):
+        self.attempts = []
+        self.calls = []
+
+    def record_attempt(self, service, method, **kwargs):
+        self.attempts.append((service, method, kwargs["code"]))
+
+    def record_call(self, service, method, **kwargs):
+        self.calls.append((service, method, kwargs["code"], kwargs["attempts"]))
+
+
+def _client(sink):
+    return DataCatalogClient(
+        transport=transports.DataCatalogGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(), metrics_sink=sink,
+        )
+    )
+
+
+def test_metrics_retried_call():
+    sink = metrics.InMemoryMetrics()
+    client = _client(sink)
+    entry = datacatalog.Entry(name="entries/e1", description="x" * 300)
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__"
+    ) as call, mock.patch("time.sleep"):
+        call.side_effect = [core_exceptions.ServiceUnavailable("down"), entry]
+        assert client.get_entry(name="entries/e1") == entry
+
+    snapshot = sink.snapshot()["DataCatalog.get_entry"]
+    assert snapshot["calls"] == {"OK": 1}
+    assert snapshot["attempts"] == {"OK": 1, "UNAVAILABLE": 1}
+    assert snapshot["retries"] == 1
+    assert snapshot["call_latency"]["count"] == 1
+    assert snapshot["attempt_latency"]["count"] == 2
+    assert snapshot["request_bytes"]["count"] == 2
+    assert snapshot["request_bytes"]["sum"] == 2 * len("\n\nentries/e1")
+    assert snapshot["response_bytes"]["count"] == 1
+    assert snapshot["response_bytes"]["buckets"][:2] == [(256, 0), (1024, 1)]
+
+
+def test_metrics_thread_local_attempts():
+    # The stand-in for contextvars used on Python 3.6.
+    sink = RecordingSink()
+    client = _client(sink)
+
+    with mock.patch.object(
+        metrics, "_attempts", metrics._ThreadLocalVar()
+    ), mock.patch.object(
+        type(client.transport.get_entry), "__call__"
+    ) as call, mock.patch(
+        "time.sleep"
+    ):
+        call.side_effect = [
+            core_exceptions.ServiceUnavailable("down"),
+            datacatalog.Entry(name="entries/e1"),
+        ]
+        client.get_entry(name="entries/e1")
+        assert metrics._attempts.get(None) is None
+
+    assert sink.calls == [("DataCatalog", "get_entry", "OK", 2)]
+
+
+def test_metrics_failed_call():
+    sink = RecordingSink()
+    client = _client(sink)
+
+    with mock.patch.object(type(client.transport.create_entry), "__call__") as call:
+        call.side_effect = core_exceptions.PermissionDenied("no")
+        with pytest.raises(core_exceptions.PermissionDenied):
+            client.create_entry(parent="p", entry_id="e", entry=datacatalog.Entry())
+
+    assert sink.attempts == [("DataCatalog", "create_entry", "PERMISSION_DENIED")]
+    assert sink.calls == [("DataCatalog", "create_entry", "PERMISSION_DENIED", 1)]
+
+
+@pytest.mark.asyncio
+async def test_metrics_async():
+    sink = RecordingSink()
+    client = DataCatalogAsyncClient(
+        transport=transports.DataCatalogGrpcAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(), metrics_sink=sink,
+        )
+    )
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = [
+            core_exceptions.NotFound("gone"),
+            datacatalog.Entry(name="entries/e1"),
+        ]
+        with pytest.raises(core_exceptions.NotFound):
+            await client.get_entry(name="entries/e1")
+        await client.get_entry(name="entries/e1")
+
+    assert sink.attempts == [
+        ("DataCatalog", "get_entry", "NOT_FOUND"),
+        ("DataCatalog", "get_entry", "OK"),
+    ]
+    assert sink.calls == [
+        ("DataCatalog", "get_entry", "NOT_FOUND", 1),
+        ("DataCatalog", "get_entry", "OK", 1),
+    ]
+
+
+def test_metrics_over_grpc():
+    sink = RecordingSink()
+    with emulator_module.DataCatalogEmulator() as emulator:
+        client = PolicyTagManagerSerializationClient(
+            transport=serialization_transports.PolicyTagManagerSerializationGrpcTransport(
+                channel=emulator.channel(), metrics_sink=sink
+            )
+        )
+        emulator.fail_next("ExportTaxonomies", grpc.StatusCode.INVALID_ARGUMENT)
+        request = policytagmanagerserialization.ExportTaxonomiesRequest(
+            parent="projects/p1/locations/us", serialized_taxonomies=True
+        )
+        with pytest.raises(core_exceptions.InvalidArgument):
+            client.export_taxonomies(request=request)
+        client.export_taxonomies(request=request)
+
+    assert sink.attempts == [
+        ("PolicyTagManagerSerialization", "export_taxonomies", "INVALID_ARGUMENT"),
+        ("PolicyTagManagerSerialization", "export_taxonomies", "OK"),
+    ]
+    assert [call[2] for call in sink.calls] == ["INVALID_ARGUMENT", "OK"]
+
+
+def test_prometheus_text():
+    sink = metrics.InMemoryMetrics(latency_buckets=[0.1, 1], size_buckets=[100])
+    sink.record_attempt(
+        "DataCatalog",
+        "get_entry",
+        latency=0.05,
+        code="UNAVAILABLE",
+        request_bytes=20,
+        response_bytes=0,
+    )
+    sink.record_attempt(
+        "DataCatalog",
+        "get_entry",
+        latency=0.5,
+        code="OK",
+        request_bytes=20,
+        response_bytes=200,
+    )
+    sink.record_call("DataCatalog", "get_entry", latency=2.0, code="OK", attempts=2)
+
+    text = sink.prometheus_text()
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    labels = 'service="DataCatalog",method="get_entry"'
+    for line in (
+        "# TYPE datacatalog_client_calls_total counter",
+        "datacatalog_client_calls_total{" + labels + ',code="OK"} 1',
+        "datacatalog_client_attempts_total{" + labels + ',code="OK"} 1',
+        "datacatalog_client_attempts_total{" + labels + ',code="UNAVAILABLE"} 1',
+        "datacatalog_client_retries_total{" + labels + "} 1",
+        "# TYPE datacatalog_client_call_latency_seconds histogram",
+        "datacatalog_client_call_latency_seconds_bucket{" + labels + ',le="1.0"} 0',
+        "datacatalog_client_call_latency_seconds_bucket{" + labels + ',le="+Inf"} 1',
+        "datacatalog_client_call_latency_seconds_sum{" + labels + "} 2.0",
+        "datacatalog_client_attempt_latency_seconds_bucket{" + labels + ',le="0.1"} 1',
+        "datacatalog_client_request_bytes_bucket{" + labels + ',le="100"} 2',
+        "datacatalog_client_response_bytes_bucket{" + labels + ',le="100"} 0',
+        "datacatalog_client_response_bytes_count{" + labels + "} 1",
+    ):
+        assert line in lines
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.cloud.datacatalog_v1 import mirror
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import schema
+from google.cloud.datacatalog_v1.types import search
+from google.cloud.datacatalog_v1.types import tags
+from google.protobuf import timestamp_pb2  # type: ignore
+
+PARENT = "projects/p1/locations/us"
+GROUP = PARENT + "/entryGroups/g1"
+
+
+def _entry(entry_id, **kwargs):
+    return datacatalog.Entry(name=GROUP + "/entries/" + entry_id, **kwargs)
+
+
+def _result(name, seconds, result_type=search.SearchResultType.ENTRY):
+    return search.SearchCatalogResult(
+        search_result_type=result_type,
+        relative_resource_name=name,
+        modify_time=timestamp_pb2.Timestamp(seconds=seconds),
+    )
+
+
+def _client():
+    client = mock.Mock(spec=DataCatalogClient)
+    client._raw_responses = False
+    client.parse_common_location_path = DataCatalogClient.parse_common_location_path
+    client.list_entry_groups.return_value = [datacatalog.EntryGroup(name=GROUP)]
+    client.list_entries.return_value = [
+        _entry(
+            "e1",
+            linked_resource="//bigquery.googleapis.com/t1",
+            type_=datacatalog.EntryType.TABLE,
+            schema=schema.Schema(
+                columns=[
+                    schema.ColumnSchema(
+                        column="a",
+                        type_="RECORD",
+                        subcolumns=[schema.ColumnSchema(column="b", type_="STRING")],
+                    )
+                ]
+            ),
+        ),
+        _entry("e2", user_specified_type="feed"),
+    ]
+    client.list_tags.side_effect = lambda parent: [
+        tags.Tag(name=parent + "/tags/t1", template="projects/p1/tagTemplates/tt")
+    ]
+    client.search_catalog.return_value = [_result(GROUP + "/entries/e1", 100)]
+    return client
+
+
+def test_mirror_full_sync():
+    client = _client()
+    with mirror.CatalogMirror(client, [PARENT]) as catalog:
+        assert catalog.watermark is None
+        assert catalog.sync() == 2
+        assert catalog.watermark == 100 * 10 ** 9
+
+        _, kwargs = client.search_catalog.call_args
+        assert kwargs["request"].scope.include_project_ids == ["p1"]
+        assert kwargs["request"].order_by == "last_modified_timestamp desc"
+        client.list_entries.assert_called_once_with(parent=GROUP)
+
+        entry = catalog.get_entry(GROUP + "/entries/e1")
+        assert entry.type_ == datacatalog.EntryType.TABLE
+        assert catalog.lookup_entry("//bigquery.googleapis.com/t1") == entry
+        assert catalog.lookup_entry("//bigquery.googleapis.com/t2") is None
+        assert [e.name for e in catalog.list_entries(GROUP)] == [
+            GROUP + "/entries/e1",
+            GROUP + "/entries/e2",
+        ]
+        assert [t.name for t in catalog.list_tags(entry.name)] == [
+            entry.name + "/tags/t1"
+        ]
+        assert catalog.connection.execute(
+            "SELECT path, type FROM columns ORDER BY position"
+        ).fetchall() == [("a", "RECORD"), ("a.b", "STRING")]
+        assert catalog.connection.execute(
+            "SELECT type FROM entries ORDER BY name"
+        ).fetchall() == [("TABLE",), ("feed",)]
+
+
+def test_mirror_incremental_sync():
+    client = _client()
+    catalog = mirror.CatalogMirror(client, [PARENT])
+    catalog.sync()
+
+    client.search_catalog.return_value = [
+        _result(GROUP + "/entries/e3", 300),
+        _result(
+            "projects/p1/tagTemplates/tt", 250, search.SearchResultType.TAG_TEMPLATE
+        ),
+        _result("projects/p1/locations/eu/entryGroups/g/entries/e", 220),
+        _result(GROUP + "/entries/e2", 200),
+        _result(GROUP + "/entries/e3", 150),
+        _result(GROUP + "/entries/e1", 100),
+        _result(GROUP + "/entries/e0", 50),
+    ]
+    entries = {
+        GROUP + "/entries/e3": _entry("e3", description="new"),
+        GROUP + "/entries/e1": _entry("e1", description="changed"),
+    }
+
+    def get_entry(name):
+        if name not in entries:
+            raise core_exceptions.NotFound("Entry deleted.")
+        return entries[name]
+
+    client.get_entry.side_effect = get_entry
+    client.list_entries.reset_mock()
+
+    assert catalog.sync() == 3
+    assert catalog.watermark == 300 * 10 ** 9
+    client.list_entries.assert_not_called()
+    assert [c[2]["name"] for c in client.get_entry.mock_calls] == [
+        GROUP + "/entries/e3",
+        GROUP + "/entries/e2",
+        GROUP + "/entries/e1",
+    ]
+    assert [e.description for e in catalog.list_entries(GROUP)] == ["changed", "new"]
+    assert catalog.list_tags(GROUP + "/entries/e2") == []
+    assert catalog.connection.execute("SELECT COUNT(*) FROM columns").fetchone() == (0,)
+
+    # A full sync reloads everything.
+    assert catalog.sync(full=True) == 2
+    assert [e.description for e in catalog.list_entries(GROUP)] == ["", ""]
+    assert catalog.watermark == 300 * 10 ** 9
+
+
+def test_mirror_database_file(tmp_path):
+    client = _client()
+    database = str(tmp_path / "catalog.db")
+    with mirror.CatalogMirror(client, [PARENT], database) as catalog:
+        catalog.sync()
+
+    client.search_catalog.return_value = []
+    with mirror.CatalogMirror(client, [PARENT], database) as catalog:
+        assert catalog.watermark == 100 * 10 ** 9
+        assert catalog.sync() == 0
+        assert len(catalog.list_entries(GROUP)) == 2
+
+
+def test_mirror_arguments():
+    client = _client()
+    with pytest.raises(ValueError):
+        mirror.CatalogMirror(client, [])
+
+    client._raw_responses = True
+    with pytest.raises(ValueError):
+        mirror.CatalogMirror(client, [PARENT])
+
+    scope = datacatalog.SearchCatalogRequest.Scope(include_org_ids=["o1"])
+    client = _client()
+    catalog = mirror.CatalogMirror(
+        client, [PARENT], query="system=bigquery", scope=scope
+    )
+    catalog.sync()
+    _, kwargs = client.search_catalog.call_args
+    assert kwargs["request"].scope == scope
+    assert kwargs["request"].query == "system=bigquery"
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+import re
+
+import pytest
+
+from google.cloud.datacatalog_v1 import path_parser
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+
+TEMPLATES = (
+    "projects/{project}",
+    "projects/{project}/locations/{location}/entryGroups/{entry_group}/entries/{entry}",
+    "projects/{project}/locations/{location}/tagTemplates/{tag_template}/fields/"
+    "{tag_template_field_id}/enumValues/{enum_value_display_name}",
+)
+
+PATHS = (
+    "",
+    "projects/p",
+    "projects/p/",
+    "projects//locations/l",
+    "projects/a/b/locations/l",
+    "projects/p/locations/l/entryGroups/g/entries/e",
+    "projects/p/locations/l/entryGroups/g/entries/e/tags/t",
+    "projects/p/locations/l/entryGroups/g/entries/",
+    "projects/p/locations/l/entryGroups/g/entries/e\n",
+    "projects/p\n/locations/l/entryGroups/g/entries/e",
+    "projects/p/locations/l/entryGroups/entries/entries/e",
+    "projects/p/locations/locations/l/entryGroups/g/entries/e",
+    "projects/p/locations/l/tagTemplates/t/fields/f/enumValues/v",
+    "projects/p/locations/l/tagTemplates/t/fields/f/enumValues/v/w",
+)
+
+
+def _regex_parse(template, path):
+    # The generated parsers, before they were precompiled.
+    pattern = "^{}$".format(re.sub(r"\{(\w+)\}", r"(?P<\1>.+?)", template))
+    m = re.match(pattern, path)
+    return m.groupdict() if m else {}
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_parse_matches_regex(template):
+    parser = path_parser.PathParser(template)
+    for path in PATHS:
+        assert parser.parse(path) == _regex_parse(template, path), path
+
+
+def test_parse_matches_regex_fuzzed():
+    template = TEMPLATES[1]
+    parser = path_parser.PathParser(template)
+    pieces = ["projects", "locations", "entryGroups", "entries", "x", "", "\n"]
+    rng = random.Random(0)
+    for _ in range(2000):
+        path = "/".join(rng.choice(pieces) for _ in range(rng.randint(1, 10)))
+        assert parser.parse(path) == _regex_parse(template, path), repr(path)
+
+
+def test_parse_batch():
+    parser = path_parser.PathParser("projects/{project}/locations/{location}")
+    assert parser.names == ("project", "location")
+    columns = parser.parse_batch(
+        ["projects/p1/locations/l1", "folders/f", "projects/p/2/locations/l2"]
+    )
+    assert columns == {
+        "project": ["p1", None, "p/2"],
+        "location": ["l1", None, "l2"],
+    }
+    assert parser.parse_batch(iter([])) == {"project": [], "location": []}
+
+
+def test_client_parsers():
+    names = [
+        DataCatalogClient.entry_path("p{}".format(i), "l", "g", "e{}".format(i))
+        for i in range(3)
+    ]
+    columns = DataCatalogClient.parse_entry_paths(names + ["bogus"])
+    assert columns["entry"] == ["e0", "e1", "e2", None]
+    for i, name in enumerate(names):
+        assert DataCatalogClient.parse_entry_path(name) == {
+            key: values[i] for key, values in columns.items()
+        }
+    assert DataCatalogAsyncClient.parse_entry_paths(names) == (
+        DataCatalogClient.parse_entry_paths(names)
+    )
+
+    taxonomies = PolicyTagManagerClient.parse_taxonomy_paths(
+        [PolicyTagManagerClient.taxonomy_path("p", "l", "t")]
+    )
+    assert taxonomies == {"project": ["p"], "location": ["l"], "taxonomy": ["t"]}
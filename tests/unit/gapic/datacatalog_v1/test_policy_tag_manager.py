@@ -1622,6 +1622,47 @@ async def test_list_taxonomies_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_list_taxonomies_async_pages_prefetch():
+    client = PolicyTagManagerAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_taxonomies), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            policytagmanager.ListTaxonomiesResponse(
+                taxonomies=[
+                    policytagmanager.Taxonomy(),
+                    policytagmanager.Taxonomy(),
+                    policytagmanager.Taxonomy(),
+                ],
+                next_page_token="abc",
+            ),
+            policytagmanager.ListTaxonomiesResponse(
+                taxonomies=[], next_page_token="def",
+            ),
+            policytagmanager.ListTaxonomiesResponse(
+                taxonomies=[policytagmanager.Taxonomy(),], next_page_token="ghi",
+            ),
+            policytagmanager.ListTaxonomiesResponse(
+                taxonomies=[policytagmanager.Taxonomy(), policytagmanager.Taxonomy(),],
+            ),
+            RuntimeError,
+        )
+        responses = []
+        async for response in await client.list_taxonomies(
+            request={}, prefetch_pages=3
+        ):
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, policytagmanager.Taxonomy) for i in responses)
+
+
 @pytest.mark.parametrize("request_type", [policytagmanager.GetTaxonomyRequest, dict,])
 def test_get_taxonomy(request_type, transport: str = "grpc"):
     client = PolicyTagManagerClient(
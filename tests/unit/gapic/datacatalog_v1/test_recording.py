@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import grpc
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.cloud.datacatalog_v1 import emulator as emulator_module
+from google.cloud.datacatalog_v1 import recording
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.data_catalog import transports
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    transports as policy_tag_manager_transports,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanager
+
+LOCATION = "projects/p1/locations/us"
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with emulator_module.DataCatalogEmulator(default_page_size=2) as emulator:
+        yield emulator
+
+
+def _record_client(emulator, path):
+    return DataCatalogClient(
+        transport=transports.DataCatalogGrpcRecordReplayTransport(
+            path=path, mode=recording.RECORD, channel=emulator.channel()
+        )
+    )
+
+
+def _record(emulator, path, entry_group_id):
+    client = _record_client(emulator, path)
+    entry_group = client.create_entry_group(
+        parent=LOCATION,
+        entry_group_id=entry_group_id,
+        entry_group=datacatalog.EntryGroup(),
+    )
+    for i in range(3):
+        client.create_entry(
+            parent=entry_group.name,
+            entry_id="e{}".format(i),
+            entry=datacatalog.Entry(user_specified_type="table"),
+        )
+    entries = list(client.list_entries(parent=entry_group.name))
+    emulator.fail_next("GetEntry", grpc.StatusCode.PERMISSION_DENIED)
+    with pytest.raises(core_exceptions.PermissionDenied):
+        client.get_entry(name=entries[0].name)
+    client.transport.close()
+    return entry_group, entries
+
+
+def _replay_client(path, **kwargs):
+    return DataCatalogClient(
+        transport=transports.DataCatalogGrpcRecordReplayTransport(path=path, **kwargs)
+    )
+
+
+def test_record_and_replay(emulator, tmp_path):
+    path = str(tmp_path / "calls.rec")
+    entry_group, entries = _record(emulator, path, "replayed")
+
+    records = list(recording.read_records(path))
+    assert [record.method.rsplit("/", 1)[-1] for record in records] == [
+        "CreateEntryGroup",
+        "CreateEntry",
+        "CreateEntry",
+        "CreateEntry",
+        "ListEntries",
+        "ListEntries",
+        "GetEntry",
+    ]
+    assert records[-1].code == grpc.StatusCode.PERMISSION_DENIED
+    assert datacatalog.ListEntriesRequest.deserialize(records[5].request).page_token
+    assert all(record.latency > 0 and record.start_time > 0 for record in records)
+
+    client = _replay_client(path)
+    assert list(client.list_entries(parent=entry_group.name)) == entries
+    with pytest.raises(core_exceptions.PermissionDenied):
+        client.get_entry(name=entries[0].name)
+    # The last recorded response repeats.
+    with pytest.raises(core_exceptions.PermissionDenied):
+        client.get_entry(name=entries[0].name)
+    with pytest.raises(LookupError):
+        client.get_entry(name=entries[1].name)
+    client.transport.close()
+
+
+def test_replay_in_turn_and_latency(emulator, tmp_path):
+    path = str(tmp_path / "calls.rec")
+    client = PolicyTagManagerClient(
+        transport=policy_tag_manager_transports.PolicyTagManagerGrpcRecordReplayTransport(
+            path=path, mode=recording.RECORD, channel=emulator.channel()
+        )
+    )
+    taxonomy = client.create_taxonomy(
+        parent=LOCATION, taxonomy=policytagmanager.Taxonomy(display_name="PII")
+    )
+    before = client.get_taxonomy(name=taxonomy.name)
+    client.create_policy_tag(
+        parent=taxonomy.name,
+        policy_tag=policytagmanager.PolicyTag(display_name="Email"),
+    )
+    after = client.get_taxonomy(name=taxonomy.name)
+    client.transport.close()
+
+    client = PolicyTagManagerClient(
+        transport=policy_tag_manager_transports.PolicyTagManagerGrpcRecordReplayTransport(
+            path=path, reproduce_latency=True
+        )
+    )
+    with mock.patch("time.sleep") as sleep:
+        assert client.get_taxonomy(name=taxonomy.name) == before
+        assert client.get_taxonomy(name=taxonomy.name) == after
+    assert after.policy_tag_count == 1
+    assert sleep.call_count == 2
+    assert sleep.call_args[0][0] > 0
+
+
+def test_replay_deterministic_request_and_with_call(emulator, tmp_path):
+    path = str(tmp_path / "calls.rec")
+    client = _record_client(emulator, path)
+    entry_group = client.create_entry_group(
+        parent=LOCATION,
+        entry_group_id="labelled",
+        entry_group=datacatalog.EntryGroup(),
+    )
+    entry = client.create_entry(
+        parent=entry_group.name,
+        entry_id="e1",
+        entry=datacatalog.Entry(
+            user_specified_type="table", labels={"a": "1", "b": "2"}
+        ),
+    )
+    client.transport.close()
+
+    def serialize(request):
+        # Equal requests need not be serialized to equal bytes: here the
+        # parent is repeated, and the map entries come in another order.
+        return datacatalog.CreateEntryRequest.serialize(
+            request
+        ) + datacatalog.CreateEntryRequest.serialize(
+            datacatalog.CreateEntryRequest(parent=request.parent)
+        )
+
+    with recording.ReplayChannel(path) as channel:
+        create_entry = channel.unary_unary(
+            "/google.cloud.datacatalog.v1.DataCatalog/CreateEntry",
+            request_serializer=serialize,
+            response_deserializer=datacatalog.Entry.deserialize,
+        )
+        response, call = create_entry.with_call(
+            datacatalog.CreateEntryRequest(
+                parent=entry_group.name,
+                entry_id="e1",
+                entry=datacatalog.Entry(
+                    user_specified_type="table", labels={"b": "2", "a": "1"}
+                ),
+            )
+        )
+        assert response == entry
+        assert call.code() == grpc.StatusCode.OK
+        assert not call.is_active()
+        assert call.trailing_metadata() == ()
+
+
+def test_recording_appends(emulator, tmp_path):
+    path = str(tmp_path / "calls.rec")
+    entry_group, _ = _record(emulator, path, "appended")
+    count = len(list(recording.read_records(path)))
+    # Appending to the recording keeps the earlier calls, and a record cut
+    # short is ignored.
+    client = _record_client(emulator, path)
+    client.get_entry_group(name=entry_group.name)
+    client.transport.close()
+    records = list(recording.read_records(path))
+    assert len(records) == count + 1
+    assert records[-1].method.endswith("/GetEntryGroup")
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 10)
+    assert len(list(recording.read_records(path))) == count + 1
+
+    with open(path, "r+b") as f:
+        f.write(b"x")
+    with pytest.raises(ValueError):
+        _replay_client(path)
+
+
+def test_record_replay_mode():
+    with pytest.raises(ValueError):
+        transports.DataCatalogGrpcRecordReplayTransport(path="calls.rec", mode="live")
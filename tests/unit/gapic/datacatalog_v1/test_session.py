@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import grpc_helpers
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1 import session as session_module
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerAsyncClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationAsyncClient,
+)
+from google.cloud.datacatalog_v1.services.policy_tag_manager_serialization import (
+    PolicyTagManagerSerializationClient,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+
+
+def test_session_shares_channel_and_credentials():
+    creds = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        session_module.google.auth, "default", return_value=(creds, None)
+    ) as adc, mock.patch.object(grpc_helpers, "create_channel") as create_channel:
+        session = session_module.DataCatalogSession(quota_project_id="octopus")
+        clients = [
+            session.data_catalog_client(),
+            session.policy_tag_manager_client(),
+            session.policy_tag_manager_serialization_client(),
+        ]
+
+    adc.assert_called_once_with(
+        scopes=None,
+        default_scopes=("https://www.googleapis.com/auth/cloud-platform",),
+        quota_project_id="octopus",
+    )
+    create_channel.assert_called_once_with(
+        "datacatalog.googleapis.com:443",
+        credentials=creds,
+        scopes=None,
+        default_scopes=("https://www.googleapis.com/auth/cloud-platform",),
+        default_host="datacatalog.googleapis.com",
+        quota_project_id="octopus",
+        options=[
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ],
+    )
+    assert session.credentials is creds
+    assert isinstance(clients[0], DataCatalogClient)
+    assert isinstance(clients[1], PolicyTagManagerClient)
+    assert isinstance(clients[2], PolicyTagManagerSerializationClient)
+    for client in clients:
+        assert client.transport.grpc_channel._channel is create_channel.return_value
+
+
+def test_session_closes_channel_after_last_client():
+    channel = mock.Mock(spec=grpc.Channel)
+    session = session_module.DataCatalogSession(channel=channel)
+    catalog = session.data_catalog_client()
+    policy_tags = session.policy_tag_manager_client()
+
+    with catalog:
+        pass
+    session.close()
+    session.close()
+    channel.close.assert_not_called()
+
+    # Closing the same client twice does not release the channel twice.
+    catalog.transport.close()
+    channel.close.assert_not_called()
+    policy_tags.transport.close()
+    channel.close.assert_called_once_with()
+
+    with pytest.raises(ValueError):
+        session.data_catalog_client()
+
+
+def test_session_context_manager():
+    channel = mock.Mock(spec=grpc.Channel)
+    with session_module.DataCatalogSession(channel=channel) as session:
+        with session.policy_tag_manager_serialization_client():
+            pass
+        channel.close.assert_not_called()
+    channel.close.assert_called_once_with()
+
+
+def test_session_credentials_arguments():
+    with pytest.raises(core_exceptions.DuplicateCredentialArgs):
+        session_module.DataCatalogSession(
+            credentials=ga_credentials.AnonymousCredentials(),
+            credentials_file="credentials.json",
+        )
+
+    creds = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(
+        session_module.google.auth,
+        "load_credentials_from_file",
+        return_value=(creds, None),
+    ) as load_creds, mock.patch.object(grpc_helpers, "create_channel"):
+        session = session_module.DataCatalogSession(
+            credentials_file="credentials.json", host="localhost:8080"
+        )
+    load_creds.assert_called_once_with(
+        "credentials.json",
+        scopes=None,
+        default_scopes=("https://www.googleapis.com/auth/cloud-platform",),
+        quota_project_id=None,
+    )
+    assert session.credentials is creds
+    assert session.data_catalog_client().transport._host == "localhost:8080"
+
+
+def test_session_client_call():
+    session = session_module.DataCatalogSession(
+        channel=grpc.insecure_channel("localhost:1")
+    )
+    client = session.data_catalog_client(entry_cache=None)
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="entries/e1")
+        assert client.get_entry(name="entries/e1").name == "entries/e1"
+
+    session.close()
+    client.transport.close()
+
+
+@pytest.mark.asyncio
+async def test_async_session():
+    channel = mock.Mock(spec=aio.Channel)
+    channel.close = mock.AsyncMock()
+    with mock.patch.object(
+        grpc_helpers_async, "create_channel", return_value=channel
+    ) as create_channel:
+        session = session_module.DataCatalogAsyncSession(
+            credentials=ga_credentials.AnonymousCredentials()
+        )
+    create_channel.assert_called_once()
+
+    async with session:
+        clients = [
+            session.data_catalog_client(),
+            session.policy_tag_manager_client(),
+            session.policy_tag_manager_serialization_client(),
+        ]
+    assert isinstance(clients[0], DataCatalogAsyncClient)
+    assert isinstance(clients[1], PolicyTagManagerAsyncClient)
+    assert isinstance(clients[2], PolicyTagManagerSerializationAsyncClient)
+
+    for client in clients[:2]:
+        async with client:
+            pass
+    channel.close.assert_not_awaited()
+    await clients[2].transport.close()
+    channel.close.assert_awaited_once_with(None)
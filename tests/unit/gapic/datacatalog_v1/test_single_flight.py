@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+
+import mock
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud.datacatalog_v1 import coalescing
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogAsyncClient
+from google.cloud.datacatalog_v1.services.data_catalog import DataCatalogClient
+from google.cloud.datacatalog_v1.services.policy_tag_manager import (
+    PolicyTagManagerClient,
+)
+from google.cloud.datacatalog_v1.types import datacatalog
+from google.cloud.datacatalog_v1.types import policytagmanager
+
+
+def test_request_key():
+    first = coalescing.request_key(datacatalog.GetEntryRequest(name="e1"), [])
+    second = coalescing.request_key(datacatalog.GetEntryRequest(name="e1"), ())
+    assert first == second
+    assert first != coalescing.request_key(datacatalog.GetEntryRequest(name="e2"), [])
+    assert first != coalescing.request_key(
+        datacatalog.GetEntryRequest(name="e1"), [("x-goog-request-params", "a")]
+    )
+    assert first != coalescing.request_key(
+        datacatalog.GetEntryGroupRequest(name="e1"), []
+    )
+
+
+class CountingEvent(threading.Event):
+    """An event that counts the threads waiting on it."""
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = 0
+
+    def wait(self, timeout=None):
+        self.waiters += 1
+        return super().wait(timeout)
+
+
+def _join_flight(single_flight, started, call, count):
+    """Starts ``count`` threads that join the call in flight."""
+    started.wait()
+    (flight,) = single_flight._flights.values()
+    flight.done = CountingEvent()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_capture(call)))
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.done.waiters < count:
+        time.sleep(0.001)
+    return threads, results
+
+
+def _capture(call):
+    try:
+        return call()
+    except Exception as exc:
+        return exc
+
+
+def test_single_flight_shares_response():
+    single_flight = coalescing.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(None)
+        started.set()
+        release.wait()
+        return datacatalog.Entry(name="e1")
+
+    def call():
+        return single_flight.call("key", send)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    threads, results = _join_flight(single_flight, started, call, 3)
+    release.set()
+    for thread in threads + [leader]:
+        thread.join()
+
+    assert [r.name for r in results] == ["e1"] * 3
+    assert len(calls) == 1
+    # Each waiter gets its own message.
+    assert len({id(r) for r in results}) == 3
+    assert not single_flight._flights
+
+    # Once the flight has landed, the next call is sent again.
+    call()
+    assert len(calls) == 2
+
+
+def test_single_flight_shares_error():
+    single_flight = coalescing.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def send():
+        started.set()
+        release.wait()
+        raise core_exceptions.NotFound("no e1")
+
+    def call():
+        return single_flight.call("key", send)
+
+    leader = threading.Thread(target=_capture, args=(call,))
+    leader.start()
+    threads, results = _join_flight(single_flight, started, call, 2)
+    release.set()
+    for thread in threads + [leader]:
+        thread.join()
+
+    assert len(results) == 2
+    assert all(isinstance(r, core_exceptions.NotFound) for r in results)
+    assert not single_flight._flights
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight():
+    single_flight = coalescing.AsyncSingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def send():
+        calls.append(None)
+        await release.wait()
+        return datacatalog.Entry(name="e1")
+
+    tasks = [asyncio.ensure_future(single_flight.call("key", send)) for _ in range(3)]
+    await asyncio.sleep(0)
+    # Cancelling one waiter leaves the call running for the others.
+    tasks[0].cancel()
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert [r.name for r in results[1:]] == ["e1", "e1"]
+    assert len(calls) == 1
+    assert not single_flight._flights
+
+
+def test_get_entry_coalesced():
+    client = DataCatalogClient(
+        credentials=ga_credentials.AnonymousCredentials(), coalesce_reads=True,
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_entry(request, **kwargs):
+        started.set()
+        release.wait()
+        return datacatalog.Entry(name=request.name)
+
+    def call():
+        return client.get_entry(name="entries/e1")
+
+    with mock.patch.object(type(client.transport.get_entry), "__call__") as call_:
+        call_.side_effect = get_entry
+        leader = threading.Thread(target=call)
+        leader.start()
+        threads, results = _join_flight(client._single_flight, started, call, 2)
+        release.set()
+        for thread in threads + [leader]:
+            thread.join()
+
+    assert [r.name for r in results] == ["entries/e1"] * 2
+    assert call_.call_count == 1
+
+
+def test_get_taxonomy_not_coalesced_by_default():
+    client = PolicyTagManagerClient(credentials=ga_credentials.AnonymousCredentials())
+    assert client._single_flight is None
+
+    with mock.patch.object(type(client.transport.get_taxonomy), "__call__") as call:
+        call.return_value = policytagmanager.Taxonomy(name="taxonomies/t1")
+        client.get_taxonomy(name="taxonomies/t1")
+        client.get_taxonomy(name="taxonomies/t1")
+
+    assert call.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_entry_coalesced_async():
+    client = DataCatalogAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), coalesce_reads=True,
+    )
+    release = asyncio.Event()
+
+    async def get_entry(request, **kwargs):
+        await release.wait()
+        return datacatalog.Entry(name=request.name)
+
+    with mock.patch.object(
+        type(client.transport.get_entry), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = get_entry
+        pending = asyncio.gather(
+            *[client.get_entry(name="entries/e1") for _ in range(5)]
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await pending
+
+    assert [r.name for r in results] == ["entries/e1"] * 5
+    assert call.call_count == 1
@@ -7465,6 +7465,27 @@ def test_client_with_default_client_info():
         prep.assert_called_once_with(client_info)
 
 
+def test_transport_wraps_methods_on_first_use():
+    transport = transports.DataCatalogGrpcTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert transport._stubs == {}
+    assert len(transport._wrapped_methods) == 0
+
+    client = DataCatalogClient(transport=transport)
+    with mock.patch.object(type(transport.get_entry), "__call__") as call:
+        call.return_value = datacatalog.Entry(name="name_value")
+        client.get_entry(name="name_value")
+        client.get_entry(name="name_value")
+
+    assert list(transport._stubs) == ["get_entry"]
+    assert len(transport._wrapped_methods) == 1
+    wrapped = transport._wrapped_methods["get_entry"]
+    assert wrapped._timeout == 60.0
+    assert wrapped._retry._predicate(core_exceptions.ServiceUnavailable("unavailable"))
+    assert transport._wrapped_methods["create_entry"]._retry is None
+
+
 @pytest.mark.asyncio
 async def test_transport_close_async():
     client = DataCatalogAsyncClient(
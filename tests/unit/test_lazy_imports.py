@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import ast
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = (
+    "google.cloud.datacatalog",
+    "google.cloud.datacatalog_v1",
+    "google.cloud.datacatalog_v1beta1",
+)
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_public_names(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name).__name__ == name
+        assert name in dir(module)
+
+    with pytest.raises(AttributeError):
+        module.NotAName
+
+
+@pytest.mark.parametrize("package", PACKAGES[1:])
+def test_subpackages(package):
+    module = importlib.import_module(package)
+    assert module.types.Entry is module.Entry
+    assert module.services.data_catalog.DataCatalogClient is module.DataCatalogClient
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_import_is_lazy(package):
+    # Run in a fresh interpreter, since this one has loaded everything.
+    code = "\n".join(
+        [
+            "import sys",
+            "from {} import Entry".format(package),
+            "assert 'grpc' not in sys.modules",
+            "assert not [name for name in sys.modules if '.services' in name]",
+        ]
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_type_checking_imports(package):
+    module = importlib.import_module(package)
+    with open(module.__file__) as source:
+        tree = ast.parse(source.read())
+    (block,) = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and "TYPE_CHECKING" in ast.dump(node.test)
+    ]
+    imports = {}
+    for node in block.body:
+        module_name = "." * node.level + (node.module or "")
+        for alias in node.names:
+            imports[alias.name] = module_name
+    assert imports == module._LAZY_IMPORTS